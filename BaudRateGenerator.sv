@@ -1,26 +1,53 @@
 `default_nettype none
 
+//
+//  Module 'BaudRateGenerator'
+//
+//  Ticks once per bit period at the rate picked by baud_sel. A phase
+//  accumulator adds a fraction of a bit every clock and ticks on overflow, so
+//  rates that do not divide CLK_HZ evenly still average out to the right
+//  frequency instead of being rounded to a whole number of clocks.
+//
 module BaudRateGenerator #(
-    parameter int CLK_HZ    = 25_000_000,
-              int BAUD_RATE = 115200
+    parameter int CLK_HZ      = 25_000_000,
+              int BAUD_RATE   = 115200,      // Selected when baud_sel is 0
+              int BAUD_RATE_1 = 460800,
+              int BAUD_RATE_2 = 921600,
+              int BAUD_RATE_3 = 1_000_000,
+              int ACC_WIDTH   = 16
 ) (
-    input  logic clock,
-    input  logic reset,
-    input  logic start_rx,
-    input  logic start_tx,
-    output logic tick
+    input  logic       clock,
+    input  logic       reset,
+    input  logic       start_rx,
+    input  logic       start_tx,
+    input  logic [1:0] baud_sel,
+    output logic       tick
 );
 
-  parameter int DIVISOR = CLK_HZ / BAUD_RATE;
+  // Fraction of a bit that passes every clock, scaled by 2^ACC_WIDTH
+  localparam logic [63:0] SCALE = 64'd1 << ACC_WIDTH;
+  localparam logic [ACC_WIDTH-1:0] STEP_0 = (BAUD_RATE * SCALE + CLK_HZ / 2) / CLK_HZ;
+  localparam logic [ACC_WIDTH-1:0] STEP_1 = (BAUD_RATE_1 * SCALE + CLK_HZ / 2) / CLK_HZ;
+  localparam logic [ACC_WIDTH-1:0] STEP_2 = (BAUD_RATE_2 * SCALE + CLK_HZ / 2) / CLK_HZ;
+  localparam logic [ACC_WIDTH-1:0] STEP_3 = (BAUD_RATE_3 * SCALE + CLK_HZ / 2) / CLK_HZ;
 
-  logic [$clog2(DIVISOR) + 1:0] clockCount;
+  logic [ACC_WIDTH-1:0] step;
+  logic [ACC_WIDTH-1:0] phase, next_phase;
 
-  assign tick = clockCount == DIVISOR;
+  always_comb
+    unique case (baud_sel)
+      2'd0: step = STEP_0;
+      2'd1: step = STEP_1;
+      2'd2: step = STEP_2;
+      2'd3: step = STEP_3;
+    endcase
+
+  assign {tick, next_phase} = phase + step;
 
   always_ff @(posedge clock)
-    if (reset | tick) clockCount <= '0;
-    else if (start_rx) clockCount <= DIVISOR / 2;
-    else if (start_tx) clockCount <= '0;
-    else clockCount <= clockCount + 1'b1;
+    if (reset) phase <= '0;
+    else if (start_rx) phase <= 1'b1 << (ACC_WIDTH - 1);  // Half a bit
+    else if (start_tx) phase <= '0;
+    else phase <= next_phase;
 
 endmodule : BaudRateGenerator
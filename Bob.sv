@@ -14,18 +14,21 @@ module BobTop (
     input  logic       rx,
     input  logic [1:0] runway_override,
     input  logic       emergency_override,
+    input  logic [1:0] baud_strap,         // Baud rate selected at reset
     output logic       tx,
     output logic       framing_error,
     output logic [1:0] runway_active,
     output logic       emergency,
     output logic       receiving,
-    output logic       sending
+    output logic       sending,
+    output logic       cts_n               // Low when the host may send
 );
 
   logic [7:0] uart_rx_data, uart_tx_data;
-  logic uart_rx_valid;
+  logic uart_rx_valid, uart_rx_ready;
   logic uart_tx_ready;
   logic uart_tx_send;
+  logic [1:0] rx_baud_sel, tx_baud_sel;
 
   UartRX #(
       .CLK_HZ(25_000_000),
@@ -34,6 +37,7 @@ module BobTop (
       .clock(clock),
       .reset(reset),
       .rx(rx),
+      .baud_sel(rx_baud_sel),
       .data(uart_rx_data),
       .done(uart_rx_valid),
       .framing_error(framing_error),
@@ -48,6 +52,7 @@ module BobTop (
       .reset(reset),
       .send(uart_tx_send),
       .data(uart_tx_data),
+      .baud_sel(tx_baud_sel),
       .tx(tx),
       .ready(uart_tx_ready),
       .sending(sending)
@@ -73,12 +78,24 @@ module BobTop (
       .runway_active(runway_active),
       .runway_override(ro_sync),
       .emergency_out(emergency),
-      .emergency_override(eo_sync)
+      .emergency_override(eo_sync),
+      .uart_rx_ready(uart_rx_ready),
+      .baud_strap(baud_strap),
+      .rx_baud_sel(rx_baud_sel),
+      .tx_baud_sel(tx_baud_sel)
   );
 
+  // Active low, like the CTS line of an RS-232 port
+  assign cts_n = ~uart_rx_ready;
+
 endmodule : BobTop
 
-module Bob (
+module Bob #(
+    parameter int        REPLY_DEPTH  = 4,            // Holds, say-agains and ID replies
+              int        URGENT_DEPTH = 4,            // Clearances and emergency diverts
+              schedule_t SCHEDULE     = S_ALTERNATE,  // Policy used after reset
+              int        QUEUE_BURST  = 2             // Queue services per request read
+) (
     input  logic       clock,
     input  logic       reset,
     input  logic [7:0] uart_rx_data,        // Data from UART
@@ -89,13 +106,20 @@ module Bob (
     input  logic       uart_tx_ready,       // High if ready to write to UART
     output logic       uart_tx_send,        // High if data is ready for transmit
     output logic [1:0] runway_active,       // Tracks runway status
-    output logic       emergency_out
+    output logic       emergency_out,
+    output logic       uart_rx_ready,       // High if the host may send
+    input  logic [1:0] baud_strap,          // UART rate to use after reset
+    output logic [1:0] rx_baud_sel,         // UART rates currently in use
+    output logic [1:0] tx_baud_sel
 );
 
   // For UART Request Storage FIFO
+  localparam int REQUEST_DEPTH = 4;
+  localparam int REQUEST_SLACK = 2;  // Bytes the host may send after CTS drops
   msg_t uart_request;
   logic uart_rd_request;
   logic uart_empty;
+  logic [$clog2(REQUEST_DEPTH):0] uart_request_count;
 
   // For RunwayManager
   logic runway_id;
@@ -108,11 +132,19 @@ module Bob (
   logic queue_takeoff_plane, unqueue_takeoff_plane;
   logic [3:0] cleared_takeoff_id;
   logic takeoff_fifo_full, takeoff_fifo_empty;
+  logic [3:0] takeoff_count;
 
   // For Aircraft Landing FIFO
   logic queue_landing_plane, unqueue_landing_plane;
   logic [3:0] cleared_landing_id;
   logic landing_fifo_full, landing_fifo_empty;
+  logic [3:0] landing_count;
+
+  // For emergency flushes of the landing queue
+  logic flush_landings;
+  logic [15:0] landing_queued, divert_pending;
+  logic [3:0] divert_id;
+  logic divert_waiting;
 
   // For Reply Generation
   logic send_hold, send_say_ag, send_divert, send_divert_landing;
@@ -120,9 +152,33 @@ module Bob (
   logic [1:0] send_clear;
   msg_t reply_to_send;
 
-  // For UART Reply Storage FIFO
+  // For UART Reply Storage FIFOs
   logic send_reply, queue_reply;
-  logic reply_fifo_full, reply_fifo_empty;
+  logic reply_fifo_we, reply_fifo_full, reply_fifo_empty;
+  logic send_urgent, queue_urgent_reply;
+  logic urgent_fifo_we, urgent_fifo_full, urgent_reply_fifo_full, urgent_fifo_empty;
+  logic [7:0] reply_tx_data, urgent_tx_data;
+  logic [$clog2(REPLY_DEPTH):0] reply_count;
+  logic [$clog2(URGENT_DEPTH):0] urgent_count;
+  logic tx_from_urgent;
+  logic urgent_behind_hold;
+  logic [15:0] hold_pending;
+  msg_t sent_reply;
+  logic sent_status;
+  logic [2:0] status_tx_index;
+  logic status_in_progress;
+
+  // For status snapshots
+  logic take_snapshot, send_status, queue_status, status_done;
+  logic [2:0] status_index;
+  logic [7:0][7:0] status_snapshot;
+
+  // For host commands
+  logic send_echo;
+  logic switch_rx_baud, switch_tx_baud;
+  logic uart_tx_idle;
+  logic set_schedule;
+  schedule_t schedule;
 
   // For emergency latching
   logic emergency;
@@ -135,7 +191,7 @@ module Bob (
 
   FIFO #(
       .WIDTH(8),
-      .DEPTH(4)
+      .DEPTH(REQUEST_DEPTH)
   ) uart_requests (
       .clock(clock),
       .reset(reset),
@@ -144,9 +200,14 @@ module Bob (
       .re(uart_rd_request),
       .data_out({uart_request.plane_id, uart_request.msg_type, uart_request.msg_action}),
       .full(),
-      .empty(uart_empty)
+      .empty(uart_empty),
+      .count(uart_request_count)
   );
 
+  // Flow control: ask the host to pause while there is still room for the
+  // bytes it may already have in flight, so that no request is ever dropped.
+  assign uart_rx_ready = uart_request_count < REQUEST_DEPTH - REQUEST_SLACK;
+
   ////////////////////////////
   // Aircraft Take-Off FIFO //
   ////////////////////////////
@@ -162,7 +223,8 @@ module Bob (
       .re(unqueue_takeoff_plane),
       .data_out(cleared_takeoff_id),
       .full(takeoff_fifo_full),
-      .empty(takeoff_fifo_empty)
+      .empty(takeoff_fifo_empty),
+      .count(takeoff_count)
   );
 
   ///////////////////////////
@@ -174,34 +236,59 @@ module Bob (
       .DEPTH(8)   // Limited to 8 for chip size and congestion
   ) landing_fifo (
       .clock(clock),
-      .reset(reset),
+      .reset(reset | flush_landings),
       .data_in(uart_request.plane_id),
       .we(queue_landing_plane),
       .re(unqueue_landing_plane),
       .data_out(cleared_landing_id),
       .full(landing_fifo_full),
-      .empty(landing_fifo_empty)
+      .empty(landing_fifo_empty),
+      .count(landing_count)
   );
 
+  // One bit per plane ID waiting to land, so an emergency can empty the
+  // whole queue in one cycle and divert the planes from here afterwards
+  always_ff @(posedge clock) begin
+    if (reset || flush_landings) begin
+      landing_queued <= '0;
+    end else begin
+      if (send_clear[1]) landing_queued[cleared_landing_id] <= 1'b0;
+      if (queue_landing_plane) landing_queued[uart_request.plane_id] <= 1'b1;
+    end
+  end
+
+  always_ff @(posedge clock) begin
+    if (reset) divert_pending <= '0;
+    else if (flush_landings) divert_pending <= divert_pending | landing_queued;
+    else if (send_divert_landing) divert_pending[divert_id] <= 1'b0;
+  end
+
+  // Lowest plane ID still owed a divert
+  always_comb begin
+    divert_id = 4'd0;
+    for (int i = 15; i >= 0; i--) if (divert_pending[i]) divert_id = 4'(i);
+  end
+
+  assign divert_waiting = divert_pending != 0;
+
   ////////////////
   // ID Manager //
   ////////////////
 
-  logic [3:0] new_id, id_in;
-  logic sel_diverted_id;
+  logic [3:0] new_id;
   logic take_id, release_id;
   logic id_full;
   logic [15:0] all_id;
 
-  always_comb
-    if (sel_diverted_id) id_in = cleared_landing_id;
-    else id_in = uart_request.plane_id;
-
+  // Diverted IDs are freed as soon as the queue is flushed, but are not
+  // handed out again until their divert has been queued
   AircraftIDManager id_manager (
       .clock(clock),
       .reset(reset),
-      .id_in(id_in),
+      .id_in(uart_request.plane_id),
       .release_id(release_id),
+      .release_mask(flush_landings ? landing_queued : 16'h0000),
+      .reserved_id(divert_pending),
       .take_id(take_id),
       .id_out(new_id),
       .all_id(all_id),
@@ -212,7 +299,9 @@ module Bob (
   // FSM //
   /////////
 
-  ReadRequestFsm fsm (
+  ReadRequestFsm #(
+      .QUEUE_BURST(QUEUE_BURST)
+  ) fsm (
       .emergency(emergency_out),
       .*
   );
@@ -249,7 +338,7 @@ module Bob (
       reply_to_send.msg_type   <= T_DIVERT;
       reply_to_send.msg_action <= 1'b0;
     end else if (send_divert_landing) begin
-      reply_to_send.plane_id   <= cleared_landing_id;
+      reply_to_send.plane_id   <= divert_id;
       reply_to_send.msg_type   <= T_DIVERT;
       reply_to_send.msg_action <= 1'b0;
     end else if (send_invalid_id) begin
@@ -260,25 +349,99 @@ module Bob (
       reply_to_send.plane_id   <= new_id;
       reply_to_send.msg_type   <= T_ID_PLEASE;
       reply_to_send.msg_action <= 1'b0;
+    end else if (send_status) begin
+      reply_to_send <= status_snapshot[3'd7-status_index];
+    end else if (send_echo) begin
+      reply_to_send <= uart_request;  // Echo the command back
+    end
+  end
+
+  /////////////////////
+  // Status Snapshot //
+  /////////////////////
+
+  // Answer to an ID_PLEASE with the action bit set and plane ID 0. Eight bytes
+  // go out back to back, starting with 8'hFF, which no other reply uses:
+  //   1, 2 : all_id[15:8], all_id[7:0]
+  //   3    : runway 1 plane ID, runway 0 plane ID
+  //   4    : emergency_id, emergency, 0, runway 1 active, runway 0 active
+  //   5    : takeoff FIFO count, landing FIFO count
+  //   6    : reply FIFO count, urgent reply FIFO count
+  //   7    : request FIFO count, 0, scheduling policy
+  always_ff @(posedge clock) begin
+    if (reset) begin
+      status_snapshot <= '0;
+    end else if (take_snapshot) begin
+      status_snapshot <= {
+        8'hFF,
+        all_id,
+        runway[1].plane_id,
+        runway[0].plane_id,
+        emergency_id,
+        emergency_out,
+        1'b0,
+        runway[1].active,
+        runway[0].active,
+        takeoff_count,
+        landing_count,
+        4'(reply_count),
+        4'(urgent_count),
+        4'(uart_request_count),
+        2'b0,
+        schedule
+      };
     end
   end
 
-  /////////////////////////////
-  // UART Reply Storage FIFO //
-  /////////////////////////////
+  // Counts the bytes loaded into reply_to_send, wrapping back to 0 after the
+  // last one
+  always_ff @(posedge clock)
+    if (reset || take_snapshot) status_index <= '0;
+    else if (send_status) status_index <= status_index + 1'b1;
 
+  assign status_done = status_index == 3'd0;
+
+  //////////////////////////////
+  // UART Reply Storage FIFOs //
+  //////////////////////////////
+
+  // Clearances and emergency diverts skip ahead of holds and say-agains,
+  // unless a hold for the same plane has not gone out yet. Those wait behind
+  // it in the regular FIFO so a plane never hears "hold" after "cleared".
+  assign urgent_behind_hold = hold_pending[reply_to_send.plane_id];
+  assign reply_fifo_we      = queue_reply | queue_status | (queue_urgent_reply & urgent_behind_hold);
+  assign urgent_fifo_we     = queue_urgent_reply & ~urgent_behind_hold;
+  assign urgent_fifo_full   = urgent_behind_hold ? reply_fifo_full : urgent_reply_fifo_full;
+
+  // The extra bit marks status bytes so they are never mistaken for holds
   FIFO #(
-      .WIDTH(8),
-      .DEPTH(4)
+      .WIDTH(9),
+      .DEPTH(REPLY_DEPTH)
   ) uart_replies (
       .clock(clock),
       .reset(reset),
-      .data_in(reply_to_send),
-      .we(queue_reply),
+      .data_in({queue_status, reply_to_send}),
+      .we(reply_fifo_we),
       .re(send_reply),
-      .data_out(uart_tx_data),
+      .data_out({sent_status, reply_tx_data}),
       .full(reply_fifo_full),
-      .empty(reply_fifo_empty)
+      .empty(reply_fifo_empty),
+      .count(reply_count)
+  );
+
+  FIFO #(
+      .WIDTH(8),
+      .DEPTH(URGENT_DEPTH)
+  ) urgent_replies (
+      .clock(clock),
+      .reset(reset),
+      .data_in(reply_to_send),
+      .we(urgent_fifo_we),
+      .re(send_urgent),
+      .data_out(urgent_tx_data),
+      .full(urgent_reply_fifo_full),
+      .empty(urgent_fifo_empty),
+      .count(urgent_count)
   );
 
   SendReplyFsm reply_fsm (
@@ -286,10 +449,41 @@ module Bob (
       .reset(reset),
       .uart_tx_ready(uart_tx_ready),
       .reply_fifo_empty(reply_fifo_empty),
+      .urgent_fifo_empty(urgent_fifo_empty),
+      .status_in_progress(status_in_progress),
       .send_reply(send_reply),
+      .send_urgent(send_urgent),
       .uart_tx_send(uart_tx_send)
   );
 
+  // Remember which FIFO the byte being transmitted came from
+  always_ff @(posedge clock)
+    if (reset) tx_from_urgent <= 1'b0;
+    else if (send_reply || send_urgent) tx_from_urgent <= send_urgent;
+
+  assign uart_tx_data = tx_from_urgent ? urgent_tx_data : reply_tx_data;
+  assign sent_reply   = reply_tx_data;
+
+  // Counts status bytes on the wire so urgent replies wait for the end of a
+  // snapshot instead of splitting it
+  always_ff @(posedge clock)
+    if (reset) status_tx_index <= '0;
+    else if (uart_tx_send && !tx_from_urgent && sent_status) status_tx_index <= status_tx_index + 1'b1;
+
+  assign status_in_progress = status_tx_index != 0;
+
+  // One bit per plane ID, high while a hold for that plane is still queued
+  always_ff @(posedge clock) begin
+    if (reset) begin
+      hold_pending <= '0;
+    end else begin
+      if (uart_tx_send && !tx_from_urgent && !sent_status && sent_reply.msg_type == T_HOLD)
+        hold_pending[sent_reply.plane_id] <= 1'b0;
+      if (queue_reply && reply_to_send.msg_type == T_HOLD)
+        hold_pending[reply_to_send.plane_id] <= 1'b1;
+    end
+  end
+
   always_comb
     if (sel_takeoff_id_lock) cleared_id_to_lock = cleared_takeoff_id;
     else cleared_id_to_lock = cleared_landing_id;
@@ -321,9 +515,39 @@ module Bob (
 
   assign emergency_out = emergency | emergency_override;
 
+  ///////////////
+  // Baud Rate //
+  ///////////////
+
+  // An ID_PLEASE with the action bit set and plane ID 4'b10xx asks for rate
+  // xx. The host sends nothing more until it sees the echo, so the receiver
+  // switches right away. The echo goes out at the old rate, and the
+  // transmitter switches once it and everything queued before it are sent.
+  assign uart_tx_idle = reply_fifo_empty && urgent_fifo_empty && uart_tx_ready && !uart_tx_send;
+
+  always_ff @(posedge clock)
+    if (reset) rx_baud_sel <= baud_strap;
+    else if (switch_rx_baud) rx_baud_sel <= uart_request.plane_id[1:0];
+
+  always_ff @(posedge clock)
+    if (reset) tx_baud_sel <= baud_strap;
+    else if (switch_tx_baud) tx_baud_sel <= uart_request.plane_id[1:0];
+
+  ////////////////
+  // Scheduling //
+  ////////////////
+
+  // Plane ID 4'b01xx in a host command picks policy xx, echoed like a baud
+  // rate change
+  always_ff @(posedge clock)
+    if (reset) schedule <= SCHEDULE;
+    else if (set_schedule) schedule <= schedule_t'(uart_request.plane_id[1:0]);
+
 endmodule : Bob
 
-module ReadRequestFsm (
+module ReadRequestFsm #(
+    parameter int QUEUE_BURST = 2
+) (
     input  logic           clock,
     input  logic           reset,
     input  logic           uart_empty,
@@ -333,12 +557,19 @@ module ReadRequestFsm (
     input  logic           takeoff_fifo_empty,
     input  logic           landing_fifo_empty,
     input  logic           reply_fifo_full,
+    input  logic           urgent_fifo_full,
     input  logic    [ 1:0] runway_active,
     input  logic           emergency,
     input  logic    [15:0] all_id,
     input  logic           id_full,
     input  logic    [ 3:0] emergency_id,
     input  runway_t [ 1:0] runway,
+    input  logic           status_done,
+    input  logic           uart_tx_idle,
+    input  schedule_t      schedule,
+    input  logic    [ 3:0] takeoff_count,
+    input  logic    [ 3:0] landing_count,
+    input  logic           divert_waiting,
     output logic           uart_rd_request,
     output logic           queue_takeoff_plane,
     output logic           queue_landing_plane,
@@ -352,6 +583,7 @@ module ReadRequestFsm (
     output logic           send_invalid_id,
     output logic           send_valid_id,
     output logic           queue_reply,
+    output logic           queue_urgent_reply,
     output logic           lock,
     output logic           unlock,
     output logic           runway_id,
@@ -360,7 +592,14 @@ module ReadRequestFsm (
     output logic           take_id,
     output logic           release_id,
     output logic           sel_takeoff_id_lock,
-    output logic           sel_diverted_id
+    output logic           take_snapshot,
+    output logic           send_status,
+    output logic           queue_status,
+    output logic           send_echo,
+    output logic           switch_rx_baud,
+    output logic           switch_tx_baud,
+    output logic           set_schedule,
+    output logic           flush_landings
 );
 
   logic      [3:0] plane_id;
@@ -368,24 +607,63 @@ module ReadRequestFsm (
   logic      [1:0] msg_action;
   logic            takeoff_first;
   logic            reverse_takeoff_first;
+  logic            serve_flush, serve_divert, serve_takeoff, serve_landing, serve_queue;
+  logic            contested;
+  logic      [$clog2(QUEUE_BURST+1)-1:0] queue_streak;
 
   assign plane_id   = uart_request.plane_id;
   assign msg_type   = uart_request.msg_type;
   assign msg_action = uart_request.msg_action;
 
-  typedef enum logic [2:0] {
-    QUIET          = 3'b000,
-    INTERPRET      = 3'b001,
-    REPLY          = 3'b010,
-    CHECK_QUEUES   = 3'b011,
-    CLR_TAKEOFF    = 3'b100,
-    CLR_LANDING    = 3'b101,
-    DIVERT_LANDING = 3'b110,
-    QUEUE_CLR      = 3'b111
+  typedef enum logic [3:0] {
+    QUIET          = 4'b0000,
+    INTERPRET      = 4'b0001,
+    REPLY          = 4'b0010,
+    CHECK_QUEUES   = 4'b0011,
+    CLR_TAKEOFF    = 4'b0100,
+    CLR_LANDING    = 4'b0101,
+    DIVERT_LANDING = 4'b0110,
+    QUEUE_CLR      = 4'b0111,
+    SEND_STATUS    = 4'b1000,
+    QUEUE_STATUS   = 4'b1001,
+    SWITCH_BAUD    = 4'b1010,
+    FLUSH_LANDINGS = 4'b1011
   } state_t;
 
   state_t state, next_state;
 
+  // Decides which queue a free runway goes to. During an emergency the
+  // landing queue is flushed instead, and flushed planes are diverted before
+  // anything else is cleared.
+  always_comb begin
+    serve_flush   = 1'b0;
+    serve_divert  = 1'b0;
+    serve_takeoff = 1'b0;
+    serve_landing = 1'b0;
+    contested     = !takeoff_fifo_empty && !landing_fifo_empty;
+
+    if (emergency && !landing_fifo_empty) begin
+      serve_flush = 1'b1;
+    end else if (divert_waiting) begin
+      serve_divert = 1'b1;
+    end else if (!emergency && runway_active != 2'b11) begin  // If runways aren't full
+      if (contested) begin
+        unique case (schedule)
+          S_ALTERNATE:     serve_takeoff = takeoff_first;
+          S_TAKEOFF_FIRST: serve_takeoff = 1'b1;
+          S_LANDING_FIRST: serve_takeoff = 1'b0;
+          S_LONGEST_QUEUE: serve_takeoff = takeoff_count > landing_count;
+        endcase
+        serve_landing = !serve_takeoff;
+      end else begin
+        serve_takeoff = !takeoff_fifo_empty;
+        serve_landing = !landing_fifo_empty;
+      end
+    end
+  end
+
+  assign serve_queue = serve_flush | serve_divert | serve_takeoff | serve_landing;
+
   always_comb begin
     uart_rd_request       = 1'b0;
     queue_takeoff_plane   = 1'b0;
@@ -400,6 +678,7 @@ module ReadRequestFsm (
     send_invalid_id       = 1'b0;
     send_valid_id         = 1'b0;
     queue_reply           = 1'b0;
+    queue_urgent_reply    = 1'b0;
     lock                  = 1'b0;
     unlock                = 1'b0;
     runway_id             = 1'b0;
@@ -408,42 +687,40 @@ module ReadRequestFsm (
     take_id               = 1'b0;
     release_id            = 1'b0;
     sel_takeoff_id_lock   = 1'b0;
-    sel_diverted_id       = 1'b0;
+    take_snapshot         = 1'b0;
+    send_status           = 1'b0;
+    queue_status          = 1'b0;
+    send_echo             = 1'b0;
+    switch_rx_baud        = 1'b0;
+    switch_tx_baud        = 1'b0;
+    set_schedule          = 1'b0;
+    flush_landings        = 1'b0;
     reverse_takeoff_first = 1'b0;
     next_state            = QUIET;
 
     case (state)
       QUIET: begin
-        if (uart_empty) begin
-          if (emergency) begin
-            if (!landing_fifo_empty) begin
-              next_state            = DIVERT_LANDING;
-              unqueue_landing_plane = 1'b1;
-            end else next_state = QUIET;
-          end else if (runway_active != 2'b11) begin  // If runways aren't full
-            if (!takeoff_fifo_empty && !landing_fifo_empty) begin
-              if (takeoff_first) begin
-                next_state            = CLR_TAKEOFF;
-                unqueue_takeoff_plane = 1'b1;
-              end else begin
-                next_state            = CLR_LANDING;
-                unqueue_landing_plane = 1'b1;
-              end
-            end else if (!takeoff_fifo_empty) begin
-              next_state            = CLR_TAKEOFF;
-              unqueue_takeoff_plane = 1'b1;
-            end else if (!landing_fifo_empty) begin
-              next_state            = CLR_LANDING;
-              unqueue_landing_plane = 1'b1;
-            end else begin
-              next_state = QUIET;
-            end
+        // Fill every free runway before going back to the UART, but read a
+        // request after QUEUE_BURST services in a row so it can't starve
+        if (serve_queue && (uart_empty || queue_streak < QUEUE_BURST)) begin
+          if (serve_flush) begin
+            next_state = FLUSH_LANDINGS;
+          end else if (serve_divert) begin
+            next_state = DIVERT_LANDING;
+          end else if (serve_takeoff) begin
+            next_state            = CLR_TAKEOFF;
+            unqueue_takeoff_plane = 1'b1;
+            reverse_takeoff_first = contested;
           end else begin
-            next_state = QUIET;  // If runways are full don't clear anything
+            next_state            = CLR_LANDING;
+            unqueue_landing_plane = 1'b1;
+            reverse_takeoff_first = contested;
           end
-        end else begin
+        end else if (!uart_empty) begin
           next_state      = INTERPRET;
           uart_rd_request = 1'b1;
+        end else begin
+          next_state = QUIET;
         end
       end
 
@@ -499,10 +776,8 @@ module ReadRequestFsm (
           // It should still unlock runways normally.
           // It will not send out a special message of any kind
           if (msg_action == 1'b1) begin
-            if (!landing_fifo_empty) begin
-              next_state            = DIVERT_LANDING;  // Divert all landings
-              unqueue_landing_plane = 1'b1;
-            end else next_state = QUIET;
+            if (!landing_fifo_empty) next_state = FLUSH_LANDINGS;  // Divert all landings
+            else next_state = QUIET;
             // Declare emergency
             set_emergency = 1'b1;
           end else if (msg_action == 1'b0) begin
@@ -513,9 +788,24 @@ module ReadRequestFsm (
             release_id = 1'b1;
           end
         end else if (msg_type == T_ID_PLEASE) begin  // ID_PLEASE
+          // With the action bit set this is a host command instead, picked
+          // by the plane ID field.
           // When full, send action bits 11 to invalidate ID
           next_state = REPLY;
-          if (id_full) begin
+          if (msg_action) begin
+            if (plane_id == 4'b0000) begin  // Status query
+              next_state    = SEND_STATUS;
+              take_snapshot = 1'b1;
+            end else if (plane_id[3:2] == 2'b10) begin  // Baud rate change
+              send_echo      = 1'b1;
+              switch_rx_baud = 1'b1;
+            end else if (plane_id[3:2] == 2'b01) begin  // Scheduling policy
+              send_echo    = 1'b1;
+              set_schedule = 1'b1;
+            end else begin
+              send_say_ag = 1'b1;
+            end
+          end else if (id_full) begin
             send_invalid_id = 1'b1;
           end else begin
             send_valid_id = 1'b1;
@@ -532,39 +822,38 @@ module ReadRequestFsm (
         if (reply_fifo_full) begin
           next_state = REPLY;
         end else begin
-          next_state  = CHECK_QUEUES;
           queue_reply = 1'b1;
+          if (msg_type == T_ID_PLEASE && msg_action && plane_id[3:2] == 2'b10)
+            next_state = SWITCH_BAUD;
+          else next_state = CHECK_QUEUES;
+        end
+      end
+
+      SWITCH_BAUD: begin
+        // Nothing new is read until the echo has been sent at the old rate
+        if (uart_tx_idle) begin
+          next_state     = CHECK_QUEUES;
+          switch_tx_baud = 1'b1;
+        end else begin
+          next_state = SWITCH_BAUD;
         end
       end
 
       CHECK_QUEUES: begin
-        if (emergency) begin
-          if (!landing_fifo_empty) begin
-            next_state            = DIVERT_LANDING;
-            unqueue_landing_plane = 1'b1;
-          end else next_state = QUIET;
-        end else if (runway_active != 2'b11) begin  // If runways aren't full
-          if (!takeoff_fifo_empty && !landing_fifo_empty) begin
-            if (takeoff_first) begin
-              next_state            = CLR_TAKEOFF;
-              unqueue_takeoff_plane = 1'b1;
-              reverse_takeoff_first = 1'b1;
-            end else begin
-              next_state            = CLR_LANDING;
-              unqueue_landing_plane = 1'b1;
-              reverse_takeoff_first = 1'b1;
-            end
-          end else if (!takeoff_fifo_empty) begin
-            next_state            = CLR_TAKEOFF;
-            unqueue_takeoff_plane = 1'b1;
-          end else if (!landing_fifo_empty) begin
-            next_state            = CLR_LANDING;
-            unqueue_landing_plane = 1'b1;
-          end else begin
-            next_state = QUIET;
-          end
+        if (serve_flush) begin
+          next_state = FLUSH_LANDINGS;
+        end else if (serve_divert) begin
+          next_state = DIVERT_LANDING;
+        end else if (serve_takeoff) begin
+          next_state            = CLR_TAKEOFF;
+          unqueue_takeoff_plane = 1'b1;
+          reverse_takeoff_first = contested;
+        end else if (serve_landing) begin
+          next_state            = CLR_LANDING;
+          unqueue_landing_plane = 1'b1;
+          reverse_takeoff_first = contested;
         end else begin
-          next_state = QUIET;  // If runways are full don't clear anything
+          next_state = QUIET;
         end
       end
 
@@ -597,16 +886,41 @@ module ReadRequestFsm (
         end
       end
 
+      FLUSH_LANDINGS: begin
+        // Empties the landing queue and frees every ID in it at once
+        next_state     = DIVERT_LANDING;
+        flush_landings = 1'b1;
+      end
+
       DIVERT_LANDING: begin
         next_state          = QUEUE_CLR;
         send_divert_landing = 1'b1;
-        sel_diverted_id     = 1'b1;
-        release_id          = 1'b1;
+      end
+
+      SEND_STATUS: begin
+        next_state  = QUEUE_STATUS;
+        send_status = 1'b1;
+      end
+
+      QUEUE_STATUS: begin
+        if (reply_fifo_full) begin
+          next_state = QUEUE_STATUS;
+        end else begin
+          queue_status = 1'b1;
+          if (status_done) next_state = CHECK_QUEUES;
+          else next_state = SEND_STATUS;
+        end
       end
 
       QUEUE_CLR: begin
-        next_state  = QUIET;
-        queue_reply = 1'b1;
+        // Runway and queues are already updated, so wait for room rather
+        // than lose the clearance or divert.
+        if (urgent_fifo_full) begin
+          next_state = QUEUE_CLR;
+        end else begin
+          next_state         = QUIET;
+          queue_urgent_reply = 1'b1;
+        end
       end
 
       default: next_state = QUIET;
@@ -621,11 +935,21 @@ module ReadRequestFsm (
     end
   end
 
+  // S_ALTERNATE turns to the other queue after every clearance made while
+  // both queues wait, from QUIET as well as CHECK_QUEUES, so the clearances
+  // made as runway_override lifts alternate too.
   always_ff @(posedge clock) begin
     if (reset) takeoff_first <= 1'b0;
     else if (reverse_takeoff_first) takeoff_first <= ~takeoff_first;
   end
 
+  // Queue services since the last request was read
+  always_ff @(posedge clock) begin
+    if (reset || uart_rd_request) queue_streak <= '0;
+    else if ((unqueue_takeoff_plane || unqueue_landing_plane || send_divert_landing) && queue_streak != QUEUE_BURST)
+      queue_streak <= queue_streak + 1'b1;
+  end
+
 endmodule : ReadRequestFsm
 
 module SendReplyFsm (
@@ -633,7 +957,10 @@ module SendReplyFsm (
     input  logic reset,
     input  logic uart_tx_ready,
     input  logic reply_fifo_empty,
+    input  logic urgent_fifo_empty,
+    input  logic status_in_progress,
     output logic send_reply,
+    output logic send_urgent,
     output logic uart_tx_send
 );
 
@@ -646,14 +973,18 @@ module SendReplyFsm (
 
   always_comb begin
     send_reply   = 1'b0;
+    send_urgent  = 1'b0;
     uart_tx_send = 1'b0;
     unique case (state)
       WAIT: begin
-        if (reply_fifo_empty || !uart_tx_ready) next_state = WAIT;
-        else begin
+        if (!uart_tx_ready) next_state = WAIT;
+        else if (!urgent_fifo_empty && !status_in_progress) begin
+          next_state  = SEND;
+          send_urgent = 1'b1;
+        end else if (!reply_fifo_empty) begin
           next_state = SEND;
           send_reply = 1'b1;
-        end
+        end else next_state = WAIT;
       end
 
       SEND: begin
@@ -683,23 +1014,24 @@ endmodule : SendReplyFsm
 //    - Writes are processed on the clock edge
 //    - If a write is pending while the buffer is full, do nothing
 //    - If a read is pending while the buffer is empty, do nothing
+//    - count holds the number of entries currently in the buffer
 //
 module FIFO #(
     parameter int WIDTH = 8,
     int DEPTH = 4
 ) (
-    input  logic             clock,
-    input  logic             reset,
-    input  logic [WIDTH-1:0] data_in,
-    input  logic             we,
-    input  logic             re,
-    output logic [WIDTH-1:0] data_out,
-    output logic             full,
-    output logic             empty
+    input  logic                   clock,
+    input  logic                   reset,
+    input  logic [      WIDTH-1:0] data_in,
+    input  logic                   we,
+    input  logic                   re,
+    output logic [      WIDTH-1:0] data_out,
+    output logic                   full,
+    output logic                   empty,
+    output logic [$clog2(DEPTH):0] count
 );
 
   logic [DEPTH-1:0][WIDTH-1:0] queue;
-  logic [$clog2(DEPTH):0] count;
   logic [$clog2(DEPTH)-1:0] put_ptr, get_ptr;
 
   assign empty = (count == 0);
@@ -796,53 +1128,60 @@ endmodule : RunwayManager
 //  Keeps track of 16 IDs that can be assigned to aircraft entering the airspace
 //
 module AircraftIDManager (
-    input  logic        clock,       //! Clock signal
-    input  logic        reset,       //! Reset signal
-    input  logic [ 3:0] id_in,       //! Incoming ID to release
-    input  logic        release_id,  //! Assert for one cycle to free id_in ID
-    input  logic        take_id,     //! Assert for one cycle to claim id_out ID
-    output logic [ 3:0] id_out,      //! ID that is currently available
-    output logic [15:0] all_id,      //! Vector indicates which IDs are taken
-    output logic        full         //! High if all IDs are taken
+    input  logic        clock,         //! Clock signal
+    input  logic        reset,         //! Reset signal
+    input  logic [ 3:0] id_in,         //! Incoming ID to release
+    input  logic        release_id,    //! Assert for one cycle to free id_in ID
+    input  logic [15:0] release_mask,  //! Assert for one cycle to free several IDs
+    input  logic [15:0] reserved_id,   //! Free IDs that may not be handed out yet
+    input  logic        take_id,       //! Assert for one cycle to claim id_out ID
+    output logic [ 3:0] id_out,        //! ID that is currently available
+    output logic [15:0] all_id,        //! Vector indicates which IDs are taken
+    output logic        full           //! High if all IDs are taken
 );
 
   // TODO when a request is not made by ID in certain number of interpret
   // cycles, give up ID to someone else. 100 cycles?
 
   logic [15:0] taken_id;
+  logic [15:0] unavailable;
   logic [ 3:0] id_avail;
 
+  assign unavailable = taken_id | reserved_id;
+
   assign all_id = taken_id;
   assign id_out = id_avail;  // always available
-  assign full   = taken_id == 16'hFFFF;
+  assign full   = unavailable == 16'hFFFF;
 
   always_comb begin
     id_avail = 4'd0;
 
     case (1'b0)
-      taken_id[0]:  id_avail = 4'd0;
-      taken_id[1]:  id_avail = 4'd1;
-      taken_id[2]:  id_avail = 4'd2;
-      taken_id[3]:  id_avail = 4'd3;
-      taken_id[4]:  id_avail = 4'd4;
-      taken_id[5]:  id_avail = 4'd5;
-      taken_id[6]:  id_avail = 4'd6;
-      taken_id[7]:  id_avail = 4'd7;
-      taken_id[8]:  id_avail = 4'd8;
-      taken_id[9]:  id_avail = 4'd9;
-      taken_id[10]: id_avail = 4'd10;
-      taken_id[11]: id_avail = 4'd11;
-      taken_id[12]: id_avail = 4'd12;
-      taken_id[13]: id_avail = 4'd13;
-      taken_id[14]: id_avail = 4'd14;
-      taken_id[15]: id_avail = 4'd15;
-      default:      id_avail = 4'd0;
+      unavailable[0]:  id_avail = 4'd0;
+      unavailable[1]:  id_avail = 4'd1;
+      unavailable[2]:  id_avail = 4'd2;
+      unavailable[3]:  id_avail = 4'd3;
+      unavailable[4]:  id_avail = 4'd4;
+      unavailable[5]:  id_avail = 4'd5;
+      unavailable[6]:  id_avail = 4'd6;
+      unavailable[7]:  id_avail = 4'd7;
+      unavailable[8]:  id_avail = 4'd8;
+      unavailable[9]:  id_avail = 4'd9;
+      unavailable[10]: id_avail = 4'd10;
+      unavailable[11]: id_avail = 4'd11;
+      unavailable[12]: id_avail = 4'd12;
+      unavailable[13]: id_avail = 4'd13;
+      unavailable[14]: id_avail = 4'd14;
+      unavailable[15]: id_avail = 4'd15;
+      default:         id_avail = 4'd0;
     endcase
   end
 
   always_ff @(posedge clock) begin
     if (reset) begin
       taken_id <= '0;
+    end else if (release_mask != 0) begin
+      taken_id <= taken_id & ~release_mask;
     end else if (release_id) begin
       taken_id[id_in] <= 1'b0;
     end else if (take_id && !full) begin
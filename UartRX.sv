@@ -7,6 +7,7 @@ module UartRX #(
     input  logic       clock,
     input  logic       reset,
     input  logic       rx,             // Serial data input line
+    input  logic [1:0] baud_sel,       // Picks a BaudRateGenerator rate
     output logic [7:0] data,           // Data received
     output logic       done,           // High if data is fully received
     output logic       framing_error,
@@ -23,6 +24,7 @@ module UartRX #(
       .reset(reset),
       .start_rx(start),
       .start_tx(1'b0),
+      .baud_sel(baud_sel),
       .tick(tick)
   );
 
@@ -14,7 +14,7 @@ module UartTB (
   output logic framing_error
 );
 
-  UartTX dut_tx(.data(data_tx), .*);
-  UartRX dut_rx(.data(data_rx), .*);
+  UartTX dut_tx(.data(data_tx), .baud_sel(2'b00), .*);
+  UartRX dut_rx(.data(data_rx), .baud_sel(2'b00), .*);
 
 endmodule : UartTB
@@ -8,6 +8,7 @@ module UartTX #(
     input  logic       reset,
     input  logic       send,    // High to send data
     input  logic [7:0] data,    // Data to send
+    input  logic [1:0] baud_sel,  // Picks a BaudRateGenerator rate
     output logic       tx,      // Serial data output line
     output logic       ready,   // High if TX is not busy
     output logic       sending  // High when sending a packet
@@ -23,6 +24,7 @@ module UartTX #(
       .reset(reset),
       .start_rx(1'b0),
       .start_tx(start),
+      .baud_sel(baud_sel),
       .tick(tick)
   );
 
@@ -1,6 +1,10 @@
+import argparse
+import os
 import serial
+import socket
 import threading
-from time import sleep
+from collections import deque
+from time import monotonic, sleep
 
 T_REQUEST    = 0b000
 T_DECLARE    = 0b001
@@ -23,17 +27,66 @@ D_RUNWAY_1  = 0b1
 E_DECLARE    = 0b1
 E_RESOLVE    = 0b0
 
+I_NEW_ID     = 0b0 # ID please
+I_COMMAND    = 0b1
+
+H_STATUS     = 0b0000 # Host command, sent in the plane ID field
+H_BAUD       = 0b1000 # Low two bits pick the rate from BAUD_RATES
+H_SCHEDULE   = 0b0100 # Low two bits pick the policy from SCHEDULES
+
+BAUD_RATES   = [115200, 460800, 921600, 1000000]
+SCHEDULES    = ["alternate", "takeoff-first", "landing-first", "longest-queue"]
+
+STATUS_HEADER = 0xFF # Starts a status snapshot, followed by 7 bytes
+STATUS_LENGTH = 7
+
+# Honor Bob's CTS pin so requests can be sent back to back. Needs cts_n
+# (GP[27]) wired to the adapter's CTS input, see --no-flow-control.
+FLOW_CONTROL = True
+
+MAX_BACKLOG = 4096 # Replies held for a client that stopped reading before it is cut off
+
 ser = serial.Serial()
 stop_flag = False
+dashboard_mode = False
+router = None
+trace = None
+trace_lock = threading.Lock()
+trace_start = 0
+latest_status = None
+status_ready = threading.Event()
+baud_ack = threading.Event()
 
 def initialize_serial():
   ser.baudrate = 115200
   ser.port = '/dev/cu.usbserial-A10MPCQ8'
   ser.timeout = 0
+  ser.rtscts = FLOW_CONTROL
   if ser.isOpen(): ser.close()
   ser.open()
   print(f"Opened serial port at {ser.name}")
 
+def open_trace(path):
+  global trace, trace_start
+  # Line buffered, so a session that ends on Ctrl-C or a crash still has
+  # every event up to then
+  trace = open(path, "w", buffering=1)
+  trace_start = monotonic()
+  record(f"baud {ser.baudrate}")
+
+def record(event):
+  # One line per event, "<seconds> > 0e" for a byte to Bob, "< 1e" for a
+  # byte from Bob and "baud <rate>" when the port changes rate, so a trace
+  # can be replayed without loading it whole
+  if trace is None:
+    return
+  with trace_lock:
+    trace.write(f"{monotonic() - trace_start:.6f} {event}\n")
+
+def write_byte(data):
+  record(f"> {data:02x}")
+  ser.write(bytes([data]))
+
 def interpret(data):
   reply = ord(data)
   print("***************************************************")
@@ -61,7 +114,14 @@ def translate(request):
   action = request & 0b1
   print("***************************************************")
   if type == T_ID_PLEASE:
-    print(f"New Plane    : Requesting ID for entry")
+    if action == I_COMMAND and id == H_STATUS:
+      print(f"Host         : Requesting status")
+    elif action == I_COMMAND and (id & 0b1100) == H_BAUD:
+      print(f"Host         : Requesting {BAUD_RATES[id & 0b11]} baud")
+    elif action == I_COMMAND and (id & 0b1100) == H_SCHEDULE:
+      print(f"Host         : Requesting {SCHEDULES[id & 0b11]} scheduling")
+    else:
+      print(f"New Plane    : Requesting ID for entry")
   elif type == T_REQUEST:
     if action == R_TAKEOFF:
       print(f"Plane {"{:02d}".format(id)}     : Requesting takeoff")
@@ -81,27 +141,379 @@ def translate(request):
     print(f"Plane {"{:02d}".format(id)}     : Making invalid request")
   print("***************************************************")
         
+def parse_status(snapshot):
+  return {
+    "all_id"        : (snapshot[0] << 8) | snapshot[1],
+    "runway"        : [(snapshot[2] & 0xF, snapshot[3] & 0b1),
+                       (snapshot[2] >> 4, (snapshot[3] >> 1) & 0b1)],
+    "emergency"     : (snapshot[3] >> 3) & 0b1,
+    "emergency_id"  : snapshot[3] >> 4,
+    "takeoff_queue" : snapshot[4] >> 4,
+    "landing_queue" : snapshot[4] & 0xF,
+    "reply_queue"   : snapshot[5] >> 4,
+    "urgent_queue"  : snapshot[5] & 0xF,
+    "request_queue" : snapshot[6] >> 4,
+    "schedule"      : SCHEDULES[snapshot[6] & 0b11]
+  }
+
+def print_status(state):
+  print("***************************************************")
+  print(f"Bob          : IDs taken {state['all_id']:016b}")
+  for i, (plane, active) in enumerate(state["runway"]):
+    if active:
+      print(f"Bob          : Runway {i} locked by plane {plane:02d}")
+    else:
+      print(f"Bob          : Runway {i} free")
+  if state["emergency"]:
+    print(f"Bob          : Emergency declared by plane {state['emergency_id']:02d}")
+  print(f"Bob          : Takeoff queue {state['takeoff_queue']}, landing queue {state['landing_queue']}, {state['schedule']} scheduling")
+  print(f"Bob          : Requests {state['request_queue']}, replies {state['reply_queue']}, urgent replies {state['urgent_queue']}")
+  print("***************************************************")
+
+def status(timeout=1):
+  # Ask Bob for a snapshot and wait for the reader thread to decode it
+  status_ready.clear()
+  write_byte((H_STATUS << 4) + (T_ID_PLEASE << 1) + I_COMMAND)
+  if not status_ready.wait(timeout):
+    return None
+  return latest_status
+
+def set_baud_rate(rate, timeout=1):
+  # Bob echoes the command at the old rate and switches once it has gone
+  # out, so only change the port after the echo arrives. Nothing else may be
+  # sent in between.
+  old_rate = ser.baudrate
+  ser.baudrate = rate # Raises before Bob is touched if the adapter can't
+  ser.baudrate = old_rate
+  command = ((H_BAUD + BAUD_RATES.index(rate)) << 4) + (T_ID_PLEASE << 1) + I_COMMAND
+  baud_ack.clear()
+  write_byte(command)
+  if not baud_ack.wait(timeout):
+    return False
+  ser.baudrate = rate
+  record(f"baud {rate}")
+  # Make sure both ends agree before going on
+  return status(timeout) is not None
+
+def set_schedule(policy):
+  # Bob echoes the command once the new policy is in place
+  write_byte(((H_SCHEDULE + SCHEDULES.index(policy)) << 4) + (T_ID_PLEASE << 1) + I_COMMAND)
+
+def negotiate_baud_rate(fastest):
+  # Walk down from the fastest rate asked for until the adapter supports one
+  for rate in reversed(BAUD_RATES):
+    if rate > fastest or rate == ser.baudrate:
+      continue
+    try:
+      if not set_baud_rate(rate):
+        print(f"Lost Bob while switching to {rate} baud, reset the board")
+      break
+    except (ValueError, serial.SerialException):
+      continue
+  return ser.baudrate
+
+def dashboard(interval):
+  global stop_flag
+  try:
+    while True:
+      state = status()
+      print("\033[2J\033[H", end="")
+      if state is None:
+        print("Bob did not answer the status request")
+      else:
+        print_status(state)
+      sleep(interval)
+  except KeyboardInterrupt:
+    stop_flag = True
+
 def keep_reading():
+  global latest_status
+  snapshot = None
   while not stop_flag:
     data = ser.read(1)
     if len(data) > 0:
-      interpret(data)
+      record(f"< {data[0]:02x}")
+      if router is not None:
+        router.reply(data[0])
+      elif snapshot is not None:
+        snapshot.append(data[0])
+        if len(snapshot) == STATUS_LENGTH:
+          latest_status = parse_status(snapshot)
+          status_ready.set()
+          if not dashboard_mode:
+            print_status(latest_status)
+          snapshot = None
+      elif data[0] == STATUS_HEADER:
+        snapshot = []
+      elif (data[0] >> 6) == (H_BAUD >> 2) and (data[0] & 0b1111) == (T_ID_PLEASE << 1) + I_COMMAND:
+        baud_ack.set()
+      elif (data[0] >> 6) == (H_SCHEDULE >> 2) and (data[0] & 0b1111) == (T_ID_PLEASE << 1) + I_COMMAND:
+        if not dashboard_mode:
+          print(f"Bob          : Switched to {SCHEDULES[(data[0] >> 4) & 0b11]} scheduling")
+      elif not dashboard_mode:
+        interpret(data)
 
-# Main routine
-initialize_serial()
-t1 = threading.Thread(target=keep_reading, args=())
-t1.start()
-while True:
-  id =      int(input("Plane ID     : "))
-  if id == 44:
+class Client:
+  def __init__(self, conn, name):
+    self.conn = conn
+    self.name = name
+    self.pending = deque()
+    # Replies wait here for the client's own writer thread, so one client
+    # that stops reading can't hold up Bob or the other clients
+    self.outbox = deque()
+    self.ready = threading.Condition()
+    self.closed = False
+
+class Router:
+  # Shares the serial port between socket clients. Each client speaks the
+  # same bytes as the UART. Requests go out one byte per client in turn, and
+  # each reply goes back to the client that owns its plane ID. A client owns
+  # an ID once Bob hands it out in answer to that client's ID please, or once
+  # it sends a request for that plane, so clearances and diverts that arrive
+  # later still find their way home.
+  def __init__(self):
+    self.lock = threading.Lock()
+    self.work = threading.Condition(self.lock)
+    self.clients = []
+    self.turn = 0
+    self.owner = [None] * 16
+    # Replies that carry no plane ID come back in the order they were asked for
+    self.id_waiting = deque()
+    self.status_waiting = deque()
+    self.echo_waiting = deque()
+    self.status_client = None
+    self.status_left = 0
+
+  def add(self, conn, name):
+    client = Client(conn, name)
+    with self.lock:
+      self.clients.append(client)
+    print(f"Client {name} connected")
+    threading.Thread(target=self.read_client, args=(client,), daemon=True).start()
+    threading.Thread(target=self.write_client, args=(client,), daemon=True).start()
+
+  def read_client(self, client):
+    while True:
+      try:
+        data = client.conn.recv(256)
+      except OSError:
+        data = b""
+      if not data:
+        break
+      with self.lock:
+        client.pending.extend(data)
+        self.work.notify()
+    self.remove(client)
+
+  def write_client(self, client):
+    while True:
+      with client.ready:
+        while not client.outbox and not client.closed:
+          client.ready.wait()
+        if client.closed:
+          return
+        data = bytes(client.outbox)
+        client.outbox.clear()
+      try:
+        client.conn.sendall(data)
+      except OSError:
+        return # Its reader thread cleans up
+
+  def remove(self, client):
+    with self.lock:
+      self.clients.remove(client)
+      self.owner = [None if owner is client else owner for owner in self.owner]
+      # Keep the places in line so later replies still match up
+      for waiting in (self.id_waiting, self.status_waiting, self.echo_waiting):
+        for i, owner in enumerate(waiting):
+          if owner is client:
+            waiting[i] = None
+      if self.status_client is client:
+        self.status_client = None
+    with client.ready:
+      client.closed = True
+      client.ready.notify()
+    hang_up(client.conn)
+    client.conn.close()
+    print(f"Client {client.name} disconnected")
+
+  def next_request(self):
+    # Round robin, one byte at a time, so a busy client can't starve the rest
+    while True:
+      with self.work:
+        client = None
+        while client is None:
+          for i in range(len(self.clients)):
+            client = self.clients[(self.turn + i) % len(self.clients)]
+            if client.pending:
+              self.turn = (self.turn + i + 1) % len(self.clients)
+              break
+          else:
+            client = None
+            self.work.wait()
+        request = client.pending.popleft()
+        forward = self.expect(client, request)
+      if forward:
+        return request
+      # Answered here instead
+      self.send(client, (request & 0xF0) + (T_SAY_AGAIN << 1))
+
+  def expect(self, client, request):
+    # Notes who gets the reply before the request goes out, since Bob can
+    # answer before write() returns. Returns False for a request that must
+    # not reach Bob.
+    id = request >> 4
+    type = (request >> 1) & 0b111
+    action = request & 0b1
+    if type == T_ID_PLEASE and action == I_NEW_ID:
+      self.id_waiting.append(client)
+    elif type == T_ID_PLEASE and id == H_STATUS:
+      self.status_waiting.append(client)
+    elif type == T_ID_PLEASE and (id & 0b1100) == H_SCHEDULE:
+      self.echo_waiting.append(client)
+    elif type == T_ID_PLEASE:
+      # Only the daemon may change the rate, every client would lose Bob.
+      # Bob says again to any other host command, with the command in the
+      # plane ID field, so that reply would go to whoever owns the plane.
+      return False
+    else:
+      self.owner[id] = client
+    return True
+
+  def write_requests(self):
+    while not stop_flag:
+      write_byte(self.next_request())
+
+  def reply(self, data):
+    with self.lock:
+      client = self.route(data)
+    self.send(client, data)
+
+  def route(self, data):
+    # Picks the client a reply from Bob goes to, called with the lock held
+    if self.status_left > 0:
+      self.status_left -= 1
+      return self.status_client
+    id = data >> 4
+    type = (data >> 1) & 0b111
+    action = data & 0b1
+    if data == STATUS_HEADER and self.status_waiting:
+      self.status_client = self.status_waiting.popleft()
+      self.status_left = STATUS_LENGTH
+      return self.status_client
+    if type == T_ID_PLEASE and action == I_COMMAND and (id & 0b1100) == H_SCHEDULE and self.echo_waiting:
+      return self.echo_waiting.popleft()
+    if type == T_ID_PLEASE and (action == I_NEW_ID or id == 0) and self.id_waiting:
+      client = self.id_waiting.popleft()
+      if action == I_NEW_ID:
+        self.owner[id] = client
+      return client
+    if self.owner[id] is None:
+      print(f"Bob          : No client owns plane {id:02d}, dropped reply {data:08b}")
+    return self.owner[id]
+
+  def send(self, client, data):
+    # Never blocks, the client's writer thread does the sending
+    if client is None:
+      return
+    with client.ready:
+      if client.closed:
+        return
+      stalled = len(client.outbox) >= MAX_BACKLOG
+      if stalled:
+        client.closed = True
+      else:
+        client.outbox.append(data)
+      client.ready.notify()
+    if stalled:
+      # Its reader thread sees the hang up and cleans up
+      print(f"Client {client.name} stopped reading, disconnecting it")
+      hang_up(client.conn)
+
+def hang_up(conn):
+  # Wakes up any thread still blocked on the socket
+  try:
+    conn.shutdown(socket.SHUT_RDWR)
+  except OSError:
+    pass
+
+def serve(address):
+  # address is PORT or HOST:PORT for TCP, or a path for a Unix socket
+  global router, stop_flag
+  if "/" in address:
+    if os.path.exists(address):
+      os.remove(address)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(address)
+  else:
+    host, _, port = address.rpartition(":")
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host or "127.0.0.1", int(port)))
+  listener.listen()
+  router = Router()
+  threading.Thread(target=router.write_requests, daemon=True).start()
+  print(f"Sharing Bob on {address}")
+  try:
+    count = 0
+    while True:
+      conn, _ = listener.accept()
+      count += 1
+      router.add(conn, count)
+  except KeyboardInterrupt:
     stop_flag = True
-    break
-  request = int(input("Request type : "))
-  action =  int(input("Action bit   : "))
-  packet = (id << 4) + (request << 1) + action
-  translate(packet)
-  ser.write(bytes([packet]))
-  sleep(0.5)
-t1.join()
-ser.close()
-print("\nClosed serial port")
\ No newline at end of file
+  finally:
+    listener.close()
+    if "/" in address:
+      os.remove(address)
+
+# Main routine
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--dashboard", type=float, metavar="SECONDS",
+                      help="poll Bob's status every SECONDS instead of sending requests")
+  parser.add_argument("--baud", type=int, choices=BAUD_RATES, default=BAUD_RATES[0],
+                      help="fastest baud rate to try after connecting")
+  parser.add_argument("--schedule", choices=SCHEDULES,
+                      help="policy Bob uses when planes are waiting to both take off and land")
+  parser.add_argument("--serve", metavar="ADDRESS",
+                      help="share Bob with local clients on a TCP PORT, HOST:PORT, or Unix socket path")
+  parser.add_argument("--record", metavar="FILE",
+                      help="log every byte to and from Bob with its time, for replaying in simulation")
+  parser.add_argument("--no-flow-control", action="store_true",
+                      help="ignore CTS, for adapters without cts_n wired to CTS or bitstreams without cts_n")
+  args = parser.parse_args()
+
+  FLOW_CONTROL = not args.no_flow_control
+  initialize_serial()
+  if args.record:
+    # Reset the board first, the replay starts from a freshly reset Bob
+    open_trace(args.record)
+  t1 = threading.Thread(target=keep_reading, args=())
+  t1.start()
+  if args.baud != ser.baudrate:
+    print(f"Talking to Bob at {negotiate_baud_rate(args.baud)} baud")
+  if args.schedule:
+    set_schedule(args.schedule)
+  if args.serve:
+    serve(args.serve)
+  elif args.dashboard:
+    dashboard_mode = True
+    dashboard(args.dashboard)
+  else:
+    while True:
+      id =      int(input("Plane ID     : "))
+      if id == 44:
+        stop_flag = True
+        break
+      request = int(input("Request type : "))
+      action =  int(input("Action bit   : "))
+      packet = (id << 4) + (request << 1) + action
+      translate(packet)
+      write_byte(packet)
+      sleep(0.5)
+  t1.join()
+  ser.close()
+  if trace is not None:
+    trace.close()
+  print("\nClosed serial port")
@@ -0,0 +1,445 @@
+import argparse
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import zipfile
+from array import array
+from collections import deque
+
+# Streams a VCD/FST/VPD dump of BobTop and turns it into transactions and
+# occupancy metrics without loading the dump. FST and VPD dumps are piped
+# through fst2vcd/vpd2vcd, so any of them can be gigabytes long.
+#
+#   python bobATC_waves.py test/sim_build/BobTop.fst -o run.npz
+#
+# The .npz holds one array per column, load it with numpy.load:
+#   messages_* : every decoded UART frame (line 0 is rx, 1 is tx), from the
+#                start bit to the middle of the stop bit
+#   latency_*  : request to reply pairs, see the K_ kinds below. Latency runs
+#                from the end of the request to the start of the reply.
+#   state_*    : ReadRequestFsm state changes
+#   fifo_*     : FIFO count changes, fifo_index follows FIFO_NAMES
+# Times are in ns.
+
+T_REQUEST    = 0b000
+T_DECLARE    = 0b001
+T_EMERGENCY  = 0b010
+T_CLEAR      = 0b011
+T_HOLD       = 0b100
+T_SAY_AGAIN  = 0b101
+T_DIVERT     = 0b110
+T_ID_PLEASE  = 0b111
+
+H_STATUS     = 0b0000 # Host command, sent in the plane ID field
+
+BAUD_RATES   = [115200, 460800, 921600, 1000000]
+
+STATUS_HEADER = 0xFF # Starts a status snapshot, followed by 7 bytes
+STATUS_LENGTH = 7
+
+STATE_NAMES  = ["QUIET", "INTERPRET", "REPLY", "CHECK_QUEUES", "CLR_TAKEOFF", "CLR_LANDING",
+                "DIVERT_LANDING", "QUEUE_CLR", "SEND_STATUS", "QUEUE_STATUS", "SWITCH_BAUD",
+                "FLUSH_LANDINGS"]
+
+FIFO_NAMES   = ["uart_requests", "takeoff_fifo", "landing_fifo", "uart_replies", "urgent_replies"]
+
+K_REPLY      = 0 # First reply to a request
+K_DEFERRED   = 1 # Clearance or divert for a plane that was told to hold
+K_STATUS     = 2 # Status snapshot header
+K_ECHO       = 3 # Host command echo
+
+MAX_OUTSTANDING = 64 # Requests kept per plane while waiting for a reply
+
+CONVERTERS   = {".fst": "fst2vcd", ".vpd": "vpd2vcd"}
+
+TIME_UNITS   = {"s": 1e9, "ms": 1e6, "us": 1e3, "ns": 1.0, "ps": 1e-3, "fs": 1e-6}
+
+class Column:
+  # One .npy file written as values arrive, the length is patched in at close
+  HEADER_LENGTH = 128
+
+  def __init__(self, path, typecode):
+    self.path = path
+    self.typecode = typecode
+    self.values = array(typecode)
+    self.length = 0
+    self.file = open(path, "wb")
+    self.file.write(self.header())
+
+  def header(self):
+    order = "<" if sys.byteorder == "little" else ">"
+    descr = order + {"B": "u1", "H": "u2", "q": "i8", "d": "f8"}[self.typecode]
+    text = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (descr, self.length)
+    text = text.ljust(self.HEADER_LENGTH - 11) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(text)) + text.encode("latin1")
+
+  def append(self, value):
+    self.values.append(value)
+    if len(self.values) >= 65536:
+      self.flush()
+
+  def flush(self):
+    self.length += len(self.values)
+    self.values.tofile(self.file)
+    self.values = array(self.typecode)
+
+  def close(self):
+    self.flush()
+    self.file.seek(0)
+    self.file.write(self.header())
+    self.file.close()
+
+class Table:
+  def __init__(self, directory, name, columns):
+    self.columns = [Column(os.path.join(directory, f"{name}_{column}.npy"), typecode)
+                    for column, typecode in columns]
+
+  def append(self, *row):
+    for column, value in zip(self.columns, row):
+      column.append(value)
+
+  def close(self):
+    for column in self.columns:
+      column.close()
+
+class UartDecoder:
+  # Rebuilds 8N1 frames from the changes on one line, sampling mid bit
+  def __init__(self, bit_ns, on_frame):
+    self.bit_ns = bit_ns
+    self.on_frame = on_frame
+    self.level = 1
+    self.start = None
+    self.frame_bit_ns = bit_ns
+    self.sample = 0
+    self.data = 0
+    self.framing_errors = 0
+
+  def advance(self, time):
+    # Takes every sample that falls before time, the line held its level
+    while self.start is not None:
+      sample_time = self.start + (self.sample + 0.5) * self.frame_bit_ns
+      if sample_time >= time:
+        return
+      if self.sample == 0:
+        if self.level != 0:  # Glitch, not a start bit
+          self.start = None
+          return
+      elif self.sample <= 8:
+        self.data |= self.level << (self.sample - 1)
+      else:
+        if self.level == 1:
+          self.on_frame(self.start, sample_time, self.data)
+        else:
+          self.framing_errors += 1
+        self.start = None
+        return
+      self.sample += 1
+
+  def change(self, time, level):
+    if level is None:
+      return
+    self.advance(time)
+    if self.start is None and self.level == 1 and level == 0:
+      self.start = time
+      self.frame_bit_ns = self.bit_ns
+      self.sample = 0
+      self.data = 0
+    self.level = level
+
+class Matcher:
+  # Pairs each reply with the request that caused it. Clearances and
+  # emergency diverts arrive unprompted, so they are paired with the request
+  # that was answered with a hold.
+  def __init__(self, table):
+    self.table = table
+    self.outstanding = [deque() for _ in range(16)]
+    self.held = [None] * 16
+    self.id_requests = deque()
+    self.status_requests = deque()
+    self.echo_requests = deque()
+    self.status_left = 0
+    self.unanswered = 0
+    self.unmatched = 0
+    self.count = [0] * 4
+    self.total = [0.0] * 4
+    self.worst = [0.0] * 4
+
+  def keep(self, queue, entry):
+    if len(queue) == MAX_OUTSTANDING:
+      queue.popleft()
+      self.unanswered += 1
+    queue.append(entry)
+
+  def request(self, end, data):
+    plane = data >> 4
+    type = (data >> 1) & 0b111
+    action = data & 0b1
+    if type == T_ID_PLEASE:
+      if action == 0:
+        self.keep(self.id_requests, (end, data))
+      elif plane == H_STATUS:
+        self.keep(self.status_requests, (end, data))
+      elif plane >> 2 in (0b01, 0b10):  # Schedule and baud changes are echoed
+        self.keep(self.echo_requests, (end, data))
+      else:
+        self.keep(self.outstanding[plane], (end, data, (T_SAY_AGAIN,)))
+    elif type == T_REQUEST:
+      self.keep(self.outstanding[plane], (end, data, (T_HOLD, T_DIVERT)))
+    elif type not in (T_DECLARE, T_EMERGENCY):
+      self.keep(self.outstanding[plane], (end, data, (T_SAY_AGAIN,)))
+
+  def record(self, kind, request, start, data, plane):
+    latency = start - request[0]
+    self.table.append(request[0], start, latency, plane, request[1], data, kind)
+    self.count[kind] += 1
+    self.total[kind] += latency
+    self.worst[kind] = max(self.worst[kind], latency)
+
+  def reply(self, start, data):
+    if self.status_left:
+      self.status_left -= 1
+      return
+    plane = data >> 4
+    type = (data >> 1) & 0b111
+    if data == STATUS_HEADER and self.status_requests:
+      self.status_left = STATUS_LENGTH
+      self.record(K_STATUS, self.status_requests.popleft(), start, data, plane)
+    elif type == T_ID_PLEASE:
+      if self.echo_requests and self.echo_requests[0][1] == data:
+        self.record(K_ECHO, self.echo_requests.popleft(), start, data, plane)
+      elif self.id_requests:
+        self.record(K_REPLY, self.id_requests.popleft(), start, data, plane)
+      else:
+        self.unmatched += 1
+    elif type in (T_CLEAR, T_DIVERT) and self.held[plane] is not None:
+      self.record(K_DEFERRED, self.held[plane], start, data, plane)
+      self.held[plane] = None
+    elif type == T_CLEAR:
+      self.unmatched += 1
+    else:
+      # Replies to one plane come back in order, so older requests that
+      # can't have led to this reply were never answered
+      queue = self.outstanding[plane]
+      while queue and type not in queue[0][2]:
+        queue.popleft()
+        self.unanswered += 1
+      if queue:
+        request = queue.popleft()
+        self.record(K_REPLY, request, start, data, plane)
+        if type == T_HOLD:
+          self.held[plane] = request
+      else:
+        self.unmatched += 1
+
+class Residency:
+  # Time spent at each value of a signal, plus its time weighted mean
+  def __init__(self, table=None, index=None):
+    self.table = table
+    self.index = index
+    self.value = None
+    self.since = None
+    self.time = {}
+    self.peak = 0
+
+  def change(self, time, value):
+    if value is None:
+      return
+    self.settle(time)
+    self.value = value
+    self.since = time
+    self.peak = max(self.peak, value)
+    if self.table is not None:
+      if self.index is None:
+        self.table.append(time, value)
+      else:
+        self.table.append(time, self.index, value)
+
+  def settle(self, time):
+    if self.value is not None:
+      self.time[self.value] = self.time.get(self.value, 0.0) + time - self.since
+      self.since = time
+
+  def mean(self):
+    total = sum(self.time.values())
+    return sum(value * time for value, time in self.time.items()) / total if total else 0.0
+
+def open_dump(path):
+  if path == "-":
+    return sys.stdin, None
+  converter = CONVERTERS.get(os.path.splitext(path)[1].lower())
+  if converter is None:
+    return open(path, "r", errors="replace"), None
+  process = subprocess.Popen([converter, path], stdout=subprocess.PIPE, text=True, errors="replace")
+  return process.stdout, process
+
+def read_header(stream):
+  # Returns the ns per time unit and every variable as (code, path)
+  scale = 1.0
+  scopes = []
+  variables = []
+  tokens = []
+  for line in stream:
+    tokens.extend(line.split())
+    while "$end" in tokens:
+      end = tokens.index("$end")
+      command, arguments, tokens = tokens[0], tokens[1:end], tokens[end + 1:]
+      if command == "$timescale":
+        text = "".join(arguments)
+        digits = text.rstrip("munpfs")
+        scale = float(digits or 1) * TIME_UNITS[text[len(digits):]]
+      elif command == "$scope":
+        scopes.append(arguments[-1])
+      elif command == "$upscope":
+        scopes.pop()
+      elif command == "$var":
+        variables.append((arguments[2], ".".join(scopes + [arguments[3]])))
+      elif command == "$enddefinitions":
+        return scale, variables
+  raise ValueError("dump ended before $enddefinitions")
+
+def find(variables, suffix):
+  # Shortest path wins, so the top level rx beats the one inside UartRX.
+  # Signals the dump lists in several scopes share a code, only distinct
+  # codes at the shortest depth are ambiguous. Verilator repeats the top
+  # level ports under $rootio, those copies are left out.
+  matches = [(path.count("."), code, path) for code, path in variables
+             if (path == suffix or path.endswith("." + suffix)) and not path.startswith("$")]
+  if not matches:
+    return None
+  depth = min(matches)[0]
+  shortest = {code: path for count, code, path in matches if count == depth}
+  if len(shortest) > 1:
+    raise ValueError(f"{suffix} matches {', '.join(sorted(shortest.values()))}")
+  return next(iter(shortest))
+
+def analyze(stream, output, baud, rx_name, tx_name):
+  scale, variables = read_header(stream)
+  directory = tempfile.mkdtemp()
+  messages = Table(directory, "messages", [("time", "d"), ("end", "d"), ("line", "B"), ("data", "B")])
+  latency  = Table(directory, "latency", [("request_time", "d"), ("reply_time", "d"), ("latency", "d"),
+                                          ("plane_id", "B"), ("request", "B"), ("reply", "B"), ("kind", "B")])
+  states   = Table(directory, "state", [("time", "d"), ("state", "B")])
+  fifos    = Table(directory, "fifo", [("time", "d"), ("fifo_index", "B"), ("fifo_count", "H")])
+  tables   = [messages, latency, states, fifos]
+
+  matcher = Matcher(latency)
+
+  def on_request(start, end, data):
+    messages.append(start, end, 0, data)
+    matcher.request(end, data)
+
+  def on_reply(start, end, data):
+    messages.append(start, end, 1, data)
+    matcher.reply(start, data)
+
+  rx = UartDecoder(1e9 / baud, on_request)
+  tx = UartDecoder(1e9 / baud, on_reply)
+  state = Residency(states)
+  occupancy = [Residency(fifos, i) for i in range(len(FIFO_NAMES))]
+
+  def baud_sel(decoder):
+    def change(time, value):
+      if value is not None:
+        decoder.bit_ns = 1e9 / BAUD_RATES[value]
+    return change
+
+  watches = {}
+  def watch(suffix, handler, required=False):
+    code = find(variables, suffix)
+    if code is None:
+      if required:
+        raise ValueError(f"no {suffix} signal in the dump")
+      print(f"Skipping {suffix}, not in the dump")
+      return
+    watches.setdefault(code, []).append(handler)
+
+  watch(rx_name, rx.change, required=True)
+  watch(tx_name, tx.change, required=True)
+  watch("rx_baud_sel", baud_sel(rx))
+  watch("tx_baud_sel", baud_sel(tx))
+  watch("bobby.fsm.state", state.change)
+  for name, fifo in zip(FIFO_NAMES, occupancy):
+    watch(name + ".count", fifo.change)
+
+  time = 0.0
+  vector = None
+  skipping = False
+  for line in stream:
+    for token in line.split():
+      if skipping:
+        skipping = token != "$end"
+      elif vector is not None:
+        if token in watches:
+          value = int(vector, 2) if vector.strip("01") == "" else None
+          for handler in watches[token]:
+            handler(time, value)
+        vector = None
+      elif token[0] == "#":
+        time = int(token[1:]) * scale
+        rx.advance(time)
+        tx.advance(time)
+      elif token[0] in "01xXzZ":
+        handlers = watches.get(token[1:])
+        if handlers:
+          value = int(token[0]) if token[0] in "01" else None
+          for handler in handlers:
+            handler(time, value)
+      elif token[0] in "bBrR":
+        vector = token[1:] if token[0] in "bB" else "x"
+      elif token == "$comment":
+        skipping = True
+
+  rx.advance(float("inf"))
+  tx.advance(float("inf"))
+  state.settle(time)
+  for fifo in occupancy:
+    fifo.settle(time)
+
+  for table in tables:
+    table.close()
+  with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+    for table in tables:
+      for column in table.columns:
+        archive.write(column.path, os.path.basename(column.path))
+  shutil.rmtree(directory)
+
+  report(time, rx, tx, matcher, state, occupancy)
+
+def report(time, rx, tx, matcher, state, occupancy):
+  print("***************************************************")
+  print(f"Dump         : {time / 1e6:.3f} ms, {rx.framing_errors + tx.framing_errors} framing errors")
+  print(f"UART         : {matcher.unanswered} requests unanswered, {matcher.unmatched} replies unmatched")
+  for kind, name in enumerate(["Replies", "Deferred", "Status", "Echoes"]):
+    if matcher.count[kind]:
+      print(f"{name:<13}: {matcher.count[kind]}, mean latency {matcher.total[kind] / matcher.count[kind] / 1e3:.1f} us, "
+            f"worst {matcher.worst[kind] / 1e3:.1f} us")
+  total = sum(state.time.values())
+  for value, spent in sorted(state.time.items()):
+    name = STATE_NAMES[value] if value < len(STATE_NAMES) else f"STATE_{value}"
+    print(f"State        : {name:<15} {100 * spent / total:6.2f}%")
+  for name, fifo in zip(FIFO_NAMES, occupancy):
+    if fifo.time:
+      print(f"FIFO         : {name:<15} mean {fifo.mean():.2f}, peak {fifo.peak}")
+  print("***************************************************")
+
+# Main routine
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument("dump", help="VCD, FST or VPD dump of BobTop, or - for VCD on stdin")
+  parser.add_argument("-o", "--output", default="waves.npz", help="columnar output for numpy.load")
+  parser.add_argument("--baud", type=int, choices=BAUD_RATES, default=BAUD_RATES[0],
+                      help="rate used until a baud_sel signal in the dump says otherwise")
+  parser.add_argument("--rx", default="rx", help="request line, matched on the end of its path")
+  parser.add_argument("--tx", default="tx", help="reply line, matched on the end of its path")
+  args = parser.parse_args()
+
+  stream, process = open_dump(args.dump)
+  try:
+    analyze(stream, args.output, args.baud, args.rx, args.tx)
+  finally:
+    if process is not None:
+      process.stdout.close()
+      process.wait()
@@ -0,0 +1,32 @@
+`default_nettype none
+
+//
+//  Module 'BobFPGA'
+//
+//  Board wrapper around BobTop for the ULX3S. The reset button is active low,
+//  and the baud strap has no pins, so Bob always comes out of reset at
+//  115200 baud and the host raises the rate with a baud command.
+//  netlists.sh renames this module to BobTop in fpga/BobFPGA.v.
+//
+module BobFPGA (
+    input  logic       clock,
+    input  logic       reset_n,
+    input  logic       rx,
+    input  logic [1:0] runway_override,
+    input  logic       emergency_override,
+    output logic       tx,
+    output logic       framing_error,
+    output logic [1:0] runway_active,
+    output logic       emergency,
+    output logic       receiving,
+    output logic       sending,
+    output logic       cts_n
+);
+
+  BobTop bob (
+      .reset(~reset_n),
+      .baud_strap(2'b00),
+      .*
+  );
+
+endmodule : BobFPGA
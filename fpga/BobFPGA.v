@@ -1,1207 +1,5610 @@
-`default_nettype none
-module BobTop (
-	clock,
-	reset_n,
-	rx,
-	runway_override,
-	emergency_override,
-	tx,
-	framing_error,
-	runway_active,
-	emergency,
-	receiving,
-	sending
-);
-	input wire clock;
-	input wire reset_n;
-	input wire rx;
-	input wire [1:0] runway_override;
-	input wire emergency_override;
-	output wire tx;
-	output wire framing_error;
-	output wire [1:0] runway_active;
-	output wire emergency;
-	output wire receiving;
-	output wire sending;
-	wire [7:0] uart_rx_data;
-	wire [7:0] uart_tx_data;
-	wire uart_rx_valid;
-	wire uart_tx_ready;
-	wire uart_tx_send;
-	UartRX #(
-		.CLK_HZ(25000000),
-		.BAUD_RATE(115200)
-	) receiver(
-		.clock(clock),
-		.reset(~reset_n),
-		.rx(rx),
-		.data(uart_rx_data),
-		.done(uart_rx_valid),
-		.framing_error(framing_error),
-		.receiving(receiving)
-	);
-	UartTX #(
-		.CLK_HZ(25000000),
-		.BAUD_RATE(115200)
-	) transmitter(
-		.clock(clock),
-		.reset(~reset_n),
-		.send(uart_tx_send),
-		.data(uart_tx_data),
-		.tx(tx),
-		.ready(uart_tx_ready),
-		.sending(sending)
-	);
-	reg [1:0] ro_temp;
-	reg [1:0] ro_sync;
-	reg eo_temp;
-	reg eo_sync;
-	always @(posedge clock) begin
-		ro_temp <= runway_override;
-		eo_temp <= emergency_override;
-		ro_sync <= ro_temp;
-		eo_sync <= eo_temp;
-	end
-	Bob bobby(
-		.clock(clock),
-		.reset(~reset_n),
-		.uart_rx_data(uart_rx_data),
-		.uart_rx_valid(uart_rx_valid),
-		.uart_tx_data(uart_tx_data),
-		.uart_tx_ready(uart_tx_ready),
-		.uart_tx_send(uart_tx_send),
-		.runway_active(runway_active),
-		.runway_override(ro_sync),
-		.emergency_out(emergency),
-		.emergency_override(eo_sync)
-	);
+/* Generated by Yosys 0.70 (git sha1 28ba3cb92, Release, Clang /workspace/YoWASP/yosys/wasi-sdk-33.0-x86_64-linux/share/cmake/../..//bin/clang++ 22.1.0) */
+
+module \AircraftIDManager$BobFPGA.bob.bobby.id_manager (reset, clock, take_id, release_id, all_id, full, id_in, release_mask, reserved_id, id_out);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input take_id;
+  wire take_id;
+  input release_id;
+  wire release_id;
+  output [15:0] all_id;
+  wire [15:0] all_id;
+  output full;
+  wire full;
+  input [3:0] id_in;
+  wire [3:0] id_in;
+  input [15:0] release_mask;
+  wire [15:0] release_mask;
+  input [15:0] reserved_id;
+  wire [15:0] reserved_id;
+  output [3:0] id_out;
+  wire [3:0] id_out;
+  wire _000_;
+  wire [15:0] _001_;
+  wire [15:0] _002_;
+  wire [15:0] _003_;
+  wire [15:0] _004_;
+  wire _005_;
+  wire _006_;
+  wire [15:0] _007_;
+  wire [15:0] _008_;
+  wire [15:0] _009_;
+  wire [15:0] _010_;
+  wire [15:0] _011_;
+  wire [15:0] _012_;
+  wire [15:0] _013_;
+  wire [15:0] _014_;
+  wire [15:0] _015_;
+  wire [15:0] _016_;
+  wire [15:0] _017_;
+  wire [15:0] _018_;
+  wire [15:0] _019_;
+  wire [3:0] _020_;
+  wire [3:0] _021_;
+  wire [3:0] _022_;
+  wire [3:0] _023_;
+  wire [3:0] _024_;
+  wire [3:0] _025_;
+  wire [3:0] _026_;
+  wire [3:0] _027_;
+  wire [3:0] _028_;
+  wire [3:0] _029_;
+  wire [3:0] _030_;
+  wire [3:0] _031_;
+  wire [3:0] _032_;
+  wire [3:0] _033_;
+  wire [3:0] _034_;
+  wire [3:0] id_avail;
+  reg [15:0] taken_id;
+  wire [15:0] unavailable;
+  assign unavailable = taken_id | reserved_id;
+  assign _000_ = | release_mask;
+  assign _001_ = ~ release_mask;
+  assign _002_ = taken_id & _001_;
+  assign _005_ = ! full;
+  assign _006_ = take_id && _005_;
+  assign full = unavailable == 16'hffff;
+  assign _007_[0] = id_avail == 4'h0;
+  assign _007_[1] = id_avail == 4'h1;
+  assign _007_[2] = id_avail == 4'h2;
+  assign _007_[3] = id_avail == 4'h3;
+  assign _007_[4] = id_avail == 4'h4;
+  assign _007_[5] = id_avail == 4'h5;
+  assign _007_[6] = id_avail == 4'h6;
+  assign _007_[7] = id_avail == 4'h7;
+  assign _007_[8] = id_avail == 4'h8;
+  assign _007_[9] = id_avail == 4'h9;
+  assign _007_[10] = id_avail == 4'ha;
+  assign _007_[11] = id_avail == 4'hb;
+  assign _007_[12] = id_avail == 4'hc;
+  assign _007_[13] = id_avail == 4'hd;
+  assign _007_[14] = id_avail == 4'he;
+  assign _007_[15] = id_avail == 4'hf;
+  assign _003_[0] = id_in == 4'h0;
+  assign _003_[1] = id_in == 4'h1;
+  assign _003_[2] = id_in == 4'h2;
+  assign _003_[3] = id_in == 4'h3;
+  assign _003_[4] = id_in == 4'h4;
+  assign _003_[5] = id_in == 4'h5;
+  assign _003_[6] = id_in == 4'h6;
+  assign _003_[7] = id_in == 4'h7;
+  assign _003_[8] = id_in == 4'h8;
+  assign _003_[9] = id_in == 4'h9;
+  assign _003_[10] = id_in == 4'ha;
+  assign _003_[11] = id_in == 4'hb;
+  assign _003_[12] = id_in == 4'hc;
+  assign _003_[13] = id_in == 4'hd;
+  assign _003_[14] = id_in == 4'he;
+  assign _003_[15] = id_in == 4'hf;
+  assign _004_ = taken_id & _009_;
+  assign _009_ = ~ _003_;
+  assign _008_ = taken_id | _007_;
+  always @(posedge clock)
+    taken_id <= _019_;
+  assign _010_ = _006_ ? _008_ : taken_id;
+  assign _011_ = release_id ? 16'hxxxx : _010_;
+  assign _012_ = _000_ ? 16'hxxxx : _011_;
+  assign _013_ = reset ? 16'hxxxx : _012_;
+  assign _014_ = release_id ? _004_ : _013_;
+  assign _015_ = _000_ ? 16'hxxxx : _014_;
+  assign _016_ = reset ? 16'hxxxx : _015_;
+  assign _017_ = _000_ ? _002_ : _016_;
+  assign _018_ = reset ? 16'hxxxx : _017_;
+  assign _019_ = reset ? 16'h0000 : _018_;
+  assign _020_ = unavailable[15] ? 4'h0 : 4'hf;
+  assign _021_ = unavailable[14] ? _020_ : 4'he;
+  assign _022_ = unavailable[13] ? _021_ : 4'hd;
+  assign _023_ = unavailable[12] ? _022_ : 4'hc;
+  assign _024_ = unavailable[11] ? _023_ : 4'hb;
+  assign _025_ = unavailable[10] ? _024_ : 4'ha;
+  assign _026_ = unavailable[9] ? _025_ : 4'h9;
+  assign _027_ = unavailable[8] ? _026_ : 4'h8;
+  assign _028_ = unavailable[7] ? _027_ : 4'h7;
+  assign _029_ = unavailable[6] ? _028_ : 4'h6;
+  assign _030_ = unavailable[5] ? _029_ : 4'h5;
+  assign _031_ = unavailable[4] ? _030_ : 4'h4;
+  assign _032_ = unavailable[3] ? _031_ : 4'h3;
+  assign _033_ = unavailable[2] ? _032_ : 4'h2;
+  assign _034_ = unavailable[1] ? _033_ : 4'h1;
+  assign id_avail = unavailable[0] ? _034_ : 4'h0;
+  assign all_id = taken_id;
+  assign id_out = id_avail;
 endmodule
-module Bob (
-	clock,
-	reset,
-	uart_rx_data,
-	uart_rx_valid,
-	runway_override,
-	emergency_override,
-	uart_tx_data,
-	uart_tx_ready,
-	uart_tx_send,
-	runway_active,
-	emergency_out
-);
-	input wire clock;
-	input wire reset;
-	input wire [7:0] uart_rx_data;
-	input wire uart_rx_valid;
-	input wire [1:0] runway_override;
-	input wire emergency_override;
-	output wire [7:0] uart_tx_data;
-	input wire uart_tx_ready;
-	output wire uart_tx_send;
-	output wire [1:0] runway_active;
-	output wire emergency_out;
-	wire [7:0] uart_request;
-	wire uart_rd_request;
-	wire uart_empty;
-	wire runway_id;
-	wire lock;
-	wire unlock;
-	reg [3:0] cleared_id_to_lock;
-	wire sel_takeoff_id_lock;
-	wire [9:0] runway;
-	wire queue_takeoff_plane;
-	wire unqueue_takeoff_plane;
-	wire [3:0] cleared_takeoff_id;
-	wire takeoff_fifo_full;
-	wire takeoff_fifo_empty;
-	wire queue_landing_plane;
-	wire unqueue_landing_plane;
-	wire [3:0] cleared_landing_id;
-	wire landing_fifo_full;
-	wire landing_fifo_empty;
-	wire send_hold;
-	wire send_say_ag;
-	wire send_divert;
-	wire send_divert_landing;
-	wire send_valid_id;
-	wire send_invalid_id;
-	wire [1:0] send_clear;
-	reg [7:0] reply_to_send;
-	wire send_reply;
-	wire queue_reply;
-	wire reply_fifo_full;
-	wire reply_fifo_empty;
-	reg emergency;
-	wire set_emergency;
-	wire unset_emergency;
-	reg [3:0] emergency_id;
-	FIFO #(
-		.WIDTH(8),
-		.DEPTH(4)
-	) uart_requests(
-		.clock(clock),
-		.reset(reset),
-		.data_in(uart_rx_data),
-		.we(uart_rx_valid),
-		.re(uart_rd_request),
-		.data_out({uart_request[7-:4], uart_request[3-:3], uart_request[0]}),
-		.full(),
-		.empty(uart_empty)
-	);
-	FIFO #(
-		.WIDTH(4),
-		.DEPTH(8)
-	) takeoff_fifo(
-		.clock(clock),
-		.reset(reset),
-		.data_in(uart_request[7-:4]),
-		.we(queue_takeoff_plane),
-		.re(unqueue_takeoff_plane),
-		.data_out(cleared_takeoff_id),
-		.full(takeoff_fifo_full),
-		.empty(takeoff_fifo_empty)
-	);
-	FIFO #(
-		.WIDTH(4),
-		.DEPTH(8)
-	) landing_fifo(
-		.clock(clock),
-		.reset(reset),
-		.data_in(uart_request[7-:4]),
-		.we(queue_landing_plane),
-		.re(unqueue_landing_plane),
-		.data_out(cleared_landing_id),
-		.full(landing_fifo_full),
-		.empty(landing_fifo_empty)
-	);
-	wire [3:0] new_id;
-	reg [3:0] id_in;
-	wire sel_diverted_id;
-	wire take_id;
-	wire release_id;
-	wire id_full;
-	wire [15:0] all_id;
-	always @(*)
-		if (sel_diverted_id)
-			id_in = cleared_landing_id;
-		else
-			id_in = uart_request[7-:4];
-	AircraftIDManager id_manager(
-		.clock(clock),
-		.reset(reset),
-		.id_in(id_in),
-		.release_id(release_id),
-		.take_id(take_id),
-		.id_out(new_id),
-		.all_id(all_id),
-		.full(id_full)
-	);
-	ReadRequestFsm fsm(
-		.emergency(emergency_out),
-		.clock(clock),
-		.reset(reset),
-		.uart_empty(uart_empty),
-		.uart_request(uart_request),
-		.takeoff_fifo_full(takeoff_fifo_full),
-		.landing_fifo_full(landing_fifo_full),
-		.takeoff_fifo_empty(takeoff_fifo_empty),
-		.landing_fifo_empty(landing_fifo_empty),
-		.reply_fifo_full(reply_fifo_full),
-		.runway_active(runway_active),
-		.all_id(all_id),
-		.id_full(id_full),
-		.emergency_id(emergency_id),
-		.runway(runway),
-		.uart_rd_request(uart_rd_request),
-		.queue_takeoff_plane(queue_takeoff_plane),
-		.queue_landing_plane(queue_landing_plane),
-		.unqueue_takeoff_plane(unqueue_takeoff_plane),
-		.unqueue_landing_plane(unqueue_landing_plane),
-		.send_clear(send_clear),
-		.send_hold(send_hold),
-		.send_say_ag(send_say_ag),
-		.send_divert(send_divert),
-		.send_divert_landing(send_divert_landing),
-		.send_invalid_id(send_invalid_id),
-		.send_valid_id(send_valid_id),
-		.queue_reply(queue_reply),
-		.lock(lock),
-		.unlock(unlock),
-		.runway_id(runway_id),
-		.set_emergency(set_emergency),
-		.unset_emergency(unset_emergency),
-		.take_id(take_id),
-		.release_id(release_id),
-		.sel_takeoff_id_lock(sel_takeoff_id_lock),
-		.sel_diverted_id(sel_diverted_id)
-	);
-	always @(posedge clock)
-		if (reset)
-			reply_to_send <= 0;
-		else if (send_clear[0] ^ send_clear[1]) begin
-			if (send_clear[0]) begin
-				reply_to_send[7-:4] <= cleared_takeoff_id;
-				reply_to_send[3-:3] <= 3'b011;
-				reply_to_send[0] <= runway_id;
-			end
-			else if (send_clear[1]) begin
-				reply_to_send[7-:4] <= cleared_landing_id;
-				reply_to_send[3-:3] <= 3'b011;
-				reply_to_send[0] <= runway_id;
-			end
-		end
-		else if (send_hold) begin
-			reply_to_send[7-:4] <= uart_request[7-:4];
-			reply_to_send[3-:3] <= 3'b100;
-			reply_to_send[0] <= 1'b0;
-		end
-		else if (send_say_ag) begin
-			reply_to_send[7-:4] <= uart_request[7-:4];
-			reply_to_send[3-:3] <= 3'b101;
-			reply_to_send[0] <= 1'b0;
-		end
-		else if (send_divert) begin
-			reply_to_send[7-:4] <= uart_request[7-:4];
-			reply_to_send[3-:3] <= 3'b110;
-			reply_to_send[0] <= 1'b0;
-		end
-		else if (send_divert_landing) begin
-			reply_to_send[7-:4] <= cleared_landing_id;
-			reply_to_send[3-:3] <= 3'b110;
-			reply_to_send[0] <= 1'b0;
-		end
-		else if (send_invalid_id) begin
-			reply_to_send[7-:4] <= 4'd0;
-			reply_to_send[3-:3] <= 3'b111;
-			reply_to_send[0] <= 1'b1;
-		end
-		else if (send_valid_id) begin
-			reply_to_send[7-:4] <= new_id;
-			reply_to_send[3-:3] <= 3'b111;
-			reply_to_send[0] <= 1'b0;
-		end
-	FIFO #(
-		.WIDTH(8),
-		.DEPTH(4)
-	) uart_replies(
-		.clock(clock),
-		.reset(reset),
-		.data_in(reply_to_send),
-		.we(queue_reply),
-		.re(send_reply),
-		.data_out(uart_tx_data),
-		.full(reply_fifo_full),
-		.empty(reply_fifo_empty)
-	);
-	SendReplyFsm reply_fsm(
-		.clock(clock),
-		.reset(reset),
-		.uart_tx_ready(uart_tx_ready),
-		.reply_fifo_empty(reply_fifo_empty),
-		.send_reply(send_reply),
-		.uart_tx_send(uart_tx_send)
-	);
-	always @(*)
-		if (sel_takeoff_id_lock)
-			cleared_id_to_lock = cleared_takeoff_id;
-		else
-			cleared_id_to_lock = cleared_landing_id;
-	RunwayManager runway_manager(
-		.clock(clock),
-		.reset(reset),
-		.plane_id_unlock(uart_request[7-:4]),
-		.plane_id_lock(cleared_id_to_lock),
-		.runway_id(runway_id),
-		.lock(lock),
-		.unlock(unlock),
-		.runway_active(runway_active),
-		.runway_override(runway_override),
-		.runway(runway)
-	);
-	always @(posedge clock)
-		if (reset) begin
-			emergency_id <= 4'd0;
-			emergency <= 1'b0;
-		end
-		else if (set_emergency) begin
-			emergency_id <= uart_request[7-:4];
-			emergency <= 1'b1;
-		end
-		else if (unset_emergency)
-			emergency <= 1'b0;
-	assign emergency_out = emergency | emergency_override;
+
+module \BaudRateGenerator$BobFPGA.bob.receiver.conductor (reset, clock, baud_sel, tick, start_rx, start_tx);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [1:0] baud_sel;
+  wire [1:0] baud_sel;
+  output tick;
+  wire tick;
+  input start_rx;
+  wire start_rx;
+  input start_tx;
+  wire start_tx;
+  wire [15:0] _00_;
+  wire [15:0] _01_;
+  wire [15:0] _02_;
+  wire [15:0] _03_;
+  wire [15:0] _04_;
+  wire [15:0] _05_;
+  wire _06_;
+  wire _07_;
+  wire _08_;
+  wire _09_;
+  wire [15:0] next_phase;
+  reg [15:0] phase;
+  wire [15:0] step;
+  assign { tick, next_phase } = { 1'h0, phase } + { 1'h0, step };
+  always @(posedge clock)
+    phase <= _02_;
+  assign _03_ = start_tx ? 16'h0000 : next_phase;
+  assign _04_ = start_rx ? 16'hxxxx : _03_;
+  assign _00_ = reset ? 16'hxxxx : _04_;
+  assign _05_ = start_rx ? 16'h8000 : _00_;
+  assign _01_ = reset ? 16'hxxxx : _05_;
+  assign _02_ = reset ? 16'h0000 : _01_;
+  function [15:0] _18_;
+    input [15:0] a;
+    input [63:0] b;
+    input [3:0] s;
+    casez (s) // synopsys parallel_case
+      4'b???1:
+        _18_ = b[15:0];
+      4'b??1?:
+        _18_ = b[31:16];
+      4'b?1??:
+        _18_ = b[47:32];
+      4'b1???:
+        _18_ = b[63:48];
+      default:
+        _18_ = a;
+    endcase
+  endfunction
+  assign step = _18_(16'hxxxx, 64'h012e04b809700a3d, { _09_, _08_, _07_, _06_ });
+  assign _06_ = baud_sel == 2'h3;
+  assign _07_ = baud_sel == 2'h2;
+  assign _08_ = baud_sel == 2'h1;
+  assign _09_ = ! baud_sel;
 endmodule
-module ReadRequestFsm (
-	clock,
-	reset,
-	uart_empty,
-	uart_request,
-	takeoff_fifo_full,
-	landing_fifo_full,
-	takeoff_fifo_empty,
-	landing_fifo_empty,
-	reply_fifo_full,
-	runway_active,
-	emergency,
-	all_id,
-	id_full,
-	emergency_id,
-	runway,
-	uart_rd_request,
-	queue_takeoff_plane,
-	queue_landing_plane,
-	unqueue_takeoff_plane,
-	unqueue_landing_plane,
-	send_clear,
-	send_hold,
-	send_say_ag,
-	send_divert,
-	send_divert_landing,
-	send_invalid_id,
-	send_valid_id,
-	queue_reply,
-	lock,
-	unlock,
-	runway_id,
-	set_emergency,
-	unset_emergency,
-	take_id,
-	release_id,
-	sel_takeoff_id_lock,
-	sel_diverted_id
-);
-	input wire clock;
-	input wire reset;
-	input wire uart_empty;
-	input wire [7:0] uart_request;
-	input wire takeoff_fifo_full;
-	input wire landing_fifo_full;
-	input wire takeoff_fifo_empty;
-	input wire landing_fifo_empty;
-	input wire reply_fifo_full;
-	input wire [1:0] runway_active;
-	input wire emergency;
-	input wire [15:0] all_id;
-	input wire id_full;
-	input wire [3:0] emergency_id;
-	input wire [9:0] runway;
-	output reg uart_rd_request;
-	output reg queue_takeoff_plane;
-	output reg queue_landing_plane;
-	output reg unqueue_takeoff_plane;
-	output reg unqueue_landing_plane;
-	output reg [1:0] send_clear;
-	output reg send_hold;
-	output reg send_say_ag;
-	output reg send_divert;
-	output reg send_divert_landing;
-	output reg send_invalid_id;
-	output reg send_valid_id;
-	output reg queue_reply;
-	output reg lock;
-	output reg unlock;
-	output reg runway_id;
-	output reg set_emergency;
-	output reg unset_emergency;
-	output reg take_id;
-	output reg release_id;
-	output reg sel_takeoff_id_lock;
-	output reg sel_diverted_id;
-	wire [3:0] plane_id;
-	wire [2:0] msg_type;
-	wire [1:0] msg_action;
-	reg takeoff_first;
-	reg reverse_takeoff_first;
-	assign plane_id = uart_request[7-:4];
-	assign msg_type = uart_request[3-:3];
-	assign msg_action = uart_request[0];
-	reg [2:0] state;
-	reg [2:0] next_state;
-	always @(*) begin
-		uart_rd_request = 1'b0;
-		queue_takeoff_plane = 1'b0;
-		queue_landing_plane = 1'b0;
-		unqueue_takeoff_plane = 1'b0;
-		unqueue_landing_plane = 1'b0;
-		send_clear = 2'b00;
-		send_hold = 1'b0;
-		send_say_ag = 1'b0;
-		send_divert = 1'b0;
-		send_divert_landing = 1'b0;
-		send_invalid_id = 1'b0;
-		send_valid_id = 1'b0;
-		queue_reply = 1'b0;
-		lock = 1'b0;
-		unlock = 1'b0;
-		runway_id = 1'b0;
-		set_emergency = 1'b0;
-		unset_emergency = 1'b0;
-		take_id = 1'b0;
-		release_id = 1'b0;
-		sel_takeoff_id_lock = 1'b0;
-		sel_diverted_id = 1'b0;
-		reverse_takeoff_first = 1'b0;
-		next_state = 3'b000;
-		case (state)
-			3'b000:
-				if (uart_empty) begin
-					if (emergency) begin
-						if (!landing_fifo_empty) begin
-							next_state = 3'b110;
-							unqueue_landing_plane = 1'b1;
-						end
-						else
-							next_state = 3'b000;
-					end
-					else if (runway_active != 2'b11) begin
-						if (!takeoff_fifo_empty && !landing_fifo_empty) begin
-							if (takeoff_first) begin
-								next_state = 3'b100;
-								unqueue_takeoff_plane = 1'b1;
-							end
-							else begin
-								next_state = 3'b101;
-								unqueue_landing_plane = 1'b1;
-							end
-						end
-						else if (!takeoff_fifo_empty) begin
-							next_state = 3'b100;
-							unqueue_takeoff_plane = 1'b1;
-						end
-						else if (!landing_fifo_empty) begin
-							next_state = 3'b101;
-							unqueue_landing_plane = 1'b1;
-						end
-						else
-							next_state = 3'b000;
-					end
-					else
-						next_state = 3'b000;
-				end
-				else begin
-					next_state = 3'b001;
-					uart_rd_request = 1'b1;
-				end
-			3'b001:
-				if (msg_type == 3'b000) begin
-					if (all_id[plane_id]) begin
-						next_state = 3'b010;
-						if (msg_action == 1'b0) begin
-							if (takeoff_fifo_full) begin
-								send_divert = 1'b1;
-								release_id = 1'b1;
-							end
-							else begin
-								queue_takeoff_plane = 1'b1;
-								send_hold = 1'b1;
-							end
-						end
-						else if (msg_action == 1'b1) begin
-							if (landing_fifo_full || emergency) begin
-								send_divert = 1'b1;
-								release_id = 1'b1;
-							end
-							else begin
-								queue_landing_plane = 1'b1;
-								send_hold = 1'b1;
-							end
-						end
-					end
-					else
-						next_state = 3'b011;
-				end
-				else if (msg_type == 3'b001) begin
-					if (all_id[plane_id]) begin
-						next_state = 3'b011;
-						if (!msg_action) begin
-							if ((runway[4-:4] == plane_id) && runway[0])
-								release_id = 1'b1;
-							unlock = 1'b1;
-							runway_id = 1'b0;
-						end
-						else if (msg_action) begin
-							if ((runway[9-:4] == plane_id) && runway[5])
-								release_id = 1'b1;
-							unlock = 1'b1;
-							runway_id = 1'b1;
-						end
-					end
-					else
-						next_state = 3'b011;
-				end
-				else if (msg_type == 3'b010) begin
-					if (msg_action == 1'b1) begin
-						if (!landing_fifo_empty) begin
-							next_state = 3'b110;
-							unqueue_landing_plane = 1'b1;
-						end
-						else
-							next_state = 3'b000;
-						set_emergency = 1'b1;
-					end
-					else if (msg_action == 1'b0) begin
-						next_state = 3'b011;
-						if (emergency_id == plane_id)
-							unset_emergency = 1'b1;
-						release_id = 1'b1;
-					end
-				end
-				else if (msg_type == 3'b111) begin
-					next_state = 3'b010;
-					if (id_full)
-						send_invalid_id = 1'b1;
-					else begin
-						send_valid_id = 1'b1;
-						take_id = 1'b1;
-					end
-				end
-				else begin
-					next_state = 3'b010;
-					send_say_ag = 1'b1;
-				end
-			3'b010:
-				if (reply_fifo_full)
-					next_state = 3'b010;
-				else begin
-					next_state = 3'b011;
-					queue_reply = 1'b1;
-				end
-			3'b011:
-				if (emergency) begin
-					if (!landing_fifo_empty) begin
-						next_state = 3'b110;
-						unqueue_landing_plane = 1'b1;
-					end
-					else
-						next_state = 3'b000;
-				end
-				else if (runway_active != 2'b11) begin
-					if (!takeoff_fifo_empty && !landing_fifo_empty) begin
-						if (takeoff_first) begin
-							next_state = 3'b100;
-							unqueue_takeoff_plane = 1'b1;
-							reverse_takeoff_first = 1'b1;
-						end
-						else begin
-							next_state = 3'b101;
-							unqueue_landing_plane = 1'b1;
-							reverse_takeoff_first = 1'b1;
-						end
-					end
-					else if (!takeoff_fifo_empty) begin
-						next_state = 3'b100;
-						unqueue_takeoff_plane = 1'b1;
-					end
-					else if (!landing_fifo_empty) begin
-						next_state = 3'b101;
-						unqueue_landing_plane = 1'b1;
-					end
-					else
-						next_state = 3'b000;
-				end
-				else
-					next_state = 3'b000;
-			3'b100: begin
-				next_state = 3'b111;
-				sel_takeoff_id_lock = 1'b1;
-				if (!runway_active[0]) begin
-					runway_id = 1'b0;
-					lock = 1'b1;
-					send_clear = 2'b01;
-				end
-				else if (!runway_active[1]) begin
-					runway_id = 1'b1;
-					lock = 1'b1;
-					send_clear = 2'b01;
-				end
-			end
-			3'b101: begin
-				next_state = 3'b111;
-				if (!runway_active[0]) begin
-					runway_id = 1'b0;
-					lock = 1'b1;
-					send_clear = 2'b10;
-				end
-				else if (!runway_active[1]) begin
-					runway_id = 1'b1;
-					lock = 1'b1;
-					send_clear = 2'b10;
-				end
-			end
-			3'b110: begin
-				next_state = 3'b111;
-				send_divert_landing = 1'b1;
-				sel_diverted_id = 1'b1;
-				release_id = 1'b1;
-			end
-			3'b111: begin
-				next_state = 3'b000;
-				queue_reply = 1'b1;
-			end
-			default: next_state = 3'b000;
-		endcase
-	end
-	always @(posedge clock)
-		if (reset)
-			state <= 3'b000;
-		else
-			state <= next_state;
-	always @(posedge clock)
-		if (reset)
-			takeoff_first <= 1'b0;
-		else if (reverse_takeoff_first)
-			takeoff_first <= ~takeoff_first;
+
+module \BaudRateGenerator$BobFPGA.bob.transmitter.conductor (reset, clock, baud_sel, tick, start_rx, start_tx);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [1:0] baud_sel;
+  wire [1:0] baud_sel;
+  output tick;
+  wire tick;
+  input start_rx;
+  wire start_rx;
+  input start_tx;
+  wire start_tx;
+  wire [15:0] _00_;
+  wire [15:0] _01_;
+  wire [15:0] _02_;
+  wire [15:0] _03_;
+  wire [15:0] _04_;
+  wire [15:0] _05_;
+  wire _06_;
+  wire _07_;
+  wire _08_;
+  wire _09_;
+  wire [15:0] next_phase;
+  reg [15:0] phase;
+  wire [15:0] step;
+  assign { tick, next_phase } = { 1'h0, phase } + { 1'h0, step };
+  always @(posedge clock)
+    phase <= _02_;
+  assign _03_ = start_tx ? 16'h0000 : next_phase;
+  assign _04_ = start_rx ? 16'hxxxx : _03_;
+  assign _00_ = reset ? 16'hxxxx : _04_;
+  assign _05_ = start_rx ? 16'h8000 : _00_;
+  assign _01_ = reset ? 16'hxxxx : _05_;
+  assign _02_ = reset ? 16'h0000 : _01_;
+  function [15:0] _18_;
+    input [15:0] a;
+    input [63:0] b;
+    input [3:0] s;
+    casez (s) // synopsys parallel_case
+      4'b???1:
+        _18_ = b[15:0];
+      4'b??1?:
+        _18_ = b[31:16];
+      4'b?1??:
+        _18_ = b[47:32];
+      4'b1???:
+        _18_ = b[63:48];
+      default:
+        _18_ = a;
+    endcase
+  endfunction
+  assign step = _18_(16'hxxxx, 64'h012e04b809700a3d, { _09_, _08_, _07_, _06_ });
+  assign _06_ = baud_sel == 2'h3;
+  assign _07_ = baud_sel == 2'h2;
+  assign _08_ = baud_sel == 2'h1;
+  assign _09_ = ! baud_sel;
 endmodule
-module SendReplyFsm (
-	clock,
-	reset,
-	uart_tx_ready,
-	reply_fifo_empty,
-	send_reply,
-	uart_tx_send
-);
-	input wire clock;
-	input wire reset;
-	input wire uart_tx_ready;
-	input wire reply_fifo_empty;
-	output reg send_reply;
-	output reg uart_tx_send;
-	reg state;
-	reg next_state;
-	always @(*) begin
-		send_reply = 1'b0;
-		uart_tx_send = 1'b0;
-		case (state)
-			1'd0:
-				if (reply_fifo_empty || !uart_tx_ready)
-					next_state = 1'd0;
-				else begin
-					next_state = 1'd1;
-					send_reply = 1'b1;
-				end
-			1'd1: begin
-				next_state = 1'd0;
-				uart_tx_send = 1'b1;
-			end
-			default: next_state = 1'd0;
-		endcase
-	end
-	always @(posedge clock)
-		if (reset)
-			state <= 1'd0;
-		else
-			state <= next_state;
+
+module \Bob$BobFPGA.bob.bobby (reset, clock, runway_override, emergency_override, runway_active, baud_strap, uart_rx_data, uart_tx_data, uart_rx_valid, uart_rx_ready, uart_tx_ready, uart_tx_send, rx_baud_sel, tx_baud_sel, emergency_out);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [1:0] runway_override;
+  wire [1:0] runway_override;
+  input emergency_override;
+  wire emergency_override;
+  output [1:0] runway_active;
+  wire [1:0] runway_active;
+  input [1:0] baud_strap;
+  wire [1:0] baud_strap;
+  input [7:0] uart_rx_data;
+  wire [7:0] uart_rx_data;
+  output [7:0] uart_tx_data;
+  wire [7:0] uart_tx_data;
+  input uart_rx_valid;
+  wire uart_rx_valid;
+  output uart_rx_ready;
+  wire uart_rx_ready;
+  input uart_tx_ready;
+  wire uart_tx_ready;
+  output uart_tx_send;
+  wire uart_tx_send;
+  output [1:0] rx_baud_sel;
+  reg [1:0] rx_baud_sel;
+  output [1:0] tx_baud_sel;
+  reg [1:0] tx_baud_sel;
+  output emergency_out;
+  wire emergency_out;
+  wire [15:0] _000_;
+  wire [15:0] _001_;
+  wire _002_;
+  wire _003_;
+  wire [15:0] _004_;
+  wire [15:0] _005_;
+  wire _006_;
+  wire _007_;
+  wire _008_;
+  wire [15:0] _009_;
+  wire [15:0] _010_;
+  wire [15:0] _011_;
+  wire _012_;
+  wire [15:0] _013_;
+  wire _014_;
+  wire [2:0] _015_;
+  wire [7:0] _016_;
+  wire _017_;
+  wire [15:0] _018_;
+  wire _019_;
+  wire [2:0] _020_;
+  wire _021_;
+  wire _022_;
+  wire [15:0] _023_;
+  wire _024_;
+  wire _025_;
+  wire _026_;
+  wire _027_;
+  wire _028_;
+  wire [2:0] _029_;
+  wire [15:0] _030_;
+  wire _031_;
+  wire _032_;
+  wire _033_;
+  wire _034_;
+  wire _035_;
+  wire _036_;
+  wire [15:0] _037_;
+  wire [7:0] _038_;
+  wire [3:0] _039_;
+  wire [1:0] _040_;
+  wire [31:0] _041_;
+  wire [15:0] _042_;
+  wire [15:0] _043_;
+  wire [15:0] _044_;
+  wire [15:0] _045_;
+  wire [3:0] _046_;
+  wire [3:0] _047_;
+  wire [3:0] _048_;
+  wire [3:0] _049_;
+  wire [3:0] _050_;
+  wire [3:0] _051_;
+  wire [3:0] _052_;
+  wire [3:0] _053_;
+  wire [3:0] _054_;
+  wire [3:0] _055_;
+  wire [3:0] _056_;
+  wire [3:0] _057_;
+  wire [3:0] _058_;
+  wire [3:0] _059_;
+  wire [3:0] _060_;
+  wire [15:0] _061_;
+  wire [15:0] _062_;
+  wire [15:0] _063_;
+  wire _064_;
+  wire _065_;
+  wire _066_;
+  wire [3:0] _067_;
+  wire [3:0] _068_;
+  wire [15:0] _069_;
+  wire [15:0] _070_;
+  wire [15:0] _071_;
+  wire [15:0] _072_;
+  wire [15:0] _073_;
+  wire [15:0] _074_;
+  wire [1:0] _075_;
+  wire [1:0] _076_;
+  wire [1:0] _077_;
+  wire [1:0] _078_;
+  wire [1:0] _079_;
+  wire [1:0] _080_;
+  wire [1:0] _081_;
+  wire [1:0] _082_;
+  wire [1:0] _083_;
+  wire _084_;
+  wire _085_;
+  wire _086_;
+  wire [3:0] _087_;
+  wire [15:0] _088_;
+  wire [15:0] _089_;
+  wire [2:0] _090_;
+  wire [2:0] _091_;
+  wire [2:0] _092_;
+  wire _093_;
+  wire _094_;
+  wire _095_;
+  wire [2:0] _096_;
+  wire [2:0] _097_;
+  wire [2:0] _098_;
+  wire [63:0] _099_;
+  wire [63:0] _100_;
+  wire [63:0] _101_;
+  wire [7:0] _102_;
+  wire [7:0] _103_;
+  wire [7:0] _104_;
+  wire [7:0] _105_;
+  wire [7:0] _106_;
+  wire [7:0] _107_;
+  wire [7:0] _108_;
+  wire [7:0] _109_;
+  wire [7:0] _110_;
+  wire [7:0] _111_;
+  wire [7:0] _112_;
+  wire [7:0] _113_;
+  wire [7:0] _114_;
+  wire [7:0] _115_;
+  wire [7:0] _116_;
+  wire [7:0] _117_;
+  wire [7:0] _118_;
+  wire [7:0] _119_;
+  wire [7:0] _120_;
+  wire [7:0] _121_;
+  wire [7:0] _122_;
+  wire [7:0] _123_;
+  wire [7:0] _124_;
+  wire [7:0] _125_;
+  wire [7:0] _126_;
+  wire [7:0] _127_;
+  wire [7:0] _128_;
+  wire [7:0] _129_;
+  wire [7:0] _130_;
+  wire [7:0] _131_;
+  wire [7:0] _132_;
+  wire [7:0] _133_;
+  wire [7:0] _134_;
+  wire [7:0] _135_;
+  wire [7:0] _136_;
+  wire [7:0] _137_;
+  wire [7:0] _138_;
+  wire [7:0] _139_;
+  wire [7:0] _140_;
+  wire [7:0] _141_;
+  wire [7:0] _142_;
+  wire [7:0] _143_;
+  wire [7:0] _144_;
+  wire [7:0] _145_;
+  wire [7:0] _146_;
+  wire [7:0] _147_;
+  wire [7:0] _148_;
+  wire [7:0] _149_;
+  wire [7:0] _150_;
+  wire [7:0] _151_;
+  wire [7:0] _152_;
+  wire [7:0] _153_;
+  wire [7:0] _154_;
+  wire [7:0] _155_;
+  wire [7:0] _156_;
+  wire [7:0] _157_;
+  wire [7:0] _158_;
+  wire [7:0] _159_;
+  wire [7:0] _160_;
+  wire [7:0] _161_;
+  wire [7:0] _162_;
+  wire [7:0] _163_;
+  wire [15:0] _164_;
+  wire [15:0] _165_;
+  wire [15:0] _166_;
+  wire [15:0] _167_;
+  wire [15:0] _168_;
+  wire [15:0] all_id;
+  wire [3:0] cleared_id_to_lock;
+  wire [3:0] cleared_landing_id;
+  wire [3:0] cleared_takeoff_id;
+  wire [3:0] divert_id;
+  reg [15:0] divert_pending;
+  wire divert_waiting;
+  reg emergency;
+  reg [3:0] emergency_id;
+  wire flush_landings;
+  reg [15:0] hold_pending;
+  wire id_full;
+  wire [3:0] landing_count;
+  wire landing_fifo_empty;
+  wire landing_fifo_full;
+  reg [15:0] landing_queued;
+  wire lock;
+  wire [3:0] new_id;
+  wire queue_landing_plane;
+  wire queue_reply;
+  wire queue_status;
+  wire queue_takeoff_plane;
+  wire queue_urgent_reply;
+  wire release_id;
+  wire [2:0] reply_count;
+  wire reply_fifo_empty;
+  wire reply_fifo_full;
+  wire reply_fifo_we;
+  reg [7:0] reply_to_send;
+  wire [7:0] reply_tx_data;
+  wire [9:0] runway;
+  wire runway_id;
+  reg [1:0] schedule;
+  wire sel_takeoff_id_lock;
+  wire [1:0] send_clear;
+  wire send_divert;
+  wire send_divert_landing;
+  wire send_echo;
+  wire send_hold;
+  wire send_invalid_id;
+  wire send_reply;
+  wire send_say_ag;
+  wire send_status;
+  wire send_urgent;
+  wire send_valid_id;
+  wire [7:0] sent_reply;
+  wire sent_status;
+  wire set_emergency;
+  wire set_schedule;
+  wire status_done;
+  wire status_in_progress;
+  reg [2:0] status_index;
+  reg [63:0] status_snapshot;
+  reg [2:0] status_tx_index;
+  wire switch_rx_baud;
+  wire switch_tx_baud;
+  wire take_id;
+  wire take_snapshot;
+  wire [3:0] takeoff_count;
+  wire takeoff_fifo_empty;
+  wire takeoff_fifo_full;
+  reg tx_from_urgent;
+  wire uart_empty;
+  wire uart_rd_request;
+  wire [7:0] uart_request;
+  wire [2:0] uart_request_count;
+  wire uart_tx_idle;
+  wire unlock;
+  wire unqueue_landing_plane;
+  wire unqueue_takeoff_plane;
+  wire unset_emergency;
+  wire urgent_behind_hold;
+  wire [2:0] urgent_count;
+  wire urgent_fifo_empty;
+  wire urgent_fifo_full;
+  wire urgent_fifo_we;
+  wire urgent_reply_fifo_full;
+  wire [7:0] urgent_tx_data;
+  assign uart_rx_ready = { 29'h00000000, uart_request_count } < 32'd2;
+  assign _002_ = reply_to_send[3:1] == 3'h4;
+  assign _003_ = queue_reply && _002_;
+  assign emergency_out = emergency | emergency_override;
+  assign _006_ = reply_fifo_empty && urgent_fifo_empty;
+  assign _007_ = _006_ && uart_tx_ready;
+  assign _008_ = ! uart_tx_send;
+  assign uart_tx_idle = _007_ && _008_;
+  assign _009_ = divert_pending | landing_queued;
+  assign _012_ = reset | flush_landings;
+  assign divert_waiting = | divert_pending;
+  assign _013_ = flush_landings ? landing_queued : 16'h0000;
+  assign _017_ = reset || flush_landings;
+  assign _014_ = send_clear[0] ^ send_clear[1];
+  assign _015_ = 3'h7 - status_index;
+  assign _019_ = reset || take_snapshot;
+  assign _020_ = status_index + 3'h1;
+  assign status_done = ! status_index;
+  assign _021_ = queue_reply | queue_status;
+  assign _022_ = queue_urgent_reply & urgent_behind_hold;
+  assign reply_fifo_we = _021_ | _022_;
+  assign _024_ = ~ urgent_behind_hold;
+  assign urgent_fifo_we = queue_urgent_reply & _024_;
+  assign urgent_fifo_full = urgent_behind_hold ? reply_fifo_full : urgent_reply_fifo_full;
+  assign _025_ = send_reply || send_urgent;
+  assign uart_tx_data = tx_from_urgent ? urgent_tx_data : reply_tx_data;
+  assign _026_ = ! tx_from_urgent;
+  assign _027_ = uart_tx_send && _026_;
+  assign _028_ = _027_ && sent_status;
+  assign _029_ = status_tx_index + 3'h1;
+  assign status_in_progress = | status_tx_index;
+  assign _031_ = ! tx_from_urgent;
+  assign _032_ = uart_tx_send && _031_;
+  assign _033_ = ! sent_status;
+  assign _034_ = _032_ && _033_;
+  assign _035_ = reply_tx_data[3:1] == 3'h4;
+  assign _036_ = _034_ && _035_;
+  assign _038_[0] = reply_to_send[4] ? hold_pending[1] : hold_pending[0];
+  assign _038_[1] = reply_to_send[4] ? hold_pending[3] : hold_pending[2];
+  assign _038_[2] = reply_to_send[4] ? hold_pending[5] : hold_pending[4];
+  assign _038_[3] = reply_to_send[4] ? hold_pending[7] : hold_pending[6];
+  assign _038_[4] = reply_to_send[4] ? hold_pending[9] : hold_pending[8];
+  assign _038_[5] = reply_to_send[4] ? hold_pending[11] : hold_pending[10];
+  assign _038_[6] = reply_to_send[4] ? hold_pending[13] : hold_pending[12];
+  assign _038_[7] = reply_to_send[4] ? hold_pending[15] : hold_pending[14];
+  assign _039_[0] = reply_to_send[5] ? _038_[1] : _038_[0];
+  assign _039_[1] = reply_to_send[5] ? _038_[3] : _038_[2];
+  assign _039_[2] = reply_to_send[5] ? _038_[5] : _038_[4];
+  assign _039_[3] = reply_to_send[5] ? _038_[7] : _038_[6];
+  assign _040_[0] = reply_to_send[6] ? _039_[1] : _039_[0];
+  assign _040_[1] = reply_to_send[6] ? _039_[3] : _039_[2];
+  assign urgent_behind_hold = reply_to_send[7] ? _040_[1] : _040_[0];
+  assign _041_[7:0] = _015_[0] ? status_snapshot[15:8] : status_snapshot[7:0];
+  assign _041_[15:8] = _015_[0] ? status_snapshot[31:24] : status_snapshot[23:16];
+  assign _041_[23:16] = _015_[0] ? status_snapshot[47:40] : status_snapshot[39:32];
+  assign _041_[31:24] = _015_[0] ? status_snapshot[63:56] : status_snapshot[55:48];
+  assign _042_[7:0] = _015_[1] ? _041_[15:8] : _041_[7:0];
+  assign _042_[15:8] = _015_[1] ? _041_[31:24] : _041_[23:16];
+  assign _016_ = _015_[2] ? _042_[15:8] : _042_[7:0];
+  assign _004_[0] = reply_to_send[7:4] == 4'h0;
+  assign _004_[1] = reply_to_send[7:4] == 4'h1;
+  assign _004_[2] = reply_to_send[7:4] == 4'h2;
+  assign _004_[3] = reply_to_send[7:4] == 4'h3;
+  assign _004_[4] = reply_to_send[7:4] == 4'h4;
+  assign _004_[5] = reply_to_send[7:4] == 4'h5;
+  assign _004_[6] = reply_to_send[7:4] == 4'h6;
+  assign _004_[7] = reply_to_send[7:4] == 4'h7;
+  assign _004_[8] = reply_to_send[7:4] == 4'h8;
+  assign _004_[9] = reply_to_send[7:4] == 4'h9;
+  assign _004_[10] = reply_to_send[7:4] == 4'ha;
+  assign _004_[11] = reply_to_send[7:4] == 4'hb;
+  assign _004_[12] = reply_to_send[7:4] == 4'hc;
+  assign _004_[13] = reply_to_send[7:4] == 4'hd;
+  assign _004_[14] = reply_to_send[7:4] == 4'he;
+  assign _004_[15] = reply_to_send[7:4] == 4'hf;
+  assign _000_[0] = reply_tx_data[7:4] == 4'h0;
+  assign _000_[1] = reply_tx_data[7:4] == 4'h1;
+  assign _000_[2] = reply_tx_data[7:4] == 4'h2;
+  assign _000_[3] = reply_tx_data[7:4] == 4'h3;
+  assign _000_[4] = reply_tx_data[7:4] == 4'h4;
+  assign _000_[5] = reply_tx_data[7:4] == 4'h5;
+  assign _000_[6] = reply_tx_data[7:4] == 4'h6;
+  assign _000_[7] = reply_tx_data[7:4] == 4'h7;
+  assign _000_[8] = reply_tx_data[7:4] == 4'h8;
+  assign _000_[9] = reply_tx_data[7:4] == 4'h9;
+  assign _000_[10] = reply_tx_data[7:4] == 4'ha;
+  assign _000_[11] = reply_tx_data[7:4] == 4'hb;
+  assign _000_[12] = reply_tx_data[7:4] == 4'hc;
+  assign _000_[13] = reply_tx_data[7:4] == 4'hd;
+  assign _000_[14] = reply_tx_data[7:4] == 4'he;
+  assign _000_[15] = reply_tx_data[7:4] == 4'hf;
+  assign _010_[0] = divert_id == 4'h0;
+  assign _010_[1] = divert_id == 4'h1;
+  assign _010_[2] = divert_id == 4'h2;
+  assign _010_[3] = divert_id == 4'h3;
+  assign _010_[4] = divert_id == 4'h4;
+  assign _010_[5] = divert_id == 4'h5;
+  assign _010_[6] = divert_id == 4'h6;
+  assign _010_[7] = divert_id == 4'h7;
+  assign _010_[8] = divert_id == 4'h8;
+  assign _010_[9] = divert_id == 4'h9;
+  assign _010_[10] = divert_id == 4'ha;
+  assign _010_[11] = divert_id == 4'hb;
+  assign _010_[12] = divert_id == 4'hc;
+  assign _010_[13] = divert_id == 4'hd;
+  assign _010_[14] = divert_id == 4'he;
+  assign _010_[15] = divert_id == 4'hf;
+  assign _030_[0] = uart_request[7:4] == 4'h0;
+  assign _030_[1] = uart_request[7:4] == 4'h1;
+  assign _030_[2] = uart_request[7:4] == 4'h2;
+  assign _030_[3] = uart_request[7:4] == 4'h3;
+  assign _030_[4] = uart_request[7:4] == 4'h4;
+  assign _030_[5] = uart_request[7:4] == 4'h5;
+  assign _030_[6] = uart_request[7:4] == 4'h6;
+  assign _030_[7] = uart_request[7:4] == 4'h7;
+  assign _030_[8] = uart_request[7:4] == 4'h8;
+  assign _030_[9] = uart_request[7:4] == 4'h9;
+  assign _030_[10] = uart_request[7:4] == 4'ha;
+  assign _030_[11] = uart_request[7:4] == 4'hb;
+  assign _030_[12] = uart_request[7:4] == 4'hc;
+  assign _030_[13] = uart_request[7:4] == 4'hd;
+  assign _030_[14] = uart_request[7:4] == 4'he;
+  assign _030_[15] = uart_request[7:4] == 4'hf;
+  assign _018_[0] = cleared_landing_id == 4'h0;
+  assign _018_[1] = cleared_landing_id == 4'h1;
+  assign _018_[2] = cleared_landing_id == 4'h2;
+  assign _018_[3] = cleared_landing_id == 4'h3;
+  assign _018_[4] = cleared_landing_id == 4'h4;
+  assign _018_[5] = cleared_landing_id == 4'h5;
+  assign _018_[6] = cleared_landing_id == 4'h6;
+  assign _018_[7] = cleared_landing_id == 4'h7;
+  assign _018_[8] = cleared_landing_id == 4'h8;
+  assign _018_[9] = cleared_landing_id == 4'h9;
+  assign _018_[10] = cleared_landing_id == 4'ha;
+  assign _018_[11] = cleared_landing_id == 4'hb;
+  assign _018_[12] = cleared_landing_id == 4'hc;
+  assign _018_[13] = cleared_landing_id == 4'hd;
+  assign _018_[14] = cleared_landing_id == 4'he;
+  assign _018_[15] = cleared_landing_id == 4'hf;
+  assign _023_ = landing_queued & _043_;
+  assign _043_ = ~ _018_;
+  assign _011_ = divert_pending & _044_;
+  assign _044_ = ~ _010_;
+  assign _001_ = hold_pending & _045_;
+  assign _045_ = ~ _000_;
+  assign _037_ = _074_ | _030_;
+  assign _005_ = _069_ | _004_;
+  always @(posedge clock)
+    divert_pending <= _063_;
+  always @(posedge clock)
+    emergency <= _066_;
+  always @(posedge clock)
+    emergency_id <= _068_;
+  always @(posedge clock)
+    hold_pending <= _071_;
+  always @(posedge clock)
+    landing_queued <= _073_;
+  always @(posedge clock)
+    reply_to_send[0] <= _163_[0];
+  always @(posedge clock)
+    reply_to_send[3:1] <= _163_[3:1];
+  always @(posedge clock)
+    reply_to_send[7:4] <= _163_[7:4];
+  always @(posedge clock)
+    rx_baud_sel <= _083_;
+  always @(posedge clock)
+    schedule <= _077_;
+  always @(posedge clock)
+    status_index <= _098_;
+  always @(posedge clock)
+    status_snapshot[7:0] <= _101_[7:0];
+  always @(posedge clock)
+    status_snapshot[15:8] <= _101_[15:8];
+  always @(posedge clock)
+    status_snapshot[23:16] <= _101_[23:16];
+  always @(posedge clock)
+    status_snapshot[31:24] <= _101_[31:24];
+  always @(posedge clock)
+    status_snapshot[39:32] <= _101_[39:32];
+  always @(posedge clock)
+    status_snapshot[47:40] <= _101_[47:40];
+  always @(posedge clock)
+    status_snapshot[55:48] <= _101_[55:48];
+  always @(posedge clock)
+    status_snapshot[63:56] <= _101_[63:56];
+  always @(posedge clock)
+    status_tx_index <= _092_;
+  always @(posedge clock)
+    tx_baud_sel <= _080_;
+  always @(posedge clock)
+    tx_from_urgent <= _095_;
+  assign _075_ = set_schedule ? uart_request[5:4] : schedule;
+  assign _076_ = reset ? 2'hx : _075_;
+  assign _077_ = reset ? 2'h0 : _076_;
+  assign _078_ = switch_tx_baud ? uart_request[5:4] : tx_baud_sel;
+  assign _079_ = reset ? 2'hx : _078_;
+  assign _080_ = reset ? baud_strap : _079_;
+  assign _081_ = switch_rx_baud ? uart_request[5:4] : rx_baud_sel;
+  assign _082_ = reset ? 2'hx : _081_;
+  assign _083_ = reset ? baud_strap : _082_;
+  assign _084_ = unset_emergency ? 1'h0 : emergency;
+  assign _085_ = set_emergency ? 1'hx : _084_;
+  assign _064_ = reset ? 1'hx : _085_;
+  assign _086_ = set_emergency ? 1'h1 : _064_;
+  assign _065_ = reset ? 1'hx : _086_;
+  assign _087_ = set_emergency ? uart_request[7:4] : emergency_id;
+  assign _067_ = reset ? 4'hx : _087_;
+  assign _068_ = reset ? 4'h0 : _067_;
+  assign _066_ = reset ? 1'h0 : _065_;
+  assign cleared_id_to_lock = sel_takeoff_id_lock ? cleared_takeoff_id : cleared_landing_id;
+  assign _088_ = _003_ ? _005_ : _069_;
+  assign _070_ = reset ? 16'hxxxx : _088_;
+  assign _089_ = _036_ ? _001_ : hold_pending;
+  assign _069_ = reset ? 16'hxxxx : _089_;
+  assign _071_ = reset ? 16'h0000 : _070_;
+  assign _090_ = _028_ ? _029_ : status_tx_index;
+  assign _091_ = reset ? 3'hx : _090_;
+  assign _092_ = reset ? 3'h0 : _091_;
+  assign _093_ = _025_ ? send_urgent : tx_from_urgent;
+  assign _094_ = reset ? 1'hx : _093_;
+  assign _095_ = reset ? 1'h0 : _094_;
+  assign _096_ = send_status ? _020_ : status_index;
+  assign _097_ = _019_ ? 3'hx : _096_;
+  assign _098_ = _019_ ? 3'h0 : _097_;
+  assign _099_ = take_snapshot ? { 8'hff, all_id, runway[9:6], runway[4:1], emergency_id, emergency_out, 1'h0, runway[5], runway[0], takeoff_count, landing_count, 1'h0, reply_count, 1'h0, urgent_count, 1'h0, uart_request_count, 2'h0, schedule } : status_snapshot;
+  assign _100_ = reset ? 64'hxxxxxxxxxxxxxxxx : _099_;
+  assign _101_ = reset ? 64'h0000000000000000 : _100_;
+  assign _102_ = send_echo ? uart_request : reply_to_send;
+  assign _103_ = send_status ? 8'hxx : _102_;
+  assign _104_ = send_valid_id ? 8'hxx : _103_;
+  assign _105_ = send_invalid_id ? 8'hxx : _104_;
+  assign _106_ = send_divert_landing ? 8'hxx : _105_;
+  assign _107_ = send_divert ? 8'hxx : _106_;
+  assign _108_ = send_say_ag ? 8'hxx : _107_;
+  assign _109_ = send_hold ? 8'hxx : _108_;
+  assign _110_ = _014_ ? 8'hxx : _109_;
+  assign _111_ = reset ? 8'hxx : _110_;
+  assign _112_ = send_status ? _016_ : _111_;
+  assign _113_ = send_valid_id ? 8'hxx : _112_;
+  assign _114_ = send_invalid_id ? 8'hxx : _113_;
+  assign _115_ = send_divert_landing ? 8'hxx : _114_;
+  assign _116_ = send_divert ? 8'hxx : _115_;
+  assign _117_ = send_say_ag ? 8'hxx : _116_;
+  assign _118_ = send_hold ? 8'hxx : _117_;
+  assign _119_ = _014_ ? 8'hxx : _118_;
+  assign _120_ = reset ? 8'hxx : _119_;
+  assign _121_ = send_valid_id ? { new_id, 4'he } : _120_;
+  assign _122_ = send_invalid_id ? 8'hxx : _121_;
+  assign _123_ = send_divert_landing ? 8'hxx : _122_;
+  assign _124_ = send_divert ? 8'hxx : _123_;
+  assign _125_ = send_say_ag ? 8'hxx : _124_;
+  assign _126_ = send_hold ? 8'hxx : _125_;
+  assign _127_ = _014_ ? 8'hxx : _126_;
+  assign _128_ = reset ? 8'hxx : _127_;
+  assign _129_ = send_invalid_id ? 8'h0f : _128_;
+  assign _130_ = send_divert_landing ? 8'hxx : _129_;
+  assign _131_ = send_divert ? 8'hxx : _130_;
+  assign _132_ = send_say_ag ? 8'hxx : _131_;
+  assign _133_ = send_hold ? 8'hxx : _132_;
+  assign _134_ = _014_ ? 8'hxx : _133_;
+  assign _135_ = reset ? 8'hxx : _134_;
+  assign _136_ = send_divert_landing ? { divert_id, 4'hc } : _135_;
+  assign _137_ = send_divert ? 8'hxx : _136_;
+  assign _138_ = send_say_ag ? 8'hxx : _137_;
+  assign _139_ = send_hold ? 8'hxx : _138_;
+  assign _140_ = _014_ ? 8'hxx : _139_;
+  assign _141_ = reset ? 8'hxx : _140_;
+  assign _142_ = send_divert ? { uart_request[7:4], 4'hc } : _141_;
+  assign _143_ = send_say_ag ? 8'hxx : _142_;
+  assign _144_ = send_hold ? 8'hxx : _143_;
+  assign _145_ = _014_ ? 8'hxx : _144_;
+  assign _146_ = reset ? 8'hxx : _145_;
+  assign _147_ = send_say_ag ? { uart_request[7:4], 4'ha } : _146_;
+  assign _148_ = send_hold ? 8'hxx : _147_;
+  assign _149_ = _014_ ? 8'hxx : _148_;
+  assign _150_ = reset ? 8'hxx : _149_;
+  assign _151_ = send_hold ? { uart_request[7:4], 4'h8 } : _150_;
+  assign _152_ = _014_ ? 8'hxx : _151_;
+  assign _153_ = reset ? 8'hxx : _152_;
+  assign _154_ = _014_ ? _162_ : _153_;
+  assign _155_ = reset ? 8'hxx : _154_;
+  assign _156_ = send_clear[1] ? { cleared_landing_id, 3'h3, runway_id } : reply_to_send;
+  assign _157_ = send_clear[0] ? 8'hxx : _156_;
+  assign _158_ = _014_ ? _157_ : 8'hxx;
+  assign _159_ = reset ? 8'hxx : _158_;
+  assign _160_ = send_clear[0] ? { cleared_takeoff_id, 3'h3, runway_id } : _159_;
+  assign _161_ = _014_ ? _160_ : 8'hxx;
+  assign _162_ = reset ? 8'hxx : _161_;
+  assign _163_ = reset ? 8'h00 : _155_;
+  assign divert_id = divert_pending[0] ? 4'h0 : _060_;
+  assign _060_ = divert_pending[1] ? 4'h1 : _059_;
+  assign _059_ = divert_pending[2] ? 4'h2 : _058_;
+  assign _058_ = divert_pending[3] ? 4'h3 : _057_;
+  assign _057_ = divert_pending[4] ? 4'h4 : _056_;
+  assign _056_ = divert_pending[5] ? 4'h5 : _055_;
+  assign _055_ = divert_pending[6] ? 4'h6 : _054_;
+  assign _054_ = divert_pending[7] ? 4'h7 : _053_;
+  assign _053_ = divert_pending[8] ? 4'h8 : _052_;
+  assign _052_ = divert_pending[9] ? 4'h9 : _051_;
+  assign _051_ = divert_pending[10] ? 4'ha : _050_;
+  assign _050_ = divert_pending[11] ? 4'hb : _049_;
+  assign _049_ = divert_pending[12] ? 4'hc : _048_;
+  assign _048_ = divert_pending[13] ? 4'hd : _047_;
+  assign _047_ = divert_pending[14] ? 4'he : _046_;
+  assign _046_ = divert_pending[15] ? 4'hf : 4'h0;
+  assign _164_ = send_divert_landing ? _011_ : divert_pending;
+  assign _165_ = flush_landings ? 16'hxxxx : _164_;
+  assign _061_ = reset ? 16'hxxxx : _165_;
+  assign _166_ = flush_landings ? _009_ : _061_;
+  assign _062_ = reset ? 16'hxxxx : _166_;
+  assign _063_ = reset ? 16'h0000 : _062_;
+  assign _167_ = queue_landing_plane ? _037_ : _074_;
+  assign _072_ = _017_ ? 16'hxxxx : _167_;
+  assign _168_ = send_clear[1] ? _023_ : landing_queued;
+  assign _074_ = _017_ ? 16'hxxxx : _168_;
+  assign _073_ = _017_ ? 16'h0000 : _072_;
+  \ReadRequestFsm$BobFPGA.bob.bobby.fsm  fsm (
+    .all_id(all_id),
+    .clock(clock),
+    .divert_waiting(divert_waiting),
+    .emergency(emergency_out),
+    .emergency_id(emergency_id),
+    .flush_landings(flush_landings),
+    .id_full(id_full),
+    .landing_count(landing_count),
+    .landing_fifo_empty(landing_fifo_empty),
+    .landing_fifo_full(landing_fifo_full),
+    .lock(lock),
+    .queue_landing_plane(queue_landing_plane),
+    .queue_reply(queue_reply),
+    .queue_status(queue_status),
+    .queue_takeoff_plane(queue_takeoff_plane),
+    .queue_urgent_reply(queue_urgent_reply),
+    .release_id(release_id),
+    .reply_fifo_full(reply_fifo_full),
+    .reset(reset),
+    .runway(runway),
+    .runway_active(runway_active),
+    .runway_id(runway_id),
+    .schedule(schedule),
+    .sel_takeoff_id_lock(sel_takeoff_id_lock),
+    .send_clear(send_clear),
+    .send_divert(send_divert),
+    .send_divert_landing(send_divert_landing),
+    .send_echo(send_echo),
+    .send_hold(send_hold),
+    .send_invalid_id(send_invalid_id),
+    .send_say_ag(send_say_ag),
+    .send_status(send_status),
+    .send_valid_id(send_valid_id),
+    .set_emergency(set_emergency),
+    .set_schedule(set_schedule),
+    .status_done(status_done),
+    .switch_rx_baud(switch_rx_baud),
+    .switch_tx_baud(switch_tx_baud),
+    .take_id(take_id),
+    .take_snapshot(take_snapshot),
+    .takeoff_count(takeoff_count),
+    .takeoff_fifo_empty(takeoff_fifo_empty),
+    .takeoff_fifo_full(takeoff_fifo_full),
+    .uart_empty(uart_empty),
+    .uart_rd_request(uart_rd_request),
+    .uart_request(uart_request),
+    .uart_tx_idle(uart_tx_idle),
+    .unlock(unlock),
+    .unqueue_landing_plane(unqueue_landing_plane),
+    .unqueue_takeoff_plane(unqueue_takeoff_plane),
+    .unset_emergency(unset_emergency),
+    .urgent_fifo_full(urgent_fifo_full)
+  );
+  \AircraftIDManager$BobFPGA.bob.bobby.id_manager  id_manager (
+    .all_id(all_id),
+    .clock(clock),
+    .full(id_full),
+    .id_in(uart_request[7:4]),
+    .id_out(new_id),
+    .release_id(release_id),
+    .release_mask(_013_),
+    .reserved_id(divert_pending),
+    .reset(reset),
+    .take_id(take_id)
+  );
+  \FIFO$BobFPGA.bob.bobby.landing_fifo  landing_fifo (
+    .clock(clock),
+    .count(landing_count),
+    .data_in(uart_request[7:4]),
+    .data_out(cleared_landing_id),
+    .empty(landing_fifo_empty),
+    .full(landing_fifo_full),
+    .re(unqueue_landing_plane),
+    .reset(_012_),
+    .we(queue_landing_plane)
+  );
+  \SendReplyFsm$BobFPGA.bob.bobby.reply_fsm  reply_fsm (
+    .clock(clock),
+    .reply_fifo_empty(reply_fifo_empty),
+    .reset(reset),
+    .send_reply(send_reply),
+    .send_urgent(send_urgent),
+    .status_in_progress(status_in_progress),
+    .uart_tx_ready(uart_tx_ready),
+    .uart_tx_send(uart_tx_send),
+    .urgent_fifo_empty(urgent_fifo_empty)
+  );
+  \RunwayManager$BobFPGA.bob.bobby.runway_manager  runway_manager (
+    .clock(clock),
+    .lock(lock),
+    .plane_id_lock(cleared_id_to_lock),
+    .plane_id_unlock(uart_request[7:4]),
+    .reset(reset),
+    .runway(runway),
+    .runway_active(runway_active),
+    .runway_id(runway_id),
+    .runway_override(runway_override),
+    .unlock(unlock)
+  );
+  \FIFO$BobFPGA.bob.bobby.takeoff_fifo  takeoff_fifo (
+    .clock(clock),
+    .count(takeoff_count),
+    .data_in(uart_request[7:4]),
+    .data_out(cleared_takeoff_id),
+    .empty(takeoff_fifo_empty),
+    .full(takeoff_fifo_full),
+    .re(unqueue_takeoff_plane),
+    .reset(reset),
+    .we(queue_takeoff_plane)
+  );
+  \FIFO$BobFPGA.bob.bobby.uart_replies  uart_replies (
+    .clock(clock),
+    .count(reply_count),
+    .data_in({ queue_status, reply_to_send }),
+    .data_out({ sent_status, reply_tx_data }),
+    .empty(reply_fifo_empty),
+    .full(reply_fifo_full),
+    .re(send_reply),
+    .reset(reset),
+    .we(reply_fifo_we)
+  );
+  \FIFO$BobFPGA.bob.bobby.uart_requests  uart_requests (
+    .clock(clock),
+    .count(uart_request_count),
+    .data_in(uart_rx_data),
+    .data_out(uart_request),
+    .empty(uart_empty),
+    .re(uart_rd_request),
+    .reset(reset),
+    .we(uart_rx_valid)
+  );
+  \FIFO$BobFPGA.bob.bobby.urgent_replies  urgent_replies (
+    .clock(clock),
+    .count(urgent_count),
+    .data_in(reply_to_send),
+    .data_out(urgent_tx_data),
+    .empty(urgent_fifo_empty),
+    .full(urgent_reply_fifo_full),
+    .re(send_urgent),
+    .reset(reset),
+    .we(urgent_fifo_we)
+  );
+  assign sent_reply = reply_tx_data;
 endmodule
-module FIFO (
-	clock,
-	reset,
-	data_in,
-	we,
-	re,
-	data_out,
-	full,
-	empty
-);
-	parameter signed [31:0] WIDTH = 8;
-	parameter signed [31:0] DEPTH = 4;
-	input wire clock;
-	input wire reset;
-	input wire [WIDTH - 1:0] data_in;
-	input wire we;
-	input wire re;
-	output reg [WIDTH - 1:0] data_out;
-	output wire full;
-	output wire empty;
-	reg [(DEPTH * WIDTH) - 1:0] queue;
-	reg [$clog2(DEPTH):0] count;
-	reg [$clog2(DEPTH) - 1:0] put_ptr;
-	reg [$clog2(DEPTH) - 1:0] get_ptr;
-	assign empty = count == 0;
-	assign full = count == DEPTH;
-	always @(posedge clock)
-		if (reset) begin
-			count <= 0;
-			get_ptr <= 0;
-			put_ptr <= 0;
-			data_out <= 0;
-		end
-		else if ((re && !empty) && we) begin
-			data_out <= queue[get_ptr * WIDTH+:WIDTH];
-			get_ptr <= get_ptr + 1;
-			queue[put_ptr * WIDTH+:WIDTH] <= data_in;
-			put_ptr <= put_ptr + 1;
-		end
-		else if (re && !empty) begin
-			data_out <= queue[get_ptr * WIDTH+:WIDTH];
-			get_ptr <= get_ptr + 1;
-			count <= count - 1;
-		end
-		else if (we && !full) begin
-			queue[put_ptr * WIDTH+:WIDTH] <= data_in;
-			put_ptr <= put_ptr + 1;
-			count <= count + 1;
-		end
+
+module BobTop(clock, reset_n, rx, runway_override, emergency_override, tx, framing_error, runway_active, emergency, receiving, sending, cts_n);
+  input clock;
+  wire clock;
+  input reset_n;
+  wire reset_n;
+  input rx;
+  wire rx;
+  input [1:0] runway_override;
+  wire [1:0] runway_override;
+  input emergency_override;
+  wire emergency_override;
+  output tx;
+  wire tx;
+  output framing_error;
+  wire framing_error;
+  output [1:0] runway_active;
+  wire [1:0] runway_active;
+  output emergency;
+  wire emergency;
+  output receiving;
+  wire receiving;
+  output sending;
+  wire sending;
+  output cts_n;
+  wire cts_n;
+  wire _0_;
+  assign _0_ = ~ reset_n;
+  \BobTop$BobFPGA.bob  bob (
+    .baud_strap(2'h0),
+    .clock(clock),
+    .cts_n(cts_n),
+    .emergency(emergency),
+    .emergency_override(emergency_override),
+    .framing_error(framing_error),
+    .receiving(receiving),
+    .reset(_0_),
+    .runway_active(runway_active),
+    .runway_override(runway_override),
+    .rx(rx),
+    .sending(sending),
+    .tx(tx)
+  );
 endmodule
-module RunwayManager (
-	clock,
-	reset,
-	plane_id_unlock,
-	plane_id_lock,
-	runway_id,
-	lock,
-	unlock,
-	runway_override,
-	runway_active,
-	runway
-);
-	input wire clock;
-	input wire reset;
-	input wire [3:0] plane_id_unlock;
-	input wire [3:0] plane_id_lock;
-	input wire runway_id;
-	input wire lock;
-	input wire unlock;
-	input wire [1:0] runway_override;
-	output wire [1:0] runway_active;
-	output reg [9:0] runway;
-	assign runway_active[0] = runway[0] | runway_override[0];
-	assign runway_active[1] = runway[5] | runway_override[1];
-	always @(posedge clock)
-		if (reset)
-			runway <= 1'sb0;
-		else if (lock && !unlock) begin
-			if (runway_id) begin
-				runway[9-:4] <= plane_id_lock;
-				runway[5] <= 1'b1;
-			end
-			else begin
-				runway[4-:4] <= plane_id_lock;
-				runway[0] <= 1'b1;
-			end
-		end
-		else if (!lock && unlock) begin
-			if (runway_id) begin
-				if (plane_id_unlock == runway[9-:4])
-					runway[5] <= 1'b0;
-			end
-			else if (plane_id_unlock == runway[4-:4])
-				runway[0] <= 1'b0;
-		end
+
+module \BobTop$BobFPGA.bob (reset, clock, rx, runway_override, emergency_override, tx, framing_error, runway_active, emergency, receiving, sending, cts_n, baud_strap);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input rx;
+  wire rx;
+  input [1:0] runway_override;
+  wire [1:0] runway_override;
+  input emergency_override;
+  wire emergency_override;
+  output tx;
+  wire tx;
+  output framing_error;
+  wire framing_error;
+  output [1:0] runway_active;
+  wire [1:0] runway_active;
+  output emergency;
+  wire emergency;
+  output receiving;
+  wire receiving;
+  output sending;
+  wire sending;
+  output cts_n;
+  wire cts_n;
+  input [1:0] baud_strap;
+  wire [1:0] baud_strap;
+  reg eo_sync;
+  reg eo_temp;
+  reg [1:0] ro_sync;
+  reg [1:0] ro_temp;
+  wire [1:0] rx_baud_sel;
+  wire [1:0] tx_baud_sel;
+  wire [7:0] uart_rx_data;
+  wire uart_rx_ready;
+  wire uart_rx_valid;
+  wire [7:0] uart_tx_data;
+  wire uart_tx_ready;
+  wire uart_tx_send;
+  assign cts_n = ~ uart_rx_ready;
+  always @(posedge clock)
+    eo_sync <= eo_temp;
+  always @(posedge clock)
+    eo_temp <= emergency_override;
+  always @(posedge clock)
+    ro_sync <= ro_temp;
+  always @(posedge clock)
+    ro_temp <= runway_override;
+  \Bob$BobFPGA.bob.bobby  bobby (
+    .baud_strap(baud_strap),
+    .clock(clock),
+    .emergency_out(emergency),
+    .emergency_override(eo_sync),
+    .reset(reset),
+    .runway_active(runway_active),
+    .runway_override(ro_sync),
+    .rx_baud_sel(rx_baud_sel),
+    .tx_baud_sel(tx_baud_sel),
+    .uart_rx_data(uart_rx_data),
+    .uart_rx_ready(uart_rx_ready),
+    .uart_rx_valid(uart_rx_valid),
+    .uart_tx_data(uart_tx_data),
+    .uart_tx_ready(uart_tx_ready),
+    .uart_tx_send(uart_tx_send)
+  );
+  \UartRX$BobFPGA.bob.receiver  receiver (
+    .baud_sel(rx_baud_sel),
+    .clock(clock),
+    .data(uart_rx_data),
+    .done(uart_rx_valid),
+    .framing_error(framing_error),
+    .receiving(receiving),
+    .reset(reset),
+    .rx(rx)
+  );
+  \UartTX$BobFPGA.bob.transmitter  transmitter (
+    .baud_sel(tx_baud_sel),
+    .clock(clock),
+    .data(uart_tx_data),
+    .ready(uart_tx_ready),
+    .reset(reset),
+    .send(uart_tx_send),
+    .sending(sending),
+    .tx(tx)
+  );
 endmodule
-module AircraftIDManager (
-	clock,
-	reset,
-	id_in,
-	release_id,
-	take_id,
-	id_out,
-	all_id,
-	full
-);
-	input wire clock;
-	input wire reset;
-	input wire [3:0] id_in;
-	input wire release_id;
-	input wire take_id;
-	output wire [3:0] id_out;
-	output wire [15:0] all_id;
-	output wire full;
-	reg [15:0] taken_id;
-	reg [3:0] id_avail;
-	assign all_id = taken_id;
-	assign id_out = id_avail;
-	assign full = taken_id == 16'hffff;
-	always @(*) begin
-		id_avail = 4'd0;
-		case (1'b0)
-			taken_id[0]: id_avail = 4'd0;
-			taken_id[1]: id_avail = 4'd1;
-			taken_id[2]: id_avail = 4'd2;
-			taken_id[3]: id_avail = 4'd3;
-			taken_id[4]: id_avail = 4'd4;
-			taken_id[5]: id_avail = 4'd5;
-			taken_id[6]: id_avail = 4'd6;
-			taken_id[7]: id_avail = 4'd7;
-			taken_id[8]: id_avail = 4'd8;
-			taken_id[9]: id_avail = 4'd9;
-			taken_id[10]: id_avail = 4'd10;
-			taken_id[11]: id_avail = 4'd11;
-			taken_id[12]: id_avail = 4'd12;
-			taken_id[13]: id_avail = 4'd13;
-			taken_id[14]: id_avail = 4'd14;
-			taken_id[15]: id_avail = 4'd15;
-			default: id_avail = 4'd0;
-		endcase
-	end
-	always @(posedge clock)
-		if (reset)
-			taken_id <= 1'sb0;
-		else if (release_id)
-			taken_id[id_in] <= 1'b0;
-		else if (take_id && !full)
-			taken_id[id_avail] <= 1'b1;
+
+module \FIFO$BobFPGA.bob.bobby.landing_fifo (reset, clock, data_in, we, re, data_out, empty, count, full);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [3:0] data_in;
+  wire [3:0] data_in;
+  input we;
+  wire we;
+  input re;
+  wire re;
+  output [3:0] data_out;
+  reg [3:0] data_out;
+  output empty;
+  wire empty;
+  output [3:0] count;
+  reg [3:0] count;
+  output full;
+  wire full;
+  wire [31:0] _000_;
+  wire [31:0] _001_;
+  wire [31:0] _002_;
+  wire _003_;
+  wire _004_;
+  wire [3:0] _005_;
+  wire [31:0] _006_;
+  wire [31:0] _007_;
+  wire _008_;
+  wire _009_;
+  wire [31:0] _010_;
+  wire [31:0] _011_;
+  wire [31:0] _012_;
+  wire [31:0] _013_;
+  wire _014_;
+  wire _015_;
+  wire _016_;
+  wire [3:0] _017_;
+  wire [31:0] _018_;
+  wire [15:0] _019_;
+  wire [7:0] _020_;
+  wire [15:0] _021_;
+  wire [7:0] _022_;
+  wire _023_;
+  wire _024_;
+  wire _025_;
+  wire _026_;
+  wire _027_;
+  wire _028_;
+  wire _029_;
+  wire _030_;
+  wire _031_;
+  wire _032_;
+  wire _033_;
+  wire _034_;
+  wire _035_;
+  wire _036_;
+  wire _037_;
+  wire _038_;
+  wire [31:0] _039_;
+  wire [31:0] _040_;
+  wire [31:0] _041_;
+  wire [31:0] _042_;
+  wire [31:0] _043_;
+  wire [31:0] _044_;
+  wire [3:0] _045_;
+  wire [3:0] _046_;
+  wire [3:0] _047_;
+  wire [3:0] _048_;
+  wire [3:0] _049_;
+  wire [3:0] _050_;
+  wire [3:0] _051_;
+  wire [2:0] _052_;
+  wire [2:0] _053_;
+  wire [2:0] _054_;
+  wire [2:0] _055_;
+  wire [2:0] _056_;
+  wire [2:0] _057_;
+  wire [2:0] _058_;
+  wire [31:0] _059_;
+  wire [31:0] _060_;
+  wire [31:0] _061_;
+  wire [31:0] _062_;
+  wire [3:0] _063_;
+  wire [3:0] _064_;
+  wire [3:0] _065_;
+  wire [3:0] _066_;
+  wire [3:0] _067_;
+  wire [2:0] _068_;
+  wire [2:0] _069_;
+  wire [2:0] _070_;
+  wire [2:0] _071_;
+  wire [2:0] _072_;
+  wire [31:0] _073_;
+  wire [31:0] _074_;
+  wire [31:0] _075_;
+  wire [3:0] _076_;
+  wire [3:0] _077_;
+  wire [2:0] _078_;
+  wire [2:0] _079_;
+  wire [2:0] _080_;
+  wire [31:0] _081_;
+  wire [31:0] _082_;
+  wire [3:0] _083_;
+  wire [3:0] _084_;
+  wire [2:0] _085_;
+  wire [31:0] _086_;
+  reg [2:0] get_ptr;
+  reg [2:0] put_ptr;
+  reg [31:0] queue;
+  assign empty = ! count;
+  assign _002_ = { 29'h00000000, put_ptr } + 32'd1;
+  assign _003_ = ! empty;
+  assign _004_ = re && _003_;
+  assign _006_ = { 29'h00000000, get_ptr } + 32'd1;
+  assign _007_ = { 28'h0000000, count } - 32'd1;
+  assign _008_ = ! full;
+  assign _009_ = we && _008_;
+  assign full = count == 4'h8;
+  assign _012_ = { 29'h00000000, put_ptr } + 32'd1;
+  assign _013_ = { 28'h0000000, count } + 32'd1;
+  assign _014_ = ! empty;
+  assign _015_ = re && _014_;
+  assign _016_ = _015_ && we;
+  assign _018_ = { 29'h00000000, get_ptr } + 32'd1;
+  assign _019_[3:0] = get_ptr[0] ? queue[7:4] : queue[3:0];
+  assign _019_[7:4] = get_ptr[0] ? queue[15:12] : queue[11:8];
+  assign _019_[11:8] = get_ptr[0] ? queue[23:20] : queue[19:16];
+  assign _019_[15:12] = get_ptr[0] ? queue[31:28] : queue[27:24];
+  assign _020_[3:0] = get_ptr[1] ? _019_[7:4] : _019_[3:0];
+  assign _020_[7:4] = get_ptr[1] ? _019_[15:12] : _019_[11:8];
+  assign _005_ = get_ptr[2] ? _020_[7:4] : _020_[3:0];
+  assign _021_[3:0] = get_ptr[0] ? queue[7:4] : queue[3:0];
+  assign _021_[7:4] = get_ptr[0] ? queue[15:12] : queue[11:8];
+  assign _021_[11:8] = get_ptr[0] ? queue[23:20] : queue[19:16];
+  assign _021_[15:12] = get_ptr[0] ? queue[31:28] : queue[27:24];
+  assign _022_[3:0] = get_ptr[1] ? _021_[7:4] : _021_[3:0];
+  assign _022_[7:4] = get_ptr[1] ? _021_[15:12] : _021_[11:8];
+  assign _017_ = get_ptr[2] ? _022_[7:4] : _022_[3:0];
+  assign _039_ = ~ _010_;
+  assign _040_ = ~ _000_;
+  assign _041_ = _010_ & { data_in, data_in, data_in, data_in, data_in, data_in, data_in, data_in };
+  assign _043_ = _000_ & { data_in, data_in, data_in, data_in, data_in, data_in, data_in, data_in };
+  assign _042_ = _039_ & queue;
+  assign _044_ = _040_ & queue;
+  assign _011_ = _042_ | _041_;
+  assign _001_ = _044_ | _043_;
+  assign _023_ = put_ptr == 3'h0;
+  assign _024_ = put_ptr == 3'h1;
+  assign _025_ = put_ptr == 3'h2;
+  assign _026_ = put_ptr == 3'h3;
+  assign _027_ = put_ptr == 3'h4;
+  assign _028_ = put_ptr == 3'h5;
+  assign _029_ = put_ptr == 3'h6;
+  assign _030_ = put_ptr == 3'h7;
+  assign _031_ = put_ptr == 3'h0;
+  assign _032_ = put_ptr == 3'h1;
+  assign _033_ = put_ptr == 3'h2;
+  assign _034_ = put_ptr == 3'h3;
+  assign _035_ = put_ptr == 3'h4;
+  assign _036_ = put_ptr == 3'h5;
+  assign _037_ = put_ptr == 3'h6;
+  assign _038_ = put_ptr == 3'h7;
+  assign _010_[3:0] = _023_ ? 4'hf : 4'h0;
+  assign _010_[7:4] = _024_ ? 4'hf : 4'h0;
+  assign _010_[11:8] = _025_ ? 4'hf : 4'h0;
+  assign _010_[15:12] = _026_ ? 4'hf : 4'h0;
+  assign _010_[19:16] = _027_ ? 4'hf : 4'h0;
+  assign _010_[23:20] = _028_ ? 4'hf : 4'h0;
+  assign _010_[27:24] = _029_ ? 4'hf : 4'h0;
+  assign _010_[31:28] = _030_ ? 4'hf : 4'h0;
+  assign _000_[3:0] = _031_ ? 4'hf : 4'h0;
+  assign _000_[7:4] = _032_ ? 4'hf : 4'h0;
+  assign _000_[11:8] = _033_ ? 4'hf : 4'h0;
+  assign _000_[15:12] = _034_ ? 4'hf : 4'h0;
+  assign _000_[19:16] = _035_ ? 4'hf : 4'h0;
+  assign _000_[23:20] = _036_ ? 4'hf : 4'h0;
+  assign _000_[27:24] = _037_ ? 4'hf : 4'h0;
+  assign _000_[31:28] = _038_ ? 4'hf : 4'h0;
+  always @(posedge clock)
+    count <= _048_;
+  always @(posedge clock)
+    data_out <= _051_;
+  always @(posedge clock)
+    get_ptr <= _054_;
+  always @(posedge clock)
+    put_ptr <= _085_;
+  always @(posedge clock)
+    queue[3:0] <= _086_[3:0];
+  always @(posedge clock)
+    queue[7:4] <= _086_[7:4];
+  always @(posedge clock)
+    queue[11:8] <= _086_[11:8];
+  always @(posedge clock)
+    queue[15:12] <= _086_[15:12];
+  always @(posedge clock)
+    queue[19:16] <= _086_[19:16];
+  always @(posedge clock)
+    queue[23:20] <= _086_[23:20];
+  always @(posedge clock)
+    queue[27:24] <= _086_[27:24];
+  always @(posedge clock)
+    queue[31:28] <= _086_[31:28];
+  assign _055_ = _009_ ? _012_[2:0] : put_ptr;
+  assign _056_ = _004_ ? 3'hx : _055_;
+  assign _057_ = _016_ ? 3'hx : _056_;
+  assign _058_ = reset ? 3'hx : _057_;
+  assign _059_ = _009_ ? _011_ : queue;
+  assign _060_ = _004_ ? 32'hxxxxxxxx : _059_;
+  assign _061_ = _016_ ? 32'hxxxxxxxx : _060_;
+  assign _062_ = reset ? 32'hxxxxxxxx : _061_;
+  assign _063_ = _009_ ? _013_[3:0] : count;
+  assign _064_ = _004_ ? 4'hx : _063_;
+  assign _065_ = _016_ ? 4'hx : _064_;
+  assign _045_ = reset ? 4'hx : _065_;
+  assign _066_ = _004_ ? _007_[3:0] : _045_;
+  assign _067_ = _016_ ? 4'hx : _066_;
+  assign _046_ = reset ? 4'hx : _067_;
+  assign _068_ = _004_ ? _006_[2:0] : get_ptr;
+  assign _069_ = _016_ ? 3'hx : _068_;
+  assign _052_ = reset ? 3'hx : _069_;
+  assign _070_ = _004_ ? put_ptr : _058_;
+  assign _071_ = _016_ ? 3'hx : _070_;
+  assign _072_ = reset ? 3'hx : _071_;
+  assign _073_ = _004_ ? queue : _062_;
+  assign _074_ = _016_ ? 32'hxxxxxxxx : _073_;
+  assign _075_ = reset ? 32'hxxxxxxxx : _074_;
+  assign _076_ = _004_ ? _005_ : data_out;
+  assign _077_ = _016_ ? 4'hx : _076_;
+  assign _049_ = reset ? 4'hx : _077_;
+  assign _078_ = _016_ ? _018_[2:0] : _052_;
+  assign _053_ = reset ? 3'hx : _078_;
+  assign _079_ = _016_ ? _002_[2:0] : _072_;
+  assign _080_ = reset ? 3'hx : _079_;
+  assign _081_ = _016_ ? _001_ : _075_;
+  assign _082_ = reset ? 32'hxxxxxxxx : _081_;
+  assign _083_ = _016_ ? _017_ : _049_;
+  assign _050_ = reset ? 4'hx : _083_;
+  assign _084_ = _016_ ? count : _046_;
+  assign _047_ = reset ? 4'hx : _084_;
+  assign _054_ = reset ? 3'h0 : _053_;
+  assign _085_ = reset ? 3'h0 : _080_;
+  assign _048_ = reset ? 4'h0 : _047_;
+  assign _051_ = reset ? 4'h0 : _050_;
+  assign _086_ = reset ? queue : _082_;
 endmodule
-`default_nettype none
-module UartRX (
-	clock,
-	reset,
-	rx,
-	data,
-	done,
-	framing_error,
-	receiving
-);
-	parameter signed [31:0] CLK_HZ = 25000000;
-	parameter signed [31:0] BAUD_RATE = 115200;
-	input wire clock;
-	input wire reset;
-	input wire rx;
-	output reg [7:0] data;
-	output wire done;
-	output wire framing_error;
-	output wire receiving;
-	wire start;
-	wire tick;
-	BaudRateGenerator #(
-		.CLK_HZ(CLK_HZ),
-		.BAUD_RATE(BAUD_RATE)
-	) conductor(
-		.clock(clock),
-		.reset(reset),
-		.start_rx(start),
-		.start_tx(1'b0),
-		.tick(tick)
-	);
-	wire collect_data;
-	wire en_data_counter;
-	wire clear_data_counter;
-	reg [3:0] data_counter;
-	wire done_data;
-	always @(posedge clock)
-		if (reset)
-			data <= 1'sb0;
-		else if (collect_data && tick) begin
-			data <= data >> 1;
-			data[7] <= rx;
-		end
-	assign done_data = data_counter == 4'd8;
-	always @(posedge clock)
-		if (reset || clear_data_counter)
-			data_counter <= 1'sb0;
-		else if (en_data_counter && tick)
-			data_counter <= data_counter + 1'b1;
-	UartRXFsm fsm(
-		.clock(clock),
-		.reset(reset),
-		.tick(tick),
-		.rx(rx),
-		.done_data(done_data),
-		.start(start),
-		.collect_data(collect_data),
-		.en_data_counter(en_data_counter),
-		.clear_data_counter(clear_data_counter),
-		.framing_error(framing_error),
-		.done(done),
-		.receiving(receiving)
-	);
+
+module \FIFO$BobFPGA.bob.bobby.takeoff_fifo (reset, clock, data_in, we, re, data_out, empty, count, full);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [3:0] data_in;
+  wire [3:0] data_in;
+  input we;
+  wire we;
+  input re;
+  wire re;
+  output [3:0] data_out;
+  reg [3:0] data_out;
+  output empty;
+  wire empty;
+  output [3:0] count;
+  reg [3:0] count;
+  output full;
+  wire full;
+  wire [31:0] _000_;
+  wire [31:0] _001_;
+  wire [31:0] _002_;
+  wire _003_;
+  wire _004_;
+  wire [3:0] _005_;
+  wire [31:0] _006_;
+  wire [31:0] _007_;
+  wire _008_;
+  wire _009_;
+  wire [31:0] _010_;
+  wire [31:0] _011_;
+  wire [31:0] _012_;
+  wire [31:0] _013_;
+  wire _014_;
+  wire _015_;
+  wire _016_;
+  wire [3:0] _017_;
+  wire [31:0] _018_;
+  wire [15:0] _019_;
+  wire [7:0] _020_;
+  wire [15:0] _021_;
+  wire [7:0] _022_;
+  wire _023_;
+  wire _024_;
+  wire _025_;
+  wire _026_;
+  wire _027_;
+  wire _028_;
+  wire _029_;
+  wire _030_;
+  wire _031_;
+  wire _032_;
+  wire _033_;
+  wire _034_;
+  wire _035_;
+  wire _036_;
+  wire _037_;
+  wire _038_;
+  wire [31:0] _039_;
+  wire [31:0] _040_;
+  wire [31:0] _041_;
+  wire [31:0] _042_;
+  wire [31:0] _043_;
+  wire [31:0] _044_;
+  wire [3:0] _045_;
+  wire [3:0] _046_;
+  wire [3:0] _047_;
+  wire [3:0] _048_;
+  wire [3:0] _049_;
+  wire [3:0] _050_;
+  wire [3:0] _051_;
+  wire [2:0] _052_;
+  wire [2:0] _053_;
+  wire [2:0] _054_;
+  wire [2:0] _055_;
+  wire [2:0] _056_;
+  wire [2:0] _057_;
+  wire [2:0] _058_;
+  wire [31:0] _059_;
+  wire [31:0] _060_;
+  wire [31:0] _061_;
+  wire [31:0] _062_;
+  wire [3:0] _063_;
+  wire [3:0] _064_;
+  wire [3:0] _065_;
+  wire [3:0] _066_;
+  wire [3:0] _067_;
+  wire [2:0] _068_;
+  wire [2:0] _069_;
+  wire [2:0] _070_;
+  wire [2:0] _071_;
+  wire [2:0] _072_;
+  wire [31:0] _073_;
+  wire [31:0] _074_;
+  wire [31:0] _075_;
+  wire [3:0] _076_;
+  wire [3:0] _077_;
+  wire [2:0] _078_;
+  wire [2:0] _079_;
+  wire [2:0] _080_;
+  wire [31:0] _081_;
+  wire [31:0] _082_;
+  wire [3:0] _083_;
+  wire [3:0] _084_;
+  wire [2:0] _085_;
+  wire [31:0] _086_;
+  reg [2:0] get_ptr;
+  reg [2:0] put_ptr;
+  reg [31:0] queue;
+  assign empty = ! count;
+  assign _002_ = { 29'h00000000, put_ptr } + 32'd1;
+  assign _003_ = ! empty;
+  assign _004_ = re && _003_;
+  assign _006_ = { 29'h00000000, get_ptr } + 32'd1;
+  assign _007_ = { 28'h0000000, count } - 32'd1;
+  assign _008_ = ! full;
+  assign _009_ = we && _008_;
+  assign full = count == 4'h8;
+  assign _012_ = { 29'h00000000, put_ptr } + 32'd1;
+  assign _013_ = { 28'h0000000, count } + 32'd1;
+  assign _014_ = ! empty;
+  assign _015_ = re && _014_;
+  assign _016_ = _015_ && we;
+  assign _018_ = { 29'h00000000, get_ptr } + 32'd1;
+  assign _019_[3:0] = get_ptr[0] ? queue[7:4] : queue[3:0];
+  assign _019_[7:4] = get_ptr[0] ? queue[15:12] : queue[11:8];
+  assign _019_[11:8] = get_ptr[0] ? queue[23:20] : queue[19:16];
+  assign _019_[15:12] = get_ptr[0] ? queue[31:28] : queue[27:24];
+  assign _020_[3:0] = get_ptr[1] ? _019_[7:4] : _019_[3:0];
+  assign _020_[7:4] = get_ptr[1] ? _019_[15:12] : _019_[11:8];
+  assign _005_ = get_ptr[2] ? _020_[7:4] : _020_[3:0];
+  assign _021_[3:0] = get_ptr[0] ? queue[7:4] : queue[3:0];
+  assign _021_[7:4] = get_ptr[0] ? queue[15:12] : queue[11:8];
+  assign _021_[11:8] = get_ptr[0] ? queue[23:20] : queue[19:16];
+  assign _021_[15:12] = get_ptr[0] ? queue[31:28] : queue[27:24];
+  assign _022_[3:0] = get_ptr[1] ? _021_[7:4] : _021_[3:0];
+  assign _022_[7:4] = get_ptr[1] ? _021_[15:12] : _021_[11:8];
+  assign _017_ = get_ptr[2] ? _022_[7:4] : _022_[3:0];
+  assign _039_ = ~ _010_;
+  assign _040_ = ~ _000_;
+  assign _041_ = _010_ & { data_in, data_in, data_in, data_in, data_in, data_in, data_in, data_in };
+  assign _043_ = _000_ & { data_in, data_in, data_in, data_in, data_in, data_in, data_in, data_in };
+  assign _042_ = _039_ & queue;
+  assign _044_ = _040_ & queue;
+  assign _011_ = _042_ | _041_;
+  assign _001_ = _044_ | _043_;
+  assign _023_ = put_ptr == 3'h0;
+  assign _024_ = put_ptr == 3'h1;
+  assign _025_ = put_ptr == 3'h2;
+  assign _026_ = put_ptr == 3'h3;
+  assign _027_ = put_ptr == 3'h4;
+  assign _028_ = put_ptr == 3'h5;
+  assign _029_ = put_ptr == 3'h6;
+  assign _030_ = put_ptr == 3'h7;
+  assign _031_ = put_ptr == 3'h0;
+  assign _032_ = put_ptr == 3'h1;
+  assign _033_ = put_ptr == 3'h2;
+  assign _034_ = put_ptr == 3'h3;
+  assign _035_ = put_ptr == 3'h4;
+  assign _036_ = put_ptr == 3'h5;
+  assign _037_ = put_ptr == 3'h6;
+  assign _038_ = put_ptr == 3'h7;
+  assign _010_[3:0] = _023_ ? 4'hf : 4'h0;
+  assign _010_[7:4] = _024_ ? 4'hf : 4'h0;
+  assign _010_[11:8] = _025_ ? 4'hf : 4'h0;
+  assign _010_[15:12] = _026_ ? 4'hf : 4'h0;
+  assign _010_[19:16] = _027_ ? 4'hf : 4'h0;
+  assign _010_[23:20] = _028_ ? 4'hf : 4'h0;
+  assign _010_[27:24] = _029_ ? 4'hf : 4'h0;
+  assign _010_[31:28] = _030_ ? 4'hf : 4'h0;
+  assign _000_[3:0] = _031_ ? 4'hf : 4'h0;
+  assign _000_[7:4] = _032_ ? 4'hf : 4'h0;
+  assign _000_[11:8] = _033_ ? 4'hf : 4'h0;
+  assign _000_[15:12] = _034_ ? 4'hf : 4'h0;
+  assign _000_[19:16] = _035_ ? 4'hf : 4'h0;
+  assign _000_[23:20] = _036_ ? 4'hf : 4'h0;
+  assign _000_[27:24] = _037_ ? 4'hf : 4'h0;
+  assign _000_[31:28] = _038_ ? 4'hf : 4'h0;
+  always @(posedge clock)
+    count <= _048_;
+  always @(posedge clock)
+    data_out <= _051_;
+  always @(posedge clock)
+    get_ptr <= _054_;
+  always @(posedge clock)
+    put_ptr <= _085_;
+  always @(posedge clock)
+    queue[3:0] <= _086_[3:0];
+  always @(posedge clock)
+    queue[7:4] <= _086_[7:4];
+  always @(posedge clock)
+    queue[11:8] <= _086_[11:8];
+  always @(posedge clock)
+    queue[15:12] <= _086_[15:12];
+  always @(posedge clock)
+    queue[19:16] <= _086_[19:16];
+  always @(posedge clock)
+    queue[23:20] <= _086_[23:20];
+  always @(posedge clock)
+    queue[27:24] <= _086_[27:24];
+  always @(posedge clock)
+    queue[31:28] <= _086_[31:28];
+  assign _055_ = _009_ ? _012_[2:0] : put_ptr;
+  assign _056_ = _004_ ? 3'hx : _055_;
+  assign _057_ = _016_ ? 3'hx : _056_;
+  assign _058_ = reset ? 3'hx : _057_;
+  assign _059_ = _009_ ? _011_ : queue;
+  assign _060_ = _004_ ? 32'hxxxxxxxx : _059_;
+  assign _061_ = _016_ ? 32'hxxxxxxxx : _060_;
+  assign _062_ = reset ? 32'hxxxxxxxx : _061_;
+  assign _063_ = _009_ ? _013_[3:0] : count;
+  assign _064_ = _004_ ? 4'hx : _063_;
+  assign _065_ = _016_ ? 4'hx : _064_;
+  assign _045_ = reset ? 4'hx : _065_;
+  assign _066_ = _004_ ? _007_[3:0] : _045_;
+  assign _067_ = _016_ ? 4'hx : _066_;
+  assign _046_ = reset ? 4'hx : _067_;
+  assign _068_ = _004_ ? _006_[2:0] : get_ptr;
+  assign _069_ = _016_ ? 3'hx : _068_;
+  assign _052_ = reset ? 3'hx : _069_;
+  assign _070_ = _004_ ? put_ptr : _058_;
+  assign _071_ = _016_ ? 3'hx : _070_;
+  assign _072_ = reset ? 3'hx : _071_;
+  assign _073_ = _004_ ? queue : _062_;
+  assign _074_ = _016_ ? 32'hxxxxxxxx : _073_;
+  assign _075_ = reset ? 32'hxxxxxxxx : _074_;
+  assign _076_ = _004_ ? _005_ : data_out;
+  assign _077_ = _016_ ? 4'hx : _076_;
+  assign _049_ = reset ? 4'hx : _077_;
+  assign _078_ = _016_ ? _018_[2:0] : _052_;
+  assign _053_ = reset ? 3'hx : _078_;
+  assign _079_ = _016_ ? _002_[2:0] : _072_;
+  assign _080_ = reset ? 3'hx : _079_;
+  assign _081_ = _016_ ? _001_ : _075_;
+  assign _082_ = reset ? 32'hxxxxxxxx : _081_;
+  assign _083_ = _016_ ? _017_ : _049_;
+  assign _050_ = reset ? 4'hx : _083_;
+  assign _084_ = _016_ ? count : _046_;
+  assign _047_ = reset ? 4'hx : _084_;
+  assign _054_ = reset ? 3'h0 : _053_;
+  assign _085_ = reset ? 3'h0 : _080_;
+  assign _048_ = reset ? 4'h0 : _047_;
+  assign _051_ = reset ? 4'h0 : _050_;
+  assign _086_ = reset ? queue : _082_;
 endmodule
-module UartRXFsm (
-	clock,
-	reset,
-	tick,
-	rx,
-	done_data,
-	start,
-	collect_data,
-	en_data_counter,
-	clear_data_counter,
-	framing_error,
-	done,
-	receiving
-);
-	input wire clock;
-	input wire reset;
-	input wire tick;
-	input wire rx;
-	input wire done_data;
-	output reg start;
-	output reg collect_data;
-	output reg en_data_counter;
-	output reg clear_data_counter;
-	output reg framing_error;
-	output reg done;
-	output reg receiving;
-	reg [1:0] state;
-	reg [1:0] next_state;
-	always @(*) begin
-		start = 1'b0;
-		collect_data = 1'b0;
-		en_data_counter = 1'b0;
-		clear_data_counter = 1'b0;
-		framing_error = 1'b0;
-		done = 1'b0;
-		receiving = 1'b0;
-		next_state = 2'd0;
-		case (state)
-			2'd0:
-				if (!rx) begin
-					next_state = 2'd1;
-					start = 1'b1;
-				end
-				else
-					next_state = 2'd0;
-			2'd1:
-				if (tick && rx)
-					next_state = 2'd0;
-				else if (tick && !rx)
-					next_state = 2'd2;
-				else
-					next_state = 2'd1;
-			2'd2: begin
-				if (tick && !done_data) begin
-					next_state = 2'd2;
-					collect_data = 1'b1;
-					en_data_counter = 1'b1;
-				end
-				else if (tick && done_data) begin
-					if (!rx) begin
-						next_state = 2'd3;
-						framing_error = 1'b1;
-					end
-					else begin
-						next_state = 2'd0;
-						clear_data_counter = 1'b1;
-						done = 1'b1;
-					end
-				end
-				else
-					next_state = 2'd2;
-				receiving = 1'b1;
-			end
-			2'd3: begin
-				if (tick && rx) begin
-					next_state = 2'd0;
-					clear_data_counter = 1'b1;
-				end
-				else if (tick && !rx)
-					next_state = 2'd3;
-				framing_error = 1'b1;
-			end
-			default: next_state = 2'd0;
-		endcase
-	end
-	always @(posedge clock)
-		if (reset)
-			state <= 2'd0;
-		else
-			state <= next_state;
+
+module \FIFO$BobFPGA.bob.bobby.uart_replies (reset, clock, data_in, we, re, data_out, empty, count, full);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [8:0] data_in;
+  wire [8:0] data_in;
+  input we;
+  wire we;
+  input re;
+  wire re;
+  output [8:0] data_out;
+  reg [8:0] data_out;
+  output empty;
+  wire empty;
+  output [2:0] count;
+  reg [2:0] count;
+  output full;
+  wire full;
+  wire [35:0] _000_;
+  wire [35:0] _001_;
+  wire [31:0] _002_;
+  wire _003_;
+  wire _004_;
+  wire [8:0] _005_;
+  wire [31:0] _006_;
+  wire [31:0] _007_;
+  wire _008_;
+  wire _009_;
+  wire [35:0] _010_;
+  wire [35:0] _011_;
+  wire [31:0] _012_;
+  wire [31:0] _013_;
+  wire _014_;
+  wire _015_;
+  wire _016_;
+  wire [8:0] _017_;
+  wire [31:0] _018_;
+  wire [17:0] _019_;
+  wire [17:0] _020_;
+  wire _021_;
+  wire _022_;
+  wire _023_;
+  wire _024_;
+  wire _025_;
+  wire _026_;
+  wire _027_;
+  wire _028_;
+  wire [35:0] _029_;
+  wire [35:0] _030_;
+  wire [35:0] _031_;
+  wire [35:0] _032_;
+  wire [35:0] _033_;
+  wire [35:0] _034_;
+  wire [2:0] _035_;
+  wire [2:0] _036_;
+  wire [2:0] _037_;
+  wire [2:0] _038_;
+  wire [8:0] _039_;
+  wire [8:0] _040_;
+  wire [8:0] _041_;
+  wire [1:0] _042_;
+  wire [1:0] _043_;
+  wire [1:0] _044_;
+  wire [1:0] _045_;
+  wire [1:0] _046_;
+  wire [1:0] _047_;
+  wire [1:0] _048_;
+  wire [35:0] _049_;
+  wire [35:0] _050_;
+  wire [35:0] _051_;
+  wire [35:0] _052_;
+  wire [2:0] _053_;
+  wire [2:0] _054_;
+  wire [2:0] _055_;
+  wire [2:0] _056_;
+  wire [2:0] _057_;
+  wire [1:0] _058_;
+  wire [1:0] _059_;
+  wire [1:0] _060_;
+  wire [1:0] _061_;
+  wire [1:0] _062_;
+  wire [35:0] _063_;
+  wire [35:0] _064_;
+  wire [35:0] _065_;
+  wire [8:0] _066_;
+  wire [8:0] _067_;
+  wire [1:0] _068_;
+  wire [1:0] _069_;
+  wire [1:0] _070_;
+  wire [35:0] _071_;
+  wire [35:0] _072_;
+  wire [8:0] _073_;
+  wire [2:0] _074_;
+  wire [1:0] _075_;
+  wire [35:0] _076_;
+  reg [1:0] get_ptr;
+  reg [1:0] put_ptr;
+  reg [35:0] queue;
+  assign empty = ! count;
+  assign _002_ = { 30'h00000000, put_ptr } + 32'd1;
+  assign _003_ = ! empty;
+  assign _004_ = re && _003_;
+  assign _006_ = { 30'h00000000, get_ptr } + 32'd1;
+  assign _007_ = { 29'h00000000, count } - 32'd1;
+  assign _008_ = ! full;
+  assign _009_ = we && _008_;
+  assign full = count == 3'h4;
+  assign _012_ = { 30'h00000000, put_ptr } + 32'd1;
+  assign _013_ = { 29'h00000000, count } + 32'd1;
+  assign _014_ = ! empty;
+  assign _015_ = re && _014_;
+  assign _016_ = _015_ && we;
+  assign _018_ = { 30'h00000000, get_ptr } + 32'd1;
+  assign _019_[8:0] = get_ptr[0] ? queue[17:9] : queue[8:0];
+  assign _019_[17:9] = get_ptr[0] ? queue[35:27] : queue[26:18];
+  assign _005_ = get_ptr[1] ? _019_[17:9] : _019_[8:0];
+  assign _020_[8:0] = get_ptr[0] ? queue[17:9] : queue[8:0];
+  assign _020_[17:9] = get_ptr[0] ? queue[35:27] : queue[26:18];
+  assign _017_ = get_ptr[1] ? _020_[17:9] : _020_[8:0];
+  assign _029_ = ~ _010_;
+  assign _030_ = ~ _000_;
+  assign _031_ = _010_ & { data_in, data_in, data_in, data_in };
+  assign _033_ = _000_ & { data_in, data_in, data_in, data_in };
+  assign _032_ = _029_ & queue;
+  assign _034_ = _030_ & queue;
+  assign _011_ = _032_ | _031_;
+  assign _001_ = _034_ | _033_;
+  assign _021_ = put_ptr == 2'h0;
+  assign _022_ = put_ptr == 2'h1;
+  assign _023_ = put_ptr == 2'h2;
+  assign _024_ = put_ptr == 2'h3;
+  assign _025_ = put_ptr == 2'h0;
+  assign _026_ = put_ptr == 2'h1;
+  assign _027_ = put_ptr == 2'h2;
+  assign _028_ = put_ptr == 2'h3;
+  assign _010_[8:0] = _021_ ? 9'h1ff : 9'h000;
+  assign _010_[17:9] = _022_ ? 9'h1ff : 9'h000;
+  assign _010_[26:18] = _023_ ? 9'h1ff : 9'h000;
+  assign _010_[35:27] = _024_ ? 9'h1ff : 9'h000;
+  assign _000_[8:0] = _025_ ? 9'h1ff : 9'h000;
+  assign _000_[17:9] = _026_ ? 9'h1ff : 9'h000;
+  assign _000_[26:18] = _027_ ? 9'h1ff : 9'h000;
+  assign _000_[35:27] = _028_ ? 9'h1ff : 9'h000;
+  always @(posedge clock)
+    count <= _038_;
+  always @(posedge clock)
+    data_out <= _041_;
+  always @(posedge clock)
+    get_ptr <= _044_;
+  always @(posedge clock)
+    put_ptr <= _075_;
+  always @(posedge clock)
+    queue[8:0] <= _076_[8:0];
+  always @(posedge clock)
+    queue[17:9] <= _076_[17:9];
+  always @(posedge clock)
+    queue[26:18] <= _076_[26:18];
+  always @(posedge clock)
+    queue[35:27] <= _076_[35:27];
+  assign _045_ = _009_ ? _012_[1:0] : put_ptr;
+  assign _046_ = _004_ ? 2'hx : _045_;
+  assign _047_ = _016_ ? 2'hx : _046_;
+  assign _048_ = reset ? 2'hx : _047_;
+  assign _049_ = _009_ ? _011_ : queue;
+  assign _050_ = _004_ ? 36'hxxxxxxxxx : _049_;
+  assign _051_ = _016_ ? 36'hxxxxxxxxx : _050_;
+  assign _052_ = reset ? 36'hxxxxxxxxx : _051_;
+  assign _053_ = _009_ ? _013_[2:0] : count;
+  assign _054_ = _004_ ? 3'hx : _053_;
+  assign _055_ = _016_ ? 3'hx : _054_;
+  assign _035_ = reset ? 3'hx : _055_;
+  assign _056_ = _004_ ? _007_[2:0] : _035_;
+  assign _057_ = _016_ ? 3'hx : _056_;
+  assign _036_ = reset ? 3'hx : _057_;
+  assign _058_ = _004_ ? _006_[1:0] : get_ptr;
+  assign _059_ = _016_ ? 2'hx : _058_;
+  assign _042_ = reset ? 2'hx : _059_;
+  assign _060_ = _004_ ? put_ptr : _048_;
+  assign _061_ = _016_ ? 2'hx : _060_;
+  assign _062_ = reset ? 2'hx : _061_;
+  assign _063_ = _004_ ? queue : _052_;
+  assign _064_ = _016_ ? 36'hxxxxxxxxx : _063_;
+  assign _065_ = reset ? 36'hxxxxxxxxx : _064_;
+  assign _066_ = _004_ ? _005_ : data_out;
+  assign _067_ = _016_ ? 9'hxxx : _066_;
+  assign _039_ = reset ? 9'hxxx : _067_;
+  assign _068_ = _016_ ? _018_[1:0] : _042_;
+  assign _043_ = reset ? 2'hx : _068_;
+  assign _069_ = _016_ ? _002_[1:0] : _062_;
+  assign _070_ = reset ? 2'hx : _069_;
+  assign _071_ = _016_ ? _001_ : _065_;
+  assign _072_ = reset ? 36'hxxxxxxxxx : _071_;
+  assign _073_ = _016_ ? _017_ : _039_;
+  assign _040_ = reset ? 9'hxxx : _073_;
+  assign _074_ = _016_ ? count : _036_;
+  assign _037_ = reset ? 3'hx : _074_;
+  assign _044_ = reset ? 2'h0 : _043_;
+  assign _075_ = reset ? 2'h0 : _070_;
+  assign _038_ = reset ? 3'h0 : _037_;
+  assign _041_ = reset ? 9'h000 : _040_;
+  assign _076_ = reset ? queue : _072_;
 endmodule
-`default_nettype none
-module UartTX (
-	clock,
-	reset,
-	send,
-	data,
-	tx,
-	ready,
-	sending
-);
-	parameter signed [31:0] CLK_HZ = 25000000;
-	parameter signed [31:0] BAUD_RATE = 115200;
-	input wire clock;
-	input wire reset;
-	input wire send;
-	input wire [7:0] data;
-	output reg tx;
-	output wire ready;
-	output wire sending;
-	wire start;
-	wire tick;
-	BaudRateGenerator #(
-		.CLK_HZ(CLK_HZ),
-		.BAUD_RATE(BAUD_RATE)
-	) conductor(
-		.clock(clock),
-		.reset(reset),
-		.start_rx(1'b0),
-		.start_tx(start),
-		.tick(tick)
-	);
-	wire en_data_counter;
-	reg [3:0] data_counter;
-	wire done_data;
-	wire clear_data_counter;
-	assign done_data = data_counter == 4'd8;
-	always @(posedge clock)
-		if (reset || clear_data_counter)
-			data_counter <= 1'sb0;
-		else if (en_data_counter && tick)
-			data_counter <= data_counter + 1;
-	reg [7:0] saved_data;
-	reg data_bit;
-	wire send_data;
-	always @(posedge clock)
-		if (reset)
-			saved_data <= 1'sb0;
-		else if (start)
-			saved_data <= data;
-		else if (send_data && tick)
-			saved_data <= saved_data >> 1;
-	always @(posedge clock)
-		if (reset || start)
-			data_bit <= 1'b0;
-		else if (send_data && tick)
-			data_bit <= saved_data[0];
-	wire send_start_bit;
-	wire send_stop_bit;
-	always @(posedge clock)
-		if (reset)
-			tx <= 1'b1;
-		else if (send_start_bit)
-			tx <= 1'b0;
-		else if (send_data)
-			tx <= data_bit;
-		else if (send_stop_bit)
-			tx <= 1'b1;
-		else
-			tx <= 1'b1;
-	UartTXFsm fsm(
-		.clock(clock),
-		.reset(reset),
-		.send(send),
-		.tick(tick),
-		.done_data(done_data),
-		.start(start),
-		.send_start_bit(send_start_bit),
-		.send_data(send_data),
-		.send_stop_bit(send_stop_bit),
-		.en_data_counter(en_data_counter),
-		.clear_data_counter(clear_data_counter),
-		.ready(ready),
-		.sending(sending)
-	);
+
+module \FIFO$BobFPGA.bob.bobby.uart_requests (reset, clock, data_in, we, re, data_out, empty, count, full);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [7:0] data_in;
+  wire [7:0] data_in;
+  input we;
+  wire we;
+  input re;
+  wire re;
+  output [7:0] data_out;
+  reg [7:0] data_out;
+  output empty;
+  wire empty;
+  output [2:0] count;
+  reg [2:0] count;
+  output full;
+  wire full;
+  wire [31:0] _000_;
+  wire [31:0] _001_;
+  wire [31:0] _002_;
+  wire _003_;
+  wire _004_;
+  wire [7:0] _005_;
+  wire [31:0] _006_;
+  wire [31:0] _007_;
+  wire _008_;
+  wire _009_;
+  wire [31:0] _010_;
+  wire [31:0] _011_;
+  wire [31:0] _012_;
+  wire [31:0] _013_;
+  wire _014_;
+  wire _015_;
+  wire _016_;
+  wire [7:0] _017_;
+  wire [31:0] _018_;
+  wire [15:0] _019_;
+  wire [15:0] _020_;
+  wire _021_;
+  wire _022_;
+  wire _023_;
+  wire _024_;
+  wire _025_;
+  wire _026_;
+  wire _027_;
+  wire _028_;
+  wire [31:0] _029_;
+  wire [31:0] _030_;
+  wire [31:0] _031_;
+  wire [31:0] _032_;
+  wire [31:0] _033_;
+  wire [31:0] _034_;
+  wire [2:0] _035_;
+  wire [2:0] _036_;
+  wire [2:0] _037_;
+  wire [2:0] _038_;
+  wire [7:0] _039_;
+  wire [7:0] _040_;
+  wire [7:0] _041_;
+  wire [1:0] _042_;
+  wire [1:0] _043_;
+  wire [1:0] _044_;
+  wire [1:0] _045_;
+  wire [1:0] _046_;
+  wire [1:0] _047_;
+  wire [1:0] _048_;
+  wire [31:0] _049_;
+  wire [31:0] _050_;
+  wire [31:0] _051_;
+  wire [31:0] _052_;
+  wire [2:0] _053_;
+  wire [2:0] _054_;
+  wire [2:0] _055_;
+  wire [2:0] _056_;
+  wire [2:0] _057_;
+  wire [1:0] _058_;
+  wire [1:0] _059_;
+  wire [1:0] _060_;
+  wire [1:0] _061_;
+  wire [1:0] _062_;
+  wire [31:0] _063_;
+  wire [31:0] _064_;
+  wire [31:0] _065_;
+  wire [7:0] _066_;
+  wire [7:0] _067_;
+  wire [1:0] _068_;
+  wire [1:0] _069_;
+  wire [1:0] _070_;
+  wire [31:0] _071_;
+  wire [31:0] _072_;
+  wire [7:0] _073_;
+  wire [2:0] _074_;
+  wire [1:0] _075_;
+  wire [31:0] _076_;
+  reg [1:0] get_ptr;
+  reg [1:0] put_ptr;
+  reg [31:0] queue;
+  assign empty = ! count;
+  assign _002_ = { 30'h00000000, put_ptr } + 32'd1;
+  assign _003_ = ! empty;
+  assign _004_ = re && _003_;
+  assign _006_ = { 30'h00000000, get_ptr } + 32'd1;
+  assign _007_ = { 29'h00000000, count } - 32'd1;
+  assign _008_ = ! full;
+  assign _009_ = we && _008_;
+  assign full = count == 3'h4;
+  assign _012_ = { 30'h00000000, put_ptr } + 32'd1;
+  assign _013_ = { 29'h00000000, count } + 32'd1;
+  assign _014_ = ! empty;
+  assign _015_ = re && _014_;
+  assign _016_ = _015_ && we;
+  assign _018_ = { 30'h00000000, get_ptr } + 32'd1;
+  assign _019_[7:0] = get_ptr[0] ? queue[15:8] : queue[7:0];
+  assign _019_[15:8] = get_ptr[0] ? queue[31:24] : queue[23:16];
+  assign _005_ = get_ptr[1] ? _019_[15:8] : _019_[7:0];
+  assign _020_[7:0] = get_ptr[0] ? queue[15:8] : queue[7:0];
+  assign _020_[15:8] = get_ptr[0] ? queue[31:24] : queue[23:16];
+  assign _017_ = get_ptr[1] ? _020_[15:8] : _020_[7:0];
+  assign _029_ = ~ _010_;
+  assign _030_ = ~ _000_;
+  assign _031_ = _010_ & { data_in, data_in, data_in, data_in };
+  assign _033_ = _000_ & { data_in, data_in, data_in, data_in };
+  assign _032_ = _029_ & queue;
+  assign _034_ = _030_ & queue;
+  assign _011_ = _032_ | _031_;
+  assign _001_ = _034_ | _033_;
+  assign _021_ = put_ptr == 2'h0;
+  assign _022_ = put_ptr == 2'h1;
+  assign _023_ = put_ptr == 2'h2;
+  assign _024_ = put_ptr == 2'h3;
+  assign _025_ = put_ptr == 2'h0;
+  assign _026_ = put_ptr == 2'h1;
+  assign _027_ = put_ptr == 2'h2;
+  assign _028_ = put_ptr == 2'h3;
+  assign _010_[7:0] = _021_ ? 8'hff : 8'h00;
+  assign _010_[15:8] = _022_ ? 8'hff : 8'h00;
+  assign _010_[23:16] = _023_ ? 8'hff : 8'h00;
+  assign _010_[31:24] = _024_ ? 8'hff : 8'h00;
+  assign _000_[7:0] = _025_ ? 8'hff : 8'h00;
+  assign _000_[15:8] = _026_ ? 8'hff : 8'h00;
+  assign _000_[23:16] = _027_ ? 8'hff : 8'h00;
+  assign _000_[31:24] = _028_ ? 8'hff : 8'h00;
+  always @(posedge clock)
+    count <= _038_;
+  always @(posedge clock)
+    data_out <= _041_;
+  always @(posedge clock)
+    get_ptr <= _044_;
+  always @(posedge clock)
+    put_ptr <= _075_;
+  always @(posedge clock)
+    queue[7:0] <= _076_[7:0];
+  always @(posedge clock)
+    queue[15:8] <= _076_[15:8];
+  always @(posedge clock)
+    queue[23:16] <= _076_[23:16];
+  always @(posedge clock)
+    queue[31:24] <= _076_[31:24];
+  assign _045_ = _009_ ? _012_[1:0] : put_ptr;
+  assign _046_ = _004_ ? 2'hx : _045_;
+  assign _047_ = _016_ ? 2'hx : _046_;
+  assign _048_ = reset ? 2'hx : _047_;
+  assign _049_ = _009_ ? _011_ : queue;
+  assign _050_ = _004_ ? 32'hxxxxxxxx : _049_;
+  assign _051_ = _016_ ? 32'hxxxxxxxx : _050_;
+  assign _052_ = reset ? 32'hxxxxxxxx : _051_;
+  assign _053_ = _009_ ? _013_[2:0] : count;
+  assign _054_ = _004_ ? 3'hx : _053_;
+  assign _055_ = _016_ ? 3'hx : _054_;
+  assign _035_ = reset ? 3'hx : _055_;
+  assign _056_ = _004_ ? _007_[2:0] : _035_;
+  assign _057_ = _016_ ? 3'hx : _056_;
+  assign _036_ = reset ? 3'hx : _057_;
+  assign _058_ = _004_ ? _006_[1:0] : get_ptr;
+  assign _059_ = _016_ ? 2'hx : _058_;
+  assign _042_ = reset ? 2'hx : _059_;
+  assign _060_ = _004_ ? put_ptr : _048_;
+  assign _061_ = _016_ ? 2'hx : _060_;
+  assign _062_ = reset ? 2'hx : _061_;
+  assign _063_ = _004_ ? queue : _052_;
+  assign _064_ = _016_ ? 32'hxxxxxxxx : _063_;
+  assign _065_ = reset ? 32'hxxxxxxxx : _064_;
+  assign _066_ = _004_ ? _005_ : data_out;
+  assign _067_ = _016_ ? 8'hxx : _066_;
+  assign _039_ = reset ? 8'hxx : _067_;
+  assign _068_ = _016_ ? _018_[1:0] : _042_;
+  assign _043_ = reset ? 2'hx : _068_;
+  assign _069_ = _016_ ? _002_[1:0] : _062_;
+  assign _070_ = reset ? 2'hx : _069_;
+  assign _071_ = _016_ ? _001_ : _065_;
+  assign _072_ = reset ? 32'hxxxxxxxx : _071_;
+  assign _073_ = _016_ ? _017_ : _039_;
+  assign _040_ = reset ? 8'hxx : _073_;
+  assign _074_ = _016_ ? count : _036_;
+  assign _037_ = reset ? 3'hx : _074_;
+  assign _044_ = reset ? 2'h0 : _043_;
+  assign _075_ = reset ? 2'h0 : _070_;
+  assign _038_ = reset ? 3'h0 : _037_;
+  assign _041_ = reset ? 8'h00 : _040_;
+  assign _076_ = reset ? queue : _072_;
 endmodule
-module UartTXFsm (
-	clock,
-	reset,
-	send,
-	tick,
-	done_data,
-	start,
-	send_start_bit,
-	send_data,
-	send_stop_bit,
-	en_data_counter,
-	clear_data_counter,
-	ready,
-	sending
-);
-	input wire clock;
-	input wire reset;
-	input wire send;
-	input wire tick;
-	input wire done_data;
-	output reg start;
-	output reg send_start_bit;
-	output reg send_data;
-	output reg send_stop_bit;
-	output reg en_data_counter;
-	output reg clear_data_counter;
-	output reg ready;
-	output reg sending;
-	reg [1:0] state;
-	reg [1:0] next_state;
-	always @(*) begin
-		start = 1'b0;
-		send_start_bit = 1'b0;
-		send_data = 1'b0;
-		send_stop_bit = 1'b0;
-		en_data_counter = 1'b0;
-		clear_data_counter = 1'b0;
-		ready = 1'b0;
-		sending = 1'b0;
-		next_state = 2'd0;
-		case (state)
-			2'd0:
-				if (send) begin
-					next_state = 2'd1;
-					start = 1'b1;
-					send_start_bit = 1'b1;
-				end
-				else begin
-					next_state = 2'd0;
-					ready = 1'b1;
-				end
-			2'd1: begin
-				if (tick) begin
-					next_state = 2'd2;
-					send_data = 1'b1;
-					en_data_counter = 1'b1;
-				end
-				else begin
-					next_state = 2'd1;
-					send_start_bit = 1'b1;
-				end
-				sending = 1'b1;
-			end
-			2'd2: begin
-				if (tick && done_data) begin
-					next_state = 2'd3;
-					send_stop_bit = 1'b1;
-					clear_data_counter = 1'b1;
-				end
-				else begin
-					next_state = 2'd2;
-					send_data = 1'b1;
-					en_data_counter = 1'b1;
-				end
-				sending = 1'b1;
-			end
-			2'd3: begin
-				if (tick) begin
-					next_state = 2'd0;
-					ready = 1'b1;
-				end
-				else begin
-					next_state = 2'd3;
-					send_stop_bit = 1'b1;
-				end
-				sending = 1'b1;
-			end
-			default: next_state = 2'd0;
-		endcase
-	end
-	always @(posedge clock)
-		if (reset)
-			state <= 2'd0;
-		else
-			state <= next_state;
+
+module \FIFO$BobFPGA.bob.bobby.urgent_replies (reset, clock, data_in, we, re, data_out, empty, count, full);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [7:0] data_in;
+  wire [7:0] data_in;
+  input we;
+  wire we;
+  input re;
+  wire re;
+  output [7:0] data_out;
+  reg [7:0] data_out;
+  output empty;
+  wire empty;
+  output [2:0] count;
+  reg [2:0] count;
+  output full;
+  wire full;
+  wire [31:0] _000_;
+  wire [31:0] _001_;
+  wire [31:0] _002_;
+  wire _003_;
+  wire _004_;
+  wire [7:0] _005_;
+  wire [31:0] _006_;
+  wire [31:0] _007_;
+  wire _008_;
+  wire _009_;
+  wire [31:0] _010_;
+  wire [31:0] _011_;
+  wire [31:0] _012_;
+  wire [31:0] _013_;
+  wire _014_;
+  wire _015_;
+  wire _016_;
+  wire [7:0] _017_;
+  wire [31:0] _018_;
+  wire [15:0] _019_;
+  wire [15:0] _020_;
+  wire _021_;
+  wire _022_;
+  wire _023_;
+  wire _024_;
+  wire _025_;
+  wire _026_;
+  wire _027_;
+  wire _028_;
+  wire [31:0] _029_;
+  wire [31:0] _030_;
+  wire [31:0] _031_;
+  wire [31:0] _032_;
+  wire [31:0] _033_;
+  wire [31:0] _034_;
+  wire [2:0] _035_;
+  wire [2:0] _036_;
+  wire [2:0] _037_;
+  wire [2:0] _038_;
+  wire [7:0] _039_;
+  wire [7:0] _040_;
+  wire [7:0] _041_;
+  wire [1:0] _042_;
+  wire [1:0] _043_;
+  wire [1:0] _044_;
+  wire [1:0] _045_;
+  wire [1:0] _046_;
+  wire [1:0] _047_;
+  wire [1:0] _048_;
+  wire [31:0] _049_;
+  wire [31:0] _050_;
+  wire [31:0] _051_;
+  wire [31:0] _052_;
+  wire [2:0] _053_;
+  wire [2:0] _054_;
+  wire [2:0] _055_;
+  wire [2:0] _056_;
+  wire [2:0] _057_;
+  wire [1:0] _058_;
+  wire [1:0] _059_;
+  wire [1:0] _060_;
+  wire [1:0] _061_;
+  wire [1:0] _062_;
+  wire [31:0] _063_;
+  wire [31:0] _064_;
+  wire [31:0] _065_;
+  wire [7:0] _066_;
+  wire [7:0] _067_;
+  wire [1:0] _068_;
+  wire [1:0] _069_;
+  wire [1:0] _070_;
+  wire [31:0] _071_;
+  wire [31:0] _072_;
+  wire [7:0] _073_;
+  wire [2:0] _074_;
+  wire [1:0] _075_;
+  wire [31:0] _076_;
+  reg [1:0] get_ptr;
+  reg [1:0] put_ptr;
+  reg [31:0] queue;
+  assign empty = ! count;
+  assign _002_ = { 30'h00000000, put_ptr } + 32'd1;
+  assign _003_ = ! empty;
+  assign _004_ = re && _003_;
+  assign _006_ = { 30'h00000000, get_ptr } + 32'd1;
+  assign _007_ = { 29'h00000000, count } - 32'd1;
+  assign _008_ = ! full;
+  assign _009_ = we && _008_;
+  assign full = count == 3'h4;
+  assign _012_ = { 30'h00000000, put_ptr } + 32'd1;
+  assign _013_ = { 29'h00000000, count } + 32'd1;
+  assign _014_ = ! empty;
+  assign _015_ = re && _014_;
+  assign _016_ = _015_ && we;
+  assign _018_ = { 30'h00000000, get_ptr } + 32'd1;
+  assign _019_[7:0] = get_ptr[0] ? queue[15:8] : queue[7:0];
+  assign _019_[15:8] = get_ptr[0] ? queue[31:24] : queue[23:16];
+  assign _005_ = get_ptr[1] ? _019_[15:8] : _019_[7:0];
+  assign _020_[7:0] = get_ptr[0] ? queue[15:8] : queue[7:0];
+  assign _020_[15:8] = get_ptr[0] ? queue[31:24] : queue[23:16];
+  assign _017_ = get_ptr[1] ? _020_[15:8] : _020_[7:0];
+  assign _029_ = ~ _010_;
+  assign _030_ = ~ _000_;
+  assign _031_ = _010_ & { data_in, data_in, data_in, data_in };
+  assign _033_ = _000_ & { data_in, data_in, data_in, data_in };
+  assign _032_ = _029_ & queue;
+  assign _034_ = _030_ & queue;
+  assign _011_ = _032_ | _031_;
+  assign _001_ = _034_ | _033_;
+  assign _021_ = put_ptr == 2'h0;
+  assign _022_ = put_ptr == 2'h1;
+  assign _023_ = put_ptr == 2'h2;
+  assign _024_ = put_ptr == 2'h3;
+  assign _025_ = put_ptr == 2'h0;
+  assign _026_ = put_ptr == 2'h1;
+  assign _027_ = put_ptr == 2'h2;
+  assign _028_ = put_ptr == 2'h3;
+  assign _010_[7:0] = _021_ ? 8'hff : 8'h00;
+  assign _010_[15:8] = _022_ ? 8'hff : 8'h00;
+  assign _010_[23:16] = _023_ ? 8'hff : 8'h00;
+  assign _010_[31:24] = _024_ ? 8'hff : 8'h00;
+  assign _000_[7:0] = _025_ ? 8'hff : 8'h00;
+  assign _000_[15:8] = _026_ ? 8'hff : 8'h00;
+  assign _000_[23:16] = _027_ ? 8'hff : 8'h00;
+  assign _000_[31:24] = _028_ ? 8'hff : 8'h00;
+  always @(posedge clock)
+    count <= _038_;
+  always @(posedge clock)
+    data_out <= _041_;
+  always @(posedge clock)
+    get_ptr <= _044_;
+  always @(posedge clock)
+    put_ptr <= _075_;
+  always @(posedge clock)
+    queue[7:0] <= _076_[7:0];
+  always @(posedge clock)
+    queue[15:8] <= _076_[15:8];
+  always @(posedge clock)
+    queue[23:16] <= _076_[23:16];
+  always @(posedge clock)
+    queue[31:24] <= _076_[31:24];
+  assign _045_ = _009_ ? _012_[1:0] : put_ptr;
+  assign _046_ = _004_ ? 2'hx : _045_;
+  assign _047_ = _016_ ? 2'hx : _046_;
+  assign _048_ = reset ? 2'hx : _047_;
+  assign _049_ = _009_ ? _011_ : queue;
+  assign _050_ = _004_ ? 32'hxxxxxxxx : _049_;
+  assign _051_ = _016_ ? 32'hxxxxxxxx : _050_;
+  assign _052_ = reset ? 32'hxxxxxxxx : _051_;
+  assign _053_ = _009_ ? _013_[2:0] : count;
+  assign _054_ = _004_ ? 3'hx : _053_;
+  assign _055_ = _016_ ? 3'hx : _054_;
+  assign _035_ = reset ? 3'hx : _055_;
+  assign _056_ = _004_ ? _007_[2:0] : _035_;
+  assign _057_ = _016_ ? 3'hx : _056_;
+  assign _036_ = reset ? 3'hx : _057_;
+  assign _058_ = _004_ ? _006_[1:0] : get_ptr;
+  assign _059_ = _016_ ? 2'hx : _058_;
+  assign _042_ = reset ? 2'hx : _059_;
+  assign _060_ = _004_ ? put_ptr : _048_;
+  assign _061_ = _016_ ? 2'hx : _060_;
+  assign _062_ = reset ? 2'hx : _061_;
+  assign _063_ = _004_ ? queue : _052_;
+  assign _064_ = _016_ ? 32'hxxxxxxxx : _063_;
+  assign _065_ = reset ? 32'hxxxxxxxx : _064_;
+  assign _066_ = _004_ ? _005_ : data_out;
+  assign _067_ = _016_ ? 8'hxx : _066_;
+  assign _039_ = reset ? 8'hxx : _067_;
+  assign _068_ = _016_ ? _018_[1:0] : _042_;
+  assign _043_ = reset ? 2'hx : _068_;
+  assign _069_ = _016_ ? _002_[1:0] : _062_;
+  assign _070_ = reset ? 2'hx : _069_;
+  assign _071_ = _016_ ? _001_ : _065_;
+  assign _072_ = reset ? 32'hxxxxxxxx : _071_;
+  assign _073_ = _016_ ? _017_ : _039_;
+  assign _040_ = reset ? 8'hxx : _073_;
+  assign _074_ = _016_ ? count : _036_;
+  assign _037_ = reset ? 3'hx : _074_;
+  assign _044_ = reset ? 2'h0 : _043_;
+  assign _075_ = reset ? 2'h0 : _070_;
+  assign _038_ = reset ? 3'h0 : _037_;
+  assign _041_ = reset ? 8'h00 : _040_;
+  assign _076_ = reset ? queue : _072_;
+endmodule
+
+module \ReadRequestFsm$BobFPGA.bob.bobby.fsm (reset, clock, runway_active, emergency, uart_request, uart_rd_request, uart_empty, runway_id, lock, unlock, sel_takeoff_id_lock, runway, queue_takeoff_plane, unqueue_takeoff_plane, takeoff_fifo_full, takeoff_fifo_empty, takeoff_count, queue_landing_plane, unqueue_landing_plane, landing_fifo_full, landing_fifo_empty
+, landing_count, flush_landings, divert_waiting, send_hold, send_say_ag, send_divert, send_divert_landing, send_valid_id, send_invalid_id, send_clear, queue_reply, reply_fifo_full, queue_urgent_reply, urgent_fifo_full, take_snapshot, send_status, queue_status, status_done, send_echo, switch_rx_baud, switch_tx_baud
+, uart_tx_idle, set_schedule, schedule, set_emergency, unset_emergency, emergency_id, take_id, release_id, id_full, all_id);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [1:0] runway_active;
+  wire [1:0] runway_active;
+  input emergency;
+  wire emergency;
+  input [7:0] uart_request;
+  wire [7:0] uart_request;
+  output uart_rd_request;
+  wire uart_rd_request;
+  input uart_empty;
+  wire uart_empty;
+  output runway_id;
+  wire runway_id;
+  output lock;
+  wire lock;
+  output unlock;
+  wire unlock;
+  output sel_takeoff_id_lock;
+  wire sel_takeoff_id_lock;
+  input [9:0] runway;
+  wire [9:0] runway;
+  output queue_takeoff_plane;
+  wire queue_takeoff_plane;
+  output unqueue_takeoff_plane;
+  wire unqueue_takeoff_plane;
+  input takeoff_fifo_full;
+  wire takeoff_fifo_full;
+  input takeoff_fifo_empty;
+  wire takeoff_fifo_empty;
+  input [3:0] takeoff_count;
+  wire [3:0] takeoff_count;
+  output queue_landing_plane;
+  wire queue_landing_plane;
+  output unqueue_landing_plane;
+  wire unqueue_landing_plane;
+  input landing_fifo_full;
+  wire landing_fifo_full;
+  input landing_fifo_empty;
+  wire landing_fifo_empty;
+  input [3:0] landing_count;
+  wire [3:0] landing_count;
+  output flush_landings;
+  wire flush_landings;
+  input divert_waiting;
+  wire divert_waiting;
+  output send_hold;
+  wire send_hold;
+  output send_say_ag;
+  wire send_say_ag;
+  output send_divert;
+  wire send_divert;
+  output send_divert_landing;
+  wire send_divert_landing;
+  output send_valid_id;
+  wire send_valid_id;
+  output send_invalid_id;
+  wire send_invalid_id;
+  output [1:0] send_clear;
+  wire [1:0] send_clear;
+  output queue_reply;
+  wire queue_reply;
+  input reply_fifo_full;
+  wire reply_fifo_full;
+  output queue_urgent_reply;
+  wire queue_urgent_reply;
+  input urgent_fifo_full;
+  wire urgent_fifo_full;
+  output take_snapshot;
+  wire take_snapshot;
+  output send_status;
+  wire send_status;
+  output queue_status;
+  wire queue_status;
+  input status_done;
+  wire status_done;
+  output send_echo;
+  wire send_echo;
+  output switch_rx_baud;
+  wire switch_rx_baud;
+  output switch_tx_baud;
+  wire switch_tx_baud;
+  input uart_tx_idle;
+  wire uart_tx_idle;
+  output set_schedule;
+  wire set_schedule;
+  input [1:0] schedule;
+  wire [1:0] schedule;
+  output set_emergency;
+  wire set_emergency;
+  output unset_emergency;
+  wire unset_emergency;
+  input [3:0] emergency_id;
+  wire [3:0] emergency_id;
+  output take_id;
+  wire take_id;
+  output release_id;
+  wire release_id;
+  input id_full;
+  wire id_full;
+  input [15:0] all_id;
+  wire [15:0] all_id;
+  wire _0000_;
+  wire _0001_;
+  wire _0002_;
+  wire _0003_;
+  wire _0004_;
+  wire _0005_;
+  wire _0006_;
+  wire _0007_;
+  wire _0008_;
+  wire _0009_;
+  wire _0010_;
+  wire _0011_;
+  wire _0012_;
+  wire _0013_;
+  wire _0014_;
+  wire _0015_;
+  wire _0016_;
+  wire _0017_;
+  wire _0018_;
+  wire _0019_;
+  wire _0020_;
+  wire _0021_;
+  wire _0022_;
+  wire _0023_;
+  wire _0024_;
+  wire [1:0] _0025_;
+  wire _0026_;
+  wire _0027_;
+  wire _0028_;
+  wire _0029_;
+  wire _0030_;
+  wire _0031_;
+  wire _0032_;
+  wire _0033_;
+  wire _0034_;
+  wire _0035_;
+  wire _0036_;
+  wire _0037_;
+  wire _0038_;
+  wire _0039_;
+  wire _0040_;
+  wire _0041_;
+  wire _0042_;
+  wire _0043_;
+  wire _0044_;
+  wire _0045_;
+  wire _0046_;
+  wire _0047_;
+  wire _0048_;
+  wire [7:0] _0049_;
+  wire [3:0] _0050_;
+  wire [1:0] _0051_;
+  wire [7:0] _0052_;
+  wire [3:0] _0053_;
+  wire [1:0] _0054_;
+  wire _0055_;
+  wire _0056_;
+  wire _0057_;
+  wire _0058_;
+  wire [3:0] _0059_;
+  wire [3:0] _0060_;
+  wire [3:0] _0061_;
+  wire [3:0] _0062_;
+  wire [3:0] _0063_;
+  wire [3:0] _0064_;
+  wire [3:0] _0065_;
+  wire [3:0] _0066_;
+  wire [3:0] _0067_;
+  wire [3:0] _0068_;
+  wire [3:0] _0069_;
+  wire [3:0] _0070_;
+  wire [3:0] _0071_;
+  wire [3:0] _0072_;
+  wire [3:0] _0073_;
+  wire [3:0] _0074_;
+  wire [3:0] _0075_;
+  wire [3:0] _0076_;
+  wire [3:0] _0077_;
+  wire [3:0] _0078_;
+  wire [3:0] _0079_;
+  wire [3:0] _0080_;
+  wire [3:0] _0081_;
+  wire [3:0] _0082_;
+  wire [3:0] _0083_;
+  wire [3:0] _0084_;
+  wire [3:0] _0085_;
+  wire [3:0] _0086_;
+  wire _0087_;
+  wire [3:0] _0088_;
+  wire _0089_;
+  wire _0090_;
+  wire _0091_;
+  wire _0092_;
+  wire [3:0] _0093_;
+  wire [3:0] _0094_;
+  wire [3:0] _0095_;
+  wire [3:0] _0096_;
+  wire _0097_;
+  wire _0098_;
+  wire _0099_;
+  wire _0100_;
+  wire _0101_;
+  wire _0102_;
+  wire _0103_;
+  wire _0104_;
+  wire _0105_;
+  wire _0106_;
+  wire _0107_;
+  wire _0108_;
+  wire _0109_;
+  wire _0110_;
+  wire _0111_;
+  wire _0112_;
+  wire _0113_;
+  wire _0114_;
+  wire _0115_;
+  wire _0116_;
+  wire _0117_;
+  wire _0118_;
+  wire _0119_;
+  wire _0120_;
+  wire _0121_;
+  wire _0122_;
+  wire _0123_;
+  wire _0124_;
+  wire _0125_;
+  wire _0126_;
+  wire _0127_;
+  wire _0128_;
+  wire _0129_;
+  wire _0130_;
+  wire _0131_;
+  wire _0132_;
+  wire _0133_;
+  wire _0134_;
+  wire _0135_;
+  wire _0136_;
+  wire _0137_;
+  wire _0138_;
+  wire _0139_;
+  wire _0140_;
+  wire _0141_;
+  wire _0142_;
+  wire _0143_;
+  wire _0144_;
+  wire _0145_;
+  wire _0146_;
+  wire _0147_;
+  wire _0148_;
+  wire _0149_;
+  wire _0150_;
+  wire _0151_;
+  wire _0152_;
+  wire _0153_;
+  wire _0154_;
+  wire _0155_;
+  wire _0156_;
+  wire _0157_;
+  wire _0158_;
+  wire _0159_;
+  wire _0160_;
+  wire _0161_;
+  wire _0162_;
+  wire _0163_;
+  wire _0164_;
+  wire _0165_;
+  wire _0166_;
+  wire _0167_;
+  wire _0168_;
+  wire _0169_;
+  wire _0170_;
+  wire _0171_;
+  wire _0172_;
+  wire _0173_;
+  wire _0174_;
+  wire _0175_;
+  wire _0176_;
+  wire _0177_;
+  wire _0178_;
+  wire _0179_;
+  wire _0180_;
+  wire _0181_;
+  wire _0182_;
+  wire _0183_;
+  wire _0184_;
+  wire _0185_;
+  wire _0186_;
+  wire _0187_;
+  wire _0188_;
+  wire _0189_;
+  wire _0190_;
+  wire _0191_;
+  wire _0192_;
+  wire _0193_;
+  wire [3:0] _0194_;
+  wire [3:0] _0195_;
+  wire [3:0] _0196_;
+  wire [3:0] _0197_;
+  wire [3:0] _0198_;
+  wire [3:0] _0199_;
+  wire _0200_;
+  wire _0201_;
+  wire _0202_;
+  wire _0203_;
+  wire _0204_;
+  wire _0205_;
+  wire _0206_;
+  wire _0207_;
+  wire _0208_;
+  wire _0209_;
+  wire _0210_;
+  wire _0211_;
+  wire _0212_;
+  wire _0213_;
+  wire _0214_;
+  wire _0215_;
+  wire _0216_;
+  wire _0217_;
+  wire _0218_;
+  wire _0219_;
+  wire _0220_;
+  wire _0221_;
+  wire _0222_;
+  wire _0223_;
+  wire _0224_;
+  wire _0225_;
+  wire _0226_;
+  wire _0227_;
+  wire _0228_;
+  wire _0229_;
+  wire _0230_;
+  wire _0231_;
+  wire _0232_;
+  wire _0233_;
+  wire _0234_;
+  wire _0235_;
+  wire _0236_;
+  wire _0237_;
+  wire _0238_;
+  wire _0239_;
+  wire _0240_;
+  wire [3:0] _0241_;
+  wire [3:0] _0242_;
+  wire [3:0] _0243_;
+  wire [3:0] _0244_;
+  wire [3:0] _0245_;
+  wire _0246_;
+  wire _0247_;
+  wire _0248_;
+  wire _0249_;
+  wire _0250_;
+  wire _0251_;
+  wire _0252_;
+  wire _0253_;
+  wire _0254_;
+  wire _0255_;
+  wire _0256_;
+  wire _0257_;
+  wire _0258_;
+  wire _0259_;
+  wire _0260_;
+  wire _0261_;
+  wire _0262_;
+  wire _0263_;
+  wire _0264_;
+  wire _0265_;
+  wire _0266_;
+  wire _0267_;
+  wire _0268_;
+  wire _0269_;
+  wire _0270_;
+  wire _0271_;
+  wire _0272_;
+  wire _0273_;
+  wire _0274_;
+  wire _0275_;
+  wire _0276_;
+  wire _0277_;
+  wire _0278_;
+  wire _0279_;
+  wire _0280_;
+  wire _0281_;
+  wire _0282_;
+  wire _0283_;
+  wire _0284_;
+  wire _0285_;
+  wire _0286_;
+  wire _0287_;
+  wire _0288_;
+  wire _0289_;
+  wire _0290_;
+  wire _0291_;
+  wire _0292_;
+  wire _0293_;
+  wire _0294_;
+  wire _0295_;
+  wire _0296_;
+  wire _0297_;
+  wire _0298_;
+  wire _0299_;
+  wire _0300_;
+  wire _0301_;
+  wire _0302_;
+  wire _0303_;
+  wire _0304_;
+  wire _0305_;
+  wire _0306_;
+  wire _0307_;
+  wire _0308_;
+  wire _0309_;
+  wire _0310_;
+  wire _0311_;
+  wire _0312_;
+  wire _0313_;
+  wire _0314_;
+  wire _0315_;
+  wire _0316_;
+  wire _0317_;
+  wire _0318_;
+  wire _0319_;
+  wire _0320_;
+  wire _0321_;
+  wire _0322_;
+  wire _0323_;
+  wire _0324_;
+  wire _0325_;
+  wire _0326_;
+  wire _0327_;
+  wire _0328_;
+  wire _0329_;
+  wire _0330_;
+  wire _0331_;
+  wire _0332_;
+  wire _0333_;
+  wire _0334_;
+  wire _0335_;
+  wire _0336_;
+  wire _0337_;
+  wire _0338_;
+  wire _0339_;
+  wire _0340_;
+  wire _0341_;
+  wire _0342_;
+  wire _0343_;
+  wire _0344_;
+  wire [3:0] _0345_;
+  wire [3:0] _0346_;
+  wire [3:0] _0347_;
+  wire _0348_;
+  wire _0349_;
+  wire _0350_;
+  wire _0351_;
+  wire _0352_;
+  wire _0353_;
+  wire _0354_;
+  wire _0355_;
+  wire _0356_;
+  wire [3:0] _0357_;
+  wire [3:0] _0358_;
+  wire [3:0] _0359_;
+  wire [3:0] _0360_;
+  wire [3:0] _0361_;
+  wire _0362_;
+  wire _0363_;
+  wire _0364_;
+  wire _0365_;
+  wire _0366_;
+  wire _0367_;
+  wire _0368_;
+  wire _0369_;
+  wire _0370_;
+  wire _0371_;
+  wire _0372_;
+  wire _0373_;
+  wire _0374_;
+  wire _0375_;
+  wire _0376_;
+  wire [3:0] _0377_;
+  wire [3:0] _0378_;
+  wire [3:0] _0379_;
+  wire [3:0] _0380_;
+  wire _0381_;
+  wire [3:0] _0382_;
+  wire [3:0] _0383_;
+  wire [3:0] _0384_;
+  wire [3:0] _0385_;
+  wire [3:0] _0386_;
+  wire _0387_;
+  wire _0388_;
+  wire _0389_;
+  wire _0390_;
+  wire _0391_;
+  wire _0392_;
+  wire _0393_;
+  wire _0394_;
+  wire _0395_;
+  wire _0396_;
+  wire _0397_;
+  wire _0398_;
+  wire _0399_;
+  wire _0400_;
+  wire _0401_;
+  wire _0402_;
+  wire _0403_;
+  wire _0404_;
+  wire _0405_;
+  wire _0406_;
+  wire _0407_;
+  wire _0408_;
+  wire _0409_;
+  wire _0410_;
+  wire _0411_;
+  wire _0412_;
+  wire _0413_;
+  wire _0414_;
+  wire _0415_;
+  wire _0416_;
+  wire _0417_;
+  wire _0418_;
+  wire _0419_;
+  wire _0420_;
+  wire _0421_;
+  wire _0422_;
+  wire _0423_;
+  wire _0424_;
+  wire _0425_;
+  wire _0426_;
+  wire _0427_;
+  wire _0428_;
+  wire _0429_;
+  wire _0430_;
+  wire _0431_;
+  wire _0432_;
+  wire _0433_;
+  wire _0434_;
+  wire _0435_;
+  wire _0436_;
+  wire _0437_;
+  wire _0438_;
+  wire _0439_;
+  wire _0440_;
+  wire _0441_;
+  wire _0442_;
+  wire _0443_;
+  wire _0444_;
+  wire _0445_;
+  wire _0446_;
+  wire _0447_;
+  wire _0448_;
+  wire _0449_;
+  wire _0450_;
+  wire _0451_;
+  wire _0452_;
+  wire _0453_;
+  wire _0454_;
+  wire _0455_;
+  wire _0456_;
+  wire _0457_;
+  wire _0458_;
+  wire _0459_;
+  wire _0460_;
+  wire [3:0] _0461_;
+  wire [3:0] _0462_;
+  wire _0463_;
+  wire _0464_;
+  wire _0465_;
+  wire _0466_;
+  wire _0467_;
+  wire [3:0] _0468_;
+  wire [3:0] _0469_;
+  wire _0470_;
+  wire _0471_;
+  wire _0472_;
+  wire _0473_;
+  wire _0474_;
+  wire _0475_;
+  wire _0476_;
+  wire _0477_;
+  wire _0478_;
+  wire _0479_;
+  wire _0480_;
+  wire _0481_;
+  wire _0482_;
+  wire _0483_;
+  wire _0484_;
+  wire _0485_;
+  wire _0486_;
+  wire _0487_;
+  wire _0488_;
+  wire _0489_;
+  wire _0490_;
+  wire _0491_;
+  wire _0492_;
+  wire _0493_;
+  wire _0494_;
+  wire _0495_;
+  wire _0496_;
+  wire _0497_;
+  wire _0498_;
+  wire _0499_;
+  wire _0500_;
+  wire _0501_;
+  wire _0502_;
+  wire _0503_;
+  wire _0504_;
+  wire _0505_;
+  wire _0506_;
+  wire _0507_;
+  wire _0508_;
+  wire _0509_;
+  wire _0510_;
+  wire _0511_;
+  wire _0512_;
+  wire _0513_;
+  wire _0514_;
+  wire _0515_;
+  wire _0516_;
+  wire _0517_;
+  wire _0518_;
+  wire _0519_;
+  wire _0520_;
+  wire _0521_;
+  wire _0522_;
+  wire _0523_;
+  wire _0524_;
+  wire _0525_;
+  wire _0526_;
+  wire _0527_;
+  wire _0528_;
+  wire _0529_;
+  wire _0530_;
+  wire _0531_;
+  wire _0532_;
+  wire _0533_;
+  wire _0534_;
+  wire _0535_;
+  wire _0536_;
+  wire _0537_;
+  wire _0538_;
+  wire _0539_;
+  wire _0540_;
+  wire _0541_;
+  wire _0542_;
+  wire _0543_;
+  wire _0544_;
+  wire _0545_;
+  wire _0546_;
+  wire _0547_;
+  wire _0548_;
+  wire _0549_;
+  wire _0550_;
+  wire _0551_;
+  wire _0552_;
+  wire _0553_;
+  wire _0554_;
+  wire _0555_;
+  wire _0556_;
+  wire _0557_;
+  wire _0558_;
+  wire _0559_;
+  wire _0560_;
+  wire _0561_;
+  wire _0562_;
+  wire _0563_;
+  wire _0564_;
+  wire _0565_;
+  wire _0566_;
+  wire _0567_;
+  wire _0568_;
+  wire _0569_;
+  wire _0570_;
+  wire _0571_;
+  wire _0572_;
+  wire _0573_;
+  wire _0574_;
+  wire _0575_;
+  wire _0576_;
+  wire _0577_;
+  wire _0578_;
+  wire _0579_;
+  wire _0580_;
+  wire _0581_;
+  wire _0582_;
+  wire _0583_;
+  wire _0584_;
+  wire _0585_;
+  wire _0586_;
+  wire _0587_;
+  wire [3:0] _0588_;
+  wire _0589_;
+  wire _0590_;
+  wire _0591_;
+  wire _0592_;
+  wire [3:0] _0593_;
+  wire [3:0] _0594_;
+  wire _0595_;
+  wire _0596_;
+  wire _0597_;
+  wire _0598_;
+  wire _0599_;
+  wire _0600_;
+  wire _0601_;
+  wire _0602_;
+  wire _0603_;
+  wire _0604_;
+  wire _0605_;
+  wire _0606_;
+  wire _0607_;
+  wire _0608_;
+  wire _0609_;
+  wire _0610_;
+  wire _0611_;
+  wire _0612_;
+  wire _0613_;
+  wire _0614_;
+  wire _0615_;
+  wire _0616_;
+  wire _0617_;
+  wire _0618_;
+  wire _0619_;
+  wire _0620_;
+  wire _0621_;
+  wire _0622_;
+  wire _0623_;
+  wire _0624_;
+  wire _0625_;
+  wire _0626_;
+  wire _0627_;
+  wire _0628_;
+  wire _0629_;
+  wire _0630_;
+  wire _0631_;
+  wire _0632_;
+  wire _0633_;
+  wire _0634_;
+  wire _0635_;
+  wire _0636_;
+  wire _0637_;
+  wire _0638_;
+  wire _0639_;
+  wire _0640_;
+  wire _0641_;
+  wire _0642_;
+  wire _0643_;
+  wire _0644_;
+  wire _0645_;
+  wire _0646_;
+  wire _0647_;
+  wire _0648_;
+  wire _0649_;
+  wire _0650_;
+  wire _0651_;
+  wire _0652_;
+  wire _0653_;
+  wire _0654_;
+  wire _0655_;
+  wire _0656_;
+  wire _0657_;
+  wire _0658_;
+  wire _0659_;
+  wire _0660_;
+  wire _0661_;
+  wire _0662_;
+  wire _0663_;
+  wire _0664_;
+  wire _0665_;
+  wire _0666_;
+  wire _0667_;
+  wire _0668_;
+  wire _0669_;
+  wire _0670_;
+  wire _0671_;
+  wire _0672_;
+  wire _0673_;
+  wire _0674_;
+  wire _0675_;
+  wire _0676_;
+  wire _0677_;
+  wire _0678_;
+  wire _0679_;
+  wire _0680_;
+  wire _0681_;
+  wire _0682_;
+  wire _0683_;
+  wire _0684_;
+  wire _0685_;
+  wire _0686_;
+  wire _0687_;
+  wire _0688_;
+  wire _0689_;
+  wire _0690_;
+  wire _0691_;
+  wire _0692_;
+  wire _0693_;
+  wire _0694_;
+  wire _0695_;
+  wire _0696_;
+  wire _0697_;
+  wire _0698_;
+  wire _0699_;
+  wire _0700_;
+  wire _0701_;
+  wire _0702_;
+  wire _0703_;
+  wire _0704_;
+  wire _0705_;
+  wire _0706_;
+  wire _0707_;
+  wire _0708_;
+  wire _0709_;
+  wire _0710_;
+  wire _0711_;
+  wire _0712_;
+  wire _0713_;
+  wire _0714_;
+  wire _0715_;
+  wire _0716_;
+  wire _0717_;
+  wire _0718_;
+  wire _0719_;
+  wire _0720_;
+  wire _0721_;
+  wire _0722_;
+  wire _0723_;
+  wire _0724_;
+  wire _0725_;
+  wire _0726_;
+  wire _0727_;
+  wire _0728_;
+  wire _0729_;
+  wire _0730_;
+  wire _0731_;
+  wire _0732_;
+  wire _0733_;
+  wire _0734_;
+  wire _0735_;
+  wire _0736_;
+  wire _0737_;
+  wire _0738_;
+  wire _0739_;
+  wire _0740_;
+  wire _0741_;
+  wire _0742_;
+  wire _0743_;
+  wire _0744_;
+  wire _0745_;
+  wire _0746_;
+  wire _0747_;
+  wire _0748_;
+  wire _0749_;
+  wire _0750_;
+  wire _0751_;
+  wire _0752_;
+  wire _0753_;
+  wire _0754_;
+  wire _0755_;
+  wire _0756_;
+  wire _0757_;
+  wire _0758_;
+  wire _0759_;
+  wire _0760_;
+  wire _0761_;
+  wire _0762_;
+  wire _0763_;
+  wire _0764_;
+  wire _0765_;
+  wire _0766_;
+  wire _0767_;
+  wire _0768_;
+  wire _0769_;
+  wire _0770_;
+  wire _0771_;
+  wire _0772_;
+  wire _0773_;
+  wire _0774_;
+  wire _0775_;
+  wire _0776_;
+  wire [3:0] _0777_;
+  wire [3:0] _0778_;
+  wire _0779_;
+  wire _0780_;
+  wire _0781_;
+  wire _0782_;
+  wire _0783_;
+  wire [3:0] _0784_;
+  wire _0785_;
+  wire [3:0] _0786_;
+  wire [3:0] _0787_;
+  wire [3:0] _0788_;
+  wire [3:0] _0789_;
+  wire _0790_;
+  wire _0791_;
+  wire _0792_;
+  wire _0793_;
+  wire _0794_;
+  wire _0795_;
+  wire _0796_;
+  wire _0797_;
+  wire _0798_;
+  wire _0799_;
+  wire _0800_;
+  wire _0801_;
+  wire _0802_;
+  wire _0803_;
+  wire _0804_;
+  wire _0805_;
+  wire _0806_;
+  wire _0807_;
+  wire [3:0] _0808_;
+  wire [3:0] _0809_;
+  wire [3:0] _0810_;
+  wire _0811_;
+  wire _0812_;
+  wire _0813_;
+  wire _0814_;
+  wire _0815_;
+  wire _0816_;
+  wire _0817_;
+  wire _0818_;
+  wire _0819_;
+  wire _0820_;
+  wire _0821_;
+  wire _0822_;
+  wire _0823_;
+  wire _0824_;
+  wire _0825_;
+  wire _0826_;
+  wire [3:0] _0827_;
+  wire [3:0] _0828_;
+  wire _0829_;
+  wire _0830_;
+  wire _0831_;
+  wire _0832_;
+  wire _0833_;
+  wire _0834_;
+  wire _0835_;
+  wire _0836_;
+  wire _0837_;
+  wire _0838_;
+  wire _0839_;
+  wire _0840_;
+  wire _0841_;
+  wire _0842_;
+  wire _0843_;
+  wire _0844_;
+  wire _0845_;
+  wire _0846_;
+  wire _0847_;
+  wire _0848_;
+  wire _0849_;
+  wire _0850_;
+  wire _0851_;
+  wire _0852_;
+  wire _0853_;
+  wire _0854_;
+  wire _0855_;
+  wire _0856_;
+  wire _0857_;
+  wire _0858_;
+  wire _0859_;
+  wire _0860_;
+  wire _0861_;
+  wire _0862_;
+  wire _0863_;
+  wire _0864_;
+  wire _0865_;
+  wire _0866_;
+  wire _0867_;
+  wire _0868_;
+  wire _0869_;
+  wire _0870_;
+  wire _0871_;
+  wire _0872_;
+  wire _0873_;
+  wire _0874_;
+  wire _0875_;
+  wire _0876_;
+  wire _0877_;
+  wire _0878_;
+  wire _0879_;
+  wire _0880_;
+  wire _0881_;
+  wire _0882_;
+  wire _0883_;
+  wire _0884_;
+  wire _0885_;
+  wire _0886_;
+  wire _0887_;
+  wire _0888_;
+  wire _0889_;
+  wire _0890_;
+  wire [1:0] _0891_;
+  wire _0892_;
+  wire _0893_;
+  wire _0894_;
+  wire _0895_;
+  wire _0896_;
+  wire _0897_;
+  wire _0898_;
+  wire _0899_;
+  wire _0900_;
+  wire [1:0] _0901_;
+  wire _0902_;
+  wire _0903_;
+  wire _0904_;
+  wire _0905_;
+  wire _0906_;
+  wire _0907_;
+  wire _0908_;
+  wire _0909_;
+  wire _0910_;
+  wire _0911_;
+  wire _0912_;
+  wire _0913_;
+  wire _0914_;
+  wire _0915_;
+  wire _0916_;
+  wire _0917_;
+  wire [1:0] _0918_;
+  wire _0919_;
+  wire _0920_;
+  wire _0921_;
+  wire _0922_;
+  wire _0923_;
+  wire _0924_;
+  wire _0925_;
+  wire _0926_;
+  wire [3:0] _0927_;
+  wire [3:0] _0928_;
+  wire _0929_;
+  wire _0930_;
+  wire _0931_;
+  wire _0932_;
+  wire [3:0] _0933_;
+  wire [3:0] _0934_;
+  wire _0935_;
+  wire [3:0] _0936_;
+  wire _0937_;
+  wire _0938_;
+  wire _0939_;
+  wire _0940_;
+  wire _0941_;
+  wire _0942_;
+  wire _0943_;
+  wire _0944_;
+  wire _0945_;
+  wire _0946_;
+  wire _0947_;
+  wire [1:0] _0948_;
+  wire [1:0] _0949_;
+  wire [1:0] _0950_;
+  wire _0951_;
+  wire _0952_;
+  wire _0953_;
+  wire _0954_;
+  wire _0955_;
+  wire _0956_;
+  wire [1:0] _0957_;
+  wire [1:0] _0958_;
+  wire _0959_;
+  wire _0960_;
+  wire _0961_;
+  wire _0962_;
+  wire _0963_;
+  wire _0964_;
+  wire _0965_;
+  wire _0966_;
+  wire [1:0] _0967_;
+  wire [1:0] _0968_;
+  wire [1:0] _0969_;
+  wire _0970_;
+  wire _0971_;
+  wire _0972_;
+  wire _0973_;
+  wire _0974_;
+  wire _0975_;
+  wire [1:0] _0976_;
+  wire [1:0] _0977_;
+  wire _0978_;
+  wire [3:0] _0979_;
+  wire [3:0] _0980_;
+  wire [3:0] _0981_;
+  wire [3:0] _0982_;
+  wire _0983_;
+  wire _0984_;
+  wire _0985_;
+  wire _0986_;
+  wire _0987_;
+  wire _0988_;
+  wire _0989_;
+  wire _0990_;
+  wire _0991_;
+  wire _0992_;
+  wire _0993_;
+  wire _0994_;
+  wire _0995_;
+  wire [3:0] _0996_;
+  wire [3:0] _0997_;
+  wire [3:0] _0998_;
+  wire _0999_;
+  wire _1000_;
+  wire _1001_;
+  wire _1002_;
+  wire _1003_;
+  wire _1004_;
+  wire _1005_;
+  wire _1006_;
+  wire _1007_;
+  wire _1008_;
+  wire _1009_;
+  wire _1010_;
+  wire _1011_;
+  wire _1012_;
+  wire _1013_;
+  wire _1014_;
+  wire [3:0] _1015_;
+  wire [3:0] _1016_;
+  wire _1017_;
+  wire _1018_;
+  wire _1019_;
+  wire _1020_;
+  wire _1021_;
+  wire _1022_;
+  wire _1023_;
+  wire _1024_;
+  wire _1025_;
+  wire _1026_;
+  wire _1027_;
+  wire _1028_;
+  wire _1029_;
+  wire [3:0] _1030_;
+  wire _1031_;
+  wire _1032_;
+  wire _1033_;
+  wire _1034_;
+  wire _1035_;
+  wire _1036_;
+  wire _1037_;
+  wire _1038_;
+  wire _1039_;
+  wire _1040_;
+  wire [3:0] _1041_;
+  wire _1042_;
+  wire _1043_;
+  wire _1044_;
+  wire _1045_;
+  wire contested;
+  wire [1:0] msg_action;
+  wire [2:0] msg_type;
+  wire [3:0] next_state;
+  wire [3:0] plane_id;
+  reg [1:0] queue_streak;
+  wire reverse_takeoff_first;
+  wire serve_divert;
+  wire serve_flush;
+  wire serve_landing;
+  wire serve_queue;
+  wire serve_takeoff;
+  reg [3:0] state;
+  reg takeoff_first;
+  assign _0003_ = runway_active != 2'h3;
+  assign _0000_ = uart_request[3:1] == 3'h2;
+  assign _0001_ = { 1'h0, uart_request[0] } == 2'h1;
+  assign _0002_ = ! { 1'h0, uart_request[0] };
+  assign _0006_ = _0048_ && _0003_;
+  assign _0004_ = emergency_id == uart_request[7:4];
+  assign _0005_ = uart_request[3:1] == 3'h7;
+  assign _0011_ = takeoff_count > landing_count;
+  assign _0007_ = | { 1'h0, uart_request[0] };
+  assign _0008_ = ! uart_request[7:4];
+  assign _0009_ = uart_request[7:6] == 2'h2;
+  assign _0010_ = uart_request[7:6] == 2'h1;
+  assign _0012_ = ! _0910_;
+  assign _0013_ = ! takeoff_fifo_empty;
+  assign _0014_ = ! landing_fifo_empty;
+  assign _0015_ = uart_request[3:1] == 3'h7;
+  assign _0016_ = _0015_ && { 1'h0, uart_request[0] };
+  assign _0017_ = uart_request[7:6] == 2'h2;
+  assign _0018_ = _0016_ && _0017_;
+  assign _0019_ = ~ takeoff_first;
+  assign _0020_ = reset || uart_rd_request;
+  assign _0021_ = unqueue_takeoff_plane || unqueue_landing_plane;
+  assign _0022_ = _0021_ || send_divert_landing;
+  assign _0026_ = serve_flush | serve_divert;
+  assign _0023_ = queue_streak != 2'h2;
+  assign _0024_ = _0022_ && _0023_;
+  assign _0025_ = queue_streak + 2'h1;
+  assign _0027_ = _0026_ | serve_takeoff;
+  assign serve_queue = _0027_ | serve_landing;
+  assign _0028_ = { 30'h00000000, queue_streak } < 32'd2;
+  assign _0029_ = uart_empty || _0028_;
+  assign _0030_ = serve_queue && _0029_;
+  assign _0031_ = ! takeoff_fifo_empty;
+  assign _0035_ = ! landing_fifo_empty;
+  assign _0032_ = ! uart_request[3:1];
+  assign _0034_ = ! { 1'h0, uart_request[0] };
+  assign contested = _0031_ && _0035_;
+  assign _0036_ = { 1'h0, uart_request[0] } == 2'h1;
+  assign _0037_ = landing_fifo_full || emergency;
+  assign _0038_ = ! landing_fifo_empty;
+  assign _0044_ = emergency && _0038_;
+  assign _0039_ = uart_request[3:1] == 3'h1;
+  assign _0041_ = ! { 1'h0, uart_request[0] };
+  assign _0042_ = runway[4:1] == uart_request[7:4];
+  assign _0043_ = _0042_ && runway[0];
+  assign _0048_ = ! emergency;
+  assign _0045_ = | { 1'h0, uart_request[0] };
+  assign _0046_ = runway[9:6] == uart_request[7:4];
+  assign _0047_ = _0046_ && runway[5];
+  assign _0049_[0] = uart_request[4] ? all_id[1] : all_id[0];
+  assign _0049_[1] = uart_request[4] ? all_id[3] : all_id[2];
+  assign _0049_[2] = uart_request[4] ? all_id[5] : all_id[4];
+  assign _0049_[3] = uart_request[4] ? all_id[7] : all_id[6];
+  assign _0049_[4] = uart_request[4] ? all_id[9] : all_id[8];
+  assign _0049_[5] = uart_request[4] ? all_id[11] : all_id[10];
+  assign _0049_[6] = uart_request[4] ? all_id[13] : all_id[12];
+  assign _0049_[7] = uart_request[4] ? all_id[15] : all_id[14];
+  assign _0050_[0] = uart_request[5] ? _0049_[1] : _0049_[0];
+  assign _0050_[1] = uart_request[5] ? _0049_[3] : _0049_[2];
+  assign _0050_[2] = uart_request[5] ? _0049_[5] : _0049_[4];
+  assign _0050_[3] = uart_request[5] ? _0049_[7] : _0049_[6];
+  assign _0051_[0] = uart_request[6] ? _0050_[1] : _0050_[0];
+  assign _0051_[1] = uart_request[6] ? _0050_[3] : _0050_[2];
+  assign _0040_ = uart_request[7] ? _0051_[1] : _0051_[0];
+  assign _0052_[0] = uart_request[4] ? all_id[1] : all_id[0];
+  assign _0052_[1] = uart_request[4] ? all_id[3] : all_id[2];
+  assign _0052_[2] = uart_request[4] ? all_id[5] : all_id[4];
+  assign _0052_[3] = uart_request[4] ? all_id[7] : all_id[6];
+  assign _0052_[4] = uart_request[4] ? all_id[9] : all_id[8];
+  assign _0052_[5] = uart_request[4] ? all_id[11] : all_id[10];
+  assign _0052_[6] = uart_request[4] ? all_id[13] : all_id[12];
+  assign _0052_[7] = uart_request[4] ? all_id[15] : all_id[14];
+  assign _0053_[0] = uart_request[5] ? _0052_[1] : _0052_[0];
+  assign _0053_[1] = uart_request[5] ? _0052_[3] : _0052_[2];
+  assign _0053_[2] = uart_request[5] ? _0052_[5] : _0052_[4];
+  assign _0053_[3] = uart_request[5] ? _0052_[7] : _0052_[6];
+  assign _0054_[0] = uart_request[6] ? _0053_[1] : _0053_[0];
+  assign _0054_[1] = uart_request[6] ? _0053_[3] : _0053_[2];
+  assign _0033_ = uart_request[7] ? _0054_[1] : _0054_[0];
+  always @(posedge clock)
+    queue_streak <= _0918_;
+  always @(posedge clock)
+    state <= _0927_;
+  always @(posedge clock)
+    takeoff_first <= _0926_;
+  assign _0085_ = _0018_ ? 4'ha : 4'h3;
+  assign _0086_ = reply_fifo_full ? 4'hx : _0085_;
+  assign _0069_ = _0087_ ? _0086_ : 4'hx;
+  assign _0087_ = state == 4'h2;
+  assign _0088_ = reply_fifo_full ? 4'h2 : _0069_;
+  assign _0070_ = _0089_ ? _0088_ : 4'hx;
+  assign _0089_ = state == 4'h2;
+  assign _0090_ = reply_fifo_full ? 1'h0 : 1'h1;
+  assign _0091_ = _0092_ ? _0090_ : 1'hx;
+  assign _0092_ = state == 4'h2;
+  assign _0093_ = _0005_ ? _0064_ : 4'h2;
+  assign _0094_ = _0000_ ? 4'hx : _0093_;
+  assign _0095_ = _0039_ ? 4'hx : _0094_;
+  assign _0096_ = _0032_ ? 4'hx : _0095_;
+  assign _0065_ = _0097_ ? _0096_ : 4'hx;
+  assign _0097_ = state == 4'h1;
+  assign _0098_ = _0005_ ? _0301_ : 1'h1;
+  assign _0099_ = _0000_ ? 1'hx : _0098_;
+  assign _0100_ = _0039_ ? 1'hx : _0099_;
+  assign _0101_ = _0032_ ? 1'hx : _0100_;
+  assign _0102_ = _0103_ ? _0101_ : 1'hx;
+  assign _0103_ = state == 4'h1;
+  assign _0104_ = id_full ? 1'h0 : 1'h1;
+  assign _0105_ = _0007_ ? 1'hx : _0104_;
+  assign _0106_ = _0005_ ? _0105_ : 1'hx;
+  assign _0107_ = _0000_ ? 1'hx : _0106_;
+  assign _0108_ = _0039_ ? 1'hx : _0107_;
+  assign _0109_ = _0032_ ? 1'hx : _0108_;
+  assign _0110_ = _0111_ ? _0109_ : 1'hx;
+  assign _0111_ = state == 4'h1;
+  assign _0112_ = id_full ? 1'h0 : 1'h1;
+  assign _0113_ = _0007_ ? 1'hx : _0112_;
+  assign _0114_ = _0005_ ? _0113_ : 1'hx;
+  assign _0115_ = _0000_ ? 1'hx : _0114_;
+  assign _0116_ = _0039_ ? 1'hx : _0115_;
+  assign _0117_ = _0032_ ? 1'hx : _0116_;
+  assign _0118_ = _0119_ ? _0117_ : 1'hx;
+  assign _0119_ = state == 4'h1;
+  assign _0120_ = id_full ? 1'h1 : 1'h0;
+  assign _0121_ = _0007_ ? 1'hx : _0120_;
+  assign _0122_ = _0005_ ? _0121_ : 1'hx;
+  assign _0123_ = _0000_ ? 1'hx : _0122_;
+  assign _0124_ = _0039_ ? 1'hx : _0123_;
+  assign _0125_ = _0032_ ? 1'hx : _0124_;
+  assign _0126_ = _0127_ ? _0125_ : 1'hx;
+  assign _0127_ = state == 4'h1;
+  assign _0128_ = _0010_ ? 1'h1 : 1'h0;
+  assign _0129_ = _0009_ ? 1'hx : _0128_;
+  assign _0130_ = _0008_ ? 1'hx : _0129_;
+  assign _0131_ = _0007_ ? _0130_ : 1'hx;
+  assign _0132_ = _0005_ ? _0131_ : 1'hx;
+  assign _0133_ = _0000_ ? 1'hx : _0132_;
+  assign _0134_ = _0039_ ? 1'hx : _0133_;
+  assign _0135_ = _0032_ ? 1'hx : _0134_;
+  assign _0136_ = _0137_ ? _0135_ : 1'hx;
+  assign _0137_ = state == 4'h1;
+  assign _0138_ = _0010_ ? 1'h1 : 1'h0;
+  assign _0139_ = _0009_ ? 1'hx : _0138_;
+  assign _0140_ = _0008_ ? 1'hx : _0139_;
+  assign _0141_ = _0007_ ? _0140_ : 1'hx;
+  assign _0142_ = _0005_ ? _0141_ : 1'hx;
+  assign _0143_ = _0000_ ? 1'hx : _0142_;
+  assign _0144_ = _0039_ ? 1'hx : _0143_;
+  assign _0145_ = _0032_ ? 1'hx : _0144_;
+  assign _0146_ = _0147_ ? _0145_ : 1'hx;
+  assign _0147_ = state == 4'h1;
+  assign _0148_ = _0010_ ? 1'h0 : 1'h1;
+  assign _0149_ = _0009_ ? 1'hx : _0148_;
+  assign _0150_ = _0008_ ? 1'hx : _0149_;
+  assign _0151_ = _0007_ ? _0150_ : 1'hx;
+  assign _0152_ = _0005_ ? _0151_ : 1'hx;
+  assign _0153_ = _0000_ ? 1'hx : _0152_;
+  assign _0154_ = _0039_ ? 1'hx : _0153_;
+  assign _0155_ = _0032_ ? 1'hx : _0154_;
+  assign _0156_ = _0157_ ? _0155_ : 1'hx;
+  assign _0157_ = state == 4'h1;
+  assign _0158_ = _0009_ ? 1'h1 : _0146_;
+  assign _0159_ = _0008_ ? 1'hx : _0158_;
+  assign _0160_ = _0007_ ? _0159_ : 1'hx;
+  assign _0161_ = _0005_ ? _0160_ : 1'hx;
+  assign _0162_ = _0000_ ? 1'hx : _0161_;
+  assign _0163_ = _0039_ ? 1'hx : _0162_;
+  assign _0164_ = _0032_ ? 1'hx : _0163_;
+  assign _0165_ = _0166_ ? _0164_ : 1'hx;
+  assign _0166_ = state == 4'h1;
+  assign _0167_ = _0009_ ? 1'h0 : _0136_;
+  assign _0168_ = _0008_ ? 1'hx : _0167_;
+  assign _0169_ = _0007_ ? _0168_ : 1'hx;
+  assign _0170_ = _0005_ ? _0169_ : 1'hx;
+  assign _0171_ = _0000_ ? 1'hx : _0170_;
+  assign _0172_ = _0039_ ? 1'hx : _0171_;
+  assign _0173_ = _0032_ ? 1'hx : _0172_;
+  assign _0174_ = _0175_ ? _0173_ : 1'hx;
+  assign _0175_ = state == 4'h1;
+  assign _0176_ = _0009_ ? 1'h1 : 1'h0;
+  assign _0177_ = _0008_ ? 1'hx : _0176_;
+  assign _0178_ = _0007_ ? _0177_ : 1'hx;
+  assign _0179_ = _0005_ ? _0178_ : 1'hx;
+  assign _0180_ = _0000_ ? 1'hx : _0179_;
+  assign _0181_ = _0039_ ? 1'hx : _0180_;
+  assign _0182_ = _0032_ ? 1'hx : _0181_;
+  assign _0183_ = _0184_ ? _0182_ : 1'hx;
+  assign _0184_ = state == 4'h1;
+  assign _0185_ = _0009_ ? 1'h0 : _0156_;
+  assign _0186_ = _0008_ ? 1'hx : _0185_;
+  assign _0187_ = _0007_ ? _0186_ : 1'hx;
+  assign _0188_ = _0005_ ? _0187_ : 1'hx;
+  assign _0189_ = _0000_ ? 1'hx : _0188_;
+  assign _0190_ = _0039_ ? 1'hx : _0189_;
+  assign _0191_ = _0032_ ? 1'hx : _0190_;
+  assign _0192_ = _0193_ ? _0191_ : 1'hx;
+  assign _0193_ = state == 4'h1;
+  assign _0194_ = _0008_ ? 4'h8 : 4'h2;
+  assign _0195_ = _0007_ ? _0194_ : 4'hx;
+  assign _0196_ = _0005_ ? _0195_ : 4'hx;
+  assign _0197_ = _0000_ ? 4'hx : _0196_;
+  assign _0198_ = _0039_ ? 4'hx : _0197_;
+  assign _0199_ = _0032_ ? 4'hx : _0198_;
+  assign _0063_ = _0200_ ? _0199_ : 4'hx;
+  assign _0200_ = state == 4'h1;
+  assign _0201_ = _0008_ ? 1'h0 : _0174_;
+  assign _0202_ = _0007_ ? _0201_ : 1'hx;
+  assign _0203_ = _0005_ ? _0202_ : 1'hx;
+  assign _0204_ = _0000_ ? 1'hx : _0203_;
+  assign _0205_ = _0039_ ? 1'hx : _0204_;
+  assign _0206_ = _0032_ ? 1'hx : _0205_;
+  assign _0207_ = _0208_ ? _0206_ : 1'hx;
+  assign _0208_ = state == 4'h1;
+  assign _0209_ = _0008_ ? 1'h0 : _0183_;
+  assign _0210_ = _0007_ ? _0209_ : 1'hx;
+  assign _0211_ = _0005_ ? _0210_ : 1'hx;
+  assign _0212_ = _0000_ ? 1'hx : _0211_;
+  assign _0213_ = _0039_ ? 1'hx : _0212_;
+  assign _0214_ = _0032_ ? 1'hx : _0213_;
+  assign _0215_ = _0216_ ? _0214_ : 1'hx;
+  assign _0216_ = state == 4'h1;
+  assign _0217_ = _0008_ ? 1'h0 : _0165_;
+  assign _0218_ = _0007_ ? _0217_ : 1'hx;
+  assign _0219_ = _0005_ ? _0218_ : 1'hx;
+  assign _0220_ = _0000_ ? 1'hx : _0219_;
+  assign _0221_ = _0039_ ? 1'hx : _0220_;
+  assign _0222_ = _0032_ ? 1'hx : _0221_;
+  assign _0223_ = _0224_ ? _0222_ : 1'hx;
+  assign _0224_ = state == 4'h1;
+  assign _0225_ = _0008_ ? 1'h1 : 1'h0;
+  assign _0226_ = _0007_ ? _0225_ : 1'hx;
+  assign _0227_ = _0005_ ? _0226_ : 1'hx;
+  assign _0228_ = _0000_ ? 1'hx : _0227_;
+  assign _0229_ = _0039_ ? 1'hx : _0228_;
+  assign _0230_ = _0032_ ? 1'hx : _0229_;
+  assign _0231_ = _0232_ ? _0230_ : 1'hx;
+  assign _0232_ = state == 4'h1;
+  assign _0233_ = _0008_ ? 1'h0 : _0192_;
+  assign _0234_ = _0007_ ? _0233_ : 1'hx;
+  assign _0235_ = _0005_ ? _0234_ : 1'hx;
+  assign _0236_ = _0000_ ? 1'hx : _0235_;
+  assign _0237_ = _0039_ ? 1'hx : _0236_;
+  assign _0238_ = _0032_ ? 1'hx : _0237_;
+  assign _0239_ = _0240_ ? _0238_ : 1'hx;
+  assign _0240_ = state == 4'h1;
+  assign _0241_ = _0007_ ? _0063_ : 4'h2;
+  assign _0242_ = _0005_ ? _0241_ : 4'hx;
+  assign _0243_ = _0000_ ? 4'hx : _0242_;
+  assign _0244_ = _0039_ ? 4'hx : _0243_;
+  assign _0245_ = _0032_ ? 4'hx : _0244_;
+  assign _0064_ = _0246_ ? _0245_ : 4'hx;
+  assign _0246_ = state == 4'h1;
+  assign _0247_ = _0007_ ? _0207_ : 1'h0;
+  assign _0248_ = _0005_ ? _0247_ : 1'hx;
+  assign _0249_ = _0000_ ? 1'hx : _0248_;
+  assign _0250_ = _0039_ ? 1'hx : _0249_;
+  assign _0251_ = _0032_ ? 1'hx : _0250_;
+  assign _0252_ = _0253_ ? _0251_ : 1'hx;
+  assign _0253_ = state == 4'h1;
+  assign _0254_ = _0007_ ? _0215_ : 1'h0;
+  assign _0255_ = _0005_ ? _0254_ : 1'hx;
+  assign _0256_ = _0000_ ? 1'hx : _0255_;
+  assign _0257_ = _0039_ ? 1'hx : _0256_;
+  assign _0258_ = _0032_ ? 1'hx : _0257_;
+  assign _0259_ = _0260_ ? _0258_ : 1'hx;
+  assign _0260_ = state == 4'h1;
+  assign _0261_ = _0007_ ? _0223_ : 1'h0;
+  assign _0262_ = _0005_ ? _0261_ : 1'hx;
+  assign _0263_ = _0000_ ? 1'hx : _0262_;
+  assign _0264_ = _0039_ ? 1'hx : _0263_;
+  assign _0265_ = _0032_ ? 1'hx : _0264_;
+  assign _0266_ = _0267_ ? _0265_ : 1'hx;
+  assign _0267_ = state == 4'h1;
+  assign _0268_ = _0007_ ? _0231_ : 1'h0;
+  assign _0269_ = _0005_ ? _0268_ : 1'hx;
+  assign _0270_ = _0000_ ? 1'hx : _0269_;
+  assign _0271_ = _0039_ ? 1'hx : _0270_;
+  assign _0272_ = _0032_ ? 1'hx : _0271_;
+  assign _0273_ = _0274_ ? _0272_ : 1'hx;
+  assign _0274_ = state == 4'h1;
+  assign _0275_ = _0007_ ? 1'h0 : _0110_;
+  assign _0276_ = _0005_ ? _0275_ : 1'hx;
+  assign _0277_ = _0000_ ? 1'hx : _0276_;
+  assign _0278_ = _0039_ ? 1'hx : _0277_;
+  assign _0279_ = _0032_ ? 1'hx : _0278_;
+  assign _0280_ = _0281_ ? _0279_ : 1'hx;
+  assign _0281_ = state == 4'h1;
+  assign _0282_ = _0007_ ? 1'h0 : _0118_;
+  assign _0283_ = _0005_ ? _0282_ : 1'hx;
+  assign _0284_ = _0000_ ? 1'hx : _0283_;
+  assign _0285_ = _0039_ ? 1'hx : _0284_;
+  assign _0286_ = _0032_ ? 1'hx : _0285_;
+  assign _0287_ = _0288_ ? _0286_ : 1'hx;
+  assign _0288_ = state == 4'h1;
+  assign _0289_ = _0007_ ? 1'h0 : _0126_;
+  assign _0290_ = _0005_ ? _0289_ : 1'hx;
+  assign _0291_ = _0000_ ? 1'hx : _0290_;
+  assign _0292_ = _0039_ ? 1'hx : _0291_;
+  assign _0293_ = _0032_ ? 1'hx : _0292_;
+  assign _0294_ = _0295_ ? _0293_ : 1'hx;
+  assign _0295_ = state == 4'h1;
+  assign _0296_ = _0007_ ? _0239_ : 1'h0;
+  assign _0297_ = _0005_ ? _0296_ : 1'hx;
+  assign _0298_ = _0000_ ? 1'hx : _0297_;
+  assign _0299_ = _0039_ ? 1'hx : _0298_;
+  assign _0300_ = _0032_ ? 1'hx : _0299_;
+  assign _0301_ = _0302_ ? _0300_ : 1'hx;
+  assign _0302_ = state == 4'h1;
+  assign _0303_ = _0005_ ? _0252_ : 1'h0;
+  assign _0304_ = _0000_ ? 1'hx : _0303_;
+  assign _0305_ = _0039_ ? 1'hx : _0304_;
+  assign _0306_ = _0032_ ? 1'hx : _0305_;
+  assign _0307_ = _0308_ ? _0306_ : 1'hx;
+  assign _0308_ = state == 4'h1;
+  assign _0309_ = _0005_ ? _0259_ : 1'h0;
+  assign _0310_ = _0000_ ? 1'hx : _0309_;
+  assign _0311_ = _0039_ ? 1'hx : _0310_;
+  assign _0312_ = _0032_ ? 1'hx : _0311_;
+  assign _0313_ = _0314_ ? _0312_ : 1'hx;
+  assign _0314_ = state == 4'h1;
+  assign _0315_ = _0005_ ? _0266_ : 1'h0;
+  assign _0316_ = _0000_ ? 1'hx : _0315_;
+  assign _0317_ = _0039_ ? 1'hx : _0316_;
+  assign _0318_ = _0032_ ? 1'hx : _0317_;
+  assign _0319_ = _0320_ ? _0318_ : 1'hx;
+  assign _0320_ = state == 4'h1;
+  assign _0321_ = _0005_ ? _0273_ : 1'h0;
+  assign _0322_ = _0000_ ? 1'hx : _0321_;
+  assign _0323_ = _0039_ ? 1'hx : _0322_;
+  assign _0324_ = _0032_ ? 1'hx : _0323_;
+  assign _0325_ = _0326_ ? _0324_ : 1'hx;
+  assign _0326_ = state == 4'h1;
+  assign _0327_ = _0005_ ? _0280_ : 1'h0;
+  assign _0328_ = _0000_ ? 1'hx : _0327_;
+  assign _0329_ = _0039_ ? 1'hx : _0328_;
+  assign _0330_ = _0032_ ? 1'hx : _0329_;
+  assign _0331_ = _0332_ ? _0330_ : 1'hx;
+  assign _0332_ = state == 4'h1;
+  assign _0333_ = _0005_ ? _0287_ : 1'h0;
+  assign _0334_ = _0000_ ? 1'hx : _0333_;
+  assign _0335_ = _0039_ ? 1'hx : _0334_;
+  assign _0336_ = _0032_ ? 1'hx : _0335_;
+  assign _0337_ = _0338_ ? _0336_ : 1'hx;
+  assign _0338_ = state == 4'h1;
+  assign _0339_ = _0005_ ? _0294_ : 1'h0;
+  assign _0340_ = _0000_ ? 1'hx : _0339_;
+  assign _0341_ = _0039_ ? 1'hx : _0340_;
+  assign _0342_ = _0032_ ? 1'hx : _0341_;
+  assign _0343_ = _0344_ ? _0342_ : 1'hx;
+  assign _0344_ = state == 4'h1;
+  assign _0345_ = _0000_ ? _0062_ : _0065_;
+  assign _0346_ = _0039_ ? 4'hx : _0345_;
+  assign _0347_ = _0032_ ? 4'hx : _0346_;
+  assign _0066_ = _0348_ ? _0347_ : 4'hx;
+  assign _0348_ = state == 4'h1;
+  assign _0349_ = _0004_ ? 1'h1 : 1'h0;
+  assign _0350_ = _0002_ ? _0349_ : 1'hx;
+  assign _0351_ = _0001_ ? 1'hx : _0350_;
+  assign _0352_ = _0000_ ? _0351_ : 1'hx;
+  assign _0353_ = _0039_ ? 1'hx : _0352_;
+  assign _0354_ = _0032_ ? 1'hx : _0353_;
+  assign _0355_ = _0356_ ? _0354_ : 1'hx;
+  assign _0356_ = state == 4'h1;
+  assign _0357_ = _0002_ ? 4'h3 : 4'h0;
+  assign _0358_ = _0001_ ? 4'hx : _0357_;
+  assign _0359_ = _0000_ ? _0358_ : 4'hx;
+  assign _0360_ = _0039_ ? 4'hx : _0359_;
+  assign _0361_ = _0032_ ? 4'hx : _0360_;
+  assign _0061_ = _0362_ ? _0361_ : 4'hx;
+  assign _0362_ = state == 4'h1;
+  assign _0363_ = _0002_ ? 1'h1 : 1'h0;
+  assign _0364_ = _0001_ ? 1'hx : _0363_;
+  assign _0365_ = _0000_ ? _0364_ : 1'hx;
+  assign _0366_ = _0039_ ? 1'hx : _0365_;
+  assign _0367_ = _0032_ ? 1'hx : _0366_;
+  assign _0368_ = _0369_ ? _0367_ : 1'hx;
+  assign _0369_ = state == 4'h1;
+  assign _0370_ = _0002_ ? _0355_ : 1'h0;
+  assign _0371_ = _0001_ ? 1'hx : _0370_;
+  assign _0372_ = _0000_ ? _0371_ : 1'hx;
+  assign _0373_ = _0039_ ? 1'hx : _0372_;
+  assign _0374_ = _0032_ ? 1'hx : _0373_;
+  assign _0375_ = _0376_ ? _0374_ : 1'hx;
+  assign _0376_ = state == 4'h1;
+  assign _0377_ = _0001_ ? _0060_ : _0061_;
+  assign _0378_ = _0000_ ? _0377_ : 4'hx;
+  assign _0379_ = _0039_ ? 4'hx : _0378_;
+  assign _0380_ = _0032_ ? 4'hx : _0379_;
+  assign _0062_ = _0381_ ? _0380_ : 4'hx;
+  assign _0381_ = state == 4'h1;
+  assign _0382_ = landing_fifo_empty ? 4'h0 : 4'hb;
+  assign _0383_ = _0001_ ? _0382_ : 4'hx;
+  assign _0384_ = _0000_ ? _0383_ : 4'hx;
+  assign _0385_ = _0039_ ? 4'hx : _0384_;
+  assign _0386_ = _0032_ ? 4'hx : _0385_;
+  assign _0060_ = _0387_ ? _0386_ : 4'hx;
+  assign _0387_ = state == 4'h1;
+  assign _0388_ = _0001_ ? 1'h0 : _0368_;
+  assign _0389_ = _0000_ ? _0388_ : 1'hx;
+  assign _0390_ = _0039_ ? 1'hx : _0389_;
+  assign _0391_ = _0032_ ? 1'hx : _0390_;
+  assign _0392_ = _0393_ ? _0391_ : 1'hx;
+  assign _0393_ = state == 4'h1;
+  assign _0394_ = _0001_ ? 1'h0 : _0375_;
+  assign _0395_ = _0000_ ? _0394_ : 1'hx;
+  assign _0396_ = _0039_ ? 1'hx : _0395_;
+  assign _0397_ = _0032_ ? 1'hx : _0396_;
+  assign _0398_ = _0399_ ? _0397_ : 1'hx;
+  assign _0399_ = state == 4'h1;
+  assign _0400_ = _0001_ ? 1'h1 : 1'h0;
+  assign _0401_ = _0000_ ? _0400_ : 1'hx;
+  assign _0402_ = _0039_ ? 1'hx : _0401_;
+  assign _0403_ = _0032_ ? 1'hx : _0402_;
+  assign _0404_ = _0405_ ? _0403_ : 1'hx;
+  assign _0405_ = state == 4'h1;
+  assign _0406_ = _0000_ ? 1'h0 : _0307_;
+  assign _0407_ = _0039_ ? 1'hx : _0406_;
+  assign _0408_ = _0032_ ? 1'hx : _0407_;
+  assign _0409_ = _0410_ ? _0408_ : 1'hx;
+  assign _0410_ = state == 4'h1;
+  assign _0411_ = _0000_ ? 1'h0 : _0313_;
+  assign _0412_ = _0039_ ? 1'hx : _0411_;
+  assign _0413_ = _0032_ ? 1'hx : _0412_;
+  assign _0414_ = _0415_ ? _0413_ : 1'hx;
+  assign _0415_ = state == 4'h1;
+  assign _0416_ = _0000_ ? 1'h0 : _0319_;
+  assign _0417_ = _0039_ ? 1'hx : _0416_;
+  assign _0418_ = _0032_ ? 1'hx : _0417_;
+  assign _0419_ = _0420_ ? _0418_ : 1'hx;
+  assign _0420_ = state == 4'h1;
+  assign _0421_ = _0000_ ? 1'h0 : _0325_;
+  assign _0422_ = _0039_ ? 1'hx : _0421_;
+  assign _0423_ = _0032_ ? 1'hx : _0422_;
+  assign _0424_ = _0425_ ? _0423_ : 1'hx;
+  assign _0425_ = state == 4'h1;
+  assign _0426_ = _0000_ ? _0392_ : 1'h0;
+  assign _0427_ = _0039_ ? 1'hx : _0426_;
+  assign _0428_ = _0032_ ? 1'hx : _0427_;
+  assign _0429_ = _0430_ ? _0428_ : 1'hx;
+  assign _0430_ = state == 4'h1;
+  assign _0431_ = _0000_ ? 1'h0 : _0331_;
+  assign _0432_ = _0039_ ? 1'hx : _0431_;
+  assign _0433_ = _0032_ ? 1'hx : _0432_;
+  assign _0434_ = _0435_ ? _0433_ : 1'hx;
+  assign _0435_ = state == 4'h1;
+  assign _0436_ = _0000_ ? _0398_ : 1'h0;
+  assign _0437_ = _0039_ ? 1'hx : _0436_;
+  assign _0438_ = _0032_ ? 1'hx : _0437_;
+  assign _0439_ = _0440_ ? _0438_ : 1'hx;
+  assign _0440_ = state == 4'h1;
+  assign _0441_ = _0000_ ? _0404_ : 1'h0;
+  assign _0442_ = _0039_ ? 1'hx : _0441_;
+  assign _0443_ = _0032_ ? 1'hx : _0442_;
+  assign _0444_ = _0445_ ? _0443_ : 1'hx;
+  assign _0445_ = state == 4'h1;
+  assign _0446_ = _0000_ ? 1'h0 : _0337_;
+  assign _0447_ = _0039_ ? 1'hx : _0446_;
+  assign _0448_ = _0032_ ? 1'hx : _0447_;
+  assign _0449_ = _0450_ ? _0448_ : 1'hx;
+  assign _0450_ = state == 4'h1;
+  assign _0451_ = _0000_ ? 1'h0 : _0343_;
+  assign _0452_ = _0039_ ? 1'hx : _0451_;
+  assign _0453_ = _0032_ ? 1'hx : _0452_;
+  assign _0454_ = _0455_ ? _0453_ : 1'hx;
+  assign _0455_ = state == 4'h1;
+  assign _0456_ = _0000_ ? 1'h0 : _0102_;
+  assign _0457_ = _0039_ ? 1'hx : _0456_;
+  assign _0458_ = _0032_ ? 1'hx : _0457_;
+  assign _0459_ = _0460_ ? _0458_ : 1'hx;
+  assign _0460_ = state == 4'h1;
+  assign _0461_ = _0039_ ? _0059_ : _0066_;
+  assign _0462_ = _0032_ ? 4'hx : _0461_;
+  assign _0067_ = _0463_ ? _0462_ : 4'hx;
+  assign _0463_ = state == 4'h1;
+  assign _0464_ = _0039_ ? _0528_ : _0429_;
+  assign _0465_ = _0032_ ? 1'hx : _0464_;
+  assign _0466_ = _0467_ ? _0465_ : 1'hx;
+  assign _0467_ = state == 4'h1;
+  assign _0468_ = _0039_ ? 4'h3 : 4'hx;
+  assign _0469_ = _0032_ ? 4'hx : _0468_;
+  assign _0059_ = _0470_ ? _0469_ : 4'hx;
+  assign _0470_ = state == 4'h1;
+  assign _0471_ = _0047_ ? 1'h1 : 1'h0;
+  assign _0472_ = _0045_ ? _0471_ : 1'hx;
+  assign _0473_ = _0041_ ? 1'hx : _0472_;
+  assign _0474_ = _0040_ ? _0473_ : 1'hx;
+  assign _0475_ = _0039_ ? _0474_ : 1'hx;
+  assign _0476_ = _0032_ ? 1'hx : _0475_;
+  assign _0477_ = _0478_ ? _0476_ : 1'hx;
+  assign _0478_ = state == 4'h1;
+  assign _0479_ = _0045_ ? _0477_ : 1'h0;
+  assign _0480_ = _0041_ ? 1'hx : _0479_;
+  assign _0481_ = _0040_ ? _0480_ : 1'hx;
+  assign _0482_ = _0039_ ? _0481_ : 1'hx;
+  assign _0483_ = _0032_ ? 1'hx : _0482_;
+  assign _0484_ = _0485_ ? _0483_ : 1'hx;
+  assign _0485_ = state == 4'h1;
+  assign _0486_ = _0045_ ? 1'h1 : 1'h0;
+  assign _0487_ = _0041_ ? 1'hx : _0486_;
+  assign _0488_ = _0040_ ? _0487_ : 1'hx;
+  assign _0489_ = _0039_ ? _0488_ : 1'hx;
+  assign _0490_ = _0032_ ? 1'hx : _0489_;
+  assign _0491_ = _0492_ ? _0490_ : 1'hx;
+  assign _0492_ = state == 4'h1;
+  assign _0493_ = _0045_ ? 1'h1 : 1'h0;
+  assign _0494_ = _0041_ ? 1'hx : _0493_;
+  assign _0495_ = _0040_ ? _0494_ : 1'hx;
+  assign _0496_ = _0039_ ? _0495_ : 1'hx;
+  assign _0497_ = _0032_ ? 1'hx : _0496_;
+  assign _0498_ = _0499_ ? _0497_ : 1'hx;
+  assign _0499_ = state == 4'h1;
+  assign _0500_ = _0041_ ? _0523_ : _0484_;
+  assign _0501_ = _0040_ ? _0500_ : 1'hx;
+  assign _0502_ = _0039_ ? _0501_ : 1'hx;
+  assign _0503_ = _0032_ ? 1'hx : _0502_;
+  assign _0504_ = _0505_ ? _0503_ : 1'hx;
+  assign _0505_ = state == 4'h1;
+  assign _0506_ = _0041_ ? 1'h0 : _0491_;
+  assign _0507_ = _0040_ ? _0506_ : 1'hx;
+  assign _0508_ = _0039_ ? _0507_ : 1'hx;
+  assign _0509_ = _0032_ ? 1'hx : _0508_;
+  assign _0510_ = _0511_ ? _0509_ : 1'hx;
+  assign _0511_ = state == 4'h1;
+  assign _0512_ = _0041_ ? 1'h1 : _0498_;
+  assign _0513_ = _0040_ ? _0512_ : 1'hx;
+  assign _0514_ = _0039_ ? _0513_ : 1'hx;
+  assign _0515_ = _0032_ ? 1'hx : _0514_;
+  assign _0516_ = _0517_ ? _0515_ : 1'hx;
+  assign _0517_ = state == 4'h1;
+  assign _0518_ = _0043_ ? 1'h1 : 1'h0;
+  assign _0519_ = _0041_ ? _0518_ : 1'hx;
+  assign _0520_ = _0040_ ? _0519_ : 1'hx;
+  assign _0521_ = _0039_ ? _0520_ : 1'hx;
+  assign _0522_ = _0032_ ? 1'hx : _0521_;
+  assign _0523_ = _0524_ ? _0522_ : 1'hx;
+  assign _0524_ = state == 4'h1;
+  assign _0525_ = _0040_ ? _0504_ : 1'h0;
+  assign _0526_ = _0039_ ? _0525_ : 1'hx;
+  assign _0527_ = _0032_ ? 1'hx : _0526_;
+  assign _0528_ = _0529_ ? _0527_ : 1'hx;
+  assign _0529_ = state == 4'h1;
+  assign _0530_ = _0040_ ? _0510_ : 1'h0;
+  assign _0531_ = _0039_ ? _0530_ : 1'hx;
+  assign _0532_ = _0032_ ? 1'hx : _0531_;
+  assign _0533_ = _0534_ ? _0532_ : 1'hx;
+  assign _0534_ = state == 4'h1;
+  assign _0535_ = _0040_ ? _0516_ : 1'h0;
+  assign _0536_ = _0039_ ? _0535_ : 1'hx;
+  assign _0537_ = _0032_ ? 1'hx : _0536_;
+  assign _0538_ = _0539_ ? _0537_ : 1'hx;
+  assign _0539_ = state == 4'h1;
+  assign _0540_ = _0039_ ? 1'h0 : _0409_;
+  assign _0541_ = _0032_ ? 1'hx : _0540_;
+  assign _0542_ = _0543_ ? _0541_ : 1'hx;
+  assign _0543_ = state == 4'h1;
+  assign _0544_ = _0039_ ? 1'h0 : _0414_;
+  assign _0545_ = _0032_ ? 1'hx : _0544_;
+  assign _0546_ = _0547_ ? _0545_ : 1'hx;
+  assign _0547_ = state == 4'h1;
+  assign _0548_ = _0039_ ? 1'h0 : _0419_;
+  assign _0549_ = _0032_ ? 1'hx : _0548_;
+  assign _0550_ = _0551_ ? _0549_ : 1'hx;
+  assign _0551_ = state == 4'h1;
+  assign _0552_ = _0039_ ? 1'h0 : _0424_;
+  assign _0553_ = _0032_ ? 1'hx : _0552_;
+  assign _0554_ = _0555_ ? _0553_ : 1'hx;
+  assign _0555_ = state == 4'h1;
+  assign _0556_ = _0039_ ? 1'h0 : _0434_;
+  assign _0557_ = _0032_ ? 1'hx : _0556_;
+  assign _0558_ = _0559_ ? _0557_ : 1'hx;
+  assign _0559_ = state == 4'h1;
+  assign _0560_ = _0039_ ? 1'h0 : _0439_;
+  assign _0561_ = _0032_ ? 1'hx : _0560_;
+  assign _0562_ = _0563_ ? _0561_ : 1'hx;
+  assign _0563_ = state == 4'h1;
+  assign _0564_ = _0039_ ? 1'h0 : _0444_;
+  assign _0565_ = _0032_ ? 1'hx : _0564_;
+  assign _0566_ = _0567_ ? _0565_ : 1'hx;
+  assign _0567_ = state == 4'h1;
+  assign _0568_ = _0039_ ? _0533_ : 1'h0;
+  assign _0569_ = _0032_ ? 1'hx : _0568_;
+  assign _0570_ = _0571_ ? _0569_ : 1'hx;
+  assign _0571_ = state == 4'h1;
+  assign _0572_ = _0039_ ? _0538_ : 1'h0;
+  assign _0573_ = _0032_ ? 1'hx : _0572_;
+  assign _0574_ = _0575_ ? _0573_ : 1'hx;
+  assign _0575_ = state == 4'h1;
+  assign _0576_ = _0039_ ? 1'h0 : _0449_;
+  assign _0577_ = _0032_ ? 1'hx : _0576_;
+  assign _0578_ = _0579_ ? _0577_ : 1'hx;
+  assign _0579_ = state == 4'h1;
+  assign _0580_ = _0039_ ? 1'h0 : _0454_;
+  assign _0581_ = _0032_ ? 1'hx : _0580_;
+  assign _0582_ = _0583_ ? _0581_ : 1'hx;
+  assign _0583_ = state == 4'h1;
+  assign _0584_ = _0039_ ? 1'h0 : _0459_;
+  assign _0585_ = _0032_ ? 1'hx : _0584_;
+  assign _0586_ = _0587_ ? _0585_ : 1'hx;
+  assign _0587_ = state == 4'h1;
+  assign _0588_ = _0032_ ? _0084_ : _0067_;
+  assign _0068_ = _0589_ ? _0588_ : 4'hx;
+  assign _0589_ = state == 4'h1;
+  assign _0590_ = _0032_ ? _0699_ : _0466_;
+  assign _0591_ = _0592_ ? _0590_ : 1'hx;
+  assign _0592_ = state == 4'h1;
+  assign _0593_ = _0033_ ? 4'h2 : 4'h3;
+  assign _0594_ = _0032_ ? _0593_ : 4'hx;
+  assign _0084_ = _0595_ ? _0594_ : 4'hx;
+  assign _0595_ = state == 4'h1;
+  assign _0596_ = _0037_ ? 1'h1 : 1'h0;
+  assign _0597_ = _0036_ ? _0596_ : 1'hx;
+  assign _0598_ = _0034_ ? 1'hx : _0597_;
+  assign _0599_ = _0033_ ? _0598_ : 1'hx;
+  assign _0600_ = _0032_ ? _0599_ : 1'hx;
+  assign _0601_ = _0602_ ? _0600_ : 1'hx;
+  assign _0602_ = state == 4'h1;
+  assign _0603_ = _0037_ ? 1'h1 : 1'h0;
+  assign _0604_ = _0036_ ? _0603_ : 1'hx;
+  assign _0605_ = _0034_ ? 1'hx : _0604_;
+  assign _0606_ = _0033_ ? _0605_ : 1'hx;
+  assign _0607_ = _0032_ ? _0606_ : 1'hx;
+  assign _0608_ = _0609_ ? _0607_ : 1'hx;
+  assign _0609_ = state == 4'h1;
+  assign _0610_ = _0037_ ? 1'h0 : 1'h1;
+  assign _0611_ = _0036_ ? _0610_ : 1'hx;
+  assign _0612_ = _0034_ ? 1'hx : _0611_;
+  assign _0613_ = _0033_ ? _0612_ : 1'hx;
+  assign _0614_ = _0032_ ? _0613_ : 1'hx;
+  assign _0615_ = _0616_ ? _0614_ : 1'hx;
+  assign _0616_ = state == 4'h1;
+  assign _0617_ = _0037_ ? 1'h0 : 1'h1;
+  assign _0618_ = _0036_ ? _0617_ : 1'hx;
+  assign _0619_ = _0034_ ? 1'hx : _0618_;
+  assign _0620_ = _0033_ ? _0619_ : 1'hx;
+  assign _0621_ = _0032_ ? _0620_ : 1'hx;
+  assign _0622_ = _0623_ ? _0621_ : 1'hx;
+  assign _0623_ = state == 4'h1;
+  assign _0624_ = _0036_ ? _0601_ : 1'h0;
+  assign _0625_ = _0034_ ? 1'hx : _0624_;
+  assign _0626_ = _0033_ ? _0625_ : 1'hx;
+  assign _0627_ = _0032_ ? _0626_ : 1'hx;
+  assign _0628_ = _0629_ ? _0627_ : 1'hx;
+  assign _0629_ = state == 4'h1;
+  assign _0630_ = _0036_ ? _0608_ : 1'h0;
+  assign _0631_ = _0034_ ? 1'hx : _0630_;
+  assign _0632_ = _0033_ ? _0631_ : 1'hx;
+  assign _0633_ = _0032_ ? _0632_ : 1'hx;
+  assign _0634_ = _0635_ ? _0633_ : 1'hx;
+  assign _0635_ = state == 4'h1;
+  assign _0636_ = _0036_ ? _0615_ : 1'h0;
+  assign _0637_ = _0034_ ? 1'hx : _0636_;
+  assign _0638_ = _0033_ ? _0637_ : 1'hx;
+  assign _0639_ = _0032_ ? _0638_ : 1'hx;
+  assign _0640_ = _0641_ ? _0639_ : 1'hx;
+  assign _0641_ = state == 4'h1;
+  assign _0642_ = _0036_ ? _0622_ : 1'h0;
+  assign _0643_ = _0034_ ? 1'hx : _0642_;
+  assign _0644_ = _0033_ ? _0643_ : 1'hx;
+  assign _0645_ = _0032_ ? _0644_ : 1'hx;
+  assign _0646_ = _0647_ ? _0645_ : 1'hx;
+  assign _0647_ = state == 4'h1;
+  assign _0648_ = _0034_ ? _0667_ : _0628_;
+  assign _0649_ = _0033_ ? _0648_ : 1'hx;
+  assign _0650_ = _0032_ ? _0649_ : 1'hx;
+  assign _0651_ = _0652_ ? _0650_ : 1'hx;
+  assign _0652_ = state == 4'h1;
+  assign _0653_ = _0034_ ? _0673_ : _0634_;
+  assign _0654_ = _0033_ ? _0653_ : 1'hx;
+  assign _0655_ = _0032_ ? _0654_ : 1'hx;
+  assign _0656_ = _0657_ ? _0655_ : 1'hx;
+  assign _0657_ = state == 4'h1;
+  assign _0658_ = _0034_ ? _0679_ : _0640_;
+  assign _0659_ = _0033_ ? _0658_ : 1'hx;
+  assign _0660_ = _0032_ ? _0659_ : 1'hx;
+  assign _0661_ = _0662_ ? _0660_ : 1'hx;
+  assign _0662_ = state == 4'h1;
+  assign _0663_ = takeoff_fifo_full ? 1'h1 : 1'h0;
+  assign _0664_ = _0034_ ? _0663_ : 1'hx;
+  assign _0665_ = _0033_ ? _0664_ : 1'hx;
+  assign _0666_ = _0032_ ? _0665_ : 1'hx;
+  assign _0667_ = _0668_ ? _0666_ : 1'hx;
+  assign _0668_ = state == 4'h1;
+  assign _0669_ = takeoff_fifo_full ? 1'h1 : 1'h0;
+  assign _0670_ = _0034_ ? _0669_ : 1'hx;
+  assign _0671_ = _0033_ ? _0670_ : 1'hx;
+  assign _0672_ = _0032_ ? _0671_ : 1'hx;
+  assign _0673_ = _0674_ ? _0672_ : 1'hx;
+  assign _0674_ = state == 4'h1;
+  assign _0675_ = takeoff_fifo_full ? 1'h0 : 1'h1;
+  assign _0676_ = _0034_ ? _0675_ : 1'hx;
+  assign _0677_ = _0033_ ? _0676_ : 1'hx;
+  assign _0678_ = _0032_ ? _0677_ : 1'hx;
+  assign _0679_ = _0680_ ? _0678_ : 1'hx;
+  assign _0680_ = state == 4'h1;
+  assign _0681_ = takeoff_fifo_full ? 1'h0 : 1'h1;
+  assign _0682_ = _0034_ ? _0681_ : 1'hx;
+  assign _0683_ = _0033_ ? _0682_ : 1'hx;
+  assign _0684_ = _0032_ ? _0683_ : 1'hx;
+  assign _0685_ = _0686_ ? _0684_ : 1'hx;
+  assign _0686_ = state == 4'h1;
+  assign _0687_ = _0034_ ? 1'h0 : _0646_;
+  assign _0688_ = _0033_ ? _0687_ : 1'hx;
+  assign _0689_ = _0032_ ? _0688_ : 1'hx;
+  assign _0690_ = _0691_ ? _0689_ : 1'hx;
+  assign _0691_ = state == 4'h1;
+  assign _0692_ = _0034_ ? _0685_ : 1'h0;
+  assign _0693_ = _0033_ ? _0692_ : 1'hx;
+  assign _0694_ = _0032_ ? _0693_ : 1'hx;
+  assign _0695_ = _0696_ ? _0694_ : 1'hx;
+  assign _0696_ = state == 4'h1;
+  assign _0697_ = _0033_ ? _0651_ : 1'h0;
+  assign _0698_ = _0032_ ? _0697_ : 1'hx;
+  assign _0699_ = _0700_ ? _0698_ : 1'hx;
+  assign _0700_ = state == 4'h1;
+  assign _0701_ = _0033_ ? _0656_ : 1'h0;
+  assign _0702_ = _0032_ ? _0701_ : 1'hx;
+  assign _0703_ = _0704_ ? _0702_ : 1'hx;
+  assign _0704_ = state == 4'h1;
+  assign _0705_ = _0033_ ? _0661_ : 1'h0;
+  assign _0706_ = _0032_ ? _0705_ : 1'hx;
+  assign _0707_ = _0708_ ? _0706_ : 1'hx;
+  assign _0708_ = state == 4'h1;
+  assign _0709_ = _0033_ ? _0690_ : 1'h0;
+  assign _0710_ = _0032_ ? _0709_ : 1'hx;
+  assign _0711_ = _0712_ ? _0710_ : 1'hx;
+  assign _0712_ = state == 4'h1;
+  assign _0713_ = _0033_ ? _0695_ : 1'h0;
+  assign _0714_ = _0032_ ? _0713_ : 1'hx;
+  assign _0715_ = _0716_ ? _0714_ : 1'hx;
+  assign _0716_ = state == 4'h1;
+  assign _0717_ = _0032_ ? 1'h0 : _0542_;
+  assign _0718_ = _0719_ ? _0717_ : 1'hx;
+  assign _0719_ = state == 4'h1;
+  assign _0720_ = _0032_ ? 1'h0 : _0546_;
+  assign _0721_ = _0722_ ? _0720_ : 1'hx;
+  assign _0722_ = state == 4'h1;
+  assign _0723_ = _0032_ ? 1'h0 : _0550_;
+  assign _0724_ = _0725_ ? _0723_ : 1'hx;
+  assign _0725_ = state == 4'h1;
+  assign _0726_ = _0032_ ? 1'h0 : _0554_;
+  assign _0727_ = _0728_ ? _0726_ : 1'hx;
+  assign _0728_ = state == 4'h1;
+  assign _0729_ = _0032_ ? 1'h0 : _0558_;
+  assign _0730_ = _0731_ ? _0729_ : 1'hx;
+  assign _0731_ = state == 4'h1;
+  assign _0732_ = _0032_ ? 1'h0 : _0562_;
+  assign _0733_ = _0734_ ? _0732_ : 1'hx;
+  assign _0734_ = state == 4'h1;
+  assign _0735_ = _0032_ ? 1'h0 : _0566_;
+  assign _0736_ = _0737_ ? _0735_ : 1'hx;
+  assign _0737_ = state == 4'h1;
+  assign _0738_ = _0032_ ? 1'h0 : _0570_;
+  assign _0739_ = _0740_ ? _0738_ : 1'hx;
+  assign _0740_ = state == 4'h1;
+  assign _0741_ = _0032_ ? 1'h0 : _0574_;
+  assign _0742_ = _0743_ ? _0741_ : 1'hx;
+  assign _0743_ = state == 4'h1;
+  assign _0744_ = _0032_ ? 1'h0 : _0578_;
+  assign _0745_ = _0746_ ? _0744_ : 1'hx;
+  assign _0746_ = state == 4'h1;
+  assign _0747_ = _0032_ ? 1'h0 : _0582_;
+  assign _0748_ = _0749_ ? _0747_ : 1'hx;
+  assign _0749_ = state == 4'h1;
+  assign _0750_ = _0032_ ? _0703_ : 1'h0;
+  assign _0751_ = _0752_ ? _0750_ : 1'hx;
+  assign _0752_ = state == 4'h1;
+  assign _0753_ = _0032_ ? 1'h0 : _0586_;
+  assign _0754_ = _0755_ ? _0753_ : 1'hx;
+  assign _0755_ = state == 4'h1;
+  assign _0756_ = _0032_ ? _0707_ : 1'h0;
+  assign _0757_ = _0758_ ? _0756_ : 1'hx;
+  assign _0758_ = state == 4'h1;
+  assign _0759_ = _0032_ ? _0711_ : 1'h0;
+  assign _0760_ = _0761_ ? _0759_ : 1'hx;
+  assign _0761_ = state == 4'h1;
+  assign _0762_ = _0032_ ? _0715_ : 1'h0;
+  assign _0763_ = _0764_ ? _0762_ : 1'hx;
+  assign _0764_ = state == 4'h1;
+  function [3:0] _1821_;
+    input [3:0] a;
+    input [47:0] b;
+    input [11:0] s;
+    casez (s) // synopsys parallel_case
+      12'b???????????1:
+        _1821_ = b[3:0];
+      12'b??????????1?:
+        _1821_ = b[7:4];
+      12'b?????????1??:
+        _1821_ = b[11:8];
+      12'b????????1???:
+        _1821_ = b[15:12];
+      12'b???????1????:
+        _1821_ = b[19:16];
+      12'b??????1?????:
+        _1821_ = b[23:20];
+      12'b?????1??????:
+        _1821_ = b[27:24];
+      12'b????1???????:
+        _1821_ = b[31:28];
+      12'b???1????????:
+        _1821_ = b[35:32];
+      12'b??1?????????:
+        _1821_ = b[39:36];
+      12'b?1??????????:
+        _1821_ = b[43:40];
+      12'b1???????????:
+        _1821_ = b[47:44];
+      default:
+        _1821_ = a;
+    endcase
+  endfunction
+  assign next_state = _1821_(4'h0, { _0083_, _0068_, _0070_, _0071_, _0075_, 20'h77679, _0077_, _0078_ }, { _0776_, _0775_, _0774_, _0773_, _0772_, _0771_, _0770_, _0769_, _0768_, _0767_, _0766_, _0765_ });
+  assign _0765_ = state == 4'h7;
+  assign _0766_ = state == 4'h9;
+  assign _0767_ = state == 4'h8;
+  assign _0768_ = state == 4'h6;
+  assign _0769_ = state == 4'hb;
+  assign _0770_ = state == 4'h5;
+  assign _0771_ = state == 4'h4;
+  assign _0772_ = state == 4'h3;
+  assign _0773_ = state == 4'ha;
+  assign _0774_ = state == 4'h2;
+  assign _0775_ = state == 4'h1;
+  assign _0776_ = ! state;
+  assign _0777_ = uart_empty ? 4'h0 : 4'h1;
+  assign _0778_ = _0030_ ? 4'hx : _0777_;
+  assign _0082_ = _0779_ ? _0778_ : 4'hx;
+  assign _0779_ = ! state;
+  assign _0780_ = uart_empty ? 1'h0 : 1'h1;
+  assign _0781_ = _0030_ ? 1'hx : _0780_;
+  assign _0782_ = _0783_ ? _0781_ : 1'hx;
+  assign _0783_ = ! state;
+  assign _0784_ = _0030_ ? _0081_ : _0082_;
+  assign _0083_ = _0785_ ? _0784_ : 4'hx;
+  assign _0785_ = ! state;
+  assign _0786_ = serve_takeoff ? 4'h4 : 4'h5;
+  assign _0787_ = serve_divert ? 4'hx : _0786_;
+  assign _0788_ = serve_flush ? 4'hx : _0787_;
+  assign _0789_ = _0030_ ? _0788_ : 4'hx;
+  assign _0079_ = _0790_ ? _0789_ : 4'hx;
+  assign _0790_ = ! state;
+  assign _0791_ = serve_divert ? 1'hx : contested;
+  assign _0792_ = serve_flush ? 1'hx : _0791_;
+  assign _0793_ = _0030_ ? _0792_ : 1'hx;
+  assign _0794_ = _0795_ ? _0793_ : 1'hx;
+  assign _0795_ = ! state;
+  assign _0796_ = serve_takeoff ? 1'h0 : 1'h1;
+  assign _0797_ = serve_divert ? 1'hx : _0796_;
+  assign _0798_ = serve_flush ? 1'hx : _0797_;
+  assign _0799_ = _0030_ ? _0798_ : 1'hx;
+  assign _0800_ = _0801_ ? _0799_ : 1'hx;
+  assign _0801_ = ! state;
+  assign _0802_ = serve_takeoff ? 1'h1 : 1'h0;
+  assign _0803_ = serve_divert ? 1'hx : _0802_;
+  assign _0804_ = serve_flush ? 1'hx : _0803_;
+  assign _0805_ = _0030_ ? _0804_ : 1'hx;
+  assign _0806_ = _0807_ ? _0805_ : 1'hx;
+  assign _0807_ = ! state;
+  assign _0808_ = serve_divert ? 4'h6 : _0079_;
+  assign _0809_ = serve_flush ? 4'hx : _0808_;
+  assign _0810_ = _0030_ ? _0809_ : 4'hx;
+  assign _0080_ = _0811_ ? _0810_ : 4'hx;
+  assign _0811_ = ! state;
+  assign _0812_ = serve_divert ? 1'h0 : _0794_;
+  assign _0813_ = serve_flush ? 1'hx : _0812_;
+  assign _0814_ = _0030_ ? _0813_ : 1'hx;
+  assign _0815_ = _0816_ ? _0814_ : 1'hx;
+  assign _0816_ = ! state;
+  assign _0817_ = serve_divert ? 1'h0 : _0800_;
+  assign _0818_ = serve_flush ? 1'hx : _0817_;
+  assign _0819_ = _0030_ ? _0818_ : 1'hx;
+  assign _0820_ = _0821_ ? _0819_ : 1'hx;
+  assign _0821_ = ! state;
+  assign _0822_ = serve_divert ? 1'h0 : _0806_;
+  assign _0823_ = serve_flush ? 1'hx : _0822_;
+  assign _0824_ = _0030_ ? _0823_ : 1'hx;
+  assign _0825_ = _0826_ ? _0824_ : 1'hx;
+  assign _0826_ = ! state;
+  assign _0827_ = serve_flush ? 4'hb : _0080_;
+  assign _0828_ = _0030_ ? _0827_ : 4'hx;
+  assign _0081_ = _0829_ ? _0828_ : 4'hx;
+  assign _0829_ = ! state;
+  assign _0830_ = serve_flush ? 1'h0 : _0815_;
+  assign _0831_ = _0030_ ? _0830_ : 1'hx;
+  assign _0832_ = _0833_ ? _0831_ : 1'hx;
+  assign _0833_ = ! state;
+  assign _0834_ = serve_flush ? 1'h0 : _0820_;
+  assign _0835_ = _0030_ ? _0834_ : 1'hx;
+  assign _0836_ = _0837_ ? _0835_ : 1'hx;
+  assign _0837_ = ! state;
+  assign _0838_ = serve_flush ? 1'h0 : _0825_;
+  assign _0839_ = _0030_ ? _0838_ : 1'hx;
+  assign _0840_ = _0841_ ? _0839_ : 1'hx;
+  assign _0841_ = ! state;
+  assign _0842_ = _0030_ ? _0832_ : 1'h0;
+  assign _0843_ = _0844_ ? _0842_ : 1'hx;
+  assign _0844_ = ! state;
+  assign _0845_ = _0030_ ? _0836_ : 1'h0;
+  assign _0846_ = _0847_ ? _0845_ : 1'hx;
+  assign _0847_ = ! state;
+  assign _0848_ = _0030_ ? _0840_ : 1'h0;
+  assign _0849_ = _0850_ ? _0848_ : 1'hx;
+  assign _0850_ = ! state;
+  assign _0851_ = _0030_ ? 1'h0 : _0782_;
+  assign _0852_ = _0853_ ? _0851_ : 1'hx;
+  assign _0853_ = ! state;
+  function [0:0] _1916_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _1916_ = b[0:0];
+      2'b1?:
+        _1916_ = b[1:1];
+      default:
+        _1916_ = a;
+    endcase
+  endfunction
+  assign reverse_takeoff_first = _1916_(1'h0, { _0843_, _1033_ }, { _0855_, _0854_ });
+  assign _0854_ = state == 4'h3;
+  assign _0855_ = ! state;
+  assign flush_landings = _0856_ ? 1'h1 : 1'h0;
+  assign _0856_ = state == 4'hb;
+  assign set_schedule = _0857_ ? _0718_ : 1'h0;
+  assign _0857_ = state == 4'h1;
+  assign switch_tx_baud = _0858_ ? _1044_ : 1'h0;
+  assign _0858_ = state == 4'ha;
+  assign switch_rx_baud = _0859_ ? _0721_ : 1'h0;
+  assign _0859_ = state == 4'h1;
+  assign send_echo = _0860_ ? _0724_ : 1'h0;
+  assign _0860_ = state == 4'h1;
+  assign queue_status = _0861_ ? _0939_ : 1'h0;
+  assign _0861_ = state == 4'h9;
+  assign send_status = _0862_ ? 1'h1 : 1'h0;
+  assign _0862_ = state == 4'h8;
+  assign take_snapshot = _0863_ ? _0727_ : 1'h0;
+  assign _0863_ = state == 4'h1;
+  assign sel_takeoff_id_lock = _0864_ ? 1'h1 : 1'h0;
+  assign _0864_ = state == 4'h4;
+  assign release_id = _0865_ ? _0591_ : 1'h0;
+  assign _0865_ = state == 4'h1;
+  assign take_id = _0866_ ? _0730_ : 1'h0;
+  assign _0866_ = state == 4'h1;
+  assign unset_emergency = _0867_ ? _0733_ : 1'h0;
+  assign _0867_ = state == 4'h1;
+  assign set_emergency = _0868_ ? _0736_ : 1'h0;
+  assign _0868_ = state == 4'h1;
+  function [0:0] _1945_;
+    input [0:0] a;
+    input [2:0] b;
+    input [2:0] s;
+    casez (s) // synopsys parallel_case
+      3'b??1:
+        _1945_ = b[0:0];
+      3'b?1?:
+        _1945_ = b[1:1];
+      3'b1??:
+        _1945_ = b[2:2];
+      default:
+        _1945_ = a;
+    endcase
+  endfunction
+  assign runway_id = _1945_(1'h0, { _0739_, _0972_, _0953_ }, { _0871_, _0870_, _0869_ });
+  assign _0869_ = state == 4'h5;
+  assign _0870_ = state == 4'h4;
+  assign _0871_ = state == 4'h1;
+  assign unlock = _0872_ ? _0742_ : 1'h0;
+  assign _0872_ = state == 4'h1;
+  function [0:0] _1951_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _1951_ = b[0:0];
+      2'b1?:
+        _1951_ = b[1:1];
+      default:
+        _1951_ = a;
+    endcase
+  endfunction
+  assign lock = _1951_(1'h0, { _0056_, _0058_ }, { _0874_, _0873_ });
+  assign _0873_ = state == 4'h5;
+  assign _0874_ = state == 4'h4;
+  assign queue_urgent_reply = _0875_ ? _0931_ : 1'h0;
+  assign _0875_ = state == 4'h7;
+  assign queue_reply = _0876_ ? _0091_ : 1'h0;
+  assign _0876_ = state == 4'h2;
+  assign send_valid_id = _0877_ ? _0745_ : 1'h0;
+  assign _0877_ = state == 4'h1;
+  assign send_invalid_id = _0878_ ? _0748_ : 1'h0;
+  assign _0878_ = state == 4'h1;
+  assign send_divert_landing = _0879_ ? 1'h1 : 1'h0;
+  assign _0879_ = state == 4'h6;
+  assign send_divert = _0880_ ? _0751_ : 1'h0;
+  assign _0880_ = state == 4'h1;
+  assign send_say_ag = _0881_ ? _0754_ : 1'h0;
+  assign _0881_ = state == 4'h1;
+  assign send_hold = _0882_ ? _0757_ : 1'h0;
+  assign _0882_ = state == 4'h1;
+  function [1:0] _1970_;
+    input [1:0] a;
+    input [3:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _1970_ = b[1:0];
+      2'b1?:
+        _1970_ = b[3:2];
+      default:
+        _1970_ = a;
+    endcase
+  endfunction
+  assign send_clear = _1970_(2'h0, { _0977_, _0958_ }, { _0884_, _0883_ });
+  assign _0883_ = state == 4'h5;
+  assign _0884_ = state == 4'h4;
+  function [0:0] _1973_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _1973_ = b[0:0];
+      2'b1?:
+        _1973_ = b[1:1];
+      default:
+        _1973_ = a;
+    endcase
+  endfunction
+  assign unqueue_landing_plane = _1973_(1'h0, { _0846_, _1036_ }, { _0886_, _0885_ });
+  assign _0885_ = state == 4'h3;
+  assign _0886_ = ! state;
+  function [0:0] _1976_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _1976_ = b[0:0];
+      2'b1?:
+        _1976_ = b[1:1];
+      default:
+        _1976_ = a;
+    endcase
+  endfunction
+  assign unqueue_takeoff_plane = _1976_(1'h0, { _0849_, _1039_ }, { _0888_, _0887_ });
+  assign _0887_ = state == 4'h3;
+  assign _0888_ = ! state;
+  assign queue_landing_plane = _0889_ ? _0760_ : 1'h0;
+  assign _0889_ = state == 4'h1;
+  assign _0891_ = _0024_ ? _0025_ : queue_streak;
+  assign queue_takeoff_plane = _0890_ ? _0763_ : 1'h0;
+  assign _0890_ = state == 4'h1;
+  assign uart_rd_request = _0892_ ? _0852_ : 1'h0;
+  assign _0892_ = ! state;
+  assign _0893_ = contested ? _0012_ : _0014_;
+  assign _0894_ = _0006_ ? _0893_ : 1'hx;
+  assign _0895_ = divert_waiting ? 1'hx : _0894_;
+  assign _0896_ = _0044_ ? 1'hx : _0895_;
+  assign _0901_ = _0020_ ? 2'hx : _0891_;
+  assign _0897_ = contested ? _0910_ : _0013_;
+  assign _0898_ = _0006_ ? _0897_ : 1'hx;
+  assign _0899_ = divert_waiting ? 1'hx : _0898_;
+  assign _0900_ = _0044_ ? 1'hx : _0899_;
+  function [0:0] _1995_;
+    input [0:0] a;
+    input [3:0] b;
+    input [3:0] s;
+    casez (s) // synopsys parallel_case
+      4'b???1:
+        _1995_ = b[0:0];
+      4'b??1?:
+        _1995_ = b[1:1];
+      4'b?1??:
+        _1995_ = b[2:2];
+      4'b1???:
+        _1995_ = b[3:3];
+      default:
+        _1995_ = a;
+    endcase
+  endfunction
+  assign _0902_ = _1995_(1'hx, { takeoff_first, 2'h2, _0011_ }, { _0906_, _0905_, _0904_, _0903_ });
+  assign _0903_ = schedule == 2'h3;
+  assign _0904_ = schedule == 2'h2;
+  assign _0905_ = schedule == 2'h1;
+  assign _0906_ = ! schedule;
+  assign _0907_ = contested ? _0902_ : 1'hx;
+  assign _0908_ = _0006_ ? _0907_ : 1'hx;
+  assign _0909_ = divert_waiting ? 1'hx : _0908_;
+  assign _0910_ = _0044_ ? 1'hx : _0909_;
+  assign _0911_ = _0006_ ? _0896_ : 1'h0;
+  assign _0912_ = divert_waiting ? 1'hx : _0911_;
+  assign _0913_ = _0044_ ? 1'hx : _0912_;
+  assign _0914_ = _0006_ ? _0900_ : 1'h0;
+  assign _0918_ = _0020_ ? 2'h0 : _0901_;
+  assign _0915_ = divert_waiting ? 1'hx : _0914_;
+  assign _0916_ = _0044_ ? 1'hx : _0915_;
+  assign _0917_ = divert_waiting ? 1'h0 : _0913_;
+  assign _0919_ = _0044_ ? 1'hx : _0917_;
+  assign _0920_ = divert_waiting ? 1'h0 : _0916_;
+  assign _0921_ = _0044_ ? 1'hx : _0920_;
+  assign _0924_ = reverse_takeoff_first ? _0019_ : takeoff_first;
+  assign _0922_ = divert_waiting ? 1'h1 : 1'h0;
+  assign _0923_ = _0044_ ? 1'hx : _0922_;
+  assign serve_landing = _0044_ ? 1'h0 : _0919_;
+  assign serve_takeoff = _0044_ ? 1'h0 : _0921_;
+  assign serve_divert = _0044_ ? 1'h0 : _0923_;
+  assign serve_flush = _0044_ ? 1'h1 : 1'h0;
+  assign _0925_ = reset ? 1'hx : _0924_;
+  assign _0926_ = reset ? 1'h0 : _0925_;
+  assign _0927_ = reset ? 4'h0 : next_state;
+  assign _0928_ = urgent_fifo_full ? 4'h7 : 4'h0;
+  assign _0078_ = _0929_ ? _0928_ : 4'hx;
+  assign _0929_ = state == 4'h7;
+  assign _0930_ = urgent_fifo_full ? 1'h0 : 1'h1;
+  assign _0931_ = _0932_ ? _0930_ : 1'hx;
+  assign _0932_ = state == 4'h7;
+  assign _0933_ = status_done ? 4'h3 : 4'h8;
+  assign _0934_ = reply_fifo_full ? 4'hx : _0933_;
+  assign _0076_ = _0935_ ? _0934_ : 4'hx;
+  assign _0935_ = state == 4'h9;
+  assign _0936_ = reply_fifo_full ? 4'h9 : _0076_;
+  assign _0077_ = _0937_ ? _0936_ : 4'hx;
+  assign _0937_ = state == 4'h9;
+  assign _0938_ = reply_fifo_full ? 1'h0 : 1'h1;
+  assign _0939_ = _0940_ ? _0938_ : 1'hx;
+  assign _0940_ = state == 4'h9;
+  assign _0941_ = runway_active[1] ? 1'h0 : 1'h1;
+  assign _0942_ = runway_active[0] ? _0941_ : 1'hx;
+  assign _0943_ = _0944_ ? _0942_ : 1'hx;
+  assign _0944_ = state == 4'h5;
+  assign _0945_ = runway_active[1] ? 1'h0 : 1'h1;
+  assign _0946_ = runway_active[0] ? _0945_ : 1'hx;
+  assign _0057_ = _0947_ ? _0946_ : 1'hx;
+  assign _0947_ = state == 4'h5;
+  assign _0948_ = runway_active[1] ? 2'h0 : 2'h2;
+  assign _0949_ = runway_active[0] ? _0948_ : 2'hx;
+  assign _0950_ = _0951_ ? _0949_ : 2'hx;
+  assign _0951_ = state == 4'h5;
+  assign _0952_ = runway_active[0] ? _0943_ : 1'h0;
+  assign _0953_ = _0954_ ? _0952_ : 1'hx;
+  assign _0954_ = state == 4'h5;
+  assign _0955_ = runway_active[0] ? _0057_ : 1'h1;
+  assign _0058_ = _0956_ ? _0955_ : 1'hx;
+  assign _0956_ = state == 4'h5;
+  assign _0957_ = runway_active[0] ? _0950_ : 2'h2;
+  assign _0958_ = _0959_ ? _0957_ : 2'hx;
+  assign _0959_ = state == 4'h5;
+  assign _0960_ = runway_active[1] ? 1'h0 : 1'h1;
+  assign _0961_ = runway_active[0] ? _0960_ : 1'hx;
+  assign _0962_ = _0963_ ? _0961_ : 1'hx;
+  assign _0963_ = state == 4'h4;
+  assign _0964_ = runway_active[1] ? 1'h0 : 1'h1;
+  assign _0965_ = runway_active[0] ? _0964_ : 1'hx;
+  assign _0055_ = _0966_ ? _0965_ : 1'hx;
+  assign _0966_ = state == 4'h4;
+  assign _0967_ = runway_active[1] ? 2'h0 : 2'h1;
+  assign _0968_ = runway_active[0] ? _0967_ : 2'hx;
+  assign _0969_ = _0970_ ? _0968_ : 2'hx;
+  assign _0970_ = state == 4'h4;
+  assign _0971_ = runway_active[0] ? _0962_ : 1'h0;
+  assign _0972_ = _0973_ ? _0971_ : 1'hx;
+  assign _0973_ = state == 4'h4;
+  assign _0974_ = runway_active[0] ? _0055_ : 1'h1;
+  assign _0056_ = _0975_ ? _0974_ : 1'hx;
+  assign _0975_ = state == 4'h4;
+  assign _0976_ = runway_active[0] ? _0969_ : 2'h1;
+  assign _0977_ = _0978_ ? _0976_ : 2'hx;
+  assign _0978_ = state == 4'h4;
+  assign _0979_ = serve_landing ? 4'h5 : 4'h0;
+  assign _0980_ = serve_takeoff ? 4'hx : _0979_;
+  assign _0981_ = serve_divert ? 4'hx : _0980_;
+  assign _0982_ = serve_flush ? 4'hx : _0981_;
+  assign _0072_ = _0983_ ? _0982_ : 4'hx;
+  assign _0983_ = state == 4'h3;
+  assign _0984_ = serve_landing ? contested : 1'h0;
+  assign _0985_ = serve_takeoff ? 1'hx : _0984_;
+  assign _0986_ = serve_divert ? 1'hx : _0985_;
+  assign _0987_ = serve_flush ? 1'hx : _0986_;
+  assign _0988_ = _0989_ ? _0987_ : 1'hx;
+  assign _0989_ = state == 4'h3;
+  assign _0990_ = serve_landing ? 1'h1 : 1'h0;
+  assign _0991_ = serve_takeoff ? 1'hx : _0990_;
+  assign _0992_ = serve_divert ? 1'hx : _0991_;
+  assign _0993_ = serve_flush ? 1'hx : _0992_;
+  assign _0994_ = _0995_ ? _0993_ : 1'hx;
+  assign _0995_ = state == 4'h3;
+  assign _0996_ = serve_takeoff ? 4'h4 : _0072_;
+  assign _0997_ = serve_divert ? 4'hx : _0996_;
+  assign _0998_ = serve_flush ? 4'hx : _0997_;
+  assign _0073_ = _0999_ ? _0998_ : 4'hx;
+  assign _0999_ = state == 4'h3;
+  assign _1000_ = serve_takeoff ? contested : _0988_;
+  assign _1001_ = serve_divert ? 1'hx : _1000_;
+  assign _1002_ = serve_flush ? 1'hx : _1001_;
+  assign _1003_ = _1004_ ? _1002_ : 1'hx;
+  assign _1004_ = state == 4'h3;
+  assign _1005_ = serve_takeoff ? 1'h0 : _0994_;
+  assign _1006_ = serve_divert ? 1'hx : _1005_;
+  assign _1007_ = serve_flush ? 1'hx : _1006_;
+  assign _1008_ = _1009_ ? _1007_ : 1'hx;
+  assign _1009_ = state == 4'h3;
+  assign _1010_ = serve_takeoff ? 1'h1 : 1'h0;
+  assign _1011_ = serve_divert ? 1'hx : _1010_;
+  assign _1012_ = serve_flush ? 1'hx : _1011_;
+  assign _1013_ = _1014_ ? _1012_ : 1'hx;
+  assign _1014_ = state == 4'h3;
+  assign _1015_ = serve_divert ? 4'h6 : _0073_;
+  assign _1016_ = serve_flush ? 4'hx : _1015_;
+  assign _0074_ = _1017_ ? _1016_ : 4'hx;
+  assign _1017_ = state == 4'h3;
+  assign _1018_ = serve_divert ? 1'h0 : _1003_;
+  assign _1019_ = serve_flush ? 1'hx : _1018_;
+  assign _1020_ = _1021_ ? _1019_ : 1'hx;
+  assign _1021_ = state == 4'h3;
+  assign _1022_ = serve_divert ? 1'h0 : _1008_;
+  assign _1023_ = serve_flush ? 1'hx : _1022_;
+  assign _1024_ = _1025_ ? _1023_ : 1'hx;
+  assign _1025_ = state == 4'h3;
+  assign _1026_ = serve_divert ? 1'h0 : _1013_;
+  assign _1027_ = serve_flush ? 1'hx : _1026_;
+  assign _1028_ = _1029_ ? _1027_ : 1'hx;
+  assign _1029_ = state == 4'h3;
+  assign _1030_ = serve_flush ? 4'hb : _0074_;
+  assign _0075_ = _1031_ ? _1030_ : 4'hx;
+  assign _1031_ = state == 4'h3;
+  assign _1032_ = serve_flush ? 1'h0 : _1020_;
+  assign _1033_ = _1034_ ? _1032_ : 1'hx;
+  assign _1034_ = state == 4'h3;
+  assign _1035_ = serve_flush ? 1'h0 : _1024_;
+  assign _1036_ = _1037_ ? _1035_ : 1'hx;
+  assign _1037_ = state == 4'h3;
+  assign _1038_ = serve_flush ? 1'h0 : _1028_;
+  assign _1039_ = _1040_ ? _1038_ : 1'hx;
+  assign _1040_ = state == 4'h3;
+  assign _1041_ = uart_tx_idle ? 4'h3 : 4'ha;
+  assign _0071_ = _1042_ ? _1041_ : 4'hx;
+  assign _1042_ = state == 4'ha;
+  assign _1043_ = uart_tx_idle ? 1'h1 : 1'h0;
+  assign _1044_ = _1045_ ? _1043_ : 1'hx;
+  assign _1045_ = state == 4'ha;
+  assign msg_action = { 1'h0, uart_request[0] };
+  assign msg_type = uart_request[3:1];
+  assign plane_id = uart_request[7:4];
+endmodule
+
+module \RunwayManager$BobFPGA.bob.bobby.runway_manager (reset, clock, runway_override, runway_active, runway_id, lock, unlock, runway, plane_id_unlock, plane_id_lock);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input [1:0] runway_override;
+  wire [1:0] runway_override;
+  output [1:0] runway_active;
+  wire [1:0] runway_active;
+  input runway_id;
+  wire runway_id;
+  input lock;
+  wire lock;
+  input unlock;
+  wire unlock;
+  output [9:0] runway;
+  reg [9:0] runway;
+  input [3:0] plane_id_unlock;
+  wire [3:0] plane_id_unlock;
+  input [3:0] plane_id_lock;
+  wire [3:0] plane_id_lock;
+  wire _00_;
+  wire _01_;
+  wire _02_;
+  wire _03_;
+  wire _04_;
+  wire _05_;
+  wire [4:0] _06_;
+  wire [4:0] _07_;
+  wire [4:0] _08_;
+  wire _09_;
+  wire _10_;
+  wire [9:0] _11_;
+  wire _12_;
+  wire _13_;
+  wire _14_;
+  wire _15_;
+  wire _16_;
+  wire _17_;
+  wire _18_;
+  wire _19_;
+  wire _20_;
+  wire _21_;
+  wire _22_;
+  wire _23_;
+  wire _24_;
+  wire _25_;
+  wire _26_;
+  wire _27_;
+  wire _28_;
+  wire _29_;
+  wire _30_;
+  wire _31_;
+  wire _32_;
+  wire _33_;
+  wire _34_;
+  wire [3:0] _35_;
+  wire [3:0] _36_;
+  wire _37_;
+  wire _38_;
+  wire [3:0] _39_;
+  wire [3:0] _40_;
+  wire [4:0] _41_;
+  wire [4:0] _42_;
+  wire [4:0] _43_;
+  wire _44_;
+  assign runway_active[0] = runway[0] | runway_override[0];
+  assign _00_ = plane_id_unlock == runway[9:6];
+  assign _01_ = plane_id_unlock == runway[4:1];
+  assign runway_active[1] = runway[5] | runway_override[1];
+  assign _02_ = ! unlock;
+  assign _03_ = lock && _02_;
+  assign _04_ = ! lock;
+  assign _05_ = _04_ && unlock;
+  always @(posedge clock)
+    runway[0] <= _11_[0];
+  always @(posedge clock)
+    runway[4:1] <= _11_[4:1];
+  always @(posedge clock)
+    runway[5] <= _11_[5];
+  always @(posedge clock)
+    runway[9:6] <= _11_[9:6];
+  assign _16_ = _01_ ? 1'h0 : runway[0];
+  assign _06_ = runway_id ? runway[4:0] : { plane_id_lock, 1'h1 };
+  assign _07_ = _03_ ? _06_ : 5'hxx;
+  assign _08_ = reset ? 5'hxx : _07_;
+  assign _09_ = _03_ ? _08_[0] : _33_;
+  assign _10_ = reset ? 1'hx : _09_;
+  assign _11_ = reset ? 10'h000 : { _36_, _38_, _40_, _10_ };
+  assign _12_ = reset ? 1'hx : _44_;
+  assign _13_ = _00_ ? 1'h0 : runway[5];
+  assign _14_ = runway_id ? _13_ : 1'hx;
+  assign _15_ = _05_ ? _14_ : 1'hx;
+  assign _17_ = _03_ ? 1'hx : _15_;
+  assign _18_ = reset ? 1'hx : _17_;
+  assign _19_ = runway_id ? _18_ : runway[5];
+  assign _20_ = _05_ ? _19_ : 1'hx;
+  assign _21_ = _03_ ? 1'hx : _20_;
+  assign _22_ = reset ? 1'hx : _21_;
+  assign _27_ = runway_id ? 1'hx : _16_;
+  assign _23_ = runway_id ? runway[0] : _12_;
+  assign _24_ = _05_ ? _23_ : 1'hx;
+  assign _25_ = _03_ ? 1'hx : _24_;
+  assign _26_ = reset ? 1'hx : _25_;
+  assign _28_ = _05_ ? _22_ : runway[5];
+  assign _29_ = _03_ ? 1'hx : _28_;
+  assign _30_ = reset ? 1'hx : _29_;
+  assign _34_ = _05_ ? _27_ : 1'hx;
+  assign _31_ = _05_ ? _26_ : runway[0];
+  assign _32_ = _03_ ? 1'hx : _31_;
+  assign _33_ = reset ? 1'hx : _32_;
+  assign _35_ = _03_ ? _43_[4:1] : runway[9:6];
+  assign _36_ = reset ? 4'hx : _35_;
+  assign _37_ = _03_ ? _43_[0] : _30_;
+  assign _38_ = reset ? 1'hx : _37_;
+  assign _39_ = _03_ ? _08_[4:1] : runway[4:1];
+  assign _40_ = reset ? 4'hx : _39_;
+  assign _44_ = _03_ ? 1'hx : _34_;
+  assign _41_ = runway_id ? { plane_id_lock, 1'h1 } : runway[9:5];
+  assign _42_ = _03_ ? _41_ : 5'hxx;
+  assign _43_ = reset ? 5'hxx : _42_;
+endmodule
+
+module \SendReplyFsm$BobFPGA.bob.bobby.reply_fsm (reset, clock, uart_tx_ready, uart_tx_send, send_reply, reply_fifo_empty, send_urgent, urgent_fifo_empty, status_in_progress);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input uart_tx_ready;
+  wire uart_tx_ready;
+  output uart_tx_send;
+  wire uart_tx_send;
+  output send_reply;
+  wire send_reply;
+  input reply_fifo_empty;
+  wire reply_fifo_empty;
+  output send_urgent;
+  wire send_urgent;
+  input urgent_fifo_empty;
+  wire urgent_fifo_empty;
+  input status_in_progress;
+  wire status_in_progress;
+  wire _00_;
+  wire _01_;
+  wire _02_;
+  wire _03_;
+  wire _04_;
+  wire _05_;
+  wire _06_;
+  wire _07_;
+  wire _08_;
+  wire _09_;
+  wire _10_;
+  wire _11_;
+  wire _12_;
+  wire _13_;
+  wire _14_;
+  wire _15_;
+  wire _16_;
+  wire _17_;
+  wire _18_;
+  wire _19_;
+  wire _20_;
+  wire _21_;
+  wire _22_;
+  wire _23_;
+  wire _24_;
+  wire _25_;
+  wire _26_;
+  wire _27_;
+  wire next_state;
+  reg state;
+  assign _00_ = ! urgent_fifo_empty;
+  assign _01_ = ! status_in_progress;
+  assign _02_ = _00_ && _01_;
+  always @(posedge clock)
+    state <= _06_;
+  assign _06_ = reset ? 1'h0 : next_state;
+  function [0:0] _33_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _33_ = b[0:0];
+      2'b1?:
+        _33_ = b[1:1];
+      default:
+        _33_ = a;
+    endcase
+  endfunction
+  assign next_state = _33_(1'hx, { _04_, 1'h0 }, { _07_, state });
+  assign _07_ = ~ state;
+  assign _08_ = reply_fifo_empty ? 1'h0 : 1'h1;
+  assign _09_ = _02_ ? 1'hx : _08_;
+  assign _10_ = uart_tx_ready ? _09_ : 1'hx;
+  assign _05_ = state ? 1'hx : _10_;
+  assign _11_ = reply_fifo_empty ? 1'h0 : 1'h1;
+  assign _12_ = _02_ ? 1'hx : _11_;
+  assign _13_ = uart_tx_ready ? _12_ : 1'hx;
+  assign _14_ = state ? 1'hx : _13_;
+  assign _15_ = _02_ ? 1'h1 : _05_;
+  assign _16_ = uart_tx_ready ? _15_ : 1'hx;
+  assign _03_ = state ? 1'hx : _16_;
+  assign _17_ = _02_ ? 1'h1 : 1'h0;
+  assign _18_ = uart_tx_ready ? _17_ : 1'hx;
+  assign _19_ = state ? 1'hx : _18_;
+  assign _20_ = _02_ ? 1'h0 : _14_;
+  assign _21_ = uart_tx_ready ? _20_ : 1'hx;
+  assign _22_ = state ? 1'hx : _21_;
+  assign _23_ = uart_tx_ready ? _03_ : 1'h0;
+  assign _04_ = state ? 1'hx : _23_;
+  assign _24_ = uart_tx_ready ? _19_ : 1'h0;
+  assign _25_ = state ? 1'hx : _24_;
+  assign _26_ = uart_tx_ready ? _22_ : 1'h0;
+  assign _27_ = state ? 1'hx : _26_;
+  assign uart_tx_send = state ? 1'h1 : 1'h0;
+  assign send_urgent = state ? 1'h0 : _25_;
+  assign send_reply = state ? 1'h0 : _27_;
+endmodule
+
+module \UartRX$BobFPGA.bob.receiver (reset, clock, rx, framing_error, receiving, baud_sel, data, done);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input rx;
+  wire rx;
+  output framing_error;
+  wire framing_error;
+  output receiving;
+  wire receiving;
+  input [1:0] baud_sel;
+  wire [1:0] baud_sel;
+  output [7:0] data;
+  reg [7:0] data;
+  output done;
+  wire done;
+  wire [3:0] _00_;
+  wire _01_;
+  wire _02_;
+  wire _03_;
+  wire [7:0] _04_;
+  wire [7:0] _05_;
+  wire [3:0] _06_;
+  wire [3:0] _07_;
+  wire [3:0] _08_;
+  wire [7:0] _09_;
+  wire clear_data_counter;
+  wire collect_data;
+  reg [3:0] data_counter;
+  wire done_data;
+  wire en_data_counter;
+  wire start;
+  wire tick;
+  assign _01_ = collect_data && tick;
+  assign _00_ = data_counter + 4'h1;
+  assign done_data = data_counter == 4'h8;
+  assign _02_ = reset || clear_data_counter;
+  assign _03_ = en_data_counter && tick;
+  always @(posedge clock)
+    data <= _05_;
+  always @(posedge clock)
+    data_counter <= _07_;
+  assign _08_ = _03_ ? _00_ : data_counter;
+  assign _06_ = _02_ ? 4'hx : _08_;
+  assign _07_ = _02_ ? 4'h0 : _06_;
+  assign _09_ = _01_ ? { rx, data[7:1] } : data;
+  assign _04_ = reset ? 8'hxx : _09_;
+  assign _05_ = reset ? 8'h00 : _04_;
+  \BaudRateGenerator$BobFPGA.bob.receiver.conductor  conductor (
+    .baud_sel(baud_sel),
+    .clock(clock),
+    .reset(reset),
+    .start_rx(start),
+    .start_tx(1'h0),
+    .tick(tick)
+  );
+  \UartRXFsm$BobFPGA.bob.receiver.fsm  fsm (
+    .clear_data_counter(clear_data_counter),
+    .clock(clock),
+    .collect_data(collect_data),
+    .done(done),
+    .done_data(done_data),
+    .en_data_counter(en_data_counter),
+    .framing_error(framing_error),
+    .receiving(receiving),
+    .reset(reset),
+    .rx(rx),
+    .start(start),
+    .tick(tick)
+  );
+endmodule
+
+module \UartRXFsm$BobFPGA.bob.receiver.fsm (reset, clock, rx, framing_error, receiving, done, start, tick, collect_data, en_data_counter, clear_data_counter, done_data);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  input rx;
+  wire rx;
+  output framing_error;
+  wire framing_error;
+  output receiving;
+  wire receiving;
+  output done;
+  wire done;
+  output start;
+  wire start;
+  input tick;
+  wire tick;
+  output collect_data;
+  wire collect_data;
+  output en_data_counter;
+  wire en_data_counter;
+  output clear_data_counter;
+  wire clear_data_counter;
+  input done_data;
+  wire done_data;
+  wire _000_;
+  wire _001_;
+  wire _002_;
+  wire _003_;
+  wire _004_;
+  wire _005_;
+  wire _006_;
+  wire _007_;
+  wire _008_;
+  wire _009_;
+  wire _010_;
+  wire _011_;
+  wire _012_;
+  wire _013_;
+  wire _014_;
+  wire _015_;
+  wire _016_;
+  wire _017_;
+  wire _018_;
+  wire _019_;
+  wire _020_;
+  wire [1:0] _021_;
+  wire [1:0] _022_;
+  wire [1:0] _023_;
+  wire [1:0] _024_;
+  wire [1:0] _025_;
+  wire [1:0] _026_;
+  wire [1:0] _027_;
+  wire [1:0] _028_;
+  wire [1:0] _029_;
+  wire [1:0] _030_;
+  wire [1:0] _031_;
+  wire _032_;
+  wire [1:0] _033_;
+  wire _034_;
+  wire _035_;
+  wire _036_;
+  wire [1:0] _037_;
+  wire [1:0] _038_;
+  wire _039_;
+  wire [1:0] _040_;
+  wire [1:0] _041_;
+  wire [1:0] _042_;
+  wire _043_;
+  wire _044_;
+  wire _045_;
+  wire _046_;
+  wire _047_;
+  wire _048_;
+  wire _049_;
+  wire _050_;
+  wire _051_;
+  wire _052_;
+  wire _053_;
+  wire _054_;
+  wire _055_;
+  wire _056_;
+  wire _057_;
+  wire _058_;
+  wire _059_;
+  wire _060_;
+  wire _061_;
+  wire _062_;
+  wire _063_;
+  wire _064_;
+  wire [1:0] _065_;
+  wire _066_;
+  wire _067_;
+  wire _068_;
+  wire _069_;
+  wire _070_;
+  wire _071_;
+  wire _072_;
+  wire _073_;
+  wire _074_;
+  wire _075_;
+  wire _076_;
+  wire [1:0] _077_;
+  wire [1:0] _078_;
+  wire _079_;
+  wire [1:0] _080_;
+  wire _081_;
+  wire _082_;
+  wire _083_;
+  wire _084_;
+  wire _085_;
+  wire [1:0] _086_;
+  wire _087_;
+  wire _088_;
+  wire _089_;
+  wire _090_;
+  wire _091_;
+  wire _092_;
+  wire _093_;
+  wire _094_;
+  wire _095_;
+  wire _096_;
+  wire _097_;
+  wire _098_;
+  wire _099_;
+  wire [1:0] next_state;
+  reg [1:0] state;
+  assign _000_ = tick && _008_;
+  assign _001_ = tick && done_data;
+  assign _002_ = tick && rx;
+  assign _003_ = ! rx;
+  assign _004_ = tick && _003_;
+  assign _005_ = tick && rx;
+  assign _006_ = ! rx;
+  assign _007_ = tick && _006_;
+  assign _008_ = ! done_data;
+  always @(posedge clock)
+    state <= _029_;
+  assign _029_ = reset ? 2'h0 : next_state;
+  assign _030_ = _004_ ? 2'h3 : 2'h0;
+  assign _031_ = _002_ ? 2'hx : _030_;
+  assign _025_ = _032_ ? _031_ : 2'hx;
+  assign _032_ = state == 2'h3;
+  assign _033_ = _002_ ? 2'h0 : _025_;
+  assign _026_ = _034_ ? _033_ : 2'hx;
+  assign _034_ = state == 2'h3;
+  assign _035_ = _002_ ? 1'h1 : 1'h0;
+  assign _012_ = _036_ ? _035_ : 1'hx;
+  assign _036_ = state == 2'h3;
+  assign _037_ = _001_ ? _021_ : 2'h2;
+  assign _038_ = _000_ ? 2'hx : _037_;
+  assign _022_ = _039_ ? _038_ : 2'hx;
+  assign _039_ = state == 2'h2;
+  assign _040_ = rx ? 2'h0 : 2'h3;
+  assign _041_ = _001_ ? _040_ : 2'hx;
+  assign _042_ = _000_ ? 2'hx : _041_;
+  assign _021_ = _043_ ? _042_ : 2'hx;
+  assign _043_ = state == 2'h2;
+  assign _044_ = rx ? 1'h1 : 1'h0;
+  assign _045_ = _001_ ? _044_ : 1'hx;
+  assign _046_ = _000_ ? 1'hx : _045_;
+  assign _014_ = _047_ ? _046_ : 1'hx;
+  assign _047_ = state == 2'h2;
+  assign _048_ = rx ? 1'h0 : 1'h1;
+  assign _049_ = _001_ ? _048_ : 1'hx;
+  assign _050_ = _000_ ? 1'hx : _049_;
+  assign _018_ = _051_ ? _050_ : 1'hx;
+  assign _051_ = state == 2'h2;
+  assign _052_ = rx ? 1'h1 : 1'h0;
+  assign _053_ = _001_ ? _052_ : 1'hx;
+  assign _054_ = _000_ ? 1'hx : _053_;
+  assign _009_ = _055_ ? _054_ : 1'hx;
+  assign _055_ = state == 2'h2;
+  assign _056_ = _001_ ? _014_ : 1'h0;
+  assign _057_ = _000_ ? 1'hx : _056_;
+  assign _015_ = _058_ ? _057_ : 1'hx;
+  assign _058_ = state == 2'h2;
+  assign _059_ = _001_ ? _018_ : 1'h0;
+  assign _060_ = _000_ ? 1'hx : _059_;
+  assign _019_ = _061_ ? _060_ : 1'hx;
+  assign _061_ = state == 2'h2;
+  assign _062_ = _001_ ? _009_ : 1'h0;
+  assign _063_ = _000_ ? 1'hx : _062_;
+  assign _010_ = _064_ ? _063_ : 1'hx;
+  assign _064_ = state == 2'h2;
+  assign _065_ = _000_ ? 2'h2 : _022_;
+  assign _023_ = _066_ ? _065_ : 2'hx;
+  assign _066_ = state == 2'h2;
+  assign _067_ = _000_ ? 1'h0 : _015_;
+  assign _016_ = _068_ ? _067_ : 1'hx;
+  assign _068_ = state == 2'h2;
+  assign _069_ = _000_ ? 1'h0 : _019_;
+  assign _020_ = _070_ ? _069_ : 1'hx;
+  assign _070_ = state == 2'h2;
+  assign _071_ = _000_ ? 1'h0 : _010_;
+  assign _011_ = _072_ ? _071_ : 1'hx;
+  assign _072_ = state == 2'h2;
+  assign _073_ = _000_ ? 1'h1 : 1'h0;
+  assign _017_ = _074_ ? _073_ : 1'hx;
+  assign _074_ = state == 2'h2;
+  assign _075_ = _000_ ? 1'h1 : 1'h0;
+  assign _013_ = _076_ ? _075_ : 1'hx;
+  assign _076_ = state == 2'h2;
+  assign _077_ = _007_ ? 2'h2 : 2'h1;
+  assign _078_ = _005_ ? 2'hx : _077_;
+  assign _027_ = _079_ ? _078_ : 2'hx;
+  assign _079_ = state == 2'h1;
+  assign _080_ = _005_ ? 2'h0 : _027_;
+  assign _028_ = _081_ ? _080_ : 2'hx;
+  assign _081_ = state == 2'h1;
+  function [1:0] _182_;
+    input [1:0] a;
+    input [7:0] b;
+    input [3:0] s;
+    casez (s) // synopsys parallel_case
+      4'b???1:
+        _182_ = b[1:0];
+      4'b??1?:
+        _182_ = b[3:2];
+      4'b?1??:
+        _182_ = b[5:4];
+      4'b1???:
+        _182_ = b[7:6];
+      default:
+        _182_ = a;
+    endcase
+  endfunction
+  assign next_state = _182_(2'hx, { _024_, _028_, _023_, _026_ }, { _085_, _084_, _083_, _082_ });
+  assign _082_ = state == 2'h3;
+  assign _083_ = state == 2'h2;
+  assign _084_ = state == 2'h1;
+  assign _085_ = ! state;
+  assign _086_ = rx ? 2'h0 : 2'h1;
+  assign _024_ = _087_ ? _086_ : 2'hx;
+  assign _087_ = ! state;
+  assign _088_ = rx ? 1'h0 : 1'h1;
+  assign _089_ = _090_ ? _088_ : 1'hx;
+  assign _090_ = ! state;
+  assign receiving = _091_ ? 1'h1 : 1'h0;
+  assign _091_ = state == 2'h2;
+  assign done = _092_ ? _016_ : 1'h0;
+  assign _092_ = state == 2'h2;
+  function [0:0] _197_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _197_ = b[0:0];
+      2'b1?:
+        _197_ = b[1:1];
+      default:
+        _197_ = a;
+    endcase
+  endfunction
+  assign framing_error = _197_(1'h0, { _020_, 1'h1 }, { _094_, _093_ });
+  assign _093_ = state == 2'h3;
+  assign _094_ = state == 2'h2;
+  function [0:0] _200_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _200_ = b[0:0];
+      2'b1?:
+        _200_ = b[1:1];
+      default:
+        _200_ = a;
+    endcase
+  endfunction
+  assign clear_data_counter = _200_(1'h0, { _011_, _012_ }, { _096_, _095_ });
+  assign _095_ = state == 2'h3;
+  assign _096_ = state == 2'h2;
+  assign en_data_counter = _097_ ? _017_ : 1'h0;
+  assign _097_ = state == 2'h2;
+  assign collect_data = _098_ ? _013_ : 1'h0;
+  assign _098_ = state == 2'h2;
+  assign start = _099_ ? _089_ : 1'h0;
+  assign _099_ = ! state;
+endmodule
+
+module \UartTX$BobFPGA.bob.transmitter (reset, clock, tx, sending, baud_sel, data, send, ready);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  output tx;
+  reg tx;
+  output sending;
+  wire sending;
+  input [1:0] baud_sel;
+  wire [1:0] baud_sel;
+  input [7:0] data;
+  wire [7:0] data;
+  input send;
+  wire send;
+  output ready;
+  wire ready;
+  wire _00_;
+  wire _01_;
+  wire _02_;
+  wire _03_;
+  wire [31:0] _04_;
+  wire _05_;
+  wire _06_;
+  wire _07_;
+  wire [3:0] _08_;
+  wire [3:0] _09_;
+  wire _10_;
+  wire _11_;
+  wire _12_;
+  wire _13_;
+  wire _14_;
+  wire _15_;
+  wire _16_;
+  wire _17_;
+  wire _18_;
+  wire _19_;
+  wire [7:0] _20_;
+  wire [7:0] _21_;
+  wire [7:0] _22_;
+  wire [7:0] _23_;
+  wire [7:0] _24_;
+  wire [7:0] _25_;
+  wire [3:0] _26_;
+  wire clear_data_counter;
+  reg data_bit;
+  reg [3:0] data_counter;
+  wire done_data;
+  wire en_data_counter;
+  reg [7:0] saved_data;
+  wire send_data;
+  wire send_start_bit;
+  wire send_stop_bit;
+  wire start;
+  wire tick;
+  assign done_data = data_counter == 4'h8;
+  assign _00_ = reset || start;
+  assign _01_ = send_data && tick;
+  assign _02_ = reset || clear_data_counter;
+  assign _03_ = en_data_counter && tick;
+  assign _04_ = { 28'h0000000, data_counter } + 32'd1;
+  assign _05_ = send_data && tick;
+  always @(posedge clock)
+    data_bit <= _07_;
+  always @(posedge clock)
+    data_counter <= _09_;
+  always @(posedge clock)
+    saved_data <= _25_;
+  always @(posedge clock)
+    tx <= _18_;
+  assign _10_ = send_data ? 1'hx : 1'h1;
+  assign _11_ = send_start_bit ? 1'hx : _10_;
+  assign _12_ = reset ? 1'hx : _11_;
+  assign _13_ = send_data ? data_bit : _12_;
+  assign _14_ = send_start_bit ? 1'hx : _13_;
+  assign _15_ = reset ? 1'hx : _14_;
+  assign _16_ = send_start_bit ? 1'h0 : _15_;
+  assign _17_ = reset ? 1'hx : _16_;
+  assign _18_ = reset ? 1'h1 : _17_;
+  assign _19_ = _01_ ? saved_data[0] : data_bit;
+  assign _06_ = _00_ ? 1'hx : _19_;
+  assign _07_ = _00_ ? 1'h0 : _06_;
+  assign _20_ = _05_ ? { 1'h0, saved_data[7:1] } : saved_data;
+  assign _21_ = start ? 8'hxx : _20_;
+  assign _22_ = reset ? 8'hxx : _21_;
+  assign _23_ = start ? data : _22_;
+  assign _24_ = reset ? 8'hxx : _23_;
+  assign _25_ = reset ? 8'h00 : _24_;
+  assign _26_ = _03_ ? _04_[3:0] : data_counter;
+  assign _08_ = _02_ ? 4'hx : _26_;
+  assign _09_ = _02_ ? 4'h0 : _08_;
+  \BaudRateGenerator$BobFPGA.bob.transmitter.conductor  conductor (
+    .baud_sel(baud_sel),
+    .clock(clock),
+    .reset(reset),
+    .start_rx(1'h0),
+    .start_tx(start),
+    .tick(tick)
+  );
+  \UartTXFsm$BobFPGA.bob.transmitter.fsm  fsm (
+    .clear_data_counter(clear_data_counter),
+    .clock(clock),
+    .done_data(done_data),
+    .en_data_counter(en_data_counter),
+    .ready(ready),
+    .reset(reset),
+    .send(send),
+    .send_data(send_data),
+    .send_start_bit(send_start_bit),
+    .send_stop_bit(send_stop_bit),
+    .sending(sending),
+    .start(start),
+    .tick(tick)
+  );
+endmodule
+
+module \UartTXFsm$BobFPGA.bob.transmitter.fsm (reset, clock, sending, send, ready, start, tick, en_data_counter, clear_data_counter, done_data, send_data, send_start_bit, send_stop_bit);
+  input reset;
+  wire reset;
+  input clock;
+  wire clock;
+  output sending;
+  wire sending;
+  input send;
+  wire send;
+  output ready;
+  wire ready;
+  output start;
+  wire start;
+  input tick;
+  wire tick;
+  output en_data_counter;
+  wire en_data_counter;
+  output clear_data_counter;
+  wire clear_data_counter;
+  input done_data;
+  wire done_data;
+  output send_data;
+  wire send_data;
+  output send_start_bit;
+  wire send_start_bit;
+  output send_stop_bit;
+  wire send_stop_bit;
+  wire _000_;
+  wire _001_;
+  wire _002_;
+  wire _003_;
+  wire [1:0] _004_;
+  wire [1:0] _005_;
+  wire [1:0] _006_;
+  wire [1:0] _007_;
+  wire [1:0] _008_;
+  wire [1:0] _009_;
+  wire _010_;
+  wire _011_;
+  wire _012_;
+  wire _013_;
+  wire _014_;
+  wire _015_;
+  wire _016_;
+  wire [1:0] _017_;
+  wire _018_;
+  wire _019_;
+  wire _020_;
+  wire _021_;
+  wire _022_;
+  wire _023_;
+  wire _024_;
+  wire _025_;
+  wire _026_;
+  wire _027_;
+  wire _028_;
+  wire [1:0] _029_;
+  wire _030_;
+  wire _031_;
+  wire _032_;
+  wire _033_;
+  wire _034_;
+  wire _035_;
+  wire _036_;
+  wire _037_;
+  wire _038_;
+  wire _039_;
+  wire _040_;
+  wire _041_;
+  wire _042_;
+  wire [1:0] _043_;
+  wire _044_;
+  wire _045_;
+  wire _046_;
+  wire _047_;
+  wire _048_;
+  wire _049_;
+  wire _050_;
+  wire _051_;
+  wire _052_;
+  wire _053_;
+  wire _054_;
+  wire _055_;
+  wire _056_;
+  wire _057_;
+  wire _058_;
+  wire _059_;
+  wire _060_;
+  wire _061_;
+  wire _062_;
+  wire _063_;
+  wire _064_;
+  wire _065_;
+  wire _066_;
+  wire _067_;
+  wire _068_;
+  wire [1:0] next_state;
+  reg [1:0] state;
+  assign _000_ = tick && done_data;
+  always @(posedge clock)
+    state <= _008_;
+  assign _008_ = reset ? 2'h0 : next_state;
+  assign _009_ = tick ? 2'h0 : 2'h3;
+  assign _005_ = _010_ ? _009_ : 2'hx;
+  assign _010_ = state == 2'h3;
+  assign _011_ = tick ? 1'h1 : 1'h0;
+  assign _012_ = _013_ ? _011_ : 1'hx;
+  assign _013_ = state == 2'h3;
+  assign _014_ = tick ? 1'h0 : 1'h1;
+  assign _015_ = _016_ ? _014_ : 1'hx;
+  assign _016_ = state == 2'h3;
+  assign _017_ = _000_ ? 2'h3 : 2'h2;
+  assign _004_ = _018_ ? _017_ : 2'hx;
+  assign _018_ = state == 2'h2;
+  assign _019_ = _000_ ? 1'h1 : 1'h0;
+  assign _001_ = _020_ ? _019_ : 1'hx;
+  assign _020_ = state == 2'h2;
+  assign _021_ = _000_ ? 1'h0 : 1'h1;
+  assign _002_ = _022_ ? _021_ : 1'hx;
+  assign _022_ = state == 2'h2;
+  assign _023_ = _000_ ? 1'h1 : 1'h0;
+  assign _024_ = _025_ ? _023_ : 1'hx;
+  assign _025_ = state == 2'h2;
+  assign _026_ = _000_ ? 1'h0 : 1'h1;
+  assign _027_ = _028_ ? _026_ : 1'hx;
+  assign _028_ = state == 2'h2;
+  assign _029_ = tick ? 2'h2 : 2'h1;
+  assign _007_ = _030_ ? _029_ : 2'hx;
+  assign _030_ = state == 2'h1;
+  assign _031_ = tick ? 1'h1 : 1'h0;
+  assign _003_ = _032_ ? _031_ : 1'hx;
+  assign _032_ = state == 2'h1;
+  assign _033_ = tick ? 1'h1 : 1'h0;
+  assign _034_ = _035_ ? _033_ : 1'hx;
+  assign _035_ = state == 2'h1;
+  assign _036_ = tick ? 1'h0 : 1'h1;
+  assign _037_ = _038_ ? _036_ : 1'hx;
+  assign _038_ = state == 2'h1;
+  function [1:0] _108_;
+    input [1:0] a;
+    input [7:0] b;
+    input [3:0] s;
+    casez (s) // synopsys parallel_case
+      4'b???1:
+        _108_ = b[1:0];
+      4'b??1?:
+        _108_ = b[3:2];
+      4'b?1??:
+        _108_ = b[5:4];
+      4'b1???:
+        _108_ = b[7:6];
+      default:
+        _108_ = a;
+    endcase
+  endfunction
+  assign next_state = _108_(2'hx, { _006_, _007_, _004_, _005_ }, { _042_, _041_, _040_, _039_ });
+  assign _039_ = state == 2'h3;
+  assign _040_ = state == 2'h2;
+  assign _041_ = state == 2'h1;
+  assign _042_ = ! state;
+  assign _043_ = send ? 2'h1 : 2'h0;
+  assign _006_ = _044_ ? _043_ : 2'hx;
+  assign _044_ = ! state;
+  assign _045_ = send ? 1'h0 : 1'h1;
+  assign _046_ = _047_ ? _045_ : 1'hx;
+  assign _047_ = ! state;
+  assign _048_ = send ? 1'h1 : 1'h0;
+  assign _049_ = _050_ ? _048_ : 1'hx;
+  assign _050_ = ! state;
+  assign _051_ = send ? 1'h1 : 1'h0;
+  assign _052_ = _053_ ? _051_ : 1'hx;
+  assign _053_ = ! state;
+  function [0:0] _125_;
+    input [0:0] a;
+    input [2:0] b;
+    input [2:0] s;
+    casez (s) // synopsys parallel_case
+      3'b??1:
+        _125_ = b[0:0];
+      3'b?1?:
+        _125_ = b[1:1];
+      3'b1??:
+        _125_ = b[2:2];
+      default:
+        _125_ = a;
+    endcase
+  endfunction
+  assign sending = _125_(1'h0, 3'h7, { _056_, _055_, _054_ });
+  assign _054_ = state == 2'h3;
+  assign _055_ = state == 2'h2;
+  assign _056_ = state == 2'h1;
+  function [0:0] _129_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _129_ = b[0:0];
+      2'b1?:
+        _129_ = b[1:1];
+      default:
+        _129_ = a;
+    endcase
+  endfunction
+  assign ready = _129_(1'h0, { _046_, _012_ }, { _058_, _057_ });
+  assign _057_ = state == 2'h3;
+  assign _058_ = ! state;
+  assign clear_data_counter = _059_ ? _001_ : 1'h0;
+  assign _059_ = state == 2'h2;
+  function [0:0] _134_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _134_ = b[0:0];
+      2'b1?:
+        _134_ = b[1:1];
+      default:
+        _134_ = a;
+    endcase
+  endfunction
+  assign en_data_counter = _134_(1'h0, { _003_, _002_ }, { _061_, _060_ });
+  assign _060_ = state == 2'h2;
+  assign _061_ = state == 2'h1;
+  function [0:0] _137_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _137_ = b[0:0];
+      2'b1?:
+        _137_ = b[1:1];
+      default:
+        _137_ = a;
+    endcase
+  endfunction
+  assign send_stop_bit = _137_(1'h0, { _024_, _015_ }, { _063_, _062_ });
+  assign _062_ = state == 2'h3;
+  assign _063_ = state == 2'h2;
+  function [0:0] _140_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _140_ = b[0:0];
+      2'b1?:
+        _140_ = b[1:1];
+      default:
+        _140_ = a;
+    endcase
+  endfunction
+  assign send_data = _140_(1'h0, { _034_, _027_ }, { _065_, _064_ });
+  assign _064_ = state == 2'h2;
+  assign _065_ = state == 2'h1;
+  function [0:0] _143_;
+    input [0:0] a;
+    input [1:0] b;
+    input [1:0] s;
+    casez (s) // synopsys parallel_case
+      2'b?1:
+        _143_ = b[0:0];
+      2'b1?:
+        _143_ = b[1:1];
+      default:
+        _143_ = a;
+    endcase
+  endfunction
+  assign send_start_bit = _143_(1'h0, { _049_, _037_ }, { _067_, _066_ });
+  assign _066_ = state == 2'h1;
+  assign _067_ = ! state;
+  assign start = _068_ ? _052_ : 1'h0;
+  assign _068_ = ! state;
 endmodule
-`default_nettype none
-module BaudRateGenerator (
-	clock,
-	reset,
-	start_rx,
-	start_tx,
-	tick
-);
-	parameter signed [31:0] CLK_HZ = 25000000;
-	parameter signed [31:0] BAUD_RATE = 115200;
-	input wire clock;
-	input wire reset;
-	input wire start_rx;
-	input wire start_tx;
-	output wire tick;
-	parameter signed [31:0] DIVISOR = CLK_HZ / BAUD_RATE;
-	reg [$clog2(DIVISOR) + 1:0] clockCount;
-	assign tick = clockCount == DIVISOR;
-	always @(posedge clock)
-		if (reset | tick)
-			clockCount <= 1'sb0;
-		else if (start_rx)
-			clockCount <= DIVISOR / 2;
-		else if (start_tx)
-			clockCount <= 1'sb0;
-		else
-			clockCount <= clockCount + 1'b1;
-endmodule
\ No newline at end of file
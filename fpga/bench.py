@@ -0,0 +1,218 @@
+import argparse
+import json
+import os
+import re
+import shlex
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Runs the fpga.sh flow (synth_ecp5, then nextpnr-ecp5 --12k) for each design
+# variant and compares resources and Fmax against bench_baselines.json.
+#
+#   python fpga/bench.py                     # every variant
+#   python fpga/bench.py Bob Bob_deep        # just these
+#   python fpga/bench.py --update            # record new baselines
+#
+# bench_baselines.json keeps the command and tool versions of the last
+# --update under "recorded_with". Place and route results move between
+# nextpnr versions, so compare with the same ones.
+#
+# Exits with 1 when a variant grows or slows down by more than --tolerance.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FPGA = os.path.join(ROOT, "fpga")
+BASELINES = os.path.join(FPGA, "bench_baselines.json")
+CONSTRAINTS = os.path.join(FPGA, "constraints.lpf")
+
+SV_SOURCES = ["BobATC.pkg", "Bob.sv", "UartRX.sv", "UartTX.sv", "BaudRateGenerator.sv"]
+
+# Parameter overrides are written into a copy of the module's header.
+# LUT counts come from ABC mapping the flattened design, which can land
+# somewhere else after a small change: Bob_no_burst has 4 fewer gates than
+# Bob going into LUT mapping and 9 fewer LUT4 with the hierarchy kept, but
+# maps to about 110 more LUT4 flattened. Compare a variant with its own
+# baseline rather than with the other variants.
+VARIANTS = {
+  "BobFPGA"      : {"sources": ["fpga/BobFPGA.v"]},
+  "Bob"          : {"sources": SV_SOURCES},
+  "Bob_deep"     : {"sources": SV_SOURCES, "params": {"Bob": {"REPLY_DEPTH": 8, "URGENT_DEPTH": 8}}},
+  "Bob_no_burst" : {"sources": SV_SOURCES, "params": {"Bob": {"QUEUE_BURST": 1}}},
+}
+
+# Netlist cell types counted after synthesis
+CELLS = {
+  "LUT4"            : "lut4",
+  "CCU2C"           : "ccu2c",
+  "TRELLIS_FF"      : "ff",
+  "DP16KD"          : "bram",
+  "TRELLIS_DPR16X4" : "lutram",
+}
+
+# Metrics where a bigger number is worse, everything else is Fmax
+RESOURCES = ["lut4", "ccu2c", "ff", "bram", "lutram", "comb", "slice_ff"]
+
+CELL_TYPE = re.compile(r'^\s*"type":\s*"([A-Za-z0-9_$]+)"')
+
+def copy_sources(variant, work):
+  names = []
+  for source in variant["sources"]:
+    name = os.path.basename(source)
+    with open(os.path.join(ROOT, source)) as f:
+      text = f.read()
+    for module, params in variant.get("params", {}).items():
+      text = override(text, module, params)
+    with open(os.path.join(work, name), "w") as f:
+      f.write(text)
+    names.append(name)
+  shutil.copy(CONSTRAINTS, work)
+  return names
+
+def override(text, module, params):
+  # Only touches the parameter list of the named module
+  header = re.search(r"module\s+%s\s*#\s*\((.*?)\)\s*\(" % module, text, re.S)
+  if header is None:
+    return text
+  ports = header.group(1)
+  for name, value in params.items():
+    ports, count = re.subn(r"(\b%s\s*=\s*)[^,\n/)]+" % name, r"\g<1>%s" % value, ports, count=1)
+    if count == 0:
+      raise ValueError(f"{module} has no parameter {name}")
+  return text[:header.start(1)] + ports + text[header.end(1):]
+
+def run(command, work, log):
+  with open(os.path.join(work, log), "w") as f:
+    result = subprocess.run(command, cwd=work, stdout=f, stderr=subprocess.STDOUT)
+  if result.returncode != 0:
+    raise RuntimeError(f"{shlex.join(command)} failed, see {os.path.join(work, log)}")
+
+def slang(args):
+  # read_slang is built into some yosys builds, like YoWASP's, and a plugin
+  # in others, so only load the plugin when the command isn't there already
+  result = subprocess.run(shlex.split(args.yosys) + ["-p", "help read_slang"], capture_output=True, text=True)
+  if "No such command" in result.stdout + result.stderr:
+    return "plugin -i slang; read_slang"
+  return "read_slang"
+
+def synthesize(args, sources, work):
+  if all(source.endswith(".v") for source in sources):
+    read = "read_verilog " + " ".join(sources)
+  else:
+    read = f"{slang(args)} -j 1 --top BobTop " + " ".join(sources)
+  script = f"{read}; synth_ecp5 -top BobTop -json synth_out.json"
+  run(shlex.split(args.yosys) + ["-q", "-p", script], work, "yosys.log")
+
+def count_cells(work):
+  # The netlist runs to tens of thousands of lines, so only look at one at a time
+  counts = {metric: 0 for metric in CELLS.values()}
+  with open(os.path.join(work, "synth_out.json")) as f:
+    for line in f:
+      match = CELL_TYPE.match(line)
+      if match and match.group(1) in CELLS:
+        counts[CELLS[match.group(1)]] += 1
+  return counts
+
+def place_and_route(args, work, seed):
+  # The SV sources have ports the board's .lpf doesn't pin out, like reset
+  # instead of reset_n, so let nextpnr place those anywhere
+  command = shlex.split(args.nextpnr) + ["--12k", "--json", "synth_out.json", "--lpf", "constraints.lpf",
+                                         "--textcfg", "pnr_out.config", "--report", "report.json",
+                                         "--seed", str(seed), "--lpf-allow-unconstrained"]
+  if args.freq:
+    command += ["--freq", str(args.freq)]
+  run(command, work, f"nextpnr_{seed}.log")
+  with open(os.path.join(work, "report.json")) as f:
+    report = json.load(f)
+  # The slowest clock sets how fast the controller can run
+  fmax = min(clock["achieved"] for clock in report["fmax"].values())
+  used = {cell: value["used"] for cell, value in report["utilization"].items()}
+  return fmax, used
+
+def benchmark(args, name, variant):
+  work = tempfile.mkdtemp(prefix=f"bench_{name}_")
+  try:
+    sources = copy_sources(variant, work)
+    synthesize(args, sources, work)
+    result = count_cells(work)
+    if not args.synth_only:
+      runs = [place_and_route(args, work, seed) for seed in range(1, args.seeds + 1)]
+      result["fmax_mhz"] = round(statistics.median(fmax for fmax, _ in runs), 2)
+      result["comb"] = runs[0][1].get("TRELLIS_COMB", 0)
+      result["slice_ff"] = runs[0][1].get("TRELLIS_FF", 0)
+  finally:
+    if args.keep:
+      print(f"Kept {name} run in {work}")
+    else:
+      shutil.rmtree(work)
+  return result
+
+def versions(args):
+  # First line of each tool's version, kept with the baselines
+  tools = {"yosys": shlex.split(args.yosys) + ["-V"], "nextpnr": shlex.split(args.nextpnr) + ["--version"]}
+  found = {}
+  for tool, command in tools.items():
+    result = subprocess.run(command, capture_output=True, text=True)
+    found[tool] = (result.stdout + result.stderr).strip().splitlines()[0]
+  return found
+
+def compare(name, result, baseline, tolerance):
+  # Returns the metrics that got worse than the tolerance allows
+  worse = []
+  print("***************************************************")
+  print(f"{name}")
+  for metric, value in result.items():
+    old = baseline.get(metric)
+    if old is None:
+      print(f"  {metric:<10} {value:>10}")
+      continue
+    change = 100.0 * (value - old) / old if old else (0.0 if value == old else float("inf"))
+    flag = ""
+    if (metric in RESOURCES and change > tolerance) or (metric not in RESOURCES and change < -tolerance):
+      flag = "  <-- regression"
+      worse.append(metric)
+    print(f"  {metric:<10} {value:>10} (baseline {old}, {change:+.1f}%){flag}")
+  return worse
+
+# Main routine
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument("variants", nargs="*", default=list(VARIANTS),
+                      help=f"variants to run, all of them by default: {', '.join(VARIANTS)}")
+  parser.add_argument("--yosys", default="yosys", help="yosys command, the slang plugin is loaded if needed")
+  parser.add_argument("--nextpnr", default="nextpnr-ecp5", help="nextpnr-ecp5 command")
+  parser.add_argument("--freq", type=float, help="target MHz for clocks the .lpf doesn't constrain")
+  parser.add_argument("--seeds", type=int, default=1, help="placement seeds, the median Fmax is kept")
+  parser.add_argument("--synth-only", action="store_true", help="skip place and route")
+  parser.add_argument("--tolerance", type=float, default=5.0, help="allowed change in percent")
+  parser.add_argument("--update", action="store_true", help="store the results as the new baselines")
+  parser.add_argument("--keep", action="store_true", help="keep each run's working directory")
+  args = parser.parse_args()
+  for name in args.variants:
+    if name not in VARIANTS:
+      parser.error(f"unknown variant {name}")
+
+  baselines = {}
+  if os.path.exists(BASELINES):
+    with open(BASELINES) as f:
+      baselines = json.load(f)
+
+  regressions = []
+  for name in args.variants:
+    result = benchmark(args, name, VARIANTS[name])
+    regressions += [f"{name} {metric}" for metric in compare(name, result, baselines.get(name, {}), args.tolerance)]
+    if args.update:
+      baselines[name] = result
+  print("***************************************************")
+
+  if args.update:
+    # Baselines only mean something next to the tools and options that made them
+    baselines["recorded_with"] = {"command": shlex.join(["python"] + sys.argv), **versions(args)}
+    with open(BASELINES, "w") as f:
+      json.dump(baselines, f, indent=2, sort_keys=True)
+      f.write("\n")
+    print(f"Updated {BASELINES}")
+  elif regressions:
+    print("Regressions: " + ", ".join(regressions))
+    sys.exit(1)
@@ -0,0 +1,41 @@
+#!/bin/bash
+# Rebuilds the Verilog copies of the SystemVerilog sources: test/Bob.v for the
+# cocotb tests, fpga/BobFPGA.v for fpga/fpga.sh, and test/BobATC.pkg. Run it
+# after changing any of the .sv files and commit the results with the change.
+# Needs yosys with the slang frontend, set YOSYS to e.g. "yowasp-yosys" when
+# it is built in rather than a plugin.
+#
+#   ./netlists.sh           # rewrite the copies
+#   ./netlists.sh --check   # exit with 1 if any copy is out of date
+
+set -e
+cd "$(dirname "$0")"
+
+YOSYS=${YOSYS:-"yosys -m slang"}
+SOURCES="BobATC.pkg Bob.sv UartRX.sv UartTX.sv BaudRateGenerator.sv"
+READ="read_slang -j 1 --keep-hierarchy"
+WRITE="hierarchy -check; proc; bwmuxmap; bmuxmap; demuxmap; opt_clean; write_verilog -noattr"
+COPIES="test/Bob.v fpga/BobFPGA.v test/BobATC.pkg"
+
+OUT=.
+if [ "$1" = "--check" ]; then
+  # Inside the tree, YoWASP's yosys can only write below the working directory
+  OUT=$(mktemp -d .netlists.XXXXXX)
+  trap 'rm -rf "$OUT"' EXIT
+  mkdir -p "$OUT/test" "$OUT/fpga"
+fi
+
+$YOSYS -q -p "$READ --top BobTop $SOURCES; $WRITE $OUT/test/Bob.v"
+$YOSYS -q -p "$READ --top BobFPGA $SOURCES fpga/BobFPGA.sv; rename BobFPGA BobTop; $WRITE $OUT/fpga/BobFPGA.v"
+cp BobATC.pkg "$OUT/test/BobATC.pkg"
+
+if [ "$OUT" != . ]; then
+  stale=0
+  for copy in $COPIES; do
+    if ! cmp -s "$copy" "$OUT/$copy"; then
+      echo "$copy is out of date, run ./netlists.sh"
+      stale=1
+    fi
+  done
+  exit $stale
+fi
@@ -1,4 +1,8 @@
 import cocotb 
+import heapq
+import os
+import random
+from collections import deque
 from cocotb.triggers import *
 from cocotb.clock import Clock
 from cocotb.utils import get_sim_time
@@ -24,59 +28,70 @@ D_RUNWAY_1  = 0b1
 E_DECLARE    = 0b1
 E_RESOLVE    = 0b0
 
+I_NEW_ID     = 0b0 # ID please
+I_COMMAND    = 0b1
+
+H_STATUS     = 0b0000 # Host command, sent in the plane ID field
+H_BAUD       = 0b1000 # Low two bits pick the rate from BAUD_RATES
+H_SCHEDULE   = 0b0100 # Low two bits pick the policy from SCHEDULES
+
+BAUD_RATES   = [115200, 460800, 921600, 1000000]
+SCHEDULES    = ["alternate", "takeoff first", "landing first", "longest queue"]
+
+STATUS_HEADER = 0xFF
+
+REQUEST_SLACK = 2 # Bytes Bob has room for after it deasserts CTS
+
 BAUD_RATE = 115200
 PERIOD = (1 / BAUD_RATE) * 10**9
 CLOCK_PERIOD = 40
 
-async def read(dut):
+async def wait_until(dut, time):
+  while get_sim_time(units="ns") < time:
+    await FallingEdge(dut.clock)
+
+async def start_bit(dut):
+  await FallingEdge(dut.tx)
+  return get_sim_time(units="ns")
+
+async def read(dut, bit_start=None):
+  # bit_start is when the start bit fell, for a reply that began before the
+  # read did. Every bit is sampled at a fixed offset from it, so rounding each
+  # wait up to a clock edge doesn't build up across the byte.
   data = 0b00000000
   fail = 0
   while True:
     if fail == 3:
       TimeoutError("UART read spurious start too many times")
 
-    start = get_sim_time(units="ns")
-    while dut.tx.value == 0b1:
-      await FallingEdge(dut.clock)
-      if get_sim_time(units="ns") - start > 10000:
-        raise TimeoutError("UART read timed out")
-      
+    if bit_start is None:
+      start = get_sim_time(units="ns")
+      while dut.tx.value == 0b1:
+        await FallingEdge(dut.clock)
+        if get_sim_time(units="ns") - start > 10000:
+          raise TimeoutError("UART read timed out")
+      bit_start = get_sim_time(units="ns")
+
     # Detect start bit
-    bit_start = get_sim_time(units="ns")
-    while get_sim_time(units="ns") - bit_start < PERIOD / 2:
-      await FallingEdge(dut.clock)
+    await wait_until(dut, bit_start + PERIOD / 2)
     if dut.tx.value == 0b1:
       # Spurious start
       fail += 1
+      bit_start = None
       continue
-    
-    # Finish start bit
-    while get_sim_time(units="ns") - bit_start < PERIOD:
-      await FallingEdge(dut.clock)
-    
+
     # Collect data
-    num_bits = 0
-    while num_bits < 8:
-      bit_start = get_sim_time(units="ns")
-      while get_sim_time(units="ns") - bit_start < PERIOD / 2:
-        await FallingEdge(dut.clock)
+    for num_bits in range(8):
+      await wait_until(dut, bit_start + PERIOD * (num_bits + 1.5))
       data >>= 1
       data |= (dut.tx.value << 7)
-      num_bits += 1
-      while get_sim_time(units="ns") - bit_start < PERIOD:
-        await FallingEdge(dut.clock)
-    
-    # STOP bit
-    bit_start = get_sim_time(units="ns")
-    while get_sim_time(units="ns") - bit_start < PERIOD / 2:
-      await FallingEdge(dut.clock)
+
+    # STOP bit, return in the middle of it so a reply sent straight after
+    # this one is still caught on its falling edge
+    await wait_until(dut, bit_start + PERIOD * 9.5)
 
     assert dut.tx.value
 
-    bit_start = get_sim_time(units="ns")
-    while get_sim_time(units="ns") - bit_start < PERIOD / 2:
-      await FallingEdge(dut.clock)
-    
     return data
   
 async def write(dut, data):
@@ -103,11 +118,96 @@ async def write(dut, data):
     await FallingEdge(dut.clock)
     dut.rx.value = 1
 
+async def write_with_flow_control(dut, data):
+  # Hold off while Bob deasserts CTS, like a host UART with RTS/CTS enabled
+  while dut.cts_n.value == 0b1:
+    await FallingEdge(dut.clock)
+  await write(dut, data)
+
+async def write_with_late_flow_control(dut, requests, in_flight):
+  # A host that only sees CTS once a byte is queued for its transmitter, so
+  # after CTS deasserts it still sends the in_flight bytes already queued
+  late = 0
+  for data in requests:
+    while dut.cts_n.value == 0b1 and late == in_flight:
+      await FallingEdge(dut.clock)
+    late = late + 1 if dut.cts_n.value == 0b1 else 0
+    await write(dut, data)
+
+async def collect_replies(dut, replies, reply_times=None):
+  # Runs alongside the request driver and keeps every byte Bob sends
+  while True:
+    bit_start = await start_bit(dut)
+    replies.append(await read(dut, bit_start))
+    if reply_times is not None:
+      reply_times.append(bit_start + PERIOD * 10)
+
+def queued_ids(fifo):
+  # Reads the IDs waiting in a plane FIFO straight out of its storage. Slots
+  # past the count may never have been written, so only those are decoded.
+  bits = str(fifo.queue.value)
+  width = len(fifo.data_in)
+  depth = len(bits) // width
+  get_ptr = int(fifo.get_ptr.value)
+  ids = []
+  for i in range(int(fifo.count.value)):
+    slot = (get_ptr + i) % depth
+    ids.append(int(bits[len(bits) - width * (slot + 1):len(bits) - width * slot], 2))
+  return ids
+
+async def check_invariants(dut):
+  # Runs alongside a test and fails it on the cycle a safety invariant first
+  # breaks. An invariant can only start failing when a signal it reads
+  # changes, so instead of waking every clock this sleeps until one does.
+  bob = dut.bobby
+  reply_fifos = {"reply": bob.uart_replies, "urgent reply": bob.urgent_replies}
+  signals = [bob.runway, bob.all_id, bob.runway_override, bob.takeoff_fifo.put_ptr, bob.landing_fifo.put_ptr]
+  for fifo in reply_fifos.values():
+    signals += [fifo.we, fifo.re, fifo.full]
+  edges = [Edge(signal) for signal in signals]
+
+  # Values from the last wake up, which is before any change in this one
+  override = int(bob.runway_override.value)
+  locked = 0
+  while True:
+    await First(*edges)
+    await ReadOnly()
+    if dut.reset.value:
+      continue
+    cycle = int(get_sim_time(units="ns") // CLOCK_PERIOD)
+    runway = int(bob.runway.value)
+    all_id = int(bob.all_id.value)
+    planes = [(runway >> 1) & 0xF, (runway >> 6) & 0xF]
+    active = (runway & 0b1) | ((runway >> 4) & 0b10)
+
+    assert not (active == 0b11 and planes[0] == planes[1]), \
+      f"Cycle {cycle}: plane {planes[0]} holds both runways"
+    for i in range(2):
+      if (active >> i) & 0b1:
+        assert (all_id >> planes[i]) & 0b1, f"Cycle {cycle}: plane {planes[i]} is on runway {i} without an ID"
+    new_locks = active & ~locked
+    assert not (new_locks & override), f"Cycle {cycle}: runway locked while runway_override is {override:02b}"
+
+    queued = queued_ids(bob.takeoff_fifo) + queued_ids(bob.landing_fifo)
+    assert len(set(queued)) == len(queued), f"Cycle {cycle}: plane queued twice in {queued}"
+
+    # A write to a full FIFO that isn't being read drops the reply
+    for name, fifo in reply_fifos.items():
+      assert not (fifo.we.value and fifo.full.value and not fifo.re.value), \
+        f"Cycle {cycle}: {name} lost to a full FIFO"
+
+    override = int(bob.runway_override.value)
+    locked = active
+
+async def flood(dut, requests):
+  for data in requests:
+    await write_with_flow_control(dut, data)
+
 async def send_uart_request(dut, data):
   await write(dut, data)
 
-async def detect_uart_reply(dut, expected):
-  reply = await read(dut)
+async def detect_uart_reply(dut, expected, bit_start=None):
+  reply = await read(dut, bit_start)
   if (reply & 0b00001110) == T_CLEAR << 1:
     if (reply & 0b00000001) == 0b0:
       print(f"Bob      : Plane {"{:02d}".format(reply >> 4)} cleared runway {reply & 0b1}")
@@ -128,7 +228,12 @@ async def detect_uart_reply(dut, expected):
   return (reply == expected, reply >> 4)
 
 async def request(dut, id, type, action, expected_reply, ignore_reply):
+  # Bob can answer before the stop bit of the request is over, so start
+  # watching for the reply while the request is still going out
+  reply_start = cocotb.start_soon(start_bit(dut))
   await send_uart_request(dut, (id << 4) + (type << 1) + action)
+  bit_start = reply_start.result() if reply_start.done() else None
+  reply_start.kill()
   start = get_sim_time(units="ns")
   if type == T_ID_PLEASE:
     print(f"New Plane: Requesting ID for entry at time {start}")
@@ -151,7 +256,7 @@ async def request(dut, id, type, action, expected_reply, ignore_reply):
     print(f"Plane {"{:02d}".format(id)} : Making invalid request at time {start}")
 
   if not ignore_reply:
-    detect = await detect_uart_reply(dut, expected_reply)
+    detect = await detect_uart_reply(dut, expected_reply, bit_start)
     while not detect[0]:
       detect = await detect_uart_reply(dut, expected_reply)
     assert detect[0]
@@ -172,6 +277,7 @@ async def basic_test(dut):
 
   dut.runway_override.value = 0b00
   dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
   
   dut.reset.value = True
   await FallingEdge(dut.clock)
@@ -217,6 +323,7 @@ async def stress_test_takeoff(dut):
 
   dut.runway_override.value = 0b00
   dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
 
   dut.reset.value = True
   await FallingEdge(dut.clock)
@@ -305,6 +412,7 @@ async def stress_test_landing(dut):
 
   dut.runway_override.value = 0b00
   dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
 
   dut.reset.value = True
   await FallingEdge(dut.clock)
@@ -393,6 +501,7 @@ async def stress_test_id(dut):
 
   dut.runway_override.value = 0b00
   dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
 
   dut.reset.value = True
   await FallingEdge(dut.clock)
@@ -431,11 +540,13 @@ async def stress_test_alternate(dut):
 
   dut.runway_override.value = 0b01
   dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
 
   dut.reset.value = True
   await FallingEdge(dut.clock)
   dut.reset.value = False
   await FallingEdge(dut.clock)
+  cocotb.start_soon(check_invariants(dut))
 
   id = []
   for i in range(16):
@@ -513,6 +624,7 @@ async def emergency_test(dut):
 
   dut.runway_override.value = 0b00
   dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
 
   dut.reset.value = True
   await FallingEdge(dut.clock)
@@ -536,8 +648,10 @@ async def emergency_test(dut):
     # 4 planes get queued for landing
     await request(dut, id[i], T_REQUEST, R_LANDING, (id[i] << 4) + (T_HOLD << 1), False)
 
+  # The first divert goes out while the declaration is still being sent
+  divert_start = cocotb.start_soon(start_bit(dut))
   await request(dut, id[0], T_EMERGENCY, E_DECLARE, 0, True)
-  detect = await detect_uart_reply(dut, (1 << 4) + (T_DIVERT << 1))
+  detect = await detect_uart_reply(dut, (1 << 4) + (T_DIVERT << 1), await divert_start)
   assert detect[0]
   detect = await detect_uart_reply(dut, (2 << 4) + (T_DIVERT << 1))
   assert detect[0]
@@ -593,6 +707,7 @@ async def say_again_test(dut):
 
   dut.runway_override.value = 0b00
   dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
   
   dut.reset.value = True
   await FallingEdge(dut.clock)
@@ -616,3 +731,816 @@ async def say_again_test(dut):
   print("////////////////////////////////////////")
   print("//       Finish say again tests       //")
   print("////////////////////////////////////////\n")
+
+@cocotb.test(skip=True)
+async def flow_control_test(dut):
+  print("////////////////////////////////////////")
+  print("//      Begin flow control tests      //")
+  print("////////////////////////////////////////\n")
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  dut.runway_override.value = 0b00
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
+
+  replies = []
+  cocotb.start_soon(collect_replies(dut, replies))
+
+  # Watches the request FIFO for CTS deasserting, how full it gets, and
+  # bytes that arrive while it is full and are lost
+  fifo = dut.bobby.uart_requests
+  depth = len(fifo.queue) // len(fifo.data_in)
+  seen = {"cts_high": 0, "deepest": 0, "dropped": 0}
+  async def watch_requests():
+    while True:
+      await FallingEdge(dut.clock)
+      count = int(fifo.count.value)
+      seen["cts_high"] += int(dut.cts_n.value)
+      seen["deepest"] = max(seen["deepest"], count)
+      if fifo.we.value and count == depth and not fifo.re.value:
+        seen["dropped"] += 1
+  cocotb.start_soon(watch_requests())
+
+  # Every status command costs Bob 8 frames to answer but the host only one
+  # to send, so the request FIFO backs up and CTS has to hold the host off.
+  # The say-again after each one shows the requests stay in order.
+  num_pairs = 32
+  requests = []
+  expected = []
+  for i in range(num_pairs):
+    requests += [(H_STATUS << 4) + (T_ID_PLEASE << 1) + I_COMMAND, ((i % 16) << 4) + (T_SAY_AGAIN << 1)]
+    expected.append(((i % 16) << 4) + (T_SAY_AGAIN << 1))
+
+  # First a host that stops as soon as CTS deasserts, then one that still
+  # sends the REQUEST_SLACK bytes it had queued, which Bob leaves room for,
+  # then one with a byte more than that, which has to overflow the FIFO
+  for in_flight in [0, REQUEST_SLACK, REQUEST_SLACK + 1]:
+    dut.reset.value = True
+    await FallingEdge(dut.clock)
+    dut.reset.value = False
+    await FallingEdge(dut.clock)
+    for key in seen:
+      seen[key] = 0
+    num_replies = len(replies)
+
+    await write_with_late_flow_control(dut, requests, in_flight)
+
+    # Let the reply FIFO drain
+    start = get_sim_time(units="ns")
+    while len(replies) < num_replies + 9 * num_pairs:
+      await FallingEdge(dut.clock)
+      if get_sim_time(units="ns") - start > PERIOD * 10 * 9 * 4:
+        break
+    await Timer(round(PERIOD * 10 * 2), units="ns")
+
+    got = replies[num_replies:]
+    print(f"TB       : {in_flight} bytes in flight, CTS high for {seen['cts_high']} clocks, "
+          f"request FIFO held up to {seen['deepest']} of {depth}, {seen['dropped']} requests lost, "
+          f"got {len(got)} replies")
+    assert seen["cts_high"] > 0
+    if in_flight > REQUEST_SLACK:
+      assert seen["dropped"] > 0
+      continue
+    assert seen["deepest"] <= depth - REQUEST_SLACK + in_flight
+    assert seen["dropped"] == 0
+    assert len(got) == 9 * num_pairs
+    assert got[0::9] == [STATUS_HEADER] * num_pairs
+    assert got[8::9] == expected
+
+  print("////////////////////////////////////////")
+  print("//      Finish flow control tests     //")
+  print("////////////////////////////////////////\n")
+
+@cocotb.test(skip=True)
+async def reply_flood_test(dut):
+  print("////////////////////////////////////////")
+  print("//       Begin reply flood tests      //")
+  print("////////////////////////////////////////\n")
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  # Keep both runways closed while the queues fill up
+  dut.runway_override.value = 0b11
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
+
+  dut.reset.value = True
+  await FallingEdge(dut.clock)
+  dut.reset.value = False
+  await FallingEdge(dut.clock)
+
+  cocotb.start_soon(check_invariants(dut))
+  replies = []
+  reply_times = []
+  cocotb.start_soon(collect_replies(dut, replies, reply_times))
+
+  # 16 planes enter, 0 to 7 want to land and 8 to 11 want to take off
+  await flood(dut, [T_ID_PLEASE << 1] * 16)
+  await flood(dut, [(i << 4) + (T_REQUEST << 1) + R_LANDING for i in range(8)])
+  await flood(dut, [(i << 4) + (T_REQUEST << 1) + R_TAKEOFF for i in range(8, 12)])
+
+  # Keep the regular reply FIFO full with say-agains, then open the runways.
+  # The two clearances should skip ahead of the say-agains.
+  num_say_again = 64
+  say_again = cocotb.start_soon(flood(dut, [((13 + i % 3) << 4) + (T_SAY_AGAIN << 1) for i in range(num_say_again)]))
+  await Timer(round(PERIOD * 10 * 8), units="ns")
+  runways_open = get_sim_time(units="ns")
+  dut.runway_override.value = 0b00
+  await say_again
+
+  # Plane 12 declares an emergency and every plane still waiting to land is
+  # diverted at once, which used to overflow the reply FIFO.
+  await flood(dut, [(12 << 4) + (T_EMERGENCY << 1) + E_DECLARE])
+
+  start = get_sim_time(units="ns")
+  while get_sim_time(units="ns") - start < PERIOD * 10 * 16:
+    await FallingEdge(dut.clock)
+
+  types = [(reply >> 1) & 0b111 for reply in replies]
+  clears = [i for i in range(len(replies)) if types[i] == T_CLEAR]
+  landings_cleared = len([i for i in clears if (replies[i] >> 4) < 8])
+
+  assert types.count(T_ID_PLEASE) == 16
+  assert types.count(T_HOLD) == 12
+  assert types.count(T_SAY_AGAIN) == num_say_again
+  assert len(clears) == 2
+  assert types.count(T_DIVERT) == 8 - landings_cleared
+
+  # Worst case time from a runway opening up to its clearance going out
+  latency = max(reply_times[i] for i in clears) - runways_open
+  print(f"TB       : Worst case clearance latency {latency} ns ({latency / (PERIOD * 10):.1f} frames)")
+  assert latency < PERIOD * 10 * 4
+
+  print("////////////////////////////////////////")
+  print("//      Finish reply flood tests      //")
+  print("////////////////////////////////////////\n")
+
+@cocotb.test(skip=True)
+async def status_test(dut):
+  print("////////////////////////////////////////")
+  print("//         Begin status tests         //")
+  print("////////////////////////////////////////\n")
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  dut.runway_override.value = 0b00
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
+
+  dut.reset.value = True
+  await FallingEdge(dut.clock)
+  dut.reset.value = False
+  await FallingEdge(dut.clock)
+
+  replies = []
+  cocotb.start_soon(collect_replies(dut, replies))
+
+  # Planes 0 to 4 enter, 0 and 1 get both runways, 2 waits to take off and
+  # 3 declares an emergency
+  await flood(dut, [(T_ID_PLEASE << 1) + I_NEW_ID] * 5)
+  await flood(dut, [(0 << 4) + (T_REQUEST << 1) + R_TAKEOFF,
+                    (1 << 4) + (T_REQUEST << 1) + R_LANDING,
+                    (2 << 4) + (T_REQUEST << 1) + R_TAKEOFF,
+                    (3 << 4) + (T_EMERGENCY << 1) + E_DECLARE])
+
+  # Wait for every reply so the FIFOs are empty in the snapshot
+  start = get_sim_time(units="ns")
+  while get_sim_time(units="ns") - start < PERIOD * 10 * 4:
+    await FallingEdge(dut.clock)
+  num_replies = len(replies)
+
+  await flood(dut, [(H_STATUS << 4) + (T_ID_PLEASE << 1) + I_COMMAND])
+  start = get_sim_time(units="ns")
+  while len(replies) < num_replies + 8:
+    await FallingEdge(dut.clock)
+    if get_sim_time(units="ns") - start > PERIOD * 10 * 12:
+      break
+
+  snapshot = replies[num_replies:]
+  print(f"TB       : Status snapshot {' '.join(f'{byte:02x}' for byte in snapshot)}")
+  assert len(snapshot) == 8
+  assert snapshot[0] == STATUS_HEADER
+  assert (snapshot[1] << 8) + snapshot[2] == 0x001F  # IDs 0 to 4 taken
+  assert snapshot[3] == (1 << 4) + 0                 # Runway 1 plane 1, runway 0 plane 0
+  assert snapshot[4] == (3 << 4) + 0b1011            # Emergency by 3, both runways locked
+  assert snapshot[5] == (1 << 4) + 0                 # Plane 2 waiting to take off
+  assert snapshot[6] == 0
+  assert snapshot[7] == 0
+
+  # Plane 0 leaves runway 0 while the next snapshot goes out, so plane 2 is
+  # cleared in the middle of it. Clearances skip ahead of other replies, but
+  # must wait for the snapshot to finish or the host loses track of it.
+  await flood(dut, [(3 << 4) + (T_EMERGENCY << 1) + E_RESOLVE])
+  num_replies = len(replies)
+  await flood(dut, [(H_STATUS << 4) + (T_ID_PLEASE << 1) + I_COMMAND,
+                    (0 << 4) + (T_DECLARE << 1) + D_RUNWAY_0])
+  start = get_sim_time(units="ns")
+  while len(replies) < num_replies + 9:
+    await FallingEdge(dut.clock)
+    if get_sim_time(units="ns") - start > PERIOD * 10 * 12:
+      break
+
+  print(f"TB       : Replies around the clearance {' '.join(f'{byte:02x}' for byte in replies[num_replies:])}")
+  assert len(replies) == num_replies + 9
+  assert replies[num_replies] == STATUS_HEADER
+  assert replies[-1] == (2 << 4) + (T_CLEAR << 1) + C_RUNWAY_0
+
+  print("////////////////////////////////////////")
+  print("//         Finish status tests        //")
+  print("////////////////////////////////////////\n")
+
+@cocotb.test(skip=True)
+async def baud_rate_test(dut):
+  global PERIOD
+  print("////////////////////////////////////////")
+  print("//       Begin baud rate tests        //")
+  print("////////////////////////////////////////\n")
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  dut.runway_override.value = 0b00
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
+
+  dut.reset.value = True
+  await FallingEdge(dut.clock)
+  dut.reset.value = False
+  await FallingEdge(dut.clock)
+
+  replies = []
+  cocotb.start_soon(collect_replies(dut, replies))
+
+  try:
+    for sel in range(1, len(BAUD_RATES)):
+      # Ask for the new rate, the echo comes back at the old one
+      command = ((H_BAUD + sel) << 4) + (T_ID_PLEASE << 1) + I_COMMAND
+      num_replies = len(replies)
+      await flood(dut, [command])
+      while len(replies) == num_replies:
+        await FallingEdge(dut.clock)
+      assert replies[-1] == command
+
+      PERIOD = (1 / BAUD_RATES[sel]) * 10**9
+      print(f"TB       : Switched to {BAUD_RATES[sel]} baud")
+
+      # Stream at the new rate and make sure nothing is lost
+      num_replies = len(replies)
+      num_requests = 256
+      await flood(dut, [((i % 16) << 4) + (T_SAY_AGAIN << 1) for i in range(num_requests)])
+      start = get_sim_time(units="ns")
+      while len(replies) < num_replies + num_requests:
+        await FallingEdge(dut.clock)
+        if get_sim_time(units="ns") - start > PERIOD * 10 * 16:
+          break
+      assert replies[num_replies:] == [((i % 16) << 4) + (T_SAY_AGAIN << 1) for i in range(num_requests)]
+  finally:
+    PERIOD = (1 / BAUD_RATE) * 10**9
+
+  print("////////////////////////////////////////")
+  print("//       Finish baud rate tests       //")
+  print("////////////////////////////////////////\n")
+
+@cocotb.test(skip=True)
+async def schedule_test(dut):
+  print("////////////////////////////////////////")
+  print("//       Begin scheduling tests       //")
+  print("////////////////////////////////////////\n")
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  # Keep both runways closed while the queues fill up
+  dut.runway_override.value = 0b11
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
+
+  dut.reset.value = True
+  await FallingEdge(dut.clock)
+  dut.reset.value = False
+  await FallingEdge(dut.clock)
+
+  cocotb.start_soon(check_invariants(dut))
+  replies = []
+  cocotb.start_soon(collect_replies(dut, replies))
+
+  # 16 planes enter, 0 to 3 want to land and 8 to 11 want to take off
+  await flood(dut, [T_ID_PLEASE << 1] * 16)
+  await flood(dut, [(i << 4) + (T_REQUEST << 1) + R_LANDING for i in range(4)])
+  await flood(dut, [(i << 4) + (T_REQUEST << 1) + R_TAKEOFF for i in range(8, 12)])
+  start = get_sim_time(units="ns")
+  while get_sim_time(units="ns") - start < PERIOD * 10 * 4:
+    await FallingEdge(dut.clock)
+
+  # Status requests send back 8 bytes each, so the FSM spends most of its
+  # time waiting on the reply FIFO. Both runways should still be filled as
+  # soon as it gets back to the queues.
+  num_status = 48
+  status = cocotb.start_soon(flood(dut, [(H_STATUS << 4) + (T_ID_PLEASE << 1) + I_COMMAND] * num_status))
+  await Timer(round(PERIOD * 10 * 8), units="ns")
+  runways_open = get_sim_time(units="ns")
+  dut.runway_override.value = 0b00
+
+  # Time each runway sat idle with planes waiting for it
+  idle = [None, None]
+  while None in idle:
+    await FallingEdge(dut.clock)
+    for runway in range(2):
+      if idle[runway] is None and (int(dut.runway_active.value) >> runway) & 0b1:
+        idle[runway] = get_sim_time(units="ns") - runways_open
+  await status
+
+  start = get_sim_time(units="ns")
+  while len(replies) < 16 + 8 + 2 + 8 * num_status:
+    await FallingEdge(dut.clock)
+    assert get_sim_time(units="ns") - start < PERIOD * 10 * 40
+
+  # Clearances must go out between snapshots, never in the middle of one
+  clears = []
+  i = 0
+  while i < len(replies):
+    if replies[i] == STATUS_HEADER:
+      i += 8
+      continue
+    if (replies[i] >> 1) & 0b111 == T_CLEAR:
+      clears.append(i)
+    i += 1
+  assert len(clears) == 2
+
+  print(f"TB       : Runways filled after {idle[0] / (PERIOD * 10):.1f} and {idle[1] / (PERIOD * 10):.1f} frames")
+  assert max(idle) - min(idle) < PERIOD * 10
+  assert max(idle) < PERIOD * 10 * 8
+
+  # Two planes wait to land and three to take off, so each policy clears a
+  # different pair
+  expected = [
+    [(0, T_CLEAR), (2, T_CLEAR)],  # Alternate, landing goes first after reset
+    [(2, T_CLEAR), (3, T_CLEAR)],  # Takeoff first
+    [(0, T_CLEAR), (1, T_CLEAR)],  # Landing first
+    [(2, T_CLEAR), (0, T_CLEAR)]   # Longest queue, ties go to landing
+  ]
+
+  for policy in range(len(SCHEDULES)):
+    dut.runway_override.value = 0b11
+    dut.reset.value = True
+    await FallingEdge(dut.clock)
+    dut.reset.value = False
+    await FallingEdge(dut.clock)
+
+    num_replies = len(replies)
+    command = ((H_SCHEDULE + policy) << 4) + (T_ID_PLEASE << 1) + I_COMMAND
+    await flood(dut, [T_ID_PLEASE << 1] * 5)
+    await flood(dut, [(i << 4) + (T_REQUEST << 1) + R_LANDING for i in range(2)])
+    await flood(dut, [(i << 4) + (T_REQUEST << 1) + R_TAKEOFF for i in range(2, 5)])
+    await flood(dut, [command])
+    while len(replies) < num_replies + 11:
+      await FallingEdge(dut.clock)
+    assert replies[-1] == command
+
+    dut.runway_override.value = 0b00
+    while len(replies) < num_replies + 13:
+      await FallingEdge(dut.clock)
+
+    cleared = [(reply >> 4, (reply >> 1) & 0b111) for reply in replies[-2:]]
+    print(f"TB       : Policy {SCHEDULES[policy]} cleared planes {cleared[0][0]} and {cleared[1][0]}")
+    assert cleared == expected[policy]
+
+  print("////////////////////////////////////////")
+  print("//      Finish scheduling tests       //")
+  print("////////////////////////////////////////\n")
+
+@cocotb.test(skip=True)
+async def mixed_load_test(dut):
+  print("////////////////////////////////////////")
+  print("//       Begin mixed load tests       //")
+  print("////////////////////////////////////////\n")
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  dut.runway_override.value = 0b00
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
+
+  replies = []
+  reply_times = []
+  cocotb.start_soon(collect_replies(dut, replies, reply_times))
+
+  # Runway clocks spent locked, and spent free while a plane sat in a queue
+  runway_clocks = {"busy": 0, "starved": 0}
+  async def sample_runways():
+    bob = dut.bobby
+    while True:
+      await FallingEdge(dut.clock)
+      active = int(dut.runway_active.value)
+      waiting = int(bob.takeoff_fifo.count.value) + int(bob.landing_fifo.count.value)
+      for runway in range(2):
+        if (active >> runway) & 0b1:
+          runway_clocks["busy"] += 1
+        elif waiting:
+          runway_clocks["starved"] += 1
+
+  # 6 planes at a time enter, ask to land or take off, hold the runway for
+  # 2 to 12 frames once cleared and leave, and a new plane enters 1 to 4
+  # frames later. The host polls status every 30 frames. Every policy runs
+  # from the same seed, so the numbers compare directly.
+  frame = PERIOD * 10
+  num_planes = 6
+  num_clears = 40
+  sampler = None
+  for policy in range(len(SCHEDULES)):
+    dut.reset.value = True
+    await FallingEdge(dut.clock)
+    dut.reset.value = False
+    await FallingEdge(dut.clock)
+    monitor = cocotb.start_soon(check_invariants(dut))
+
+    num_replies = len(replies)
+    await flood(dut, [((H_SCHEDULE + policy) << 4) + (T_ID_PLEASE << 1) + I_COMMAND])
+    while len(replies) < num_replies + 1:
+      await FallingEdge(dut.clock)
+    handled = len(replies)
+
+    rng = random.Random(44)
+    start = get_sim_time(units="ns")
+    due = [(start + rng.random() * frame * 4, T_ID_PLEASE << 1) for i in range(num_planes)]
+    heapq.heapify(due)
+    requested = {}
+    latencies = []
+    status_left = 0
+    next_status = start + frame * 30
+    runway_clocks["busy"] = runway_clocks["starved"] = 0
+    if sampler is None:
+      sampler = cocotb.start_soon(sample_runways())
+    while len(latencies) < num_clears:
+      now = get_sim_time(units="ns")
+      assert now - start < frame * num_clears * 20
+
+      while handled < len(replies):
+        reply = replies[handled]
+        reply_time = reply_times[handled]
+        handled += 1
+        if status_left > 0:
+          status_left -= 1
+          continue
+        if reply == STATUS_HEADER:
+          status_left = 7
+          continue
+        id = reply >> 4
+        type = (reply >> 1) & 0b111
+        action = reply & 0b1
+        if type == T_ID_PLEASE and action == I_NEW_ID:
+          heapq.heappush(due, (now + rng.random() * frame * 2, (id << 4) + (T_REQUEST << 1) + rng.randrange(2)))
+        elif type == T_ID_PLEASE:
+          # Airspace full, come back later
+          heapq.heappush(due, (now + frame * 4, T_ID_PLEASE << 1))
+        elif type == T_CLEAR:
+          latencies.append(reply_time - requested.pop(id))
+          leave = now + frame * rng.uniform(2, 12)
+          heapq.heappush(due, (leave, (id << 4) + (T_DECLARE << 1) + action))
+          heapq.heappush(due, (leave + frame * rng.uniform(1, 4), T_ID_PLEASE << 1))
+        elif type == T_DIVERT:
+          requested.pop(id, None)
+          heapq.heappush(due, (now + frame * 4, T_ID_PLEASE << 1))
+
+      if now >= next_status:
+        heapq.heappush(due, (now, (H_STATUS << 4) + (T_ID_PLEASE << 1) + I_COMMAND))
+        next_status += frame * 30
+
+      if due and due[0][0] <= now:
+        data = heapq.heappop(due)[1]
+        if (data >> 1) & 0b111 == T_REQUEST:
+          requested[data >> 4] = get_sim_time(units="ns")
+        await write_with_flow_control(dut, data)
+      else:
+        await FallingEdge(dut.clock)
+
+    elapsed = get_sim_time(units="ns") - start
+    busy = runway_clocks["busy"] * CLOCK_PERIOD / (2 * elapsed)
+    starved = runway_clocks["starved"] * CLOCK_PERIOD / (2 * elapsed)
+    mean = sum(latencies) / len(latencies) / frame
+    worst = max(latencies) / frame
+    print(f"TB       : {SCHEDULES[policy]:>13}: runways busy {busy:.3f}, free with planes waiting {starved:.3f}, "
+          f"clearance latency mean {mean:.1f} max {worst:.1f} frames over {elapsed / frame:.0f} frames")
+    monitor.kill()
+
+  print("////////////////////////////////////////")
+  print("//      Finish mixed load tests       //")
+  print("////////////////////////////////////////\n")
+
+@cocotb.test(skip=True)
+async def emergency_flush_test(dut):
+  print("////////////////////////////////////////")
+  print("//     Begin emergency flush tests    //")
+  print("////////////////////////////////////////\n")
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  # Keep both runways closed so every landing stays queued
+  dut.runway_override.value = 0b11
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
+
+  dut.reset.value = True
+  await FallingEdge(dut.clock)
+  dut.reset.value = False
+  await FallingEdge(dut.clock)
+
+  cocotb.start_soon(check_invariants(dut))
+  replies = []
+  reply_times = []
+  cocotb.start_soon(collect_replies(dut, replies, reply_times))
+
+  # 16 planes enter, 0 to 7 fill the landing queue and 8 to 11 want to take off
+  await flood(dut, [T_ID_PLEASE << 1] * 16)
+  await flood(dut, [(i << 4) + (T_REQUEST << 1) + R_LANDING for i in range(8)])
+  await flood(dut, [(i << 4) + (T_REQUEST << 1) + R_TAKEOFF for i in range(8, 12)])
+  while len(replies) < 16 + 12:
+    await FallingEdge(dut.clock)
+  assert dut.bobby.all_id.value == 0xFFFF
+
+  # Plane 12 declares an emergency while the say-agains keep coming
+  num_replies = len(replies)
+  declared = get_sim_time(units="ns")
+  await flood(dut, [(12 << 4) + (T_EMERGENCY << 1) + E_DECLARE])
+  say_again = cocotb.start_soon(flood(dut, [((13 + i % 3) << 4) + (T_SAY_AGAIN << 1) for i in range(16)]))
+
+  # Every landing ID is freed at once
+  while int(dut.bobby.all_id.value) & 0x00FF:
+    await FallingEdge(dut.clock)
+  freed = get_sim_time(units="ns") - declared
+  await say_again
+
+  # New planes may only get a diverted ID once its divert is on its way
+  await flood(dut, [T_ID_PLEASE << 1] * 4)
+  start = get_sim_time(units="ns")
+  while len(replies) < num_replies + 8 + 16 + 4:
+    await FallingEdge(dut.clock)
+    assert get_sim_time(units="ns") - start < PERIOD * 10 * 32
+
+  types = [(reply >> 1) & 0b111 for reply in replies[num_replies:]]
+  ids = [reply >> 4 for reply in replies[num_replies:]]
+  diverts = {ids[i]: i for i in range(len(types)) if types[i] == T_DIVERT}
+  assert sorted(diverts) == list(range(8))
+  for i in range(len(types)):
+    if types[i] == T_ID_PLEASE:
+      assert ids[i] in diverts and diverts[ids[i]] < i
+
+  # Time to clear the airspace is until the last divert has gone out. The
+  # declaration takes a frame to arrive and every divert takes a frame on
+  # the wire, so the UART alone keeps that from going below 1 + 8 frames.
+  # Flushing only changes how soon the IDs are free, the diverts already
+  # went out back to back, so both are checked against the UART.
+  cleared = reply_times[num_replies + max(diverts.values())] - declared
+  line_rate = PERIOD * 10 * (1 + len(diverts))
+  print(f"TB       : Landing IDs freed after {freed / (PERIOD * 10):.1f} frames")
+  print(f"TB       : Airspace clear after {cleared / (PERIOD * 10):.1f} frames, the UART allows {line_rate / (PERIOD * 10):.0f}")
+  assert freed < PERIOD * 10 * 2
+  assert cleared < line_rate + PERIOD * 10
+
+  print("////////////////////////////////////////")
+  print("//    Finish emergency flush tests    //")
+  print("////////////////////////////////////////\n")
+
+@cocotb.test(skip=True)
+async def random_traffic_test(dut):
+  print("////////////////////////////////////////")
+  print("//     Begin random traffic tests     //")
+  print("////////////////////////////////////////\n")
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  dut.runway_override.value = 0b00
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
+
+  dut.reset.value = True
+  await FallingEdge(dut.clock)
+  dut.reset.value = False
+  await FallingEdge(dut.clock)
+
+  cocotb.start_soon(check_invariants(dut))
+  replies = []
+  cocotb.start_soon(collect_replies(dut, replies))
+
+  # Planes enter, ask to take off or land, hold the runway for a while once
+  # cleared and leave, and try again when diverted. Runways closing, the
+  # emergency override and status requests keep the queues and reply FIFOs
+  # busy, while check_invariants watches the whole run.
+  rng = random.Random(44)
+  frame = PERIOD * 10
+  num_clears = 200
+  due = [(0, T_ID_PLEASE << 1)] * 16
+  clears = 0
+  handled = 0
+  status_left = 0
+  next_change = frame * 20
+  start = get_sim_time(units="ns")
+  while clears < num_clears:
+    now = get_sim_time(units="ns")
+    assert now - start < frame * num_clears * 20
+
+    while handled < len(replies):
+      reply = replies[handled]
+      handled += 1
+      if status_left > 0:
+        status_left -= 1
+        continue
+      if reply == STATUS_HEADER:
+        status_left = 7
+        continue
+      id = reply >> 4
+      type = (reply >> 1) & 0b111
+      action = reply & 0b1
+      if type == T_ID_PLEASE and action == I_NEW_ID:
+        heapq.heappush(due, (now + rng.random() * frame * 4, (id << 4) + (T_REQUEST << 1) + rng.randrange(2)))
+      elif type == T_ID_PLEASE:
+        # Airspace full, come back later
+        heapq.heappush(due, (now + frame * 8, T_ID_PLEASE << 1))
+      elif type == T_CLEAR:
+        clears += 1
+        leave = now + frame * rng.uniform(2, 20)
+        heapq.heappush(due, (leave, (id << 4) + (T_DECLARE << 1) + action))
+        heapq.heappush(due, (leave + frame, T_ID_PLEASE << 1))
+      elif type == T_DIVERT:
+        heapq.heappush(due, (now + frame * 4, T_ID_PLEASE << 1))
+
+    if now >= next_change:
+      dut.runway_override.value = rng.choice([0b00, 0b00, 0b01, 0b10, 0b11])
+      dut.emergency_override.value = rng.random() < 0.1
+      heapq.heappush(due, (now, (H_STATUS << 4) + (T_ID_PLEASE << 1) + I_COMMAND))
+      next_change = now + frame * rng.uniform(10, 40)
+
+    if due and due[0][0] <= now:
+      await write_with_flow_control(dut, heapq.heappop(due)[1])
+    else:
+      await FallingEdge(dut.clock)
+
+  elapsed = get_sim_time(units="ns") - start
+  print(f"TB       : {clears} clearances and {len(replies)} replies in {elapsed / frame:.0f} frames")
+
+  print("////////////////////////////////////////")
+  print("//    Finish random traffic tests     //")
+  print("////////////////////////////////////////\n")
+
+@cocotb.test(skip=True)
+async def invariant_test(dut):
+  print("////////////////////////////////////////")
+  print("//        Begin invariant tests       //")
+  print("////////////////////////////////////////\n")
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  dut.runway_override.value = 0b00
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = 0b00
+
+  dut.reset.value = True
+  await FallingEdge(dut.clock)
+  dut.reset.value = False
+  await FallingEdge(dut.clock)
+
+  # Plane 0 takes runway 0 with the monitor watching, then its ID is taken
+  # away behind Bob's back. The monitor must stop the test on that cycle.
+  monitor = cocotb.start_soon(check_invariants(dut))
+  await request(dut, 0, T_ID_PLEASE, I_NEW_ID, (0 << 4) + (T_ID_PLEASE << 1), False)
+  await request(dut, 0, T_REQUEST, R_TAKEOFF, (0 << 4) + (T_CLEAR << 1) + C_RUNWAY_0, False)
+  for i in range(100):
+    await FallingEdge(dut.clock)
+  assert not monitor.done()
+
+  broken = int(get_sim_time(units="ns") // CLOCK_PERIOD)
+  dut.bobby.id_manager.taken_id.value = 0
+  message = None
+  try:
+    await with_timeout(monitor, CLOCK_PERIOD * 10, "ns")
+  except AssertionError as e:
+    message = str(e).splitlines()[0]
+  print(f"TB       : Monitor stopped with: {message}")
+  assert message == f"Cycle {broken}: plane 0 is on runway 0 without an ID"
+
+  print("////////////////////////////////////////")
+  print("//       Finish invariant tests       //")
+  print("////////////////////////////////////////\n")
+
+def read_trace(path):
+  # Yields (seconds, event, value) from a bobATC_helper.py --record trace one
+  # line at a time, so captures of any length replay in constant memory
+  with open(path) as f:
+    for line in f:
+      fields = line.split()
+      if len(fields) != 3:
+        continue
+      seconds, event, value = fields
+      yield float(seconds), event, int(value) if event == "baud" else int(value, 16)
+
+@cocotb.test(skip="BOB_TRACE" not in os.environ)
+async def replay_test(dut):
+  global PERIOD
+  print("////////////////////////////////////////")
+  print("//         Begin replay tests         //")
+  print("////////////////////////////////////////\n")
+
+  # Replays the host side of a recorded session into a freshly reset Bob and
+  # compares every reply with the recorded one. It only runs when BOB_TRACE
+  # names a trace from bobATC_helper.py --record. BOB_SPEEDUP squeezes the
+  # gaps between requests, bytes still take a whole frame on the wire.
+  path = os.environ["BOB_TRACE"]
+  speedup = float(os.environ.get("BOB_SPEEDUP", "1"))
+  events = read_trace(path)
+  _, event, rate = next(events)
+  assert event == "baud", f"{path} does not start with the port's baud rate"
+
+  # Run the clock
+  cocotb.start_soon(Clock(dut.clock, CLOCK_PERIOD, units="ns").start())
+
+  dut.runway_override.value = 0b00
+  dut.emergency_override.value = 0b0
+  dut.baud_strap.value = BAUD_RATES.index(rate)
+  # The recording starts with the line idle, hold it high until the first byte
+  dut.rx.value = 1
+
+  dut.reset.value = True
+  await FallingEdge(dut.clock)
+  dut.reset.value = False
+  await FallingEdge(dut.clock)
+
+  replies = deque()
+  cocotb.start_soon(collect_replies(dut, replies))
+
+  # Recorded replies not yet matched, with their time and whether they are
+  # part of a status snapshot. Snapshots hold queue depths that move with the
+  # replay speed, so differences there are counted but don't fail the test.
+  expected = deque()
+  status_left = 0
+  num_recorded = 0
+  num_checked = 0
+  mismatches = 0
+  status_mismatches = 0
+
+  def compare():
+    nonlocal num_checked, mismatches, status_mismatches
+    while replies and expected:
+      reply = replies.popleft()
+      recorded, seconds, in_status = expected.popleft()
+      num_checked += 1
+      if reply == recorded:
+        continue
+      if in_status:
+        status_mismatches += 1
+      else:
+        mismatches += 1
+        if mismatches <= 20:
+          print(f"TB       : Reply {num_checked} was {reply:08b}, recorded {recorded:08b} at {seconds:.6f} s")
+
+  async def wait_for_replies(count):
+    start = get_sim_time(units="ns")
+    while num_checked + len(replies) < count and get_sim_time(units="ns") - start < PERIOD * 10 * 32:
+      await FallingEdge(dut.clock)
+
+  try:
+    PERIOD = (1 / rate) * 10**9
+    start = get_sim_time(units="ns")
+    last = 0
+    for seconds, event, value in events:
+      last = seconds
+      if event == ">":
+        wait = start + seconds * 10**9 / speedup - get_sim_time(units="ns")
+        if wait >= 1:
+          await Timer(int(wait), units="ns")
+        await write_with_flow_control(dut, value)
+      elif event == "<":
+        expected.append((value, seconds, status_left > 0))
+        num_recorded += 1
+        if status_left > 0:
+          status_left -= 1
+        elif value == STATUS_HEADER:
+          status_left = 7
+      elif event == "baud":
+        # The host only switched once the echo was in, so wait for it here too
+        await wait_for_replies(num_recorded)
+        compare()
+        PERIOD = (1 / value) * 10**9
+      compare()
+    await wait_for_replies(num_recorded)
+    compare()
+  finally:
+    PERIOD = (1 / BAUD_RATE) * 10**9
+
+  elapsed = get_sim_time(units="ns") - start
+  print(f"TB       : Replayed {last:.3f} s of traffic in {elapsed / 10**9:.3f} s of simulation")
+  print(f"TB       : {num_checked} replies compared, {mismatches} differ, {status_mismatches} status bytes differ")
+  print(f"TB       : {len(expected)} recorded replies missing, {len(replies)} extra")
+  assert mismatches == 0
+  assert not expected and not replies
+
+  print("////////////////////////////////////////")
+  print("//        Finish replay tests         //")
+  print("////////////////////////////////////////\n")
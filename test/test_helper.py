@@ -0,0 +1,131 @@
+import os
+import socket
+import sys
+import threading
+from time import monotonic, sleep
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from bobATC_helper import *
+
+# Runs the socket sharing side of bobATC_helper without a board. Each client
+# is one end of a socket pair, the test plays Bob by taking requests from the
+# router and handing it replies. Run with: python -m pytest test/test_helper.py
+
+def connect(router, count, buffer=None):
+  clients = []
+  for i in range(count):
+    ours, theirs = socket.socketpair()
+    ours.settimeout(1)
+    if buffer is not None:
+      theirs.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, buffer)
+    router.add(theirs, i)
+    clients.append(ours)
+  return clients
+
+def receive(client, length=1):
+  data = b""
+  while len(data) < length:
+    data += client.recv(length - len(data))
+  return list(data)
+
+def nothing_for(client):
+  client.settimeout(0.1)
+  try:
+    return client.recv(1) == b""
+  except socket.timeout:
+    return True
+  finally:
+    client.settimeout(1)
+
+def test_id_and_deferred_clearance():
+  router = Router()
+  a, b = connect(router, 2)
+
+  # Both planes ask for an ID, replies carry no owner and go back in order
+  a.sendall(bytes([(T_ID_PLEASE << 1) + I_NEW_ID]))
+  assert router.next_request() == (T_ID_PLEASE << 1) + I_NEW_ID
+  b.sendall(bytes([(T_ID_PLEASE << 1) + I_NEW_ID]))
+  assert router.next_request() == (T_ID_PLEASE << 1) + I_NEW_ID
+  router.reply((3 << 4) + (T_ID_PLEASE << 1))
+  router.reply((5 << 4) + (T_ID_PLEASE << 1))
+  assert receive(a) == [(3 << 4) + (T_ID_PLEASE << 1)]
+  assert receive(b) == [(5 << 4) + (T_ID_PLEASE << 1)]
+
+  # Both runways are busy, so the planes are held and cleared later, in the
+  # opposite order to their requests
+  a.sendall(bytes([(3 << 4) + (T_REQUEST << 1) + R_TAKEOFF]))
+  b.sendall(bytes([(5 << 4) + (T_REQUEST << 1) + R_LANDING]))
+  assert sorted([router.next_request(), router.next_request()]) == \
+    [(3 << 4) + (T_REQUEST << 1) + R_TAKEOFF, (5 << 4) + (T_REQUEST << 1) + R_LANDING]
+  router.reply((3 << 4) + (T_HOLD << 1))
+  router.reply((5 << 4) + (T_HOLD << 1))
+  router.reply((5 << 4) + (T_CLEAR << 1) + C_RUNWAY_1)
+  router.reply((3 << 4) + (T_CLEAR << 1) + C_RUNWAY_0)
+  assert receive(a, 2) == [(3 << 4) + (T_HOLD << 1), (3 << 4) + (T_CLEAR << 1) + C_RUNWAY_0]
+  assert receive(b, 2) == [(5 << 4) + (T_HOLD << 1), (5 << 4) + (T_CLEAR << 1) + C_RUNWAY_1]
+
+def test_status_frame_stays_whole():
+  router = Router()
+  a, b = connect(router, 2)
+  a.sendall(bytes([(1 << 4) + (T_REQUEST << 1) + R_TAKEOFF]))
+  assert router.next_request() == (1 << 4) + (T_REQUEST << 1) + R_TAKEOFF
+  b.sendall(bytes([(H_STATUS << 4) + (T_ID_PLEASE << 1) + I_COMMAND]))
+  assert router.next_request() == (H_STATUS << 4) + (T_ID_PLEASE << 1) + I_COMMAND
+
+  # Snapshot bytes can look like replies for a plane, they all go to the
+  # client that asked, and the reply after the frame goes to the plane's owner
+  snapshot = [STATUS_HEADER, 0x00, 0x02, (1 << 5) + (1 << 1) + 1, 0x00, 0x10, 0x00, 0x00]
+  for data in snapshot:
+    router.reply(data)
+  router.reply((1 << 4) + (T_CLEAR << 1) + C_RUNWAY_0)
+  assert receive(b, 8) == snapshot
+  assert receive(a) == [(1 << 4) + (T_CLEAR << 1) + C_RUNWAY_0]
+  assert nothing_for(b)
+
+def test_host_commands_stay_local():
+  router = Router()
+  a, b = connect(router, 2)
+  b.sendall(bytes([(1 << 4) + (T_REQUEST << 1) + R_LANDING]))
+  assert router.next_request() == (1 << 4) + (T_REQUEST << 1) + R_LANDING
+
+  # A baud change and an unknown host command are answered with a say again
+  # without reaching Bob, and neither takes plane 1 away from b
+  a.sendall(bytes([((H_BAUD + 1) << 4) + (T_ID_PLEASE << 1) + I_COMMAND,
+                   (1 << 4) + (T_ID_PLEASE << 1) + I_COMMAND,
+                   (H_SCHEDULE << 4) + (T_ID_PLEASE << 1) + I_COMMAND]))
+  assert router.next_request() == (H_SCHEDULE << 4) + (T_ID_PLEASE << 1) + I_COMMAND
+  assert receive(a, 2) == [((H_BAUD + 1) << 4) + (T_SAY_AGAIN << 1), (1 << 4) + (T_SAY_AGAIN << 1)]
+
+  router.reply((H_SCHEDULE << 4) + (T_ID_PLEASE << 1) + I_COMMAND)
+  router.reply((1 << 4) + (T_HOLD << 1))
+  assert receive(a) == [(H_SCHEDULE << 4) + (T_ID_PLEASE << 1) + I_COMMAND]
+  assert receive(b) == [(1 << 4) + (T_HOLD << 1)]
+  assert nothing_for(a)
+
+def test_stalled_client_is_cut_off():
+  router = Router()
+  a, b = connect(router, 2, buffer=4096)
+  a.sendall(bytes([(1 << 4) + (T_REQUEST << 1) + R_TAKEOFF]))
+  assert router.next_request() == (1 << 4) + (T_REQUEST << 1) + R_TAKEOFF
+  b.sendall(bytes([(2 << 4) + (T_REQUEST << 1) + R_LANDING]))
+  assert router.next_request() == (2 << 4) + (T_REQUEST << 1) + R_LANDING
+
+  # a never reads, so its socket fills up and the rest of its replies pile
+  # up in the router. Replying, which runs on the serial reader thread, must
+  # not wait for a, and b still hears from Bob straight away.
+  def flood():
+    for i in range(MAX_BACKLOG * 4):
+      router.reply((1 << 4) + (T_HOLD << 1))
+    router.reply((2 << 4) + (T_HOLD << 1))
+  start = monotonic()
+  replies = threading.Thread(target=flood, daemon=True)
+  replies.start()
+  replies.join(5)
+  assert not replies.is_alive()
+  assert receive(b) == [(2 << 4) + (T_HOLD << 1)]
+
+  # Past MAX_BACKLOG the router gives up on a and drops it
+  while len(router.clients) > 1 and monotonic() - start < 5:
+    sleep(0.01)
+  assert [client.name for client in router.clients] == [1]
+  assert router.owner[1] is None
@@ -0,0 +1,18 @@
+import os
+import shlex
+import shutil
+import subprocess
+
+import pytest
+
+# The cocotb tests simulate test/Bob.v, not the .sv sources, so a change to
+# the RTL that doesn't regenerate it goes untested. Fails when netlists.sh
+# would change any of the checked in copies. Set YOSYS like for netlists.sh.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+YOSYS = os.environ.get("YOSYS", "yosys -m slang")
+
+@pytest.mark.skipif(shutil.which(shlex.split(YOSYS)[0]) is None, reason="no yosys to build the netlists with")
+def test_netlists_match_rtl():
+  result = subprocess.run([os.path.join(ROOT, "netlists.sh"), "--check"], capture_output=True, text=True)
+  assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,93 @@
+import io
+import os
+import sys
+import zipfile
+from array import array
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from bobATC_waves import *
+
+# Runs bobATC_waves on a VCD written by hand. The UART FSMs have a state
+# signal at the same depth as ReadRequestFsm's, so the report only comes out
+# right if the analyzer picks the one under bobby, and Verilator's copy of the
+# ports under $rootio must not make rx ambiguous. Run with:
+# python -m pytest test/test_waves.py
+
+DUMP = """$timescale 1ns $end
+$scope module $rootio $end
+$var wire 1 g rx $end
+$upscope $end
+$scope module BobTop $end
+$var wire 1 a rx $end
+$var wire 1 b tx $end
+$scope module receiver $end
+$scope module fsm $end
+$var wire 2 c state $end
+$upscope $end
+$upscope $end
+$scope module transmitter $end
+$scope module fsm $end
+$var wire 2 d state $end
+$upscope $end
+$upscope $end
+$scope module bobby $end
+$scope module fsm $end
+$var wire 4 e state $end
+$upscope $end
+$scope module uart_requests $end
+$var wire 3 f count $end
+$upscope $end
+$upscope $end
+$upscope $end
+$enddefinitions $end
+#0
+1a
+1b
+1g
+b0 c
+b0 d
+b0 e
+b0 f
+#100
+b11 c
+b10 d
+b1 e
+b1 f
+#300
+b11 e
+b10 f
+#400
+b0 e
+b0 f
+#1000
+b1 c
+"""
+
+def test_state_and_fifo_residency(tmp_path, capsys):
+  output = tmp_path / "waves.npz"
+  analyze(io.StringIO(DUMP), output, BAUD_RATES[0], "rx", "tx")
+  report = capsys.readouterr().out
+
+  # QUIET for 100 + 600 ns, INTERPRET for 200 ns, CHECK_QUEUES for 100 ns
+  assert "State        : QUIET            70.00%" in report
+  assert "State        : INTERPRET        20.00%" in report
+  assert "State        : CHECK_QUEUES     10.00%" in report
+  assert "REPLY" not in report
+
+  # One request waits for 200 ns and two for 100 ns out of 1000 ns
+  assert "FIFO         : uart_requests   mean 0.40, peak 2" in report
+
+  # Each column is a .npy file with a 128 byte header
+  with zipfile.ZipFile(output) as archive:
+    assert list(archive.read("state_state.npy")[Column.HEADER_LENGTH:]) == [0, 1, 3, 0]
+    assert list(array("H", archive.read("fifo_fifo_count.npy")[Column.HEADER_LENGTH:])) == [0, 1, 2, 0]
+
+def test_ambiguous_suffix():
+  scale, variables = read_header(io.StringIO(DUMP))
+  assert find(variables, "bobby.fsm.state") == "e"
+  assert find(variables, "rx") == "a"
+  assert find(variables, "missing") is None
+  with pytest.raises(ValueError, match="BobTop.receiver.fsm.state, BobTop.transmitter.fsm.state"):
+    find(variables, "fsm.state")